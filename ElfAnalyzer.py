@@ -1,2379 +1,9784 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-###################
-#    This module parses and analyzes ELF file for Forensic and
-#    investigations.
-#    Copyright (C) 2023  ElfAnalyzer
-
-#    This program is free software: you can redistribute it and/or modify
-#    it under the terms of the GNU General Public License as published by
-#    the Free Software Foundation, either version 3 of the License, or
-#    (at your option) any later version.
-
-#    This program is distributed in the hope that it will be useful,
-#    but WITHOUT ANY WARRANTY; without even the implied warranty of
-#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-#    GNU General Public License for more details.
-
-#    You should have received a copy of the GNU General Public License
-#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
-###################
-
-"""
-This module parses and analyzes ELF file for Forensic and
-investigations.
-"""
-
-__version__ = "0.0.3"
-__author__ = "Maurice Lambert"
-__author_email__ = "mauricelambert434@gmail.com"
-__maintainer__ = "Maurice Lambert"
-__maintainer_email__ = "mauricelambert434@gmail.com"
-__description__ = """
-This module parses and analyzes ELF file for Forensic and
-investigations.
-"""
-__url__ = "https://github.com/mauricelambert/ElfAnalyzer"
-
-# __all__ = []
-
-__license__ = "GPL-3.0 License"
-__copyright__ = """
-ElfAnalyzer  Copyright (C) 2023  Maurice Lambert
-This program comes with ABSOLUTELY NO WARRANTY.
-This is free software, and you are welcome to redistribute it
-under certain conditions.
-"""
-copyright = __copyright__
-license = __license__
-
-print(copyright)
-
-from ctypes import (
-    Structure,
-    c_bool,
-    c_wchar,
-    c_byte,
-    c_ubyte,
-    c_short,
-    c_ushort,
-    c_int,
-    c_uint,
-    c_long,
-    c_ulong,
-    c_longlong,
-    c_size_t,
-    c_ssize_t,
-    c_float,
-    c_double,
-    c_longdouble,
-    c_char_p,
-    c_wchar_p,
-    c_void_p,
-    c_uint16,
-    c_int32,
-    c_ulonglong,
-    c_int8,
-    c_uint8,
-    c_int16,
-    c_uint32,
-    c_int64,
-    c_uint64,
-    c_char,
-    _SimpleCData,
-    sizeof as _sizeof,
-)
-from typing import TypeVar, Union, Any, Iterable, List, Tuple
-from sys import argv, executable, exit, stderr
-from urllib.request import urlopen
-from dataclasses import dataclass
-from _io import _BufferedIOBase
-from functools import partial
-from string import printable
-from os.path import getsize
-from inspect import isclass
-from _ctypes import Array
-from io import BytesIO
-from enum import Enum
-
-Section = TypeVar("Section")
-
-try:
-    from EntropyAnalysis import charts_chunks_file_entropy, Section
-    from matplotlib import pyplot
-except ImportError:
-    entropy_charts_import = False
-else:
-    entropy_charts_import = True
-
-_CData = tuple(x for x in c_char.mro() if x.__name__ == "_CData")[0]
-printable = printable[:-5].encode()
-
-_issubclass = issubclass
-
-
-def issubclass(test: Any, *args):
-    """
-    This function checks if the tested elements is a
-    subclass of comparator.
-    """
-
-    if isclass(test):
-        return _issubclass(test, *args)
-    return False
-
-
-@dataclass
-class Field:
-    """
-    This class implements
-    """
-
-    value: Any
-    information: str
-    usage: str = None
-    description: str = None
-
-
-class FileString(str):
-    """
-    This class implements strings with positions
-    (_start_position_ and _end_position_ attributes).
-    """
-
-    pass
-
-
-class FileBytes(bytes):
-    """
-    This class implements bytes with positions
-    (_start_position_ and _end_position_ attributes).
-    """
-
-    pass
-
-
-class Data:
-    """
-    This class helps you to print a title for a "CLI section".
-    """
-
-    verbose: bool = False
-    no_color: bool = False
-
-    def __init__(
-        self,
-        name: str,
-        start_position: int,
-        end_position: int,
-        data: bytes,
-        information: str,
-        format: bool = True,
-    ):
-        self.name = name
-        self.start_position = start_position
-        self.end_position = end_position
-        self.data = data
-        self.information = information
-        self.format = format
-
-    def vprint(self) -> None:
-        """
-        This method prints verbose data.
-        """
-
-        if self.verbose:
-            self.print()
-
-    def print(self) -> None:
-        """
-        This method prints the data.
-        """
-
-        if self.no_color:
-            print(self)
-            return None
-
-        print(
-            "\x1b[38;2;183;121;227m"
-            + self.name.ljust(25)
-            + "\x1b[38;2;255;240;175m"
-            + f"{self.start_position:0>8x}-{self.end_position:0>8x}".ljust(20)
-            + "\x1b[38;2;255;208;11m"
-            + (
-                (
-                    self.data.hex().ljust(40)
-                    + "\x1b[38;2;212;171;242m"
-                    + "".join(
-                        chr(x) if x in printable else "." for x in self.data
-                    ).ljust(20)
-                )
-                if len(self.data) <= 20
-                else "\x1b[38;2;212;171;242m"
-                + "".join(
-                    chr(x) if x in printable else "." for x in self.data
-                ).ljust(40)
-            )
-            + "\x1b[38;2;201;247;87m"
-            + (
-                self.information.replace("_", " ").title()
-                if self.format
-                else self.information
-            )
-            + "\x1b[39m"
-        )
-
-    def __str__(self):
-        return (
-            self.name.ljust(25)
-            + f"{self.start_position:0>8x}-{self.end_position:0>8x}".ljust(20)
-            + (
-                (
-                    self.data.hex().ljust(40)
-                    + "".join(
-                        chr(x) if x in printable else "." for x in self.data
-                    ).ljust(20)
-                )
-                if len(self.data) <= 20
-                else "".join(
-                    chr(x) if x in printable else "." for x in self.data
-                ).ljust(20)
-            )
-            + (self.information if self.format else self.information)
-        )
-
-
-class Title:
-    """
-    This class helps you to print a title for a "CLI section".
-    """
-
-    def __init__(self, value: str):
-        self.value = value
-
-    def print(self) -> None:
-        """
-        This method prints the title.
-        """
-
-        if Data.no_color:
-            print("\n" + str(self) + "\n")
-            return None
-
-        print(
-            "\n\x1b[48;2;50;50;50m\x1b[38;2;175;241;11m"
-            + str(self)
-            + "\x1b[49m\x1b[39m\n"
-        )
-
-    def __str__(self):
-        return f"{' ' + self.value + ' ':*^139}"
-
-
-class _DynamicType(int):
-    """
-    This class is an integer type with usage
-    and description attributes.
-    """
-
-    def __new__(cls, value: int, usage: str, description: str):
-        self = int.__new__(cls, value)
-        self.usage = usage
-        self.description = description
-        return self
-
-
-class _DynamicFlags(int):
-    """
-    This class is an integer type with description attribut.
-    """
-
-    def __new__(cls, value: int, description: str):
-        self = int.__new__(cls, value)
-        self.description = description
-        return self
-
-
-class DataToCClass:
-    """
-    This class implements methods to get ctypes from data.
-    """
-
-    order: str = "little"
-
-    def data_to_bytes(
-        type: type, data: Union[bytes, int, str]
-    ) -> _SimpleCData:
-        """
-        This method converts bytes, int or str to ctypes (c_char, c_char_p).
-        """
-
-        if isinstance(data, int):
-            data = data.to_bytes()
-        elif isinstance(data, str):
-            data = data.encode("latin-1")
-
-        return type(data[::-1] if DataToCClass.order == "little" else data)
-
-    def data_to_int(type: type, data: Union[bytes, int, None]) -> _SimpleCData:
-        """
-        This method converts bytes, int or None to ctypes
-        (c_bool, c_byte, c_ubyte, c_short, c_ushort, c_int,
-        c_uint, c_long, c_ulong, c_longlong, c_ulonglong,
-        c_size_t, c_ssize_t, c_void_p, c_int8, c_int16,
-        c_int32, c_int64, c_uint8, c_uint16, c_uint32,
-        c_uint64).
-        """
-
-        if isinstance(data, bytes):
-            data = int.from_bytes(
-                data[::-1] if DataToCClass.order == "little" else data
-            )
-
-        return type(data)
-
-    def data_to_str(
-        type: type, data: Union[bytes, str], encoding: str = "utf-8"
-    ) -> _SimpleCData:
-        """
-        This method converts bytes or str to ctypes (c_wchar, c_wchar_p).
-        """
-
-        if isinstance(data, bytes):
-            data = data.decode(encoding)
-
-        return type(data)
-
-    def data_to_float(type: type, data: Union[bytes, float]) -> _SimpleCData:
-        """
-        This method converts bytes or float to ctypes
-        (c_float, c_double, c_longdouble).
-        """
-
-        if isinstance(data, bytes):
-            data = float.fromhex(
-                (data[::-1] if DataToCClass.order == "little" else data).hex()
-            )
-
-        return type(data)
-
-
-data_to_ctypes = {
-    c_bool: partial(DataToCClass.data_to_int, c_bool),
-    c_char: partial(DataToCClass.data_to_bytes, c_char),
-    c_wchar: partial(DataToCClass.data_to_str, c_wchar),
-    c_byte: partial(DataToCClass.data_to_int, c_byte),
-    c_int8: partial(DataToCClass.data_to_int, c_int8),
-    c_ubyte: partial(DataToCClass.data_to_int, c_ubyte),
-    c_uint8: partial(DataToCClass.data_to_int, c_uint8),
-    c_short: partial(DataToCClass.data_to_int, c_short),
-    c_int16: partial(DataToCClass.data_to_int, c_int16),
-    c_ushort: partial(DataToCClass.data_to_int, c_ushort),
-    c_uint16: partial(DataToCClass.data_to_int, c_uint16),
-    c_int: partial(DataToCClass.data_to_int, c_int),
-    c_int32: partial(DataToCClass.data_to_int, c_int32),
-    c_uint: partial(DataToCClass.data_to_int, c_uint),
-    c_uint32: partial(DataToCClass.data_to_int, c_uint32),
-    c_long: partial(DataToCClass.data_to_int, c_long),
-    c_ulong: partial(DataToCClass.data_to_int, c_ulong),
-    c_longlong: partial(DataToCClass.data_to_int, c_longlong),
-    c_int64: partial(DataToCClass.data_to_int, c_int64),
-    c_ulonglong: partial(DataToCClass.data_to_int, c_ulonglong),
-    c_uint64: partial(DataToCClass.data_to_int, c_uint64),
-    c_size_t: partial(DataToCClass.data_to_int, c_size_t),
-    c_ssize_t: partial(DataToCClass.data_to_int, c_ssize_t),
-    c_float: partial(DataToCClass.data_to_float, c_float),
-    c_double: partial(DataToCClass.data_to_float, c_double),
-    c_longdouble: partial(DataToCClass.data_to_float, c_longdouble),
-    c_char_p: partial(DataToCClass.data_to_bytes, c_char_p),
-    c_wchar_p: partial(DataToCClass.data_to_str, c_wchar),
-    c_void_p: partial(DataToCClass.data_to_int, c_void_p),
-}
-
-
-class BaseStructure:
-    """
-    This class implements the Structure base (methods).
-    """
-
-    def __init__(self, data: Union[bytes, _BufferedIOBase]) -> None:
-        self._source = b""
-        if isinstance(data, bytes):
-            data = BytesIO(data)
-
-        for attribute_name, attribute_value in self.__annotations__.items():
-            start_position = data.tell()
-
-            if issubclass(attribute_value, Array):
-                cClass = self.array_to_cclass(attribute_value)
-                cClass_size = sizeof(cClass)
-                used_data = data.read(sizeof(attribute_value))
-                self._source += used_data
-                value = attribute_value(
-                    *(
-                        data_to_ctypes[cClass](
-                            used_data[x * cClass_size : (x + 1) * cClass_size]
-                        )
-                        for x in range(attribute_value._length_)
-                    )
-                )
-                setattr(self, attribute_name, value)
-            elif issubclass(attribute_value, BaseStructure):
-                used_data = data.read(sizeof(attribute_value))
-                self._source += used_data
-                value = attribute_value(used_data)
-                setattr(self, attribute_name, value)
-            else:
-                cClass = self.class_to_cclass(attribute_value)
-                used_data = data.read(sizeof(cClass))
-                value = data_to_ctypes[cClass](used_data)
-                self._source += used_data
-                setattr(self, attribute_name, value)
-
-            value._data_ = used_data
-            value._start_position_ = start_position
-            value._end_position_ = data.tell()
-
-    @classmethod
-    def array_to_cclass(cls, array: Array) -> type:
-        """
-        This method returns the inherited ctype.
-        """
-
-        return cls.class_to_cclass(array._type_)
-
-    @staticmethod
-    def class_to_cclass(cls: type) -> type:
-        """
-        This method returns the inherited ctype.
-        """
-
-        precedent_class = None
-        for element in cls.mro():
-            if element is _SimpleCData:
-                return precedent_class
-            precedent_class = element
-
-    @classmethod
-    def __sizeof__(cls) -> int:
-        """
-        This method returns the octet size to build the instance.
-        """
-
-        counter = 0
-        for value in cls.__annotations__.values():
-            counter += sizeof(value)
-
-        return counter
-
-    def __repr__(self):
-        return self.__class__.__name__ + "(" + repr(self._source) + ")"
-
-    def __str__(self):
-        return (
-            self.__class__.__name__
-            + "("
-            + ", ".join(
-                f"{attr}="
-                + (
-                    (
-                        getattr(self, attr).__class__.__name__
-                        + f"({getattr(self, attr).value})"
-                    )
-                    if isinstance(getattr(self, attr), Array)
-                    else getattr(self, attr)
-                )
-                for attr in self.__annotations__
-            )
-            + ")"
-        )
-
-
-Structure = TypeVar("Structure")
-
-
-def sizeof(object: Union[_CData, type]) -> int:
-    """
-    This function returns the size of this object.
-    """
-
-    if isinstance(object, _CData) or issubclass(object, _CData):
-        return _sizeof(object)
-    return object.__sizeof__()
-
-
-def structure(cls: type) -> type:
-    """
-    This decorator helps to build C Structures.
-    """
-
-    def wrap(cls: type) -> type:
-        """
-        This function builds the C Structure class.
-        """
-
-        return type(
-            cls.__name__,
-            (cls, BaseStructure),
-            {"__annotations__": cls.__annotations__},
-        )
-
-    return wrap(cls)
-
-
-class Elf32_Addr(c_uint32):
-    pass
-
-
-class Elf32_Half(c_uint16):
-    pass
-
-
-class Elf32_Section(c_uint16):
-    pass
-
-
-class Elf32_Versym(c_uint16):
-    pass
-
-
-class Elf32_Off(c_uint32):
-    pass
-
-
-class Elf32_Sword(c_int32):
-    pass
-
-
-class Elf32_Word(c_uint32):
-    pass
-
-
-class Elf32_Sxword(c_int64):
-    pass
-
-
-class Elf32_Xword(c_uint64):
-    pass
-
-
-class Elf64_Addr(c_uint64):
-    pass
-
-
-class Elf64_Half(c_uint16):
-    pass
-
-
-class Elf64_Section(c_uint16):
-    pass
-
-
-class Elf64_Versym(c_uint16):
-    pass
-
-
-class Elf64_Off(c_uint64):
-    pass
-
-
-class Elf64_Sword(c_int32):
-    pass
-
-
-class Elf64_Word(c_uint32):
-    pass
-
-
-class Elf64_Sxword(c_int64):
-    pass
-
-
-class Elf64_Xword(c_uint64):
-    pass
-
-
-class ELfIdentClass(Enum):
-    INVALID = 0
-    OBJECT_32_BITS = 1
-    OBJECT_64_BITS = 2
-
-
-class ELfIdentData(Enum):
-    INVALID = 0
-    LITTLE_ENDIAN = 1
-    BIG_ENDIAN = 2
-
-
-class ELfIdentVersion(Enum):
-    INVALID = 0
-    CURRENT = 1
-
-
-class ELfIdentOS(Enum):
-    SYSV = NONE = 0
-    HPUX = 1
-    NETBSD = 2
-    LINUX = 3
-    SOLARIS = 6
-    AIX = 7
-    IRIX = 8
-    FREEBSD = 9
-    TRU64 = 10
-    MODESTO = 11
-    OPENBSD = 12
-    OPENVMS = 13
-    NSK = 14
-    AROS = 15
-    ARM = 97
-    MSP = 255
-
-
-class ElfType(Enum):
-    NO_FILE_TYPE = 0
-    RELOCATABLE = 1
-    EXECUTABLE = 2
-    SHARED_OBJECT = 3
-    CORE = 4
-    OS_SPECIFIC_LOOS = 0xFE00
-    OS_SPECIFIC_HIOS = 0xFEFF
-    PROCESSOR_SPECIFIC_LOPROC = 0xFF00
-    PROCESSOR_SPECIFIC_HIPROC = 0xFFFF
-
-
-class ElfMachine(Enum):
-    NO_MACHINE = 0
-    ATAT_WE_32100 = 1
-    SPARC = 2
-    INTEL_80386 = 3
-    MOTOROLA_68000 = 4
-    MOTOROLA_88000 = 5
-    INTEL_80860 = 7
-    MIPS_I = 8
-    IBM_SYSTEM370 = 9
-    MIPS_RS3000 = 10
-    PA_RISC = 15
-    FUJITSU_VPP500 = 17
-    SPARC32PLUS = 18
-    INTEL_80960 = 19
-    POWERPC = 20
-    POWERPC64 = 21
-    IBM_SYSTEM390 = 22
-    NEC_V800 = 36
-    FUJITSU_FR20 = 37
-    TRW_RH32 = 38
-    MOTOROLA_RCE = 39
-    ARM = 40
-    DIGITAL_ALPHA = 41
-    HITACHI_SH = 42
-    SPARC_V9 = 43
-    SIEMENS_TRICORE = 44
-    ARC = 45
-    HITACHI_H8_300 = 46
-    HITACHI_H8_300H = 47
-    HITACHI_H8S = 48
-    HITACHI_H8_500 = 49
-    INTEL_IA_64 = 50
-    STANFORD_MIPS_X = 51
-    MOTOROLA_COLDFIRE = 52
-    MOTOROLA_68HC12 = 53
-    FUJITSU_MMA = 54
-    SIEMENS_PCP = 55
-    SONY_NCPU_RISC = 56
-    DENSO_NDR1 = 57
-    MOTOROLA_STARCORE = 58
-    TOYOTA_ME16 = 59
-    ST100 = 60
-    TINYJ = 61
-    AMD_X86_64 = 62
-    SONY_PDSP = 63
-    PDP10 = 64
-    PDP11 = 65
-    SIEMENS_FX66 = 66
-    ST9PLUS = 67
-    ST7 = 68
-    MOTOROLA_68HC16 = 69
-    MOTOROLA_68HC11 = 70
-    MOTOROLA_68HC08 = 71
-    MOTOROLA_68HC05 = 72
-    SILICON_SVX = 73
-    ST19 = 74
-    DIGITAL_VAX = 75
-    AXIS_CRIS = 76
-    INFINEON_JAVELIN = 77
-    LSI_DSP64_FIREPATH = 78
-    LSI_DSP16_ZSP = 79
-    DONALD_KNUTH_MMIX = 80
-    HARVARD_HUANY = 81
-    SITERA_PRISM = 82
-    ATMEL_AVR = 83
-    FUJITSU_FR30 = 84
-    MITSUBISHI_D10V = 85
-    MITSUBISHI_D30V = 86
-    NEC_V850 = 87
-    MITSUBISHI_M32R = 88
-    MATSUSHITA_MN10300 = 89
-    MATSUSHITA_MN10200 = 90
-    PICOJAVA = 91
-    OPENRISC = 92
-    ARC_A5 = 93
-    TENSILICA_XTENSA = 94
-    ALPHAMOSAIC_VIDEOCORE = 95
-    TMM_GPP = 96
-    NS32K = 97
-    TPC = 98
-    TREBIA_SNP1K = 99
-    ST200 = 100
-
-
-ElfVersion = ELfIdentVersion
-
-
-class SpecialSectionIndexes(Enum):
-    SHN_UNDEF = 0
-    SHN_LOPROC = SHN_LORESERVE = 0xFF00
-    SHN_HIPROC = 0xFF1F
-    SHN_LOOS = 0xFF20
-    SHN_HIOS = 0xFF3F
-    SHN_ABS = 0xFFF1
-    SHN_COMMON = 0xFFF2
-    SHN_HIRESERVE = SHN_XINDEX = 0xFFFF
-
-
-class ProgramHeaderType(Enum):
-    PT_NULL = 0
-    PT_LOAD = 1
-    PT_DYNAMIC = 2
-    PT_INTERP = 3
-    PT_NOTE = 4
-    PT_SHLIB = 5
-    PT_PHDR = 6
-    PT_TLS = 7
-    PT_NUM = 8
-    PT_LOOS = 0x60000000
-    PT_GNU_EH_FRAME = 0x6474E550
-    PT_GNU_STACK = 0x6474E551
-    PT_GNU_RELRO = 0x6474E552
-    PT_HIOS = 0x6FFFFFFF
-    PT_LOPROC = 0x70000000
-    PT_HIPROC = 0x7FFFFFFF
-
-
-class ProgramHeaderFlags(Enum):
-    PF_EXECUTE = 1
-    PF_WRITE = 2
-    PF_READ = 3
-    PF_MASKOS = 0x0FF00000
-    PF_MASKPROC = 0xF0000000
-
-
-class SectionHeaderType(Enum):
-    SHT_NULL = 0
-    SHT_PROGBITS = 1
-    SHT_SYMTAB = 2
-    SHT_STRTAB = 3
-    SHT_RELA = 4
-    SHT_HASH = 5
-    SHT_DYNAMIC = 6
-    SHT_NOTE = 7
-    SHT_NOBITS = 8
-    SHT_REL = 9
-    SHT_SHLIB = 10
-    SHT_DYNSYM = 11
-    SHT_INIT_ARRAY = 14
-    SHT_FINI_ARRAY = 15
-    SHT_PREINIT_ARRAY = 16
-    SHT_GROUP = 17
-    SHT_SYMTAB_SHNDX = 18
-    SHT_NUM = 19
-    SHT_FILTER = 0x7FFFFFF
-    SHT_LOOS = 0x60000000
-    SHT_HIOS = 0x6FFFFFFF
-    SHT_VERSYM2 = 0x6FFFFFF0
-    SHT_GNU_ATTRIBUTES = 0x6FFFFFF5
-    SHT_GNU_HASH = 0x6FFFFFF6
-    SHT_GNU_LIBLIST = 0x6FFFFFF7
-    SHT_CHECKSUM = 0x6FFFFFF8
-    SHT_VERDEF = 0x6FFFFFFD
-    SHT_VERNEED = 0x6FFFFFFE
-    SHT_VERSYM1 = 0x6FFFFFFF
-    SHT_LOPROC = 0x70000000
-    SHT_AUXILIARY = 0x7FFFFFFD
-    SHT_HIPROC = 0x7FFFFFFF
-    SHT_LOUSER = 0x80000000
-    SHT_HIUSER = 0xFFFFFFFF
-
-
-class SectionAttributeFlags(Enum):
-    SHF_WRITE = 0x1
-    SHF_ALLOC = 0x2
-    SHF_EXECINSTR = 0x4
-    SHF_MERGE = 0x10
-    SHF_STRINGS = 0x20
-    SHF_INFO_LINK = 0x40
-    SHF_LINK_ORDER = 0x80
-    SHF_OS_NONCONFORMING = 0x100
-    SHF_GROUP = 0x200
-    SHF_TLS = 0x400
-    SHF_MASKOS = 0x0FF00000
-    SHF_MASKPROC = 0xF0000000
-
-
-class SectionGroupFlags(Enum):
-    GRP_COMDAT = 0x1
-    GRP_MASKOS = 0x0FF00000
-    GRP_MASKPROC = 0xF0000000
-
-
-class SymbolBinding(Enum):
-    STB_LOCAL = 0
-    STB_GLOBAL = 1
-    STB_WEAK = 2
-    STB_LOOS = 10
-    STB_HIOS = 12
-    STB_LOPROC = 13
-    STB_HIPROC = 15
-
-
-class SymbolType(Enum):
-    STT_NOTYPE = 0
-    STT_OBJECT = 1
-    STT_FUNC = 2
-    STT_SECTION = 3
-    STT_FILE = 4
-    STT_COMMON = 5
-    STT_TLS = 6
-    STT_RELC = 8
-    STT_SRELC = 9
-    STT_LOOS = 10
-    STT_HIOS = 12
-    STT_LOPROC = 13
-    STT_HIPROC = 15
-
-
-class SymbolVisibility(Enum):
-    STV_DEFAULT = 0
-    STV_INTERNAL = 1
-    STV_HIDDEN = 2
-    STV_PROTECTED = 3
-
-
-class DynamicType(Enum):
-    DT_NULL = _DynamicType(0, "ignored", "End of dynamic array")
-    DT_NEEDED = _DynamicType(1, "value", "Needed library name offset")
-    DT_PLTRELSZ = _DynamicType(2, "value", "Relocation entries size")
-    DT_PLTGOT = _DynamicType(3, "pointer", "Address procedure linkage table")
-    DT_HASH = _DynamicType(4, "pointer", "Address symbol hash table")
-    DT_STRTAB = _DynamicType(5, "pointer", "Address string table (.dynstr)")
-    DT_SYMTAB = _DynamicType(6, "pointer", "Address symbol table (.dynsym)")
-    DT_RELA = _DynamicType(7, "pointer", "Address relocation table")
-    DT_RELASZ = _DynamicType(8, "value", "Relocation table size")
-    DT_RELAENT = _DynamicType(9, "value", "Relocation entry size")
-    DT_STRSZ = _DynamicType(10, "value", "String table size")
-    DT_SYMENT = _DynamicType(11, "value", "Symbol table entry size")
-    DT_INIT = _DynamicType(12, "pointer", "Initialization function address")
-    DT_FINI = _DynamicType(13, "pointer", "Termination function address")
-    DT_SONAME = _DynamicType(14, "value", "Shared object name")
-    DT_RPATH = _DynamicType(15, "value", "Library search path string")
-    DT_SYMBOLIC = _DynamicType(16, "ignored", "Alters dynamic linker's symbol")
-    DT_REL = _DynamicType(17, "pointer", "Address relocation table")
-    DT_RELSZ = _DynamicType(18, "value", "Relocation table size")
-    DT_RELENT = _DynamicType(19, "value", "Relocation entry size")
-    DT_PLTREL = _DynamicType(20, "value", "Relocation entry type")
-    DT_DEBUG = _DynamicType(21, "pointer", "Used for debugging")
-    DT_TEXTREL = _DynamicType(
-        22, "ignored", "No relocation on non-writable segment"
-    )
-    DT_JMPREL = _DynamicType(23, "pointer", "Procedure linkage table")
-    DT_BIND_NOW = _DynamicType(24, "ignored", "Relocations before execution")
-    DT_INIT_ARRAY = _DynamicType(
-        25, "pointer", "Initialization functions pointers"
-    )
-    DT_FINI_ARRAY = _DynamicType(
-        26, "pointer", "Termination functions pointers"
-    )
-    DT_INIT_ARRAYSZ = _DynamicType(
-        27, "value", "Initialization functions number"
-    )
-    DT_FINI_ARRAYSZ = _DynamicType(28, "value", "Termination functions number")
-    DT_RUNPATH = _DynamicType(29, "value", "Library search path")
-    DT_FLAGS = _DynamicType(30, "value", "Flag values specific")
-    DT_ENCODING = _DynamicType(
-        32, "unspecified", "Values interpretation rules"
-    )
-    DT_PREINIT_ARRAY = _DynamicType(
-        32, "pointer", "Pre-initialization functions"
-    )
-    DT_PREINIT_ARRAYSZ = _DynamicType(33, "value", "Pre-init functions size")
-    DT_LOOS = _DynamicType(
-        0x6000000D, "unspecified", "System-specific semantics"
-    )
-    DT_HIOS = _DynamicType(
-        0x6FFFF000, "unspecified", "System-specific semantics"
-    )
-    DT_LOPROC = _DynamicType(
-        0x70000000, "unspecified", "Processor-specific semantics"
-    )
-    DT_HIPROC = _DynamicType(
-        0x7FFFFFFF, "unspecified", "Processor-specific semantics"
-    )
-
-
-class DynamicFlags(Enum):
-    DF_ORIGIN = _DynamicFlags(0x1, "Load libraries using filepath")
-    DF_SYMBOLIC = _DynamicFlags(0x2, "Link start with object itself")
-    DF_TEXTREL = _DynamicFlags(0x4, "No relocation on non-writable segment")
-    DF_BIND_NOW = _DynamicFlags(0x8, "Relocations before execution")
-    DF_STATIC_TLS = _DynamicFlags(0x10, "This object can't be link")
-
-
-@structure
-class ElfIdent:
-    ei_mag: c_char * 4
-    ei_class: c_ubyte
-    ei_data: c_ubyte
-    ei_version: c_ubyte
-    ei_osabi: c_ubyte
-    ei_abiversion: c_ubyte
-    ei_pad: c_char
-    ei_nident: c_char * 6
-
-
-@structure
-class ElfHeader32:
-    e_ident: ElfIdent
-    e_type: Elf32_Half
-    e_machine: Elf32_Half
-    e_version: Elf32_Word
-    e_entry: Elf32_Addr
-    e_phoff: Elf32_Off
-    e_shoff: Elf32_Off
-    e_flags: Elf32_Word
-    e_ehsize: Elf32_Half
-    e_phentsize: Elf32_Half
-    e_phnum: Elf32_Half
-    e_shentsize: Elf32_Half
-    e_shnum: Elf32_Half
-    e_shstrndx: Elf32_Half
-
-
-@structure
-class ElfHeader64:
-    e_ident: ElfIdent
-    e_type: Elf64_Half
-    e_machine: Elf64_Half
-    e_version: Elf64_Word
-    e_entry: Elf64_Addr
-    e_phoff: Elf64_Off
-    e_shoff: Elf64_Off
-    e_flags: Elf64_Word
-    e_ehsize: Elf64_Half
-    e_phentsize: Elf64_Half
-    e_phnum: Elf64_Half
-    e_shentsize: Elf64_Half
-    e_shnum: Elf64_Half
-    e_shstrndx: Elf64_Half
-
-
-@structure
-class ProgramHeader32:
-    p_type: Elf32_Word
-    p_offset: Elf32_Off
-    p_vaddr: Elf32_Addr
-    p_paddr: Elf32_Addr
-    p_filesz: Elf32_Word
-    p_memsz: Elf32_Word
-    p_flags: Elf32_Word
-    p_align: Elf32_Word
-
-
-@structure
-class ProgramHeader64:
-    p_type: Elf64_Word
-    p_flags: Elf64_Word
-    p_offset: Elf64_Off
-    p_vaddr: Elf64_Addr
-    p_paddr: Elf64_Addr
-    p_filesz: Elf64_Xword
-    p_memsz: Elf64_Xword
-    p_align: Elf64_Xword
-
-
-@structure
-class SectionHeader32:
-    sh_name: Elf32_Word
-    sh_type: Elf32_Word
-    sh_flags: Elf32_Word
-    sh_addr: Elf32_Addr
-    sh_offset: Elf32_Off
-    sh_size: Elf32_Word
-    sh_link: Elf32_Word
-    sh_info: Elf32_Word
-    sh_addralign: Elf32_Word
-    sh_entsize: Elf32_Word
-
-
-@structure
-class SectionHeader64:
-    sh_name: Elf64_Word
-    sh_type: Elf64_Word
-    sh_flags: Elf64_Xword
-    sh_addr: Elf64_Addr
-    sh_offset: Elf64_Off
-    sh_size: Elf64_Xword
-    sh_link: Elf64_Word
-    sh_info: Elf64_Word
-    sh_addralign: Elf64_Xword
-    sh_entsize: Elf64_Xword
-
-
-@structure
-class SymbolTableEntry32:
-    st_name: Elf32_Word
-    st_value: Elf32_Addr
-    st_size: Elf32_Word
-    st_info: c_byte
-    st_other: c_byte
-    st_shndx: Elf32_Half
-
-
-@structure
-class SymbolTableEntry64:
-    st_name: Elf64_Word
-    st_info: c_byte
-    st_other: c_byte
-    st_shndx: Elf64_Half
-    st_value: Elf64_Addr
-    st_size: Elf32_Xword
-
-
-@structure
-class RelocationEntries32:
-    r_offset: Elf32_Addr
-    r_info: Elf32_Word
-
-
-@structure
-class RelocationEntriesAddend32:
-    r_offset: Elf32_Addr
-    r_info: Elf32_Word
-    r_addend: Elf32_Sword
-
-
-@structure
-class RelocationEntries64:
-    r_offset: Elf64_Addr
-    r_info: Elf64_Xword
-
-
-@structure
-class RelocationEntriesAddend64:
-    r_offset: Elf64_Addr
-    r_info: Elf64_Xword
-    r_addend: Elf32_Sxword
-
-
-@structure
-class Note32:
-    name_size: Elf32_Word
-    descriptor_size: Elf32_Word
-    type: Elf32_Word
-
-
-@structure
-class Note64:
-    name_size: Elf64_Word
-    descriptor_size: Elf64_Word
-    type: Elf64_Word
-
-
-@structure
-class Dynamic32:
-    dynamic_tag: Elf32_Sword
-    dynamic_value: Elf32_Word
-
-
-@structure
-class Dynamic64:
-    dynamic_tag: Elf64_Sxword
-    dynamic_value: Elf64_Xword
-
-
-sections_description = {
-    ".bss": "Uninitialized data",
-    ".comment": "Version control information",
-    ".data": "Initialized data",
-    ".data1": "Initialized data",
-    ".debug": "Symbolic debugging information",
-    ".dynamic": "Dynamic linking information",
-    ".dynstr": "Dynamic linking strings",
-    ".dynsym": "Dynamic linking symbol table",
-    ".fini": "Process termination code",
-    ".fini_array": "Termination function pointers",
-    ".got": "Global offset table",
-    ".hash": "Symbol hash table",
-    ".init": "Process initialization code",
-    ".init_array": "Initialization function pointers",
-    ".interp": "Program interpreter",
-    ".line": "Line number for debugging",
-    ".note": "Specific vendor information",
-    ".plt": "Procedure linkage table",
-    ".preinit_array": "Pre-initialization functions",
-    ".rel": "Relocation information,",
-    ".rodata": "Read-only data",
-    ".rodata1": "Read-only data",
-    ".shstrtab": "Section names",
-    ".strtab": "Strings (symbol table)",
-    ".symtab": "Symbol table",
-    ".symtab_shndx": "Special symbol table",
-    ".tbss": "Uninitialized thread-local data",
-    ".tdata": "Initialized thread-local data",
-    ".text": "Executable instruction",
-}
-
-
-def enum_from_value(value: _CData, enum_class: Enum) -> Field:
-    """
-    This function returns a Field with Enum name and value.
-    """
-
-    for constant in enum_class:
-        if constant.value == value.value:
-            return Field(
-                value,
-                constant.name,
-                getattr(constant.value, "usage", None),
-                getattr(constant.value, "description", None),
-            )
-    return Field(value, "UNDEFINED")
-
-
-def enum_from_flags(value: _CData, enum_class: Enum) -> Iterable[Field]:
-    """
-    This function yields Fields with Enum name and value.
-    """
-
-    for constant in enum_class:
-        if constant.value & value.value:
-            yield Field(
-                value,
-                constant.name,
-                getattr(constant.value, "usage", None),
-                getattr(constant.value, "description", None),
-            )
-
-
-def parse_from_structure(file: _BufferedIOBase, structure: type) -> Structure:
-    """
-    This function reads file and parse readed data
-    to Structure and returns it.
-    """
-
-    return structure(file.read(sizeof(structure)))
-
-
-def read_until(file: _BufferedIOBase, end_data: bytes) -> bytes:
-    """
-    This function reads file until data end doesn't match the end_data params.
-    """
-
-    old_position = file.tell()
-    data = file.read(1)
-    position = file.tell()
-    while not data.endswith(end_data) and old_position < position:
-        old_position = position
-        data += file.read(1)
-        position = file.tell()
-
-    return data
-
-
-def read_string(file: _BufferedIOBase) -> c_char_p:
-    """
-    This function reads file a NULL terminating string from file position.
-    """
-
-    return c_char_p(read_until(file, b"\0"))
-
-
-def get_padding_length(data_size: int, padding_to: int) -> int:
-    """
-    This function returns the padding length for this field.
-    """
-
-    padding_length = data_size % padding_to
-    return padding_to - padding_length if padding_length else 0
-
-
-def start_printable() -> None:
-    """
-    This function starts printing.
-    """
-
-    print(
-        "\x1b[38;2;183;121;227m"
-        + "Data name".ljust(25)
-        + "\x1b[38;2;255;240;175m"
-        + "Position".ljust(20)
-        + "\x1b[38;2;255;208;11m"
-        + "Data hexadecimal".ljust(40)
-        + "\x1b[38;2;212;171;242m"
-        + "Data".ljust(20)
-        + "\x1b[38;2;201;247;87m"
-        + "Information"
-        + "\x1b[39m\n"
-    )
-
-
-def main() -> int:
-    """
-    This function runs the script from the command line.
-    """
-
-    url = False
-    verbose = False
-    no_color = False
-
-    if "-u" in argv:
-        argv.remove("-u")
-        url = True
-
-    if "-v" in argv:
-        argv.remove("-v")
-        verbose = True
-
-    if "-c" in argv:
-        argv.remove("-c")
-        no_color = True
-
-    if len(argv) != 2:
-        print(
-            f'USAGES: "{executable}" "{argv[0]}" [-c(no '
-            "color)] [-v(verbose)] [-u(url)] ElfFile",
-            file=stderr,
-        )
-        return 1
-
-    file = (
-        BytesIO(data := urlopen(argv[1]).read())
-        if url
-        else open(argv[1], "rb")
-    )
-    filesize = len(data) if url else getsize(argv[1])
-
-    Data.verbose = verbose
-    Data.no_color = no_color
-
-    (
-        elfindent,
-        elf_headers,
-        programs_headers,
-        elf_sections,
-        symbols_tables,
-        comments,
-        note_sections,
-        notes,
-        dynamics,
-        sections,
-    ) = parse_elffile(file)
-    cli(
-        elfindent,
-        elf_headers,
-        programs_headers,
-        elf_sections,
-        symbols_tables,
-        comments,
-        notes,
-        dynamics,
-        sections,
-    )
-
-    if entropy_charts_import:
-        file.seek(0)
-        charts_chunks_file_entropy(
-            file,
-            part_size=round(filesize / 100),
-            sections=sections,
-        )
-
-    file.close()
-    return 0
-
-
-def cli(
-    elf_ident: ElfIdent,
-    elf_header: Union[ElfHeader32, ElfHeader64],
-    elf_tables: List[Union[ProgramHeader32, ProgramHeader64]],
-    elf_sections: List[Union[SectionHeader32, SectionHeader64]],
-    symbols: List[Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]],
-    comments: List[bytes],
-    note_sections: List[Union[SectionHeader32, SectionHeader64]],
-    dynamicStructures: List[Union[Dynamic32, Dynamic64]],
-    sections: List[Section],
-) -> None:
-    """
-    This function prints results in CLI.
-    """
-
-    Title("ELF identification").print()
-
-    Data(
-        "Magic bytes",
-        elf_ident.ei_mag.value._start_position_,
-        elf_ident.ei_mag.value._end_position_,
-        elf_ident.ei_mag.value.value,
-        elf_ident.ei_mag.information,
-    ).print()
-
-    Data(
-        "ELF class",
-        elf_ident.ei_class.value._start_position_,
-        elf_ident.ei_class.value._end_position_,
-        elf_ident.ei_class.value._data_,
-        f"{elf_ident.ei_class.information} ({elf_ident.ei_class.value.value})",
-    ).print()
-
-    Data(
-        "ELF data",
-        elf_ident.ei_data.value._start_position_,
-        elf_ident.ei_data.value._end_position_,
-        elf_ident.ei_data.value._data_,
-        f"{elf_ident.ei_data.information} ({elf_ident.ei_data.value.value})",
-    ).print()
-
-    Data(
-        "ELF version",
-        elf_ident.ei_version.value._start_position_,
-        elf_ident.ei_version.value._end_position_,
-        elf_ident.ei_version.value._data_,
-        elf_ident.ei_version.information
-        + f" ({elf_ident.ei_version.value.value})",
-    ).print()
-
-    Data(
-        "ELF operating system",
-        elf_ident.ei_osabi.value._start_position_,
-        elf_ident.ei_osabi.value._end_position_,
-        elf_ident.ei_osabi.value._data_,
-        elf_ident.ei_osabi.information
-        + f" ({elf_ident.ei_osabi.value.value})",
-        False,
-    ).print()
-
-    Data(
-        "ELF defined OS",
-        elf_ident.ei_abiversion.value._start_position_,
-        elf_ident.ei_abiversion.value._end_position_,
-        elf_ident.ei_abiversion.value._data_,
-        elf_ident.ei_abiversion.information
-        + f" ({elf_ident.ei_abiversion.value.value})",
-    ).print()
-
-    Data(
-        "ELF start padding",
-        elf_ident.ei_pad.value._start_position_,
-        elf_ident.ei_pad.value._end_position_,
-        elf_ident.ei_pad.value._data_,
-        elf_ident.ei_pad.information,
-    ).vprint()
-
-    Data(
-        "ELF padding",
-        elf_ident.ei_nident.value._start_position_,
-        elf_ident.ei_nident.value._end_position_,
-        elf_ident.ei_nident.value._data_,
-        elf_ident.ei_nident.information,
-    ).vprint()
-
-    Title("ELF headers").print()
-
-    Data(
-        "ELF type",
-        elf_header.e_type.value._start_position_,
-        elf_header.e_type.value._end_position_,
-        elf_header.e_type.value._data_,
-        f"{elf_header.e_type.information} ({elf_header.e_type.value.value})",
-    ).print()
-
-    Data(
-        "ELF machine",
-        elf_header.e_machine.value._start_position_,
-        elf_header.e_machine.value._end_position_,
-        elf_header.e_machine.value._data_,
-        elf_header.e_machine.information
-        + f" ({elf_header.e_machine.value.value})",
-        False,
-    ).print()
-
-    Data(
-        "ELF version",
-        elf_header.e_version.value._start_position_,
-        elf_header.e_version.value._end_position_,
-        elf_header.e_version.value._data_,
-        elf_header.e_version.information
-        + f" ({elf_header.e_version.value.value})",
-    ).print()
-
-    Data(
-        "ELF entry point",
-        elf_header.e_entry.value._start_position_,
-        elf_header.e_entry.value._end_position_,
-        elf_header.e_entry.value._data_,
-        f"{elf_header.e_entry.information} ({elf_header.e_entry.value.value})",
-    ).print()
-
-    Data(
-        "ELF header table offset",
-        elf_header.e_phoff.value._start_position_,
-        elf_header.e_phoff.value._end_position_,
-        elf_header.e_phoff.value._data_,
-        f"{elf_header.e_phoff.information} ({elf_header.e_phoff.value.value})",
-    ).vprint()
-
-    Data(
-        "ELF section table offset",
-        elf_header.e_shoff.value._start_position_,
-        elf_header.e_shoff.value._end_position_,
-        elf_header.e_shoff.value._data_,
-        f"{elf_header.e_shoff.information} ({elf_header.e_shoff.value.value})",
-    ).vprint()
-
-    Data(
-        "ELF processor specific",
-        elf_header.e_flags.value._start_position_,
-        elf_header.e_flags.value._end_position_,
-        elf_header.e_flags.value._data_,
-        f"{elf_header.e_flags.information} ({elf_header.e_flags.value.value})",
-    ).print()
-
-    Data(
-        "ELF header's size",
-        elf_header.e_ehsize.value._start_position_,
-        elf_header.e_ehsize.value._end_position_,
-        elf_header.e_ehsize.value._data_,
-        elf_header.e_ehsize.information
-        + f" ({elf_header.e_ehsize.value.value})",
-        False,
-    ).print()
-
-    Data(
-        "ELF entry header size",
-        elf_header.e_phentsize.value._start_position_,
-        elf_header.e_phentsize.value._end_position_,
-        elf_header.e_phentsize.value._data_,
-        elf_header.e_phentsize.information
-        + f" ({elf_header.e_phentsize.value.value})",
-    ).print()
-
-    Data(
-        "ELF header entry length",
-        elf_header.e_phnum.value._start_position_,
-        elf_header.e_phnum.value._end_position_,
-        elf_header.e_phnum.value._data_,
-        f"{elf_header.e_phnum.information} ({elf_header.e_phnum.value.value})",
-    ).print()
-
-    Data(
-        "ELF entry section size",
-        elf_header.e_shentsize.value._start_position_,
-        elf_header.e_shentsize.value._end_position_,
-        elf_header.e_shentsize.value._data_,
-        elf_header.e_shentsize.information
-        + f" ({elf_header.e_shentsize.value.value})",
-    ).print()
-
-    Data(
-        "ELF section entry length",
-        elf_header.e_shnum.value._start_position_,
-        elf_header.e_shnum.value._end_position_,
-        elf_header.e_shnum.value._data_,
-        f"{elf_header.e_shnum.information} ({elf_header.e_shnum.value.value})",
-    ).print()
-
-    Data(
-        "Section header table",
-        elf_header.e_shstrndx.value._start_position_,
-        elf_header.e_shstrndx.value._end_position_,
-        elf_header.e_shstrndx.value._data_,
-        elf_header.e_shstrndx.information
-        + f" ({elf_header.e_shstrndx.value.value})",
-    ).print()
-
-    Title("ELF header table").print()
-
-    for elf_table in elf_tables:
-        Data(
-            "Program header type",
-            elf_table.p_type.value._start_position_,
-            elf_table.p_type.value._end_position_,
-            elf_table.p_type.value._data_,
-            f"{elf_table.p_type.information} ({elf_table.p_type.value.value})",
-            False,
-        ).print()
-
-        for flags in elf_table.flags:
-            Data(
-                "Program header flags",
-                flags.value._start_position_,
-                flags.value._end_position_,
-                flags.value._data_,
-                f"{flags.information} ({flags.value.value})",
-                False,
-            ).print()
-
-        Data(
-            "Program header address",
-            elf_table.p_offset.value._start_position_,
-            elf_table.p_offset.value._end_position_,
-            elf_table.p_offset.value._data_,
-            elf_table.p_offset.information
-            + f" ({elf_table.p_offset.value.value})",
-        ).print()
-
-        Data(
-            "Virtual address memory",
-            elf_table.p_vaddr.value._start_position_,
-            elf_table.p_vaddr.value._end_position_,
-            elf_table.p_vaddr.value._data_,
-            elf_table.p_vaddr.information
-            + f" ({elf_table.p_vaddr.value.value})",
-        ).vprint()
-
-        Data(
-            "Physical address",
-            elf_table.p_paddr.value._start_position_,
-            elf_table.p_paddr.value._end_position_,
-            elf_table.p_paddr.value._data_,
-            elf_table.p_paddr.information
-            + f" ({elf_table.p_paddr.value.value})",
-        ).vprint()
-
-        Data(
-            "Segment length file",
-            elf_table.p_filesz.value._start_position_,
-            elf_table.p_filesz.value._end_position_,
-            elf_table.p_filesz.value._data_,
-            elf_table.p_filesz.information
-            + f" ({elf_table.p_filesz.value.value})",
-        ).print()
-
-        Data(
-            "Segment length memory",
-            elf_table.p_memsz.value._start_position_,
-            elf_table.p_memsz.value._end_position_,
-            elf_table.p_memsz.value._data_,
-            elf_table.p_memsz.information
-            + f" ({elf_table.p_memsz.value.value})",
-        ).print()
-
-        Data(
-            "Segment alignment",
-            elf_table.p_align.value._start_position_,
-            elf_table.p_align.value._end_position_,
-            elf_table.p_align.value._data_,
-            elf_table.p_align.information
-            + f" ({elf_table.p_align.value.value})",
-        ).print()
-
-    Title("ELF section table").print()
-
-    for elf_section in elf_sections:
-        Data(
-            "Name: " + elf_section.name,
-            elf_section.name._start_position_,
-            elf_section.name._end_position_,
-            elf_section.name._data_,
-            sections_description.get(
-                "." + elf_section.name.split(".")[1]
-                if "." in elf_section.name
-                else "",
-                "Undefined section role.",
-            ),
-            False,
-        ).print()
-
-        Data(
-            "Section name position",
-            elf_section.sh_name.value._start_position_,
-            elf_section.sh_name.value._end_position_,
-            elf_section.sh_name.value._data_,
-            elf_section.sh_name.information
-            + f" ({elf_section.sh_name.value.value})",
-        ).vprint()
-
-        Data(
-            "Section type",
-            elf_section.sh_type.value._start_position_,
-            elf_section.sh_type.value._end_position_,
-            elf_section.sh_type.value._data_,
-            elf_section.sh_type.information
-            + f" ({elf_section.sh_type.value.value})",
-            False,
-        ).print()
-
-        for flag in elf_section.flags:
-            Data(
-                "Section flags",
-                flag.value._start_position_,
-                flag.value._end_position_,
-                flag.value._data_,
-                f"{flag.information} ({flag.value.value})",
-                False,
-            ).print()
-
-        Data(
-            "Section memory address",
-            elf_section.sh_addr.value._start_position_,
-            elf_section.sh_addr.value._end_position_,
-            elf_section.sh_addr.value._data_,
-            elf_section.sh_addr.information
-            + f" ({elf_section.sh_addr.value.value})",
-        ).vprint()
-
-        Data(
-            "Section offset",
-            elf_section.sh_offset.value._start_position_,
-            elf_section.sh_offset.value._end_position_,
-            elf_section.sh_offset.value._data_,
-            elf_section.sh_offset.information
-            + f" ({elf_section.sh_offset.value.value})",
-        ).print()
-
-        Data(
-            "Section size",
-            elf_section.sh_size.value._start_position_,
-            elf_section.sh_size.value._end_position_,
-            elf_section.sh_size.value._data_,
-            elf_section.sh_size.information
-            + f" ({elf_section.sh_size.value.value})",
-        ).print()
-
-        Data(
-            "Section link",
-            elf_section.sh_link.value._start_position_,
-            elf_section.sh_link.value._end_position_,
-            elf_section.sh_link.value._data_,
-            elf_section.sh_link.information
-            + f" ({elf_section.sh_link.value.value})",
-        ).print()
-
-        Data(
-            "Section info",
-            elf_section.sh_info.value._start_position_,
-            elf_section.sh_info.value._end_position_,
-            elf_section.sh_info.value._data_,
-            elf_section.sh_info.information
-            + f" ({elf_section.sh_info.value.value})",
-        ).print()
-
-        Data(
-            "Section alignment",
-            elf_section.sh_addralign.value._start_position_,
-            elf_section.sh_addralign.value._end_position_,
-            elf_section.sh_addralign.value._data_,
-            elf_section.sh_addralign.information
-            + f" ({elf_section.sh_addralign.value.value})",
-        ).vprint()
-
-        Data(
-            "Symbol table entry size",
-            elf_section.sh_entsize.value._start_position_,
-            elf_section.sh_entsize.value._end_position_,
-            elf_section.sh_entsize.value._data_,
-            elf_section.sh_entsize.information
-            + f" ({elf_section.sh_entsize.value.value})",
-        ).print()
-
-    precedent_name = ""
-
-    for name, symbol in symbols:
-        if name != precedent_name:
-            Title("Symbol tables " + name).print()
-            precedent_name = name
-
-        Data(
-            "Symbol value",
-            symbol.st_value.value._start_position_,
-            symbol.st_value.value._end_position_,
-            symbol.st_value.value._data_,
-            f"{symbol.st_value.information} ({symbol.st_value.value.value})",
-            False,
-        ).print()
-
-        Data(
-            "Associated sizes",
-            symbol.st_size.value._start_position_,
-            symbol.st_size.value._end_position_,
-            symbol.st_size.value._data_,
-            f"{symbol.st_size.information} ({symbol.st_size.value.value})",
-            False,
-        ).print()
-
-        Data(
-            "Section header index",
-            symbol.st_shndx.value._start_position_,
-            symbol.st_shndx.value._end_position_,
-            symbol.st_shndx.value._data_,
-            symbol.st_shndx.information
-            + (" exported" if symbol.st_shndx.value.value else " imported")
-            + " ("
-            + (
-                elf_sections[symbol.st_shndx.value.value].name
-                if len(elf_sections) > symbol.st_shndx.value.value
-                else str(symbol.st_shndx.value.value)
-            )
-            + ")",
-            False,
-        ).print()
-
-        Data(
-            "Symbol binding",
-            symbol.st_info._start_position_,
-            symbol.st_info._end_position_,
-            symbol.st_info._data_,
-            f"{symbol.st_bind.information} ({symbol.st_bind.value.value})",
-            False,
-        ).print()
-
-        Data(
-            "Symbol type",
-            symbol.st_info._start_position_,
-            symbol.st_info._end_position_,
-            symbol.st_info._data_,
-            f"{symbol.st_type.information} ({symbol.st_type.value.value})",
-            False,
-        ).print()
-
-        Data(
-            "Symbol visibility",
-            symbol.st_other._start_position_,
-            symbol.st_other._end_position_,
-            symbol.st_other._data_,
-            symbol.st_visibility.information
-            + f" ({symbol.st_visibility.value.value})",
-            False,
-        ).print()
-
-        Data(
-            "Symbol name",
-            symbol.name._start_position_,
-            symbol.name._end_position_,
-            symbol.name._data_,
-            "Name: " + symbol.name,
-            False,
-        ).print()
-
-    first = True
-    for data in comments:
-        if first:
-            Title("Comment section").print()
-            first = False
-
-        Data(
-            "Version control info",
-            data._start_position_,
-            data._end_position_,
-            data,
-            data.string,
-            False,
-        ).print()
-
-    first = True
-    for note in note_sections:
-        if first:
-            Title("Note sections").print()
-            first = False
-
-        Data(
-            "Note name size",
-            note.name_size._start_position_,
-            note.name_size._end_position_,
-            note.name_size._data_,
-            f"Note name size ({note.name_size.value})",
-            False,
-        ).print()
-
-        Data(
-            "Descriptor size",
-            note.descriptor_size._start_position_,
-            note.descriptor_size._end_position_,
-            note.descriptor_size._data_,
-            f"Note descriptor size ({note.descriptor_size.value})",
-            False,
-        ).print()
-
-        Data(
-            "Note type",
-            note.type._start_position_,
-            note.type._end_position_,
-            note.type._data_,
-            f"Note type ({note.type.value})",
-            False,
-        ).print()
-
-        Data(
-            "Note name",
-            note.name._start_position_,
-            note.name._end_position_,
-            note.name,
-            note.name.string,
-            False,
-        ).print()
-
-        Data(
-            "Note descriptor",
-            note.descriptor._start_position_,
-            note.descriptor._end_position_,
-            note.descriptor,
-            "",
-            False,
-        ).print()
-
-    first = True
-    for dynamic in dynamicStructures:
-        if first:
-            Title("Dynamic section").print()
-            first = False
-
-        Data(
-            f"Tag {dynamic.dynamic_tag.information}",
-            dynamic.dynamic_tag._start_position_,
-            dynamic.dynamic_tag._end_position_,
-            dynamic.dynamic_tag.value._data_,
-            str(dynamic.dynamic_tag.description),
-            False,
-        ).print()
-
-        if dynamic.dynamic_tag.value.value != DynamicType.DT_FLAGS.value:
-            Data(
-                (
-                    "Address"
-                    if dynamic.dynamic_tag.usage == "pointer"
-                    else "Value"
-                ),
-                dynamic.dynamic_value._start_position_,
-                dynamic.dynamic_value._end_position_,
-                dynamic.dynamic_value._data_,
-                str(dynamic.dynamic_value.value),
-                False,
-            ).print()
-        else:
-            for flag in dynamic.dynamic_value.flags:
-                Data(
-                    "Flags " + str(flag.value.value),
-                    flag._start_position_,
-                    flag._end_position_,
-                    flag.value._data_,
-                    flag.description,
-                    False,
-                ).print()
-
-
-def parse_elffile(
-    file: _BufferedIOBase,
-) -> Tuple[
-    ElfIdent,
-    Union[ElfHeader32, ElfHeader64],
-    List[Union[ProgramHeader32, ProgramHeader64]],
-    List[Union[SectionHeader32, SectionHeader64]],
-    List[Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]],
-    List[bytes],
-    List[Union[SectionHeader32, SectionHeader64]],
-    List[Union[Note32, Note64]],
-    List[Union[Dynamic32, Dynamic64]],
-    List[Section],
-]:
-    """
-    This function parses ELF file.
-    """
-
-    elfindent, elf_classe = parse_elfidentification(file)
-    elf_headers = parse_elfheaders(file, elf_classe)
-    programs_headers = [*parse_programheaders(file, elf_headers, elf_classe)]
-    (
-        elf_sections,
-        strtab_section,
-        symtab_section,
-        dynstr_section,
-        dynsym_section,
-        comment_section,
-        dynamic_section,
-        note_sections,
-        sections,
-    ) = parse_elfsections(file, elf_headers, elf_classe)
-    symbols_tables = [
-        *parse_elfsymbolstable(
-            file,
-            dynsym_section,
-            dynstr_section,
-            symtab_section,
-            strtab_section,
-            elf_classe,
-        )
-    ]
-    comments = [*parse_elfcomment(file, comment_section)]
-    notes = [*parse_elfnote(file, note_sections, elf_classe)]
-    dynamics = [*parse_elfdynamic(file, dynamic_section, elf_classe)]
-    return (
-        elfindent,
-        elf_headers,
-        programs_headers,
-        elf_sections,
-        symbols_tables,
-        comments,
-        note_sections,
-        notes,
-        dynamics,
-        sections,
-    )
-
-
-def parse_elfidentification(file: _BufferedIOBase) -> Tuple[ElfIdent, str]:
-    """
-    This function parses ELF identification headers.
-    """
-
-    elf_ident = parse_from_structure(file, ElfIdent)
-    elf_ident.ei_mag = Field(
-        elf_ident.ei_mag,
-        "ELF magic bytes"
-        if elf_ident.ei_mag.value == b"\x7fELF"
-        else "Invalid magic bytes",
-    )
-
-    elf_ident.ei_class = enum_from_value(elf_ident.ei_class, ELfIdentClass)
-    elf_classe = "64" if elf_ident.ei_class.value.value == 2 else "32"
-    elf_ident.ei_data = enum_from_value(elf_ident.ei_data, ELfIdentData)
-
-    DataToCClass.order = (
-        "little" if elf_ident.ei_data.value.value == 1 else "big"
-    )
-    elf_ident.ei_version = enum_from_value(
-        elf_ident.ei_version, ELfIdentVersion
-    )
-    elf_ident.ei_osabi = enum_from_value(elf_ident.ei_osabi, ELfIdentOS)
-
-    elf_ident.ei_abiversion = Field(
-        elf_ident.ei_abiversion,
-        "OS specified" if elf_ident.ei_abiversion else "OS unspecified",
-    )
-
-    elf_ident.ei_pad = Field(elf_ident.ei_pad, "Start padding")
-    elf_ident.ei_nident = Field(elf_ident.ei_nident, "Padding")
-
-    return elf_ident, elf_classe
-
-
-def parse_elfheaders(
-    file: _BufferedIOBase, elf_classe: str
-) -> Union[ElfHeader32, ElfHeader64]:
-    """
-    This function parses ELF headers.
-    """
-
-    file.seek(0)
-
-    elf_header = parse_from_structure(
-        file, globals()["ElfHeader" + elf_classe]
-    )
-
-    elf_header.e_type = enum_from_value(elf_header.e_type, ElfType)
-    elf_header.e_machine = enum_from_value(elf_header.e_machine, ElfMachine)
-    elf_header.e_version = enum_from_value(elf_header.e_version, ElfVersion)
-
-    elf_header.e_entry = Field(
-        elf_header.e_entry,
-        "Entry point" if elf_header.e_entry else "No entry point",
-    )
-
-    elf_header.e_phoff = Field(
-        elf_header.e_phoff,
-        "Program header table offset"
-        if elf_header.e_phoff
-        else "No program header table",
-    )
-
-    elf_header.e_shoff = Field(
-        elf_header.e_shoff,
-        "Section table offset" if elf_header.e_shoff else "No header table",
-    )
-
-    elf_header.e_flags = Field(elf_header.e_flags, "Processor specific flags")
-    elf_header.e_ehsize = Field(elf_header.e_ehsize, "ELF header's size")
-
-    elf_header.e_phentsize = Field(
-        elf_header.e_phentsize, "Entry header table size"
-    )
-
-    elf_header.e_phnum = Field(elf_header.e_phnum, "Header table entry number")
-
-    elf_header.e_shentsize = Field(
-        elf_header.e_shentsize, "Entry section header's size"
-    )
-
-    elf_header.e_shnum = Field(
-        elf_header.e_shnum, "Section header entry number"
-    )
-
-    elf_header.e_shstrndx = Field(
-        elf_header.e_shstrndx, "Section header table address"
-    )
-
-    return elf_header
-
-
-def parse_programheaders(
-    file: _BufferedIOBase,
-    elf_header: Union[ElfHeader32, ElfHeader64],
-    elf_classe: str,
-) -> Iterable[Union[ProgramHeader32, ProgramHeader64]]:
-    """
-    This function parses program headers.
-    """
-
-    file.seek(elf_header.e_phoff.value.value)
-
-    for _ in range(elf_header.e_phnum.value.value):
-        elf_table = parse_from_structure(
-            file, globals()["ProgramHeader" + elf_classe]
-        )
-
-        elf_table.p_type = enum_from_value(elf_table.p_type, ProgramHeaderType)
-        elf_table.flags = [
-            *enum_from_flags(elf_table.p_flags, ProgramHeaderFlags)
-        ]
-
-        elf_table.p_offset = Field(
-            elf_table.p_offset, "Program header file position"
-        )
-
-        elf_table.p_vaddr = Field(
-            elf_table.p_vaddr, "Program header virtual position"
-        )
-
-        elf_table.p_paddr = Field(
-            elf_table.p_paddr, "Program header physical position"
-        )
-
-        elf_table.p_filesz = Field(
-            elf_table.p_filesz, "Segment size in bytes in file image"
-        )
-
-        elf_table.p_memsz = Field(
-            elf_table.p_memsz, "Segment size in bytes in memory image"
-        )
-
-        elf_table.p_align = Field(
-            elf_table.p_align,
-            "No segment alignment"
-            if elf_table.p_align.value in (0, 1)
-            else "Segment alignment",
-        )
-
-        yield elf_table
-
-
-def parse_elfsections(
-    file: _BufferedIOBase,
-    elf_header: Union[ElfHeader32, ElfHeader64],
-    elf_classe: str,
-) -> Tuple[
-    List[Union[SectionHeader32, SectionHeader64]],
-    Union[SectionHeader32, SectionHeader64, None],
-    Union[SectionHeader32, SectionHeader64, None],
-    Union[SectionHeader32, SectionHeader64, None],
-    Union[SectionHeader32, SectionHeader64, None],
-    Union[SectionHeader32, SectionHeader64, None],
-    Union[SectionHeader32, SectionHeader64, None],
-    List[Union[SectionHeader32, SectionHeader64]],
-    List[Section],
-]:
-    """
-    This function parses ELK sections.
-    """
-
-    file.seek(elf_header.e_shoff.value.value)
-
-    elf_sections = [
-        parse_from_structure(file, globals()["SectionHeader" + elf_classe])
-        for _ in range(elf_header.e_shnum.value.value)
-    ]
-    sections = []
-    headers_names_table_address = elf_sections[
-        elf_header.e_shstrndx.value.value
-    ].sh_offset.value
-    strtab_section = None
-    symtab_section = None
-    dynstr_section = None
-    dynsym_section = None
-    comment_section = None
-    note_sections = []
-    dynamic_section = None
-
-    for elf_section in elf_sections:
-        position = file.tell()
-        file.seek(headers_names_table_address + elf_section.sh_name.value)
-        name = read_string(file)
-        elf_section.name = FileString(name.value.decode("latin-1"))
-        elf_section.name._start_position_ = (
-            headers_names_table_address + elf_section.sh_name.value
-        )
-        elf_section.name._end_position_ = file.tell()
-        elf_section.name._data_ = name.value + b"\0"
-        file.seek(position)
-
-        if elf_section.name == ".strtab":
-            strtab_section = elf_section
-
-        if elf_section.name == ".symtab":
-            symtab_section = elf_section
-
-        if elf_section.name == ".dynstr":
-            dynstr_section = elf_section
-
-        if elf_section.name == ".dynsym":
-            dynstr_section = elf_section
-
-        if elf_section.name == ".comment":
-            comment_section = elf_section
-
-        if elf_section.name == ".dynamic":
-            dynamic_section = elf_section
-
-        if elf_section.name.startswith(".note"):
-            note_sections.append(elf_section)
-
-        if entropy_charts_import:
-            sections.append(
-                Section(
-                    elf_section.name,
-                    elf_section.sh_offset.value,
-                    elf_section.sh_size.value,
-                )
-            )
-
-        elf_section.sh_name = Field(
-            elf_section.sh_name, "Section name position"
-        )
-
-        elf_section.sh_type = enum_from_value(
-            elf_section.sh_type, SectionHeaderType
-        )
-
-        elf_section.flags = [
-            *enum_from_flags(elf_section.sh_flags, SectionAttributeFlags)
-        ]
-
-        elf_section.sh_addr = Field(
-            elf_section.sh_addr, "Section memory address"
-        )
-
-        elf_section.sh_offset = Field(
-            elf_section.sh_offset, "Section file offset"
-        )
-
-        elf_section.sh_size = Field(
-            elf_section.sh_size, "Section size in bytes"
-        )
-
-        elf_section.sh_link = Field(elf_section.sh_link, "Section link")
-        elf_section.sh_info = Field(elf_section.sh_info, "Section info")
-
-        elf_section.sh_addralign = Field(
-            elf_section.sh_addralign,
-            "Section without alignment"
-            if elf_section.sh_addralign.value in (1, 0)
-            else "Section alignment",
-        )
-
-        elf_section.sh_entsize = Field(
-            elf_section.sh_entsize,
-            "No section symbal table"
-            if elf_section.sh_entsize.value == 0
-            else "Symbol table entry size",
-        )
-
-    return (
-        elf_sections,
-        strtab_section,
-        symtab_section,
-        dynstr_section,
-        dynsym_section,
-        comment_section,
-        dynamic_section,
-        note_sections,
-        sections,
-    )
-
-
-def parse_elfsymbolstable(
-    file: _BufferedIOBase,
-    dynsym_section: Union[ElfHeader32, ElfHeader64, None],
-    dynstr_section: Union[ElfHeader32, ElfHeader64, None],
-    symtab_section: Union[ElfHeader32, ElfHeader64, None],
-    strtab_section: Union[ElfHeader32, ElfHeader64, None],
-    elf_classe: str,
-) -> Iterable[Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]]:
-    """
-    This function parses ELF symbols table.
-    """
-
-    for symbol_section, str_section in (
-        (dynsym_section, dynstr_section),
-        (symtab_section, strtab_section),
-    ):
-        if str_section is None or symbol_section is None:
-            continue
-
-        file.seek(str_section.sh_offset.value.value)
-        data = BytesIO(file.read(str_section.sh_size.value.value))
-
-        symboltable_structure = globals()["SymbolTableEntry" + elf_classe]
-        symboltable_structure_size = sizeof(symboltable_structure)
-
-        file.seek(symbol_section.sh_offset.value.value)
-        size = symbol_section.sh_size.value.value
-
-        for _ in range(size // symboltable_structure_size):
-            symbol = parse_from_structure(file, symboltable_structure)
-            symbol.st_value = Field(symbol.st_value, "Symbol table value")
-
-            symbol.st_size = Field(symbol.st_size, "Symbol table size")
-
-            symbol.st_shndx = enum_from_value(
-                symbol.st_shndx, SpecialSectionIndexes
-            )
-
-            symbol.st_bind = enum_from_value(
-                c_byte(symbol.st_info.value >> 4), SymbolBinding
-            )
-
-            symbol.st_type = enum_from_value(
-                c_byte(symbol.st_info.value & 0xF), SymbolType
-            )
-
-            symbol.st_visibility = enum_from_value(
-                c_byte(symbol.st_other.value & 0x3), SymbolVisibility
-            )
-
-            start_position = (
-                data.seek(symbol.st_name.value)
-                + str_section.sh_offset.value.value
-            )
-            symbol.st_name = read_string(data)
-            symbol.name = FileString(symbol.st_name.value.decode("latin-1"))
-            symbol.name._start_position_ = start_position
-            symbol.name._end_position_ = (
-                symbol.name._start_position_ + len(symbol.name) + 1
-            )
-            symbol.name._data_ = symbol.st_name.value + b"\0"
-
-            yield symbol_section.name, symbol
-
-
-def parse_elfcomment(
-    file: _BufferedIOBase,
-    comment_section: Union[SectionHeader32, SectionHeader64],
-) -> Iterable[bytes]:
-    """
-    This function parses ELF comment section.
-    """
-
-    if comment_section:
-        position = file.seek(comment_section.sh_offset.value.value)
-
-        for data in file.read(comment_section.sh_size.value.value).split(
-            b"\0"
-        ):
-            if data:
-                data = FileBytes(data + b"\0")
-                data._start_position_ = position
-                data._end_position_ = position + len(data) + 1
-                data.string = data.decode("latin-1")
-                yield data
-                position += len(data) + 1
-            else:
-                position += 1
-
-
-def parse_elfnote(
-    file: _BufferedIOBase,
-    note_sections: List[Union[SectionHeader32, SectionHeader64]],
-    elf_classe: str,
-) -> Iterable[Union[Note32, Note64]]:
-    """
-    This function parses ELF note sections.
-    """
-
-    for note in note_sections:
-        file.seek(note.sh_offset.value.value)
-        note = parse_from_structure(file, globals()["Note" + elf_classe])
-
-        position = file.tell()
-        note.name = FileBytes(
-            file.read(
-                note.name_size.value
-                + get_padding_length(note.name_size.value, 4)
-            )
-        )
-        note.name.string = note.name.decode("latin-1")
-        note.name._start_position_ = position
-        note.name._end_position_ = file.tell()
-        position = file.tell()
-        note.descriptor = FileBytes(
-            file.read(
-                note.descriptor_size.value
-                + get_padding_length(note.name_size.value, 4)
-            )
-        )
-        note.descriptor._start_position_ = position
-        note.descriptor._end_position_ = file.tell()
-
-        yield note
-
-
-def parse_elfdynamic(
-    file: _BufferedIOBase,
-    dynamic_section: Union[SectionHeader32, SectionHeader64, None],
-    elf_classe: str,
-) -> Iterable[Union[Dynamic32, Dynamic64]]:
-    """
-    This function parses ELF dynamic section.
-    """
-
-    if dynamic_section is None:
-        return None
-
-    file.seek(dynamic_section.sh_offset.value.value)
-
-    d_tag = 1
-    while d_tag:
-        position = file.tell()
-        dynamic = parse_from_structure(file, globals()["Dynamic" + elf_classe])
-        dynamic.dynamic_tag = enum_from_value(dynamic.dynamic_tag, DynamicType)
-        dynamic.dynamic_tag._start_position_ = position
-        dynamic.dynamic_tag._end_position_ = position + sizeof(
-            dynamic.dynamic_tag.value
-        )
-
-        if dynamic.dynamic_tag.value.value != DynamicType.DT_FLAGS.value:
-            dynamic.dynamic_value._start_position_ = position + sizeof(
-                dynamic.dynamic_tag.value
-            )
-            dynamic.dynamic_value._end_position_ = file.tell()
-        else:
-            dynamic.dynamic_value.flags = []
-            for flag in enum_from_flags(dynamic.dynamic_value, DynamicFlags):
-                flag._start_position_ = position + sizeof(
-                    dynamic.dynamic_tag.value
-                )
-                flag._end_position_ = file.tell()
-                dynamic.dynamic_value.flags.append(flag)
-
-        d_tag = dynamic.dynamic_tag.value.value
-        yield dynamic
-
-
-if __name__ == "__main__":
-    exit(main())
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+###################
+#    This module parses and analyzes ELF file for Forensic and
+#    investigations.
+#    Copyright (C) 2023  ElfAnalyzer
+
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+###################
+
+"""
+This module parses and analyzes ELF file for Forensic and
+investigations.
+"""
+
+__version__ = "0.0.3"
+__author__ = "Maurice Lambert"
+__author_email__ = "mauricelambert434@gmail.com"
+__maintainer__ = "Maurice Lambert"
+__maintainer_email__ = "mauricelambert434@gmail.com"
+__description__ = """
+This module parses and analyzes ELF file for Forensic and
+investigations.
+"""
+__url__ = "https://github.com/mauricelambert/ElfAnalyzer"
+
+# __all__ = []
+
+__license__ = "GPL-3.0 License"
+__copyright__ = """
+ElfAnalyzer  Copyright (C) 2023  Maurice Lambert
+This program comes with ABSOLUTELY NO WARRANTY.
+This is free software, and you are welcome to redistribute it
+under certain conditions.
+"""
+copyright = __copyright__
+license = __license__
+
+from ctypes import (
+    Structure,
+    c_bool,
+    c_wchar,
+    c_byte,
+    c_ubyte,
+    c_short,
+    c_ushort,
+    c_int,
+    c_uint,
+    c_long,
+    c_ulong,
+    c_longlong,
+    c_size_t,
+    c_ssize_t,
+    c_float,
+    c_double,
+    c_longdouble,
+    c_char_p,
+    c_wchar_p,
+    c_void_p,
+    c_uint16,
+    c_int32,
+    c_ulonglong,
+    c_int8,
+    c_uint8,
+    c_int16,
+    c_uint32,
+    c_int64,
+    c_uint64,
+    c_char,
+    _SimpleCData,
+    sizeof as _sizeof,
+)
+from typing import TypeVar, Union, Any, Iterable, List, Tuple, Dict
+from sys import argv, executable, exit, stderr, stdin, byteorder
+from functools import partial, lru_cache
+from itertools import accumulate
+from collections import Counter, OrderedDict, deque, namedtuple
+from dataclasses import asdict, dataclass
+from _io import _BufferedIOBase
+from string import printable
+from re import compile as regex
+from time import monotonic
+from struct import Struct, error as StructError
+from array import array
+from zlib import decompressobj
+from hashlib import blake2b, new as new_hash
+from copyreg import pickle as register_pickle
+from os import fstat, listdir, readlink
+from os.path import abspath, dirname, islink, join, relpath
+from bisect import bisect_right
+from weakref import WeakKeyDictionary
+from inspect import isclass
+from _ctypes import Array
+from io import BytesIO
+from enum import Enum
+
+Section = TypeVar("Section")
+entropy_charts_import = None
+
+_CData = tuple(x for x in c_char.mro() if x.__name__ == "_CData")[0]
+printable = printable[:-5].encode()
+
+_issubclass = issubclass
+
+
+def issubclass(test: Any, *args):
+    """
+    This function checks if the tested elements is a
+    subclass of comparator.
+    """
+
+    if isclass(test):
+        return _issubclass(test, *args)
+    return False
+
+
+def import_entropy_charts() -> bool:
+    """
+    This function imports the optional entropy charts
+    dependencies (EntropyAnalysis and matplotlib) on first use,
+    sections are built by parse_elfsections only after this call.
+    """
+
+    global entropy_charts_import, charts_chunks_file_entropy, Section
+
+    if entropy_charts_import is not None:
+        return entropy_charts_import
+
+    try:
+        from EntropyAnalysis import charts_chunks_file_entropy, Section
+        from matplotlib import pyplot
+    except ImportError:
+        entropy_charts_import = False
+    else:
+        entropy_charts_import = True
+
+    return entropy_charts_import
+
+
+@dataclass
+class Field:
+    """
+    This class implements
+    """
+
+    value: Any
+    information: str
+    usage: str = None
+    description: str = None
+
+
+@dataclass
+class Difference:
+    """
+    This class implements a difference between two ELF files.
+    """
+
+    category: str
+    name: str
+    status: str
+    field: str = None
+    old: Any = None
+    new: Any = None
+
+
+@dataclass
+class SignatureMatch:
+    """
+    This class implements a signature found in an ELF file.
+    """
+
+    name: str
+    offset: int
+    size: int
+    section: str = None
+    symbol: str = None
+
+
+@dataclass
+class ElfLayout:
+    """
+    This class implements the raw ELF layout (headers values,
+    sections and segments as tuples) used by fast paths that
+    do not build Structure objects.
+    """
+
+    elf_classe: str
+    order: str
+    type: int
+    machine: int
+    entry: int
+    sections: List["RawSection"]
+    segments: List["RawSegment"]
+
+
+@dataclass
+class DynamicInfo:
+    """
+    This class implements dynamic linking informations
+    of an ELF file (path is the path in the sysroot).
+    """
+
+    path: str
+    elf_classe: str
+    order: str
+    machine: int
+    interpreter: str
+    soname: str
+    needed: List[str]
+    rpath: List[str]
+    runpath: List[str]
+
+
+@dataclass
+class SymbolLocation:
+    """
+    This class implements a symbolized address: symbol name,
+    offset from the symbol start and section name.
+    """
+
+    address: int
+    symbol: str = None
+    offset: int = None
+    section: str = None
+
+
+@dataclass
+class PltEntry:
+    """
+    This class implements a PLT stub (address, None when unknown)
+    with its GOT slot and imported symbol name (None for unnamed
+    relocations, example: R_X86_64_IRELATIVE, printed with the GOT
+    slot address).
+    """
+
+    address: int
+    got: int
+    symbol: str
+
+    def __str__(self) -> str:
+        if self.symbol is None:
+            return f"*ABS*+{self.got:#x}@plt"
+        return f"{self.symbol}@plt"
+
+
+@dataclass
+class SizeEntry:
+    """
+    This class implements file and virtual memory sizes attributed
+    to a segment, a section or a symbol (parent is the section name
+    of symbols).
+    """
+
+    category: str
+    name: str
+    parent: str
+    file_size: int
+    vm_size: int
+
+
+RawSection = namedtuple(
+    "RawSection", "name type flags addr offset size link info entsize"
+)
+RawSegment = namedtuple("RawSegment", "type flags offset vaddr filesz memsz")
+
+
+class FileString(str):
+    """
+    This class implements strings with positions
+    (_start_position_ and _end_position_ attributes).
+    """
+
+    pass
+
+
+class FileBytes(bytes):
+    """
+    This class implements bytes with positions
+    (_start_position_ and _end_position_ attributes).
+    """
+
+    pass
+
+
+class LRUCache(OrderedDict):
+    """
+    This class implements a small mapping that keeps
+    only the maxsize most recently used keys.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        This method returns the value for key
+        (and marks it as recently used) or default.
+        """
+
+        if key in self:
+            return self[key]
+        return default
+
+
+class StringPool(LRUCache):
+    """
+    This class implements a size-bounded strings interning pool:
+    equal strings read from many files are the same object (only
+    the maxsize most recently used strings are kept).
+    """
+
+    def intern(self, string: str) -> str:
+        """
+        This method returns the pooled string equal to string.
+        """
+
+        pooled = super().get(string)
+        if pooled is None:
+            self[string] = string
+            return string
+        return pooled
+
+
+class ParseBudgetError(ValueError):
+    """
+    This class implements the error raised when a parse budget is
+    exceeded, partial is the parse_elffile result parsed before the
+    error (None for parts not parsed).
+    """
+
+    def __init__(self, reason: str, partial: Tuple = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.partial = partial
+
+
+class ParseBudget:
+    """
+    This class implements resources limits of a file parsing (bytes
+    read, entries by table and wall time, None for no limit), reads
+    and tables are clamped to the file size and to tables ends, so
+    forged sizes and entries numbers never read more than the file.
+    """
+
+    def __init__(
+        self,
+        file: _BufferedIOBase,
+        max_bytes: int = 1073741824,
+        max_entries: int = 10000000,
+        max_time: float = 300,
+    ):
+        position = file.tell()
+        self.file_size = file.seek(0, 2)
+        file.seek(position)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.deadline = None if max_time is None else monotonic() + max_time
+        self.bytes_read = 0
+
+    def check_time(self) -> None:
+        """
+        This method raises ParseBudgetError when the time is over.
+        """
+
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise ParseBudgetError("Parse time budget exceeded")
+
+    def add_bytes(self, size: int) -> None:
+        """
+        This method counts read bytes and raises ParseBudgetError
+        when the bytes budget is exceeded.
+        """
+
+        self.bytes_read += size
+        if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+            raise ParseBudgetError(
+                f"Parse bytes budget exceeded ({self.max_bytes} bytes)"
+            )
+        self.check_time()
+
+    def clamp(self, offset: int, size: int, end: int = None) -> int:
+        """
+        This method returns size clamped to the file size
+        and to end (end offset of the table).
+        """
+
+        limit = self.file_size if end is None else min(end, self.file_size)
+        return max(0, min(size, limit - offset))
+
+    def read(
+        self, file: _BufferedIOBase, offset: int, size: int, end: int = None
+    ) -> bytes:
+        """
+        This method reads size bytes at offset (clamped to
+        the file size and to end) in the budget.
+        """
+
+        size = self.clamp(offset, size, end)
+        self.add_bytes(size)
+        file.seek(min(offset, self.file_size))
+        return file.read(size)
+
+    def seek(
+        self, file: _BufferedIOBase, offset: int, table: str = "Table"
+    ) -> None:
+        """
+        This method seeks to a table offset and raises
+        ParseBudgetError when it is out of the file (forged offset).
+        """
+
+        if offset > self.file_size:
+            raise ParseBudgetError(
+                f"{table} offset out of file ({offset} > {self.file_size})"
+            )
+        file.seek(offset)
+
+    def count(
+        self,
+        offset: int,
+        number: int,
+        entry_size: int,
+        end: int = None,
+        table: str = "Table",
+    ) -> int:
+        """
+        This method returns the number of entries of a table
+        (clamped to the file size and to end) in the budget.
+        """
+
+        if entry_size <= 0:
+            return 0
+
+        number = min(
+            number, self.clamp(offset, number * entry_size, end) // entry_size
+        )
+        if self.max_entries is not None and number > self.max_entries:
+            raise ParseBudgetError(
+                f"{table} entries budget exceeded ({number} > "
+                f"{self.max_entries})"
+            )
+        self.add_bytes(number * entry_size)
+        return number
+
+
+class Data:
+    """
+    This class helps you to print a title for a "CLI section".
+    """
+
+    verbose: bool = False
+    no_color: bool = False
+
+    def __init__(
+        self,
+        name: str,
+        start_position: int,
+        end_position: int,
+        data: bytes,
+        information: str,
+        format: bool = True,
+    ):
+        self.name = name
+        self.start_position = start_position
+        self.end_position = end_position
+        self.data = data
+        self.information = information
+        self.format = format
+
+    def vprint(self) -> None:
+        """
+        This method prints verbose data.
+        """
+
+        if self.verbose:
+            self.print()
+
+    def print(self) -> None:
+        """
+        This method prints the data.
+        """
+
+        if self.no_color:
+            print(self)
+            return None
+
+        print(
+            "\x1b[38;2;183;121;227m"
+            + self.name.ljust(25)
+            + "\x1b[38;2;255;240;175m"
+            + f"{self.start_position:0>8x}-{self.end_position:0>8x}".ljust(20)
+            + "\x1b[38;2;255;208;11m"
+            + (
+                (
+                    self.data.hex().ljust(40)
+                    + "\x1b[38;2;212;171;242m"
+                    + "".join(
+                        chr(x) if x in printable else "." for x in self.data
+                    ).ljust(20)
+                )
+                if len(self.data) <= 20
+                else "\x1b[38;2;212;171;242m"
+                + "".join(
+                    chr(x) if x in printable else "." for x in self.data
+                ).ljust(40)
+            )
+            + "\x1b[38;2;201;247;87m"
+            + (
+                self.information.replace("_", " ").title()
+                if self.format
+                else self.information
+            )
+            + "\x1b[39m"
+        )
+
+    def __str__(self):
+        return (
+            self.name.ljust(25)
+            + f"{self.start_position:0>8x}-{self.end_position:0>8x}".ljust(20)
+            + (
+                (
+                    self.data.hex().ljust(40)
+                    + "".join(
+                        chr(x) if x in printable else "." for x in self.data
+                    ).ljust(20)
+                )
+                if len(self.data) <= 20
+                else "".join(
+                    chr(x) if x in printable else "." for x in self.data
+                ).ljust(20)
+            )
+            + (self.information if self.format else self.information)
+        )
+
+
+class Title:
+    """
+    This class helps you to print a title for a "CLI section".
+    """
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def print(self) -> None:
+        """
+        This method prints the title.
+        """
+
+        if Data.no_color:
+            print("\n" + str(self) + "\n")
+            return None
+
+        print(
+            "\n\x1b[48;2;50;50;50m\x1b[38;2;175;241;11m"
+            + str(self)
+            + "\x1b[49m\x1b[39m\n"
+        )
+
+    def __str__(self):
+        return f"{' ' + self.value + ' ':*^139}"
+
+
+class _DynamicType(int):
+    """
+    This class is an integer type with usage
+    and description attributes.
+    """
+
+    def __new__(cls, value: int, usage: str, description: str):
+        self = int.__new__(cls, value)
+        self.usage = usage
+        self.description = description
+        return self
+
+
+class _DynamicFlags(int):
+    """
+    This class is an integer type with description attribut.
+    """
+
+    def __new__(cls, value: int, description: str):
+        self = int.__new__(cls, value)
+        self.description = description
+        return self
+
+
+class DataToCClass:
+    """
+    This class implements methods to get ctypes from data.
+    """
+
+    order: str = "little"
+
+    def data_to_bytes(
+        type: type, data: Union[bytes, int, str]
+    ) -> _SimpleCData:
+        """
+        This method converts bytes, int or str to ctypes (c_char, c_char_p).
+        """
+
+        if isinstance(data, int):
+            data = data.to_bytes()
+        elif isinstance(data, str):
+            data = data.encode("latin-1")
+
+        return type(data[::-1] if DataToCClass.order == "little" else data)
+
+    def data_to_int(type: type, data: Union[bytes, int, None]) -> _SimpleCData:
+        """
+        This method converts bytes, int or None to ctypes
+        (c_bool, c_byte, c_ubyte, c_short, c_ushort, c_int,
+        c_uint, c_long, c_ulong, c_longlong, c_ulonglong,
+        c_size_t, c_ssize_t, c_void_p, c_int8, c_int16,
+        c_int32, c_int64, c_uint8, c_uint16, c_uint32,
+        c_uint64).
+        """
+
+        if isinstance(data, bytes):
+            data = int.from_bytes(
+                data[::-1] if DataToCClass.order == "little" else data
+            )
+
+        return type(data)
+
+    def data_to_str(
+        type: type, data: Union[bytes, str], encoding: str = "utf-8"
+    ) -> _SimpleCData:
+        """
+        This method converts bytes or str to ctypes (c_wchar, c_wchar_p).
+        """
+
+        if isinstance(data, bytes):
+            data = data.decode(encoding)
+
+        return type(data)
+
+    def data_to_float(type: type, data: Union[bytes, float]) -> _SimpleCData:
+        """
+        This method converts bytes or float to ctypes
+        (c_float, c_double, c_longdouble).
+        """
+
+        if isinstance(data, bytes):
+            data = float.fromhex(
+                (data[::-1] if DataToCClass.order == "little" else data).hex()
+            )
+
+        return type(data)
+
+
+data_to_ctypes = {
+    c_bool: partial(DataToCClass.data_to_int, c_bool),
+    c_char: partial(DataToCClass.data_to_bytes, c_char),
+    c_wchar: partial(DataToCClass.data_to_str, c_wchar),
+    c_byte: partial(DataToCClass.data_to_int, c_byte),
+    c_int8: partial(DataToCClass.data_to_int, c_int8),
+    c_ubyte: partial(DataToCClass.data_to_int, c_ubyte),
+    c_uint8: partial(DataToCClass.data_to_int, c_uint8),
+    c_short: partial(DataToCClass.data_to_int, c_short),
+    c_int16: partial(DataToCClass.data_to_int, c_int16),
+    c_ushort: partial(DataToCClass.data_to_int, c_ushort),
+    c_uint16: partial(DataToCClass.data_to_int, c_uint16),
+    c_int: partial(DataToCClass.data_to_int, c_int),
+    c_int32: partial(DataToCClass.data_to_int, c_int32),
+    c_uint: partial(DataToCClass.data_to_int, c_uint),
+    c_uint32: partial(DataToCClass.data_to_int, c_uint32),
+    c_long: partial(DataToCClass.data_to_int, c_long),
+    c_ulong: partial(DataToCClass.data_to_int, c_ulong),
+    c_longlong: partial(DataToCClass.data_to_int, c_longlong),
+    c_int64: partial(DataToCClass.data_to_int, c_int64),
+    c_ulonglong: partial(DataToCClass.data_to_int, c_ulonglong),
+    c_uint64: partial(DataToCClass.data_to_int, c_uint64),
+    c_size_t: partial(DataToCClass.data_to_int, c_size_t),
+    c_ssize_t: partial(DataToCClass.data_to_int, c_ssize_t),
+    c_float: partial(DataToCClass.data_to_float, c_float),
+    c_double: partial(DataToCClass.data_to_float, c_double),
+    c_longdouble: partial(DataToCClass.data_to_float, c_longdouble),
+    c_char_p: partial(DataToCClass.data_to_bytes, c_char_p),
+    c_wchar_p: partial(DataToCClass.data_to_str, c_wchar),
+    c_void_p: partial(DataToCClass.data_to_int, c_void_p),
+}
+
+
+def rebuild_ctypes_array(
+    type: type, length: int, data: bytes, attributes: Dict[str, Any]
+) -> Array:
+    """
+    This function rebuilds a pickled ctypes array with its attributes.
+    """
+
+    array = (type * length).from_buffer_copy(data)
+    array.__dict__.update(attributes)
+    return array
+
+
+def reduce_ctypes_array(array: Array) -> Tuple:
+    """
+    This function reduces a ctypes array to be pickled
+    (arrays types are built dynamically and can't be pickled).
+    """
+
+    return rebuild_ctypes_array, (
+        array._type_,
+        array._length_,
+        bytes(array),
+        array.__dict__,
+    )
+
+
+def rebuild_char_pointer(value: bytes, attributes: Dict[str, Any]) -> c_char_p:
+    """
+    This function rebuilds a pickled c_char_p with its attributes.
+    """
+
+    pointer = c_char_p(value)
+    pointer.__dict__.update(attributes)
+    return pointer
+
+
+def reduce_char_pointer(pointer: c_char_p) -> Tuple:
+    """
+    This function reduces a c_char_p (read_string return value)
+    to be pickled (ctypes can't pickle pointers).
+    """
+
+    return rebuild_char_pointer, (pointer.value, pointer.__dict__)
+
+
+register_pickle(c_char_p, reduce_char_pointer)
+
+
+class BaseStructure:
+    """
+    This class implements the Structure base (methods).
+    """
+
+    def __init__(
+        self, data: Union[bytes, _BufferedIOBase], offset: int = 0
+    ) -> None:
+        self._source = b""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = BytesIO(data)
+            data.seek(offset)
+
+        for attribute_name, attribute_value in self.__annotations__.items():
+            start_position = data.tell()
+
+            if issubclass(attribute_value, Array):
+                cClass = self.array_to_cclass(attribute_value)
+                cClass_size = sizeof(cClass)
+                used_data = data.read(sizeof(attribute_value))
+                self._source += used_data
+                value = attribute_value(
+                    *(
+                        data_to_ctypes[cClass](
+                            used_data[x * cClass_size : (x + 1) * cClass_size]
+                        )
+                        for x in range(attribute_value._length_)
+                    )
+                )
+                setattr(self, attribute_name, value)
+            elif issubclass(attribute_value, BaseStructure):
+                used_data = data.read(sizeof(attribute_value))
+                self._source += used_data
+                value = attribute_value(used_data)
+                setattr(self, attribute_name, value)
+            else:
+                cClass = self.class_to_cclass(attribute_value)
+                used_data = data.read(sizeof(cClass))
+                value = data_to_ctypes[cClass](used_data)
+                self._source += used_data
+                setattr(self, attribute_name, value)
+
+            value._data_ = used_data
+            value._start_position_ = start_position
+            value._end_position_ = data.tell()
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: Union[bytes, bytearray, memoryview], offset: int = 0
+    ) -> Structure:
+        """
+        This method builds the structure from buffer at offset,
+        positions are offsets in buffer.
+        """
+
+        return cls(buffer, offset)
+
+    @classmethod
+    def array_to_cclass(cls, array: Array) -> type:
+        """
+        This method returns the inherited ctype.
+        """
+
+        return cls.class_to_cclass(array._type_)
+
+    @staticmethod
+    def class_to_cclass(cls: type) -> type:
+        """
+        This method returns the inherited ctype.
+        """
+
+        precedent_class = None
+        for element in cls.mro():
+            if element is _SimpleCData:
+                return precedent_class
+            precedent_class = element
+
+    @classmethod
+    def __sizeof__(cls) -> int:
+        """
+        This method returns the octet size to build the instance.
+        """
+
+        counter = 0
+        for value in cls.__annotations__.values():
+            counter += sizeof(value)
+
+        return counter
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(" + repr(self._source) + ")"
+
+    def __str__(self):
+        return (
+            self.__class__.__name__
+            + "("
+            + ", ".join(
+                f"{attr}="
+                + (
+                    (
+                        getattr(self, attr).__class__.__name__
+                        + f"({getattr(self, attr).value})"
+                    )
+                    if isinstance(getattr(self, attr), Array)
+                    else getattr(self, attr)
+                )
+                for attr in self.__annotations__
+            )
+            + ")"
+        )
+
+
+Structure = TypeVar("Structure")
+
+
+def sizeof(object: Union[_CData, type]) -> int:
+    """
+    This function returns the size of this object.
+    """
+
+    if isinstance(object, _CData) or issubclass(object, _CData):
+        return _sizeof(object)
+    return object.__sizeof__()
+
+
+def generate_structure_init(cls: type) -> Tuple[str, Dict[str, Any]]:
+    """
+    This function generates the source code (and the globals)
+    of a specialized __init__ for a C Structure: each field is
+    unpacked from the buffer at its fixed offset.
+    """
+
+    size = sizeof(cls)
+    namespace = {
+        "BaseStructure": BaseStructure,
+        "DataToCClass": DataToCClass,
+        "from_bytes": int.from_bytes,
+    }
+    source = [
+        "def __init__(self, data, offset=0):",
+        "    buffer = data",
+        "    start = offset",
+        "    if not isinstance(buffer, bytes):",
+        "        if isinstance(buffer, (bytearray, memoryview)):",
+        f"            buffer = bytes(buffer[offset:offset + {size}])",
+        "        else:",
+        "            offset = data.tell()",
+        f"            buffer = data.read({size})",
+        "        start = 0",
+        f"    if len(buffer) - start < {size}:",
+        "        if buffer is not data and hasattr(data, 'seek'):",
+        "            data.seek(offset)",
+        "        return BaseStructure.__init__(self, data, offset)",
+        "    order = DataToCClass.order",
+        f"    self._source = buffer[start:start + {size}]",
+    ]
+
+    position = 0
+    for index, (attribute_name, attribute_value) in enumerate(
+        cls.__annotations__.items()
+    ):
+        end_position = position + sizeof(attribute_value)
+        type_name = f"_type_{index}"
+        convert_name = f"_convert_{index}"
+        namespace[type_name] = attribute_value
+        source.append(
+            f"    used_data = buffer[start + {position}:"
+            f"start + {end_position}]"
+        )
+
+        if issubclass(attribute_value, Array):
+            register_pickle(attribute_value, reduce_ctypes_array)
+            cClass = cls.array_to_cclass(attribute_value)
+            cClass_size = sizeof(cClass)
+            namespace[convert_name] = data_to_ctypes[cClass]
+            source.append(
+                f"    value = {type_name}(*({convert_name}(used_data[x:x + "
+                f"{cClass_size}]) for x in range(0, "
+                f"{end_position - position}, {cClass_size})))"
+            )
+        elif issubclass(attribute_value, BaseStructure):
+            source.append(
+                f"    value = {type_name}(buffer, start + {position})"
+            )
+        else:
+            cClass = cls.class_to_cclass(attribute_value)
+            convert = data_to_ctypes[cClass]
+            namespace[type_name] = cClass
+            if convert.func is DataToCClass.data_to_int:
+                source.append(
+                    f"    value = {type_name}(from_bytes(used_data, order))"
+                )
+            else:
+                namespace[convert_name] = convert
+                source.append(f"    value = {convert_name}(used_data)")
+
+        source.extend(
+            (
+                "    value._data_ = used_data",
+                f"    value._start_position_ = offset + {position}",
+                f"    value._end_position_ = offset + {end_position}",
+                f"    self.{attribute_name} = value",
+            )
+        )
+        position = end_position
+
+    return "\n".join(source), namespace
+
+
+def structure(cls: type) -> type:
+    """
+    This decorator helps to build C Structures.
+    """
+
+    def wrap(cls: type) -> type:
+        """
+        This function builds the C Structure class.
+        """
+
+        def __init__(
+            self, data: Union[bytes, _BufferedIOBase], offset: int = 0
+        ) -> None:
+            """
+            This function generates the specialized __init__
+            on the first instance (to keep import fast).
+            """
+
+            source, namespace = generate_structure_init(new_class)
+            exec(source, namespace)
+            new_class.__init__ = namespace["__init__"]
+            new_class.__init__.__qualname__ = cls.__name__ + ".__init__"
+            new_class.__init__(self, data, offset)
+
+        new_class = type(
+            cls.__name__,
+            (cls, BaseStructure),
+            {"__annotations__": cls.__annotations__, "__init__": __init__},
+        )
+        return new_class
+
+    return wrap(cls)
+
+
+class Elf32_Addr(c_uint32):
+    pass
+
+
+class Elf32_Half(c_uint16):
+    pass
+
+
+class Elf32_Section(c_uint16):
+    pass
+
+
+class Elf32_Versym(c_uint16):
+    pass
+
+
+class Elf32_Off(c_uint32):
+    pass
+
+
+class Elf32_Sword(c_int32):
+    pass
+
+
+class Elf32_Word(c_uint32):
+    pass
+
+
+class Elf32_Sxword(c_int64):
+    pass
+
+
+class Elf32_Xword(c_uint64):
+    pass
+
+
+class Elf64_Addr(c_uint64):
+    pass
+
+
+class Elf64_Half(c_uint16):
+    pass
+
+
+class Elf64_Section(c_uint16):
+    pass
+
+
+class Elf64_Versym(c_uint16):
+    pass
+
+
+class Elf64_Off(c_uint64):
+    pass
+
+
+class Elf64_Sword(c_int32):
+    pass
+
+
+class Elf64_Word(c_uint32):
+    pass
+
+
+class Elf64_Sxword(c_int64):
+    pass
+
+
+class Elf64_Xword(c_uint64):
+    pass
+
+
+class ELfIdentClass(Enum):
+    INVALID = 0
+    OBJECT_32_BITS = 1
+    OBJECT_64_BITS = 2
+
+
+class ELfIdentData(Enum):
+    INVALID = 0
+    LITTLE_ENDIAN = 1
+    BIG_ENDIAN = 2
+
+
+class ELfIdentVersion(Enum):
+    INVALID = 0
+    CURRENT = 1
+
+
+class ELfIdentOS(Enum):
+    SYSV = NONE = 0
+    HPUX = 1
+    NETBSD = 2
+    LINUX = 3
+    SOLARIS = 6
+    AIX = 7
+    IRIX = 8
+    FREEBSD = 9
+    TRU64 = 10
+    MODESTO = 11
+    OPENBSD = 12
+    OPENVMS = 13
+    NSK = 14
+    AROS = 15
+    ARM = 97
+    MSP = 255
+
+
+class ElfType(Enum):
+    NO_FILE_TYPE = 0
+    RELOCATABLE = 1
+    EXECUTABLE = 2
+    SHARED_OBJECT = 3
+    CORE = 4
+    OS_SPECIFIC_LOOS = 0xFE00
+    OS_SPECIFIC_HIOS = 0xFEFF
+    PROCESSOR_SPECIFIC_LOPROC = 0xFF00
+    PROCESSOR_SPECIFIC_HIPROC = 0xFFFF
+
+
+class ElfMachine(Enum):
+    NO_MACHINE = 0
+    ATAT_WE_32100 = 1
+    SPARC = 2
+    INTEL_80386 = 3
+    MOTOROLA_68000 = 4
+    MOTOROLA_88000 = 5
+    INTEL_80860 = 7
+    MIPS_I = 8
+    IBM_SYSTEM370 = 9
+    MIPS_RS3000 = 10
+    PA_RISC = 15
+    FUJITSU_VPP500 = 17
+    SPARC32PLUS = 18
+    INTEL_80960 = 19
+    POWERPC = 20
+    POWERPC64 = 21
+    IBM_SYSTEM390 = 22
+    NEC_V800 = 36
+    FUJITSU_FR20 = 37
+    TRW_RH32 = 38
+    MOTOROLA_RCE = 39
+    ARM = 40
+    DIGITAL_ALPHA = 41
+    HITACHI_SH = 42
+    SPARC_V9 = 43
+    SIEMENS_TRICORE = 44
+    ARC = 45
+    HITACHI_H8_300 = 46
+    HITACHI_H8_300H = 47
+    HITACHI_H8S = 48
+    HITACHI_H8_500 = 49
+    INTEL_IA_64 = 50
+    STANFORD_MIPS_X = 51
+    MOTOROLA_COLDFIRE = 52
+    MOTOROLA_68HC12 = 53
+    FUJITSU_MMA = 54
+    SIEMENS_PCP = 55
+    SONY_NCPU_RISC = 56
+    DENSO_NDR1 = 57
+    MOTOROLA_STARCORE = 58
+    TOYOTA_ME16 = 59
+    ST100 = 60
+    TINYJ = 61
+    AMD_X86_64 = 62
+    SONY_PDSP = 63
+    PDP10 = 64
+    PDP11 = 65
+    SIEMENS_FX66 = 66
+    ST9PLUS = 67
+    ST7 = 68
+    MOTOROLA_68HC16 = 69
+    MOTOROLA_68HC11 = 70
+    MOTOROLA_68HC08 = 71
+    MOTOROLA_68HC05 = 72
+    SILICON_SVX = 73
+    ST19 = 74
+    DIGITAL_VAX = 75
+    AXIS_CRIS = 76
+    INFINEON_JAVELIN = 77
+    LSI_DSP64_FIREPATH = 78
+    LSI_DSP16_ZSP = 79
+    DONALD_KNUTH_MMIX = 80
+    HARVARD_HUANY = 81
+    SITERA_PRISM = 82
+    ATMEL_AVR = 83
+    FUJITSU_FR30 = 84
+    MITSUBISHI_D10V = 85
+    MITSUBISHI_D30V = 86
+    NEC_V850 = 87
+    MITSUBISHI_M32R = 88
+    MATSUSHITA_MN10300 = 89
+    MATSUSHITA_MN10200 = 90
+    PICOJAVA = 91
+    OPENRISC = 92
+    ARC_A5 = 93
+    TENSILICA_XTENSA = 94
+    ALPHAMOSAIC_VIDEOCORE = 95
+    TMM_GPP = 96
+    NS32K = 97
+    TPC = 98
+    TREBIA_SNP1K = 99
+    ST200 = 100
+    AARCH64 = 183
+    RISCV = 243
+    LOONGARCH = 258
+
+
+ElfVersion = ELfIdentVersion
+
+
+class SpecialSectionIndexes(Enum):
+    SHN_UNDEF = 0
+    SHN_LOPROC = SHN_LORESERVE = 0xFF00
+    SHN_HIPROC = 0xFF1F
+    SHN_LOOS = 0xFF20
+    SHN_HIOS = 0xFF3F
+    SHN_ABS = 0xFFF1
+    SHN_COMMON = 0xFFF2
+    SHN_HIRESERVE = SHN_XINDEX = 0xFFFF
+
+
+class ProgramHeaderType(Enum):
+    PT_NULL = 0
+    PT_LOAD = 1
+    PT_DYNAMIC = 2
+    PT_INTERP = 3
+    PT_NOTE = 4
+    PT_SHLIB = 5
+    PT_PHDR = 6
+    PT_TLS = 7
+    PT_NUM = 8
+    PT_LOOS = 0x60000000
+    PT_GNU_EH_FRAME = 0x6474E550
+    PT_GNU_STACK = 0x6474E551
+    PT_GNU_RELRO = 0x6474E552
+    PT_HIOS = 0x6FFFFFFF
+    PT_LOPROC = 0x70000000
+    PT_HIPROC = 0x7FFFFFFF
+
+
+class ProgramHeaderFlags(Enum):
+    PF_EXECUTE = 1
+    PF_WRITE = 2
+    PF_READ = 3
+    PF_MASKOS = 0x0FF00000
+    PF_MASKPROC = 0xF0000000
+
+
+class SectionHeaderType(Enum):
+    SHT_NULL = 0
+    SHT_PROGBITS = 1
+    SHT_SYMTAB = 2
+    SHT_STRTAB = 3
+    SHT_RELA = 4
+    SHT_HASH = 5
+    SHT_DYNAMIC = 6
+    SHT_NOTE = 7
+    SHT_NOBITS = 8
+    SHT_REL = 9
+    SHT_SHLIB = 10
+    SHT_DYNSYM = 11
+    SHT_INIT_ARRAY = 14
+    SHT_FINI_ARRAY = 15
+    SHT_PREINIT_ARRAY = 16
+    SHT_GROUP = 17
+    SHT_SYMTAB_SHNDX = 18
+    SHT_NUM = 19
+    SHT_FILTER = 0x7FFFFFF
+    SHT_LOOS = 0x60000000
+    SHT_HIOS = 0x6FFFFFFF
+    SHT_VERSYM2 = 0x6FFFFFF0
+    SHT_GNU_ATTRIBUTES = 0x6FFFFFF5
+    SHT_GNU_HASH = 0x6FFFFFF6
+    SHT_GNU_LIBLIST = 0x6FFFFFF7
+    SHT_CHECKSUM = 0x6FFFFFF8
+    SHT_VERDEF = 0x6FFFFFFD
+    SHT_VERNEED = 0x6FFFFFFE
+    SHT_VERSYM1 = 0x6FFFFFFF
+    SHT_LOPROC = 0x70000000
+    SHT_AUXILIARY = 0x7FFFFFFD
+    SHT_HIPROC = 0x7FFFFFFF
+    SHT_LOUSER = 0x80000000
+    SHT_HIUSER = 0xFFFFFFFF
+
+
+class SectionAttributeFlags(Enum):
+    SHF_WRITE = 0x1
+    SHF_ALLOC = 0x2
+    SHF_EXECINSTR = 0x4
+    SHF_MERGE = 0x10
+    SHF_STRINGS = 0x20
+    SHF_INFO_LINK = 0x40
+    SHF_LINK_ORDER = 0x80
+    SHF_OS_NONCONFORMING = 0x100
+    SHF_GROUP = 0x200
+    SHF_TLS = 0x400
+    SHF_COMPRESSED = 0x800
+    SHF_MASKOS = 0x0FF00000
+    SHF_MASKPROC = 0xF0000000
+
+
+class CompressionType(Enum):
+    ELFCOMPRESS_ZLIB = 1
+    ELFCOMPRESS_ZSTD = 2
+    ELFCOMPRESS_LOOS = 0x60000000
+    ELFCOMPRESS_HIOS = 0x6FFFFFFF
+    ELFCOMPRESS_LOPROC = 0x70000000
+    ELFCOMPRESS_HIPROC = 0x7FFFFFFF
+
+
+class SectionGroupFlags(Enum):
+    GRP_COMDAT = 0x1
+    GRP_MASKOS = 0x0FF00000
+    GRP_MASKPROC = 0xF0000000
+
+
+class SymbolBinding(Enum):
+    STB_LOCAL = 0
+    STB_GLOBAL = 1
+    STB_WEAK = 2
+    STB_LOOS = 10
+    STB_HIOS = 12
+    STB_LOPROC = 13
+    STB_HIPROC = 15
+
+
+class SymbolType(Enum):
+    STT_NOTYPE = 0
+    STT_OBJECT = 1
+    STT_FUNC = 2
+    STT_SECTION = 3
+    STT_FILE = 4
+    STT_COMMON = 5
+    STT_TLS = 6
+    STT_RELC = 8
+    STT_SRELC = 9
+    STT_LOOS = 10
+    STT_HIOS = 12
+    STT_LOPROC = 13
+    STT_HIPROC = 15
+
+
+class SymbolVisibility(Enum):
+    STV_DEFAULT = 0
+    STV_INTERNAL = 1
+    STV_HIDDEN = 2
+    STV_PROTECTED = 3
+
+
+class DynamicType(Enum):
+    DT_NULL = _DynamicType(0, "ignored", "End of dynamic array")
+    DT_NEEDED = _DynamicType(1, "value", "Needed library name offset")
+    DT_PLTRELSZ = _DynamicType(2, "value", "Relocation entries size")
+    DT_PLTGOT = _DynamicType(3, "pointer", "Address procedure linkage table")
+    DT_HASH = _DynamicType(4, "pointer", "Address symbol hash table")
+    DT_STRTAB = _DynamicType(5, "pointer", "Address string table (.dynstr)")
+    DT_SYMTAB = _DynamicType(6, "pointer", "Address symbol table (.dynsym)")
+    DT_RELA = _DynamicType(7, "pointer", "Address relocation table")
+    DT_RELASZ = _DynamicType(8, "value", "Relocation table size")
+    DT_RELAENT = _DynamicType(9, "value", "Relocation entry size")
+    DT_STRSZ = _DynamicType(10, "value", "String table size")
+    DT_SYMENT = _DynamicType(11, "value", "Symbol table entry size")
+    DT_INIT = _DynamicType(12, "pointer", "Initialization function address")
+    DT_FINI = _DynamicType(13, "pointer", "Termination function address")
+    DT_SONAME = _DynamicType(14, "value", "Shared object name")
+    DT_RPATH = _DynamicType(15, "value", "Library search path string")
+    DT_SYMBOLIC = _DynamicType(16, "ignored", "Alters dynamic linker's symbol")
+    DT_REL = _DynamicType(17, "pointer", "Address relocation table")
+    DT_RELSZ = _DynamicType(18, "value", "Relocation table size")
+    DT_RELENT = _DynamicType(19, "value", "Relocation entry size")
+    DT_PLTREL = _DynamicType(20, "value", "Relocation entry type")
+    DT_DEBUG = _DynamicType(21, "pointer", "Used for debugging")
+    DT_TEXTREL = _DynamicType(
+        22, "ignored", "No relocation on non-writable segment"
+    )
+    DT_JMPREL = _DynamicType(23, "pointer", "Procedure linkage table")
+    DT_BIND_NOW = _DynamicType(24, "ignored", "Relocations before execution")
+    DT_INIT_ARRAY = _DynamicType(
+        25, "pointer", "Initialization functions pointers"
+    )
+    DT_FINI_ARRAY = _DynamicType(
+        26, "pointer", "Termination functions pointers"
+    )
+    DT_INIT_ARRAYSZ = _DynamicType(
+        27, "value", "Initialization functions number"
+    )
+    DT_FINI_ARRAYSZ = _DynamicType(28, "value", "Termination functions number")
+    DT_RUNPATH = _DynamicType(29, "value", "Library search path")
+    DT_FLAGS = _DynamicType(30, "value", "Flag values specific")
+    DT_ENCODING = _DynamicType(
+        32, "unspecified", "Values interpretation rules"
+    )
+    DT_PREINIT_ARRAY = _DynamicType(
+        32, "pointer", "Pre-initialization functions"
+    )
+    DT_PREINIT_ARRAYSZ = _DynamicType(33, "value", "Pre-init functions size")
+    DT_LOOS = _DynamicType(
+        0x6000000D, "unspecified", "System-specific semantics"
+    )
+    DT_HIOS = _DynamicType(
+        0x6FFFF000, "unspecified", "System-specific semantics"
+    )
+    DT_GNU_HASH = _DynamicType(
+        0x6FFFFEF5, "pointer", "Address GNU symbol hash table"
+    )
+    DT_VERSYM = _DynamicType(
+        0x6FFFFFF0, "pointer", "Address symbols versions (.gnu.version)"
+    )
+    DT_VERDEF = _DynamicType(
+        0x6FFFFFFC, "pointer", "Address versions definitions"
+    )
+    DT_VERDEFNUM = _DynamicType(
+        0x6FFFFFFD, "value", "Versions definitions number"
+    )
+    DT_VERNEED = _DynamicType(0x6FFFFFFE, "pointer", "Address needed versions")
+    DT_VERNEEDNUM = _DynamicType(0x6FFFFFFF, "value", "Needed versions number")
+    DT_LOPROC = _DynamicType(
+        0x70000000, "unspecified", "Processor-specific semantics"
+    )
+    DT_HIPROC = _DynamicType(
+        0x7FFFFFFF, "unspecified", "Processor-specific semantics"
+    )
+
+
+class DynamicFlags(Enum):
+    DF_ORIGIN = _DynamicFlags(0x1, "Load libraries using filepath")
+    DF_SYMBOLIC = _DynamicFlags(0x2, "Link start with object itself")
+    DF_TEXTREL = _DynamicFlags(0x4, "No relocation on non-writable segment")
+    DF_BIND_NOW = _DynamicFlags(0x8, "Relocations before execution")
+    DF_STATIC_TLS = _DynamicFlags(0x10, "This object can't be link")
+
+
+@structure
+class ElfIdent:
+    ei_mag: c_char * 4
+    ei_class: c_ubyte
+    ei_data: c_ubyte
+    ei_version: c_ubyte
+    ei_osabi: c_ubyte
+    ei_abiversion: c_ubyte
+    ei_pad: c_char
+    ei_nident: c_char * 6
+
+
+@structure
+class ElfHeader32:
+    e_ident: ElfIdent
+    e_type: Elf32_Half
+    e_machine: Elf32_Half
+    e_version: Elf32_Word
+    e_entry: Elf32_Addr
+    e_phoff: Elf32_Off
+    e_shoff: Elf32_Off
+    e_flags: Elf32_Word
+    e_ehsize: Elf32_Half
+    e_phentsize: Elf32_Half
+    e_phnum: Elf32_Half
+    e_shentsize: Elf32_Half
+    e_shnum: Elf32_Half
+    e_shstrndx: Elf32_Half
+
+
+@structure
+class ElfHeader64:
+    e_ident: ElfIdent
+    e_type: Elf64_Half
+    e_machine: Elf64_Half
+    e_version: Elf64_Word
+    e_entry: Elf64_Addr
+    e_phoff: Elf64_Off
+    e_shoff: Elf64_Off
+    e_flags: Elf64_Word
+    e_ehsize: Elf64_Half
+    e_phentsize: Elf64_Half
+    e_phnum: Elf64_Half
+    e_shentsize: Elf64_Half
+    e_shnum: Elf64_Half
+    e_shstrndx: Elf64_Half
+
+
+@structure
+class ProgramHeader32:
+    p_type: Elf32_Word
+    p_offset: Elf32_Off
+    p_vaddr: Elf32_Addr
+    p_paddr: Elf32_Addr
+    p_filesz: Elf32_Word
+    p_memsz: Elf32_Word
+    p_flags: Elf32_Word
+    p_align: Elf32_Word
+
+
+@structure
+class ProgramHeader64:
+    p_type: Elf64_Word
+    p_flags: Elf64_Word
+    p_offset: Elf64_Off
+    p_vaddr: Elf64_Addr
+    p_paddr: Elf64_Addr
+    p_filesz: Elf64_Xword
+    p_memsz: Elf64_Xword
+    p_align: Elf64_Xword
+
+
+@structure
+class SectionHeader32:
+    sh_name: Elf32_Word
+    sh_type: Elf32_Word
+    sh_flags: Elf32_Word
+    sh_addr: Elf32_Addr
+    sh_offset: Elf32_Off
+    sh_size: Elf32_Word
+    sh_link: Elf32_Word
+    sh_info: Elf32_Word
+    sh_addralign: Elf32_Word
+    sh_entsize: Elf32_Word
+
+
+@structure
+class SectionHeader64:
+    sh_name: Elf64_Word
+    sh_type: Elf64_Word
+    sh_flags: Elf64_Xword
+    sh_addr: Elf64_Addr
+    sh_offset: Elf64_Off
+    sh_size: Elf64_Xword
+    sh_link: Elf64_Word
+    sh_info: Elf64_Word
+    sh_addralign: Elf64_Xword
+    sh_entsize: Elf64_Xword
+
+
+@structure
+class SymbolTableEntry32:
+    st_name: Elf32_Word
+    st_value: Elf32_Addr
+    st_size: Elf32_Word
+    st_info: c_byte
+    st_other: c_byte
+    st_shndx: Elf32_Half
+
+
+@structure
+class SymbolTableEntry64:
+    st_name: Elf64_Word
+    st_info: c_byte
+    st_other: c_byte
+    st_shndx: Elf64_Half
+    st_value: Elf64_Addr
+    st_size: Elf32_Xword
+
+
+@structure
+class RelocationEntries32:
+    r_offset: Elf32_Addr
+    r_info: Elf32_Word
+
+
+@structure
+class RelocationEntriesAddend32:
+    r_offset: Elf32_Addr
+    r_info: Elf32_Word
+    r_addend: Elf32_Sword
+
+
+@structure
+class RelocationEntries64:
+    r_offset: Elf64_Addr
+    r_info: Elf64_Xword
+
+
+@structure
+class RelocationEntriesAddend64:
+    r_offset: Elf64_Addr
+    r_info: Elf64_Xword
+    r_addend: Elf32_Sxword
+
+
+@structure
+class Note32:
+    name_size: Elf32_Word
+    descriptor_size: Elf32_Word
+    type: Elf32_Word
+
+
+@structure
+class Note64:
+    name_size: Elf64_Word
+    descriptor_size: Elf64_Word
+    type: Elf64_Word
+
+
+@structure
+class Dynamic32:
+    dynamic_tag: Elf32_Sword
+    dynamic_value: Elf32_Word
+
+
+@structure
+class Dynamic64:
+    dynamic_tag: Elf64_Sxword
+    dynamic_value: Elf64_Xword
+
+
+@structure
+class CompressionHeader32:
+    ch_type: Elf32_Word
+    ch_size: Elf32_Word
+    ch_addralign: Elf32_Word
+
+
+@structure
+class CompressionHeader64:
+    ch_type: Elf64_Word
+    ch_reserved: Elf64_Word
+    ch_size: Elf64_Xword
+    ch_addralign: Elf64_Xword
+
+
+sections_description = {
+    ".bss": "Uninitialized data",
+    ".comment": "Version control information",
+    ".data": "Initialized data",
+    ".data1": "Initialized data",
+    ".debug": "Symbolic debugging information",
+    ".dynamic": "Dynamic linking information",
+    ".dynstr": "Dynamic linking strings",
+    ".dynsym": "Dynamic linking symbol table",
+    ".fini": "Process termination code",
+    ".fini_array": "Termination function pointers",
+    ".got": "Global offset table",
+    ".hash": "Symbol hash table",
+    ".init": "Process initialization code",
+    ".init_array": "Initialization function pointers",
+    ".interp": "Program interpreter",
+    ".line": "Line number for debugging",
+    ".note": "Specific vendor information",
+    ".plt": "Procedure linkage table",
+    ".preinit_array": "Pre-initialization functions",
+    ".rel": "Relocation information,",
+    ".rodata": "Read-only data",
+    ".rodata1": "Read-only data",
+    ".shstrtab": "Section names",
+    ".strtab": "Strings (symbol table)",
+    ".symtab": "Symbol table",
+    ".symtab_shndx": "Special symbol table",
+    ".tbss": "Uninitialized thread-local data",
+    ".tdata": "Initialized thread-local data",
+    ".text": "Executable instruction",
+}
+
+
+@lru_cache(maxsize=None)
+def enum_values(enum_class: Enum) -> Dict[int, Enum]:
+    """
+    This function builds (on first call only) and returns
+    the lookup table value to constant for an Enum.
+    """
+
+    values = {}
+    for constant in enum_class:
+        values.setdefault(constant.value, constant)
+    return values
+
+
+@lru_cache(maxsize=None)
+def enum_constants(enum_class: Enum) -> Tuple[Enum]:
+    """
+    This function builds (on first call only) and returns
+    the constants of an Enum.
+    """
+
+    return tuple(enum_class)
+
+
+def enum_from_value(value: _CData, enum_class: Enum) -> Field:
+    """
+    This function returns a Field with Enum name and value.
+    """
+
+    constant = enum_values(enum_class).get(value.value)
+    if constant is None:
+        return Field(value, "UNDEFINED")
+
+    return Field(
+        value,
+        constant.name,
+        getattr(constant.value, "usage", None),
+        getattr(constant.value, "description", None),
+    )
+
+
+def enum_from_flags(value: _CData, enum_class: Enum) -> Iterable[Field]:
+    """
+    This function yields Fields with Enum name and value.
+    """
+
+    for constant in enum_constants(enum_class):
+        if constant.value & value.value:
+            yield Field(
+                value,
+                constant.name,
+                getattr(constant.value, "usage", None),
+                getattr(constant.value, "description", None),
+            )
+
+
+def parse_from_structure(file: _BufferedIOBase, structure: type) -> Structure:
+    """
+    This function reads file and parse readed data
+    to Structure and returns it.
+    """
+
+    return structure(file.read(sizeof(structure)))
+
+
+def read_until(file: _BufferedIOBase, end_data: bytes) -> bytes:
+    """
+    This function reads file until data end doesn't match the end_data params.
+    """
+
+    old_position = file.tell()
+    data = file.read(1)
+    position = file.tell()
+    while not data.endswith(end_data) and old_position < position:
+        old_position = position
+        data += file.read(1)
+        position = file.tell()
+
+    return data
+
+
+def read_string(file: _BufferedIOBase) -> c_char_p:
+    """
+    This function reads file a NULL terminating string from file position.
+    """
+
+    return c_char_p(read_until(file, b"\0"))
+
+
+def get_padding_length(data_size: int, padding_to: int) -> int:
+    """
+    This function returns the padding length for this field.
+    """
+
+    padding_length = data_size % padding_to
+    return padding_to - padding_length if padding_length else 0
+
+
+def start_printable() -> None:
+    """
+    This function starts printing.
+    """
+
+    print(
+        "\x1b[38;2;183;121;227m"
+        + "Data name".ljust(25)
+        + "\x1b[38;2;255;240;175m"
+        + "Position".ljust(20)
+        + "\x1b[38;2;255;208;11m"
+        + "Data hexadecimal".ljust(40)
+        + "\x1b[38;2;212;171;242m"
+        + "Data".ljust(20)
+        + "\x1b[38;2;201;247;87m"
+        + "Information"
+        + "\x1b[39m\n"
+    )
+
+
+def main() -> int:
+    """
+    This function runs the script from the command line.
+    """
+
+    print(copyright, file=stderr)
+
+    if argv[1:2] == ["diff"]:
+        return main_diff()
+
+    if argv[1:2] == ["strings"]:
+        return main_strings()
+
+    if argv[1:2] == ["signatures"]:
+        return main_signatures()
+
+    if argv[1:2] == ["ldd"]:
+        return main_ldd()
+
+    if argv[1:2] == ["addr2line"]:
+        return main_addr2line()
+
+    if argv[1:2] == ["abi"]:
+        return main_abi()
+
+    if argv[1:2] == ["stats"]:
+        return main_stats()
+
+    if argv[1:2] == ["batch"]:
+        return main_batch()
+
+    if argv[1:2] == ["serve"]:
+        return main_serve()
+
+    if argv[1:2] == ["client"]:
+        return main_client()
+
+    if "--size-report" in argv:
+        argv.remove("--size-report")
+        return main_size_report()
+
+    url = False
+    hashes = False
+    verbose = False
+    no_color = False
+
+    if "-u" in argv:
+        argv.remove("-u")
+        url = True
+
+    if "-v" in argv:
+        argv.remove("-v")
+        verbose = True
+
+    if "-c" in argv:
+        argv.remove("-c")
+        no_color = True
+
+    if "-H" in argv:
+        argv.remove("-H")
+        hashes = True
+
+    if len(argv) != 2:
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" [-c(no '
+            "color)] [-v(verbose)] [-u(url)] [-H(hashes)] "
+            "(ElfFile|Archive|-)",
+            file=stderr,
+        )
+        return 1
+
+    if url:
+        from urllib.request import urlopen
+
+    if argv[1] == "-":
+        file = stdin.buffer
+    else:
+        file = BytesIO(urlopen(argv[1]).read()) if url else open(argv[1], "rb")
+
+    Data.verbose = verbose
+    Data.no_color = no_color
+
+    if not peek_file(file, 4) == b"\x7fELF" and get_container_type(file):
+        from tarfile import TarError
+        from zipfile import BadZipFile
+
+        try:
+            for archive_path, name, member in iter_container_elffiles(
+                file, argv[1]
+            ):
+                Title(f"{archive_path}:{name}").print()
+                print_elffile(member)
+        except (TarError, BadZipFile) as error:
+            print(f"{argv[1]!r} is not a valid container:", error, file=stderr)
+            return 1
+        finally:
+            file.close()
+
+        return 0
+
+    if not file.seekable():
+        file = spool_file(file)
+
+    if file.read(8) == b"!<arch>\n":
+        members, _ = parse_archive(file)
+        for member in members:
+            view = FileView(file, member.offset, member.size, member.name)
+            if view.read(4) == b"\x7fELF":
+                view.seek(0)
+                Title("Archive member " + member.name).print()
+                print_elffile(view)
+
+        file.close()
+        return 0
+
+    file.seek(0)
+    if file.read(4) != b"\x7fELF":
+        print(
+            f"{argv[1]!r} is not an ELF file, an archive or a container",
+            file=stderr,
+        )
+        file.close()
+        return 1
+
+    filesize = file.seek(0, 2)
+    file.seek(0)
+    import_entropy_charts()
+    (
+        elfindent,
+        elf_headers,
+        programs_headers,
+        elf_sections,
+        symbols_tables,
+        comments,
+        note_sections,
+        notes,
+        dynamics,
+        sections,
+    ) = print_elffile(file)
+
+    if hashes:
+        cli_hashes(hash_elffile(file, elf_sections, programs_headers))
+
+    if entropy_charts_import:
+        file.seek(0)
+        charts_chunks_file_entropy(
+            file,
+            part_size=round(filesize / 100),
+            sections=sections,
+        )
+
+    file.close()
+    return 0
+
+
+def pop_option(arguments: List[str], option: str, default: Any = None) -> Any:
+    """
+    This function removes an option and its value from command
+    line arguments and returns the value (default when the option
+    is not used, a trailing option without value is kept in
+    arguments so arguments number is invalid).
+    """
+
+    if option not in arguments:
+        return default
+
+    index = arguments.index(option)
+    if index + 1 >= len(arguments):
+        return default
+
+    value = arguments[index + 1]
+    del arguments[index : index + 2]
+    return value
+
+
+def main_diff() -> int:
+    """
+    This function compares two ELF files from the command line,
+    it returns 0 when files are identical, 1 when they differ.
+    """
+
+    arguments = argv.copy()
+
+    if "-c" in arguments:
+        arguments.remove("-c")
+        Data.no_color = True
+
+    if len(arguments) != 4:
+        print(
+            f'USAGES: "{executable}" "{arguments[0]}" diff [-c(no color)] '
+            "ElfFile1 ElfFile2",
+            file=stderr,
+        )
+        return 2
+
+    with open(arguments[2], "rb") as file1, open(arguments[3], "rb") as file2:
+        differences = [*diff_elffiles(file1, file2)]
+
+    cli_diff(differences)
+    return 1 if differences else 0
+
+
+def main_strings() -> int:
+    """
+    This function prints strings of ELF sections from the command line.
+    """
+
+    arguments = argv.copy()
+
+    if "-c" in arguments:
+        arguments.remove("-c")
+        Data.no_color = True
+
+    min_length = pop_option(arguments, "-n", "4")
+
+    if len(arguments) != 3 or not min_length.isdigit() or not int(min_length):
+        print(
+            f'USAGES: "{executable}" "{arguments[0]}" strings [-c(no color)] '
+            "[-n MinLength] ElfFile",
+            file=stderr,
+        )
+        return 1
+
+    with open(arguments[2], "rb") as file:
+        elfindent, elf_classe = parse_elfidentification(file)
+        elf_headers = parse_elfheaders(file, elf_classe)
+        elf_sections = parse_elfsections(file, elf_headers, elf_classe)[0]
+        compressed = {
+            section.name
+            for section in elf_sections
+            if section.sh_flags.value
+            & SectionAttributeFlags.SHF_COMPRESSED.value
+            or section.name.startswith(".zdebug")
+        }
+
+        Title("Strings").print()
+        for name, offset, encoding, string in extract_strings(
+            file, elf_sections, int(min_length)
+        ):
+            data = string.encode(encoding)
+            Data(
+                (
+                    f"{name} (decompressed) {encoding}"
+                    if name in compressed
+                    else f"{name} {encoding}"
+                ),
+                offset,
+                offset + len(data),
+                data,
+                string,
+                False,
+            ).print()
+
+    return 0
+
+
+def main_signatures() -> int:
+    """
+    This function scans an ELF file with bytes signatures
+    from the command line.
+    """
+
+    if "-c" in argv:
+        argv.remove("-c")
+        Data.no_color = True
+
+    if len(argv) != 4:
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" signatures [-c(no color)] '
+            "SignaturesFile ElfFile",
+            file=stderr,
+        )
+        return 1
+
+    from os.path import expanduser, join
+
+    with open(argv[2], encoding="utf-8") as signatures_file:
+        signatures = parse_signatures_file(signatures_file)
+
+    scanner = SignatureScanner(
+        signatures, join(expanduser("~"), ".cache", "ElfAnalyzer")
+    )
+
+    with open(argv[3], "rb") as file:
+        (
+            elfindent,
+            elf_headers,
+            programs_headers,
+            elf_sections,
+            symbols_tables,
+            *_,
+        ) = parse_elffile(file)
+
+        Title("Signatures").print()
+        for match in scanner.scan_elffile(
+            file, elf_sections, programs_headers, symbols_tables
+        ):
+            file.seek(match.offset)
+            Data(
+                match.name,
+                match.offset,
+                match.offset + match.size,
+                file.read(match.size),
+                f"{match.section or ''} {match.symbol or ''}".strip(),
+                False,
+            ).print()
+
+    return 0
+
+
+def main_ldd() -> int:
+    """
+    This function prints shared libraries dependencies
+    from the command line (without executing anything).
+    """
+
+    sysroot = None
+
+    if "-c" in argv:
+        argv.remove("-c")
+        Data.no_color = True
+
+    if "-r" in argv:
+        index = argv.index("-r")
+        sysroot = argv[index + 1]
+        del argv[index : index + 2]
+
+    if len(argv) < 3:
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" ldd [-c(no color)] '
+            "[-r Sysroot] ElfFile1 [ElfFile2 ...]",
+            file=stderr,
+        )
+        return 1
+
+    resolver = DependencyResolver(sysroot or "/")
+    for path in argv[2:]:
+        Title(path).print()
+        if sysroot is None:
+            path = abspath(path)
+
+        try:
+            graph = resolver.resolve(path)
+        except ValueError as error:
+            print(error, file=stderr)
+            continue
+
+        interpreter = resolver.get_info(path).interpreter
+        if interpreter:
+            print("Interpreter:", interpreter)
+
+        for object_path, dependencies in graph.items():
+            print(object_path)
+            for name, library in dependencies:
+                line = f"    {name} => {library or 'not found'}"
+                print(
+                    line
+                    if library or Data.no_color
+                    else "\x1b[38;2;255;95;95m" + line + "\x1b[39m"
+                )
+
+    return 0
+
+
+def main_addr2line() -> int:
+    """
+    This function prints symbol, section and source line
+    of addresses from the command line.
+    """
+
+    if len(argv) < 4:
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" addr2line ElfFile '
+            "Address1 [Address2 ...]",
+            file=stderr,
+        )
+        return 1
+
+    addresses = [int(address, 16) for address in argv[3:]]
+    locations = symbolize(argv[2], addresses)
+
+    with open(argv[2], "rb") as file:
+        lines = DwarfLineIndex(file)
+        for location in locations:
+            source = lines.lookup(location.address)
+            print(
+                f"{location.address:#x}",
+                (
+                    f"{location.symbol}+{location.offset:#x}"
+                    if location.symbol
+                    else "??"
+                ),
+                location.section or "??",
+                f"{source[0]}:{source[1]}" if source else "??:0",
+            )
+
+    return 0
+
+
+def main_size_report() -> int:
+    """
+    This function prints file and virtual memory sizes of segments,
+    sections and symbols from the command line, or differences
+    between two ELF files sizes.
+    """
+
+    limit = 20
+
+    if "-c" in argv:
+        argv.remove("-c")
+        Data.no_color = True
+
+    if "-n" in argv:
+        index = argv.index("-n")
+        limit = int(argv[index + 1])
+        del argv[index : index + 2]
+
+    if len(argv) not in (2, 3):
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" --size-report [-c(no '
+            "color)] [-n SymbolsNumber] ElfFile [NewElfFile]",
+            file=stderr,
+        )
+        return 1
+
+    reports = []
+    for path in argv[1:]:
+        with open(path, "rb") as file:
+            reports.append(get_size_report(file))
+
+    entries = (
+        reports[0]
+        if len(reports) == 1
+        else diff_size_reports(reports[0], reports[1])
+    )
+    sign = "+" if len(reports) == 2 else ""
+
+    for category, title in (
+        ("segment", "Segments sizes"),
+        ("section", "Sections sizes"),
+        ("symbol", "Symbols sizes"),
+    ):
+        Title(title).print()
+        print(f"{'VM SIZE':>14} {'FILE SIZE':>14}  NAME")
+        elements = [entry for entry in entries if entry.category == category]
+        if category == "symbol":
+            elements = sorted(
+                elements,
+                key=lambda entry: -abs(entry.vm_size) - abs(entry.file_size),
+            )[:limit]
+        for entry in elements:
+            print(
+                f"{entry.vm_size:>{sign}14,} {entry.file_size:>{sign}14,}  "
+                + entry.name
+                + (f" ({entry.parent})" if entry.parent else "")
+            )
+
+    Title("Total").print()
+    for report, name in zip(reports, argv[1:]):
+        sections = [entry for entry in report if entry.category == "section"]
+        print(
+            f"{sum(entry.vm_size for entry in sections):>14,} "
+            f"{sum(entry.file_size for entry in sections):>14,}  {name}"
+        )
+
+    return 0
+
+
+def main_abi() -> int:
+    """
+    This function compares exported symbols of two shared libraries,
+    or of a directory and an ABI manifest, from the command line,
+    it returns 1 when symbols are removed or changed (functions
+    resized are not breaking changes).
+    """
+
+    arguments = argv.copy()
+    write = False
+
+    if "-c" in arguments:
+        arguments.remove("-c")
+        Data.no_color = True
+
+    if "-w" in arguments:
+        arguments.remove("-w")
+        write = True
+
+    manifest = "-m" in arguments
+    if manifest:
+        arguments.remove("-m")
+
+    if len(arguments) != 4 or (write and not manifest):
+        print(
+            f'USAGES: "{executable}" "{arguments[0]}" abi [-c(no color)] '
+            "(OldLibrary NewLibrary|-m [-w(write)] Manifest.json Directory)",
+            file=stderr,
+        )
+        return 2
+
+    from json import dump
+
+    if write:
+        with open(arguments[2], "w", encoding="utf-8") as file:
+            dump(
+                get_abi_manifest(arguments[3]), file, indent=1, sort_keys=True
+            )
+        return 0
+
+    if manifest:
+        with open(arguments[2], encoding="utf-8") as file:
+            differences = diff_abi_manifest(
+                load_abi_manifest(file), get_abi_manifest(arguments[3])
+            )
+    else:
+        with open(arguments[2], "rb") as old, open(arguments[3], "rb") as new:
+            differences = {
+                arguments[3]: diff_abi_symbols(
+                    get_abi_symbols(old), get_abi_symbols(new)
+                )
+            }
+
+    breaking = False
+    for library, library_differences in differences.items():
+        cli_diff(library_differences, "ABI differences " + library)
+        breaking = breaking or any(
+            difference.status in ("removed", "changed")
+            for difference in library_differences
+        )
+
+    return 1 if breaking else 0
+
+
+def main_stats() -> int:
+    """
+    This function prints a JSON summary of statistics
+    of all ELF files in a directory from the command line.
+    """
+
+    arguments = argv.copy()
+    processes = pop_option(arguments, "-p")
+    top = pop_option(arguments, "-n", "20")
+    output = pop_option(arguments, "-o")
+
+    if (
+        len(arguments) != 3
+        or not top.isdigit()
+        or not (processes is None or processes.isdigit())
+    ):
+        print(
+            f'USAGES: "{executable}" "{arguments[0]}" stats [-p Processes] '
+            "[-n TopNumber] [-o Output.json] Directory",
+            file=stderr,
+        )
+        return 1
+
+    from json import dumps
+
+    summary = dumps(
+        summarize_statistics(
+            get_corpus_statistics(arguments[2], processes and int(processes)),
+            int(top),
+        ),
+        indent=1,
+    )
+
+    if output is None:
+        print(summary)
+    else:
+        with open(output, "w", encoding="utf-8") as file:
+            file.write(summary)
+
+    return 0
+
+
+def main_batch() -> int:
+    """
+    This function runs a resumable batch scan of a directory
+    (NDJSON records) from the command line.
+    """
+
+    arguments = argv.copy()
+    options = {
+        option: pop_option(arguments, option, default)
+        for option, default in (
+            ("-p", None),
+            ("-j", None),
+            ("-t", None),
+            ("-r", None),
+            ("-b", "256"),
+        )
+    }
+
+    if len(arguments) != 4 or not all(
+        value is None or value.isdigit()
+        for option, value in options.items()
+        if option != "-j"
+    ):
+        print(
+            f'USAGES: "{executable}" "{arguments[0]}" batch [-p Processes] '
+            "[-j Journal] [-t MaxTasksPerWorker] [-r MaxWorkerRSSMiB] "
+            "[-b MaxInFlightMiB] Directory Output.ndjson",
+            file=stderr,
+        )
+        return 1
+
+    try:
+        counts = run_batch(
+            arguments[2],
+            arguments[3],
+            options["-j"],
+            options["-p"] and int(options["-p"]),
+            max_tasks_per_child=options["-t"] and int(options["-t"]),
+            max_rss=options["-r"] and int(options["-r"]) * 1048576,
+            max_in_flight_bytes=int(options["-b"]) * 1048576,
+        )
+    except ValueError as error:
+        print(error, file=stderr)
+        return 1
+
+    print(
+        f"{counts['written']} records written, {counts['skipped']} files "
+        f"skipped (already scanned), {counts['records']} records in "
+        + arguments[3]
+    )
+    return 0
+
+
+def main_serve() -> int:
+    """
+    This function runs the analysis daemon from the command line.
+    """
+
+    cache_size = 1024
+
+    if "-n" in argv:
+        index = argv.index("-n")
+        cache_size = int(argv[index + 1])
+        del argv[index : index + 2]
+
+    if len(argv) != 3:
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" serve [-n CacheSize] '
+            "(SocketPath|HttpPort(requests authenticated by the "
+            "ELFANALYZER_TOKEN environment variable or a printed random "
+            "token))",
+            file=stderr,
+        )
+        return 1
+
+    address = int(argv[2]) if argv[2].isdigit() else argv[2]
+    token = None
+    if isinstance(address, int):
+        from secrets import token_urlsafe
+        from os import environ
+
+        token = environ.get("ELFANALYZER_TOKEN") or token_urlsafe(24)
+        print(
+            f"Listening on http://127.0.0.1:{address}/ (Authorization: "
+            f"Bearer {token}, export ELFANALYZER_TOKEN for the client)",
+            file=stderr,
+        )
+    else:
+        print("Listening on", address, file=stderr)
+
+    from signal import SIGTERM, signal
+
+    signal(SIGTERM, lambda *_: exit(0))
+
+    try:
+        serve(address, AnalysisServer(cache_size), token)
+    except KeyboardInterrupt:
+        pass
+    except FileExistsError as error:
+        print(error, file=stderr)
+        return 1
+
+    return 0
+
+
+def main_client() -> int:
+    """
+    This function sends ELF files to the analysis daemon from the
+    command line and prints one JSON response by line.
+    """
+
+    detail = "dynamic"
+    upload = False
+
+    if "-d" in argv:
+        index = argv.index("-d")
+        detail = argv[index + 1]
+        del argv[index : index + 2]
+
+    if "-U" in argv:
+        argv.remove("-U")
+        upload = True
+
+    if len(argv) < 4:
+        print(
+            f'USAGES: "{executable}" "{argv[0]}" client [-d (layout|dynamic'
+            "|symbols|size)] [-U(upload)] (SocketPath|http://127.0.0.1:Port"
+            "/) ElfFile1 [ElfFile2 ...]",
+            file=stderr,
+        )
+        return 1
+
+    from json import dumps
+    from os import environ
+
+    client = AnalysisClient(argv[2], environ.get("ELFANALYZER_TOKEN"))
+    errors = False
+
+    try:
+        for path in argv[3:]:
+            if upload:
+                with open(path, "rb") as file:
+                    response = client.analyze(data=file.read(), detail=detail)
+            else:
+                response = client.analyze(path, detail=detail)
+            errors = errors or "error" in response
+            print(dumps({"path": path, **response}))
+    finally:
+        client.close()
+
+    return 1 if errors else 0
+
+
+def print_elffile(file: _BufferedIOBase) -> Tuple:
+    """
+    This function parses the ELF file, prints results in CLI
+    and returns the parse_elffile result (the partial result
+    when the parse budget is exceeded).
+    """
+
+    try:
+        result = parse_elffile(file)
+    except ParseBudgetError as error:
+        if error.partial[1] is None:
+            raise
+        print("Partial result:", error, file=stderr)
+        result = [[] if value is None else value for value in error.partial]
+
+    (
+        elfindent,
+        elf_headers,
+        programs_headers,
+        elf_sections,
+        symbols_tables,
+        comments,
+        note_sections,
+        notes,
+        dynamics,
+        sections,
+    ) = result
+    cli(
+        elfindent,
+        elf_headers,
+        programs_headers,
+        elf_sections,
+        symbols_tables,
+        comments,
+        notes,
+        dynamics,
+        sections,
+    )
+    return (
+        elfindent,
+        elf_headers,
+        programs_headers,
+        elf_sections,
+        symbols_tables,
+        comments,
+        note_sections,
+        notes,
+        dynamics,
+        sections,
+    )
+
+
+def cli(
+    elf_ident: ElfIdent,
+    elf_header: Union[ElfHeader32, ElfHeader64],
+    elf_tables: List[Union[ProgramHeader32, ProgramHeader64]],
+    elf_sections: List[Union[SectionHeader32, SectionHeader64]],
+    symbols: List[Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]],
+    comments: List[bytes],
+    note_sections: List[Union[SectionHeader32, SectionHeader64]],
+    dynamicStructures: List[Union[Dynamic32, Dynamic64]],
+    sections: List[Section],
+) -> None:
+    """
+    This function prints results in CLI.
+    """
+
+    Title("ELF identification").print()
+
+    Data(
+        "Magic bytes",
+        elf_ident.ei_mag.value._start_position_,
+        elf_ident.ei_mag.value._end_position_,
+        elf_ident.ei_mag.value.value,
+        elf_ident.ei_mag.information,
+    ).print()
+
+    Data(
+        "ELF class",
+        elf_ident.ei_class.value._start_position_,
+        elf_ident.ei_class.value._end_position_,
+        elf_ident.ei_class.value._data_,
+        f"{elf_ident.ei_class.information} ({elf_ident.ei_class.value.value})",
+    ).print()
+
+    Data(
+        "ELF data",
+        elf_ident.ei_data.value._start_position_,
+        elf_ident.ei_data.value._end_position_,
+        elf_ident.ei_data.value._data_,
+        f"{elf_ident.ei_data.information} ({elf_ident.ei_data.value.value})",
+    ).print()
+
+    Data(
+        "ELF version",
+        elf_ident.ei_version.value._start_position_,
+        elf_ident.ei_version.value._end_position_,
+        elf_ident.ei_version.value._data_,
+        elf_ident.ei_version.information
+        + f" ({elf_ident.ei_version.value.value})",
+    ).print()
+
+    Data(
+        "ELF operating system",
+        elf_ident.ei_osabi.value._start_position_,
+        elf_ident.ei_osabi.value._end_position_,
+        elf_ident.ei_osabi.value._data_,
+        elf_ident.ei_osabi.information
+        + f" ({elf_ident.ei_osabi.value.value})",
+        False,
+    ).print()
+
+    Data(
+        "ELF defined OS",
+        elf_ident.ei_abiversion.value._start_position_,
+        elf_ident.ei_abiversion.value._end_position_,
+        elf_ident.ei_abiversion.value._data_,
+        elf_ident.ei_abiversion.information
+        + f" ({elf_ident.ei_abiversion.value.value})",
+    ).print()
+
+    Data(
+        "ELF start padding",
+        elf_ident.ei_pad.value._start_position_,
+        elf_ident.ei_pad.value._end_position_,
+        elf_ident.ei_pad.value._data_,
+        elf_ident.ei_pad.information,
+    ).vprint()
+
+    Data(
+        "ELF padding",
+        elf_ident.ei_nident.value._start_position_,
+        elf_ident.ei_nident.value._end_position_,
+        elf_ident.ei_nident.value._data_,
+        elf_ident.ei_nident.information,
+    ).vprint()
+
+    Title("ELF headers").print()
+
+    Data(
+        "ELF type",
+        elf_header.e_type.value._start_position_,
+        elf_header.e_type.value._end_position_,
+        elf_header.e_type.value._data_,
+        f"{elf_header.e_type.information} ({elf_header.e_type.value.value})",
+    ).print()
+
+    Data(
+        "ELF machine",
+        elf_header.e_machine.value._start_position_,
+        elf_header.e_machine.value._end_position_,
+        elf_header.e_machine.value._data_,
+        elf_header.e_machine.information
+        + f" ({elf_header.e_machine.value.value})",
+        False,
+    ).print()
+
+    Data(
+        "ELF version",
+        elf_header.e_version.value._start_position_,
+        elf_header.e_version.value._end_position_,
+        elf_header.e_version.value._data_,
+        elf_header.e_version.information
+        + f" ({elf_header.e_version.value.value})",
+    ).print()
+
+    Data(
+        "ELF entry point",
+        elf_header.e_entry.value._start_position_,
+        elf_header.e_entry.value._end_position_,
+        elf_header.e_entry.value._data_,
+        f"{elf_header.e_entry.information} ({elf_header.e_entry.value.value})",
+    ).print()
+
+    Data(
+        "ELF header table offset",
+        elf_header.e_phoff.value._start_position_,
+        elf_header.e_phoff.value._end_position_,
+        elf_header.e_phoff.value._data_,
+        f"{elf_header.e_phoff.information} ({elf_header.e_phoff.value.value})",
+    ).vprint()
+
+    Data(
+        "ELF section table offset",
+        elf_header.e_shoff.value._start_position_,
+        elf_header.e_shoff.value._end_position_,
+        elf_header.e_shoff.value._data_,
+        f"{elf_header.e_shoff.information} ({elf_header.e_shoff.value.value})",
+    ).vprint()
+
+    Data(
+        "ELF processor specific",
+        elf_header.e_flags.value._start_position_,
+        elf_header.e_flags.value._end_position_,
+        elf_header.e_flags.value._data_,
+        f"{elf_header.e_flags.information} ({elf_header.e_flags.value.value})",
+    ).print()
+
+    Data(
+        "ELF header's size",
+        elf_header.e_ehsize.value._start_position_,
+        elf_header.e_ehsize.value._end_position_,
+        elf_header.e_ehsize.value._data_,
+        elf_header.e_ehsize.information
+        + f" ({elf_header.e_ehsize.value.value})",
+        False,
+    ).print()
+
+    Data(
+        "ELF entry header size",
+        elf_header.e_phentsize.value._start_position_,
+        elf_header.e_phentsize.value._end_position_,
+        elf_header.e_phentsize.value._data_,
+        elf_header.e_phentsize.information
+        + f" ({elf_header.e_phentsize.value.value})",
+    ).print()
+
+    Data(
+        "ELF header entry length",
+        elf_header.e_phnum.value._start_position_,
+        elf_header.e_phnum.value._end_position_,
+        elf_header.e_phnum.value._data_,
+        f"{elf_header.e_phnum.information} ({elf_header.e_phnum.value.value})",
+    ).print()
+
+    Data(
+        "ELF entry section size",
+        elf_header.e_shentsize.value._start_position_,
+        elf_header.e_shentsize.value._end_position_,
+        elf_header.e_shentsize.value._data_,
+        elf_header.e_shentsize.information
+        + f" ({elf_header.e_shentsize.value.value})",
+    ).print()
+
+    Data(
+        "ELF section entry length",
+        elf_header.e_shnum.value._start_position_,
+        elf_header.e_shnum.value._end_position_,
+        elf_header.e_shnum.value._data_,
+        f"{elf_header.e_shnum.information} ({elf_header.e_shnum.value.value})",
+    ).print()
+
+    Data(
+        "Section header table",
+        elf_header.e_shstrndx.value._start_position_,
+        elf_header.e_shstrndx.value._end_position_,
+        elf_header.e_shstrndx.value._data_,
+        elf_header.e_shstrndx.information
+        + f" ({elf_header.e_shstrndx.value.value})",
+    ).print()
+
+    Title("ELF header table").print()
+
+    for elf_table in elf_tables:
+        Data(
+            "Program header type",
+            elf_table.p_type.value._start_position_,
+            elf_table.p_type.value._end_position_,
+            elf_table.p_type.value._data_,
+            f"{elf_table.p_type.information} ({elf_table.p_type.value.value})",
+            False,
+        ).print()
+
+        for flags in elf_table.flags:
+            Data(
+                "Program header flags",
+                flags.value._start_position_,
+                flags.value._end_position_,
+                flags.value._data_,
+                f"{flags.information} ({flags.value.value})",
+                False,
+            ).print()
+
+        Data(
+            "Program header address",
+            elf_table.p_offset.value._start_position_,
+            elf_table.p_offset.value._end_position_,
+            elf_table.p_offset.value._data_,
+            elf_table.p_offset.information
+            + f" ({elf_table.p_offset.value.value})",
+        ).print()
+
+        Data(
+            "Virtual address memory",
+            elf_table.p_vaddr.value._start_position_,
+            elf_table.p_vaddr.value._end_position_,
+            elf_table.p_vaddr.value._data_,
+            elf_table.p_vaddr.information
+            + f" ({elf_table.p_vaddr.value.value})",
+        ).vprint()
+
+        Data(
+            "Physical address",
+            elf_table.p_paddr.value._start_position_,
+            elf_table.p_paddr.value._end_position_,
+            elf_table.p_paddr.value._data_,
+            elf_table.p_paddr.information
+            + f" ({elf_table.p_paddr.value.value})",
+        ).vprint()
+
+        Data(
+            "Segment length file",
+            elf_table.p_filesz.value._start_position_,
+            elf_table.p_filesz.value._end_position_,
+            elf_table.p_filesz.value._data_,
+            elf_table.p_filesz.information
+            + f" ({elf_table.p_filesz.value.value})",
+        ).print()
+
+        Data(
+            "Segment length memory",
+            elf_table.p_memsz.value._start_position_,
+            elf_table.p_memsz.value._end_position_,
+            elf_table.p_memsz.value._data_,
+            elf_table.p_memsz.information
+            + f" ({elf_table.p_memsz.value.value})",
+        ).print()
+
+        Data(
+            "Segment alignment",
+            elf_table.p_align.value._start_position_,
+            elf_table.p_align.value._end_position_,
+            elf_table.p_align.value._data_,
+            elf_table.p_align.information
+            + f" ({elf_table.p_align.value.value})",
+        ).print()
+
+    Title("ELF section table").print()
+
+    for elf_section in elf_sections:
+        Data(
+            "Name: " + elf_section.name,
+            elf_section.name._start_position_,
+            elf_section.name._end_position_,
+            elf_section.name._data_,
+            sections_description.get(
+                "." + elf_section.name.split(".")[1]
+                if "." in elf_section.name
+                else "",
+                "Undefined section role.",
+            ),
+            False,
+        ).print()
+
+        Data(
+            "Section name position",
+            elf_section.sh_name.value._start_position_,
+            elf_section.sh_name.value._end_position_,
+            elf_section.sh_name.value._data_,
+            elf_section.sh_name.information
+            + f" ({elf_section.sh_name.value.value})",
+        ).vprint()
+
+        Data(
+            "Section type",
+            elf_section.sh_type.value._start_position_,
+            elf_section.sh_type.value._end_position_,
+            elf_section.sh_type.value._data_,
+            elf_section.sh_type.information
+            + f" ({elf_section.sh_type.value.value})",
+            False,
+        ).print()
+
+        for flag in elf_section.flags:
+            Data(
+                "Section flags",
+                flag.value._start_position_,
+                flag.value._end_position_,
+                flag.value._data_,
+                f"{flag.information} ({flag.value.value})",
+                False,
+            ).print()
+
+        Data(
+            "Section memory address",
+            elf_section.sh_addr.value._start_position_,
+            elf_section.sh_addr.value._end_position_,
+            elf_section.sh_addr.value._data_,
+            elf_section.sh_addr.information
+            + f" ({elf_section.sh_addr.value.value})",
+        ).vprint()
+
+        Data(
+            "Section offset",
+            elf_section.sh_offset.value._start_position_,
+            elf_section.sh_offset.value._end_position_,
+            elf_section.sh_offset.value._data_,
+            elf_section.sh_offset.information
+            + f" ({elf_section.sh_offset.value.value})",
+        ).print()
+
+        Data(
+            "Section size",
+            elf_section.sh_size.value._start_position_,
+            elf_section.sh_size.value._end_position_,
+            elf_section.sh_size.value._data_,
+            elf_section.sh_size.information
+            + f" ({elf_section.sh_size.value.value})",
+        ).print()
+
+        if elf_section.compression is not None:
+            compression = elf_section.compression
+            Data(
+                "Compression type",
+                compression.ch_type.value._start_position_,
+                compression.ch_type.value._end_position_,
+                compression.ch_type.value._data_,
+                compression.ch_type.information
+                + f" ({compression.ch_type.value.value})",
+                False,
+            ).print()
+
+            Data(
+                "Uncompressed size",
+                compression.ch_size.value._start_position_,
+                compression.ch_size.value._end_position_,
+                compression.ch_size.value._data_,
+                compression.ch_size.information
+                + f" ({compression.ch_size.value.value})",
+            ).print()
+
+        Data(
+            "Section link",
+            elf_section.sh_link.value._start_position_,
+            elf_section.sh_link.value._end_position_,
+            elf_section.sh_link.value._data_,
+            elf_section.sh_link.information
+            + f" ({elf_section.sh_link.value.value})",
+        ).print()
+
+        Data(
+            "Section info",
+            elf_section.sh_info.value._start_position_,
+            elf_section.sh_info.value._end_position_,
+            elf_section.sh_info.value._data_,
+            elf_section.sh_info.information
+            + f" ({elf_section.sh_info.value.value})",
+        ).print()
+
+        Data(
+            "Section alignment",
+            elf_section.sh_addralign.value._start_position_,
+            elf_section.sh_addralign.value._end_position_,
+            elf_section.sh_addralign.value._data_,
+            elf_section.sh_addralign.information
+            + f" ({elf_section.sh_addralign.value.value})",
+        ).vprint()
+
+        Data(
+            "Symbol table entry size",
+            elf_section.sh_entsize.value._start_position_,
+            elf_section.sh_entsize.value._end_position_,
+            elf_section.sh_entsize.value._data_,
+            elf_section.sh_entsize.information
+            + f" ({elf_section.sh_entsize.value.value})",
+        ).print()
+
+    precedent_name = ""
+
+    for name, symbol in symbols:
+        if name != precedent_name:
+            Title("Symbol tables " + name).print()
+            precedent_name = name
+
+        Data(
+            "Symbol value",
+            symbol.st_value.value._start_position_,
+            symbol.st_value.value._end_position_,
+            symbol.st_value.value._data_,
+            f"{symbol.st_value.information} ({symbol.st_value.value.value})",
+            False,
+        ).print()
+
+        Data(
+            "Associated sizes",
+            symbol.st_size.value._start_position_,
+            symbol.st_size.value._end_position_,
+            symbol.st_size.value._data_,
+            f"{symbol.st_size.information} ({symbol.st_size.value.value})",
+            False,
+        ).print()
+
+        Data(
+            "Section header index",
+            symbol.st_shndx.value._start_position_,
+            symbol.st_shndx.value._end_position_,
+            symbol.st_shndx.value._data_,
+            symbol.st_shndx.information
+            + (" exported" if symbol.st_shndx.value.value else " imported")
+            + " ("
+            + (
+                elf_sections[symbol.st_shndx.value.value].name
+                if len(elf_sections) > symbol.st_shndx.value.value
+                else str(symbol.st_shndx.value.value)
+            )
+            + ")",
+            False,
+        ).print()
+
+        Data(
+            "Symbol binding",
+            symbol.st_info._start_position_,
+            symbol.st_info._end_position_,
+            symbol.st_info._data_,
+            f"{symbol.st_bind.information} ({symbol.st_bind.value.value})",
+            False,
+        ).print()
+
+        Data(
+            "Symbol type",
+            symbol.st_info._start_position_,
+            symbol.st_info._end_position_,
+            symbol.st_info._data_,
+            f"{symbol.st_type.information} ({symbol.st_type.value.value})",
+            False,
+        ).print()
+
+        Data(
+            "Symbol visibility",
+            symbol.st_other._start_position_,
+            symbol.st_other._end_position_,
+            symbol.st_other._data_,
+            symbol.st_visibility.information
+            + f" ({symbol.st_visibility.value.value})",
+            False,
+        ).print()
+
+        Data(
+            "Symbol name",
+            symbol.name._start_position_,
+            symbol.name._end_position_,
+            symbol.name._data_,
+            "Name: " + symbol.name,
+            False,
+        ).print()
+
+        if symbol.version is not None:
+            Data(
+                "Symbol version",
+                symbol.name._start_position_,
+                symbol.name._end_position_,
+                symbol.name._data_,
+                symbol.name
+                + (
+                    "@"
+                    if symbol.version_hidden or symbol.version_file
+                    else "@@"
+                )
+                + symbol.version
+                + (f" ({symbol.version_file})" if symbol.version_file else ""),
+                False,
+            ).print()
+
+    first = True
+    for data in comments:
+        if first:
+            Title("Comment section").print()
+            first = False
+
+        Data(
+            "Version control info",
+            data._start_position_,
+            data._end_position_,
+            data,
+            data.string,
+            False,
+        ).print()
+
+    first = True
+    for note in note_sections:
+        if first:
+            Title("Note sections").print()
+            first = False
+
+        Data(
+            "Note name size",
+            note.name_size._start_position_,
+            note.name_size._end_position_,
+            note.name_size._data_,
+            f"Note name size ({note.name_size.value})",
+            False,
+        ).print()
+
+        Data(
+            "Descriptor size",
+            note.descriptor_size._start_position_,
+            note.descriptor_size._end_position_,
+            note.descriptor_size._data_,
+            f"Note descriptor size ({note.descriptor_size.value})",
+            False,
+        ).print()
+
+        Data(
+            "Note type",
+            note.type._start_position_,
+            note.type._end_position_,
+            note.type._data_,
+            f"Note type ({note.type.value})",
+            False,
+        ).print()
+
+        Data(
+            "Note name",
+            note.name._start_position_,
+            note.name._end_position_,
+            note.name,
+            note.name.string,
+            False,
+        ).print()
+
+        Data(
+            "Note descriptor",
+            note.descriptor._start_position_,
+            note.descriptor._end_position_,
+            note.descriptor,
+            "",
+            False,
+        ).print()
+
+    first = True
+    for dynamic in dynamicStructures:
+        if first:
+            Title("Dynamic section").print()
+            first = False
+
+        Data(
+            f"Tag {dynamic.dynamic_tag.information}",
+            dynamic.dynamic_tag._start_position_,
+            dynamic.dynamic_tag._end_position_,
+            dynamic.dynamic_tag.value._data_,
+            str(dynamic.dynamic_tag.description),
+            False,
+        ).print()
+
+        if dynamic.dynamic_tag.value.value != DynamicType.DT_FLAGS.value:
+            Data(
+                (
+                    "Address"
+                    if dynamic.dynamic_tag.usage == "pointer"
+                    else "Value"
+                ),
+                dynamic.dynamic_value._start_position_,
+                dynamic.dynamic_value._end_position_,
+                dynamic.dynamic_value._data_,
+                str(dynamic.dynamic_value.value),
+                False,
+            ).print()
+        else:
+            for flag in dynamic.dynamic_value.flags:
+                Data(
+                    "Flags " + str(flag.value.value),
+                    flag._start_position_,
+                    flag._end_position_,
+                    flag.value._data_,
+                    flag.description,
+                    False,
+                ).print()
+
+
+def cli_diff(
+    differences: List[Difference], title: str = "ELF differences"
+) -> None:
+    """
+    This function prints differences between two ELF files in CLI.
+    """
+
+    Title(title).print()
+
+    colors = {
+        "added": "\x1b[38;2;201;247;87m",
+        "removed": "\x1b[38;2;255;95;95m",
+        "changed": "\x1b[38;2;255;208;11m",
+        "resized": "\x1b[38;2;95;175;255m",
+    }
+    signs = {"added": "+", "removed": "-", "changed": "~", "resized": "~"}
+
+    for difference in differences:
+        line = (
+            signs[difference.status]
+            + " "
+            + difference.category.ljust(10)
+            + difference.name.ljust(50)
+            + (
+                f"{difference.field}: {difference.old} -> {difference.new}"
+                if difference.status in ("changed", "resized")
+                else ""
+            )
+        )
+        print(
+            line
+            if Data.no_color
+            else colors[difference.status] + line + "\x1b[39m"
+        )
+
+
+def cli_hashes(hashes: Dict[str, Dict[str, Tuple[int, int, str]]]) -> None:
+    """
+    This function prints file, sections and segments hashes in CLI.
+    """
+
+    for title, elements in (
+        ("File hashes", hashes["file"]),
+        ("Sections hashes", hashes["sections"]),
+        ("Segments hashes", hashes["segments"]),
+    ):
+        Title(title).print()
+        for name, element_hashes in elements.items():
+            for algorithm, (start, end, hexdigest) in element_hashes.items():
+                Data(
+                    f"{name} {algorithm}",
+                    start,
+                    end,
+                    b"",
+                    hexdigest,
+                    False,
+                ).print()
+
+
+def parse_elffile(
+    file: _BufferedIOBase,
+    budget: ParseBudget = None,
+) -> Tuple[
+    ElfIdent,
+    Union[ElfHeader32, ElfHeader64],
+    List[Union[ProgramHeader32, ProgramHeader64]],
+    List[Union[SectionHeader32, SectionHeader64]],
+    List[Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]],
+    List[bytes],
+    List[Union[SectionHeader32, SectionHeader64]],
+    List[Union[Note32, Note64]],
+    List[Union[Dynamic32, Dynamic64]],
+    List[Section],
+]:
+    """
+    This function parses ELF file.
+
+    Reads are bounded by budget (a default ParseBudget when None),
+    when the budget is exceeded the ParseBudgetError partial
+    attribute is the result parsed before.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    result = [None] * 10
+    try:
+        result[0], elf_classe = parse_elfidentification(file)
+        elf_headers = result[1] = parse_elfheaders(file, elf_classe)
+        result[2] = []
+        result[2].extend(
+            parse_programheaders(file, elf_headers, elf_classe, budget)
+        )
+        (
+            result[3],
+            strtab_section,
+            symtab_section,
+            dynstr_section,
+            dynsym_section,
+            comment_section,
+            dynamic_section,
+            result[6],
+            result[9],
+        ) = parse_elfsections(file, elf_headers, elf_classe, budget)
+        symbols_tables = result[4] = []
+        symbols_tables.extend(
+            parse_elfsymbolstable(
+                file,
+                dynsym_section,
+                dynstr_section,
+                symtab_section,
+                strtab_section,
+                elf_classe,
+                budget,
+            )
+        )
+        parse_elfsymbolsversions(
+            file,
+            symbols_tables,
+            get_parsed_layout(result[0], elf_headers, result[2], result[3]),
+        )
+        result[5] = []
+        result[5].extend(parse_elfcomment(file, comment_section, budget))
+        result[7] = []
+        result[7].extend(parse_elfnote(file, result[6], elf_classe, budget))
+        result[8] = []
+        result[8].extend(
+            parse_elfdynamic(file, dynamic_section, elf_classe, budget)
+        )
+    except ParseBudgetError as error:
+        error.partial = tuple(result)
+        raise
+
+    return tuple(result)
+
+
+def parse_elfidentification(file: _BufferedIOBase) -> Tuple[ElfIdent, str]:
+    """
+    This function parses ELF identification headers.
+    """
+
+    elf_ident = parse_from_structure(file, ElfIdent)
+    elf_ident.ei_mag = Field(
+        elf_ident.ei_mag,
+        "ELF magic bytes"
+        if elf_ident.ei_mag.value == b"\x7fELF"
+        else "Invalid magic bytes",
+    )
+
+    elf_ident.ei_class = enum_from_value(elf_ident.ei_class, ELfIdentClass)
+    elf_classe = "64" if elf_ident.ei_class.value.value == 2 else "32"
+    elf_ident.ei_data = enum_from_value(elf_ident.ei_data, ELfIdentData)
+
+    DataToCClass.order = (
+        "little" if elf_ident.ei_data.value.value == 1 else "big"
+    )
+    elf_ident.ei_version = enum_from_value(
+        elf_ident.ei_version, ELfIdentVersion
+    )
+    elf_ident.ei_osabi = enum_from_value(elf_ident.ei_osabi, ELfIdentOS)
+
+    elf_ident.ei_abiversion = Field(
+        elf_ident.ei_abiversion,
+        "OS specified" if elf_ident.ei_abiversion else "OS unspecified",
+    )
+
+    elf_ident.ei_pad = Field(elf_ident.ei_pad, "Start padding")
+    elf_ident.ei_nident = Field(elf_ident.ei_nident, "Padding")
+
+    return elf_ident, elf_classe
+
+
+def parse_elfheaders(
+    file: _BufferedIOBase, elf_classe: str
+) -> Union[ElfHeader32, ElfHeader64]:
+    """
+    This function parses ELF headers.
+    """
+
+    file.seek(0)
+
+    elf_header = parse_from_structure(
+        file, globals()["ElfHeader" + elf_classe]
+    )
+
+    elf_header.e_type = enum_from_value(elf_header.e_type, ElfType)
+    elf_header.e_machine = enum_from_value(elf_header.e_machine, ElfMachine)
+    elf_header.e_version = enum_from_value(elf_header.e_version, ElfVersion)
+
+    elf_header.e_entry = Field(
+        elf_header.e_entry,
+        "Entry point" if elf_header.e_entry else "No entry point",
+    )
+
+    elf_header.e_phoff = Field(
+        elf_header.e_phoff,
+        "Program header table offset"
+        if elf_header.e_phoff
+        else "No program header table",
+    )
+
+    elf_header.e_shoff = Field(
+        elf_header.e_shoff,
+        "Section table offset" if elf_header.e_shoff else "No header table",
+    )
+
+    elf_header.e_flags = Field(elf_header.e_flags, "Processor specific flags")
+    elf_header.e_ehsize = Field(elf_header.e_ehsize, "ELF header's size")
+
+    elf_header.e_phentsize = Field(
+        elf_header.e_phentsize, "Entry header table size"
+    )
+
+    elf_header.e_phnum = Field(elf_header.e_phnum, "Header table entry number")
+
+    elf_header.e_shentsize = Field(
+        elf_header.e_shentsize, "Entry section header's size"
+    )
+
+    elf_header.e_shnum = Field(
+        elf_header.e_shnum, "Section header entry number"
+    )
+
+    elf_header.e_shstrndx = Field(
+        elf_header.e_shstrndx, "Section header table address"
+    )
+
+    return elf_header
+
+
+def parse_programheaders(
+    file: _BufferedIOBase,
+    elf_header: Union[ElfHeader32, ElfHeader64],
+    elf_classe: str,
+    budget: ParseBudget = None,
+) -> Iterable[Union[ProgramHeader32, ProgramHeader64]]:
+    """
+    This function parses program headers.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    structure = globals()["ProgramHeader" + elf_classe]
+    offset = elf_header.e_phoff.value.value
+    number = budget.count(
+        offset,
+        elf_header.e_phnum.value.value,
+        sizeof(structure),
+        table="Program headers",
+    )
+    budget.seek(file, offset, "Program headers")
+
+    for _ in range(number):
+        elf_table = parse_from_structure(file, structure)
+
+        elf_table.p_type = enum_from_value(elf_table.p_type, ProgramHeaderType)
+        elf_table.flags = [
+            *enum_from_flags(elf_table.p_flags, ProgramHeaderFlags)
+        ]
+
+        elf_table.p_offset = Field(
+            elf_table.p_offset, "Program header file position"
+        )
+
+        elf_table.p_vaddr = Field(
+            elf_table.p_vaddr, "Program header virtual position"
+        )
+
+        elf_table.p_paddr = Field(
+            elf_table.p_paddr, "Program header physical position"
+        )
+
+        elf_table.p_filesz = Field(
+            elf_table.p_filesz, "Segment size in bytes in file image"
+        )
+
+        elf_table.p_memsz = Field(
+            elf_table.p_memsz, "Segment size in bytes in memory image"
+        )
+
+        elf_table.p_align = Field(
+            elf_table.p_align,
+            "No segment alignment"
+            if elf_table.p_align.value in (0, 1)
+            else "Segment alignment",
+        )
+
+        yield elf_table
+
+
+def parse_elfsections(
+    file: _BufferedIOBase,
+    elf_header: Union[ElfHeader32, ElfHeader64],
+    elf_classe: str,
+    budget: ParseBudget = None,
+) -> Tuple[
+    List[Union[SectionHeader32, SectionHeader64]],
+    Union[SectionHeader32, SectionHeader64, None],
+    Union[SectionHeader32, SectionHeader64, None],
+    Union[SectionHeader32, SectionHeader64, None],
+    Union[SectionHeader32, SectionHeader64, None],
+    Union[SectionHeader32, SectionHeader64, None],
+    Union[SectionHeader32, SectionHeader64, None],
+    List[Union[SectionHeader32, SectionHeader64]],
+    List[Section],
+]:
+    """
+    This function parses ELK sections.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    structure = globals()["SectionHeader" + elf_classe]
+    offset = elf_header.e_shoff.value.value
+    number = budget.count(
+        offset,
+        elf_header.e_shnum.value.value,
+        sizeof(structure),
+        table="Sections headers",
+    )
+    budget.seek(file, offset, "Sections headers")
+
+    elf_sections = [
+        parse_from_structure(file, structure) for _ in range(number)
+    ]
+    sections = []
+    headers_names_table_address = 0
+    headers_names = b""
+    if elf_header.e_shstrndx.value.value < len(elf_sections):
+        names_section = elf_sections[elf_header.e_shstrndx.value.value]
+        headers_names_table_address = names_section.sh_offset.value
+        headers_names = budget.read(
+            file, headers_names_table_address, names_section.sh_size.value
+        )
+    strtab_section = None
+    symtab_section = None
+    dynstr_section = None
+    dynsym_section = None
+    comment_section = None
+    note_sections = []
+    dynamic_section = None
+
+    for elf_section in elf_sections:
+        budget.check_time()
+        name_end = headers_names.find(b"\0", elf_section.sh_name.value)
+        name = headers_names[
+            elf_section.sh_name.value : name_end if name_end >= 0 else None
+        ]
+        elf_section.name = FileString(name.decode("latin-1"))
+        elf_section.name._start_position_ = (
+            headers_names_table_address + elf_section.sh_name.value
+        )
+        elf_section.name._end_position_ = (
+            elf_section.name._start_position_ + len(name) + 1
+        )
+        elf_section.name._data_ = name + b"\0"
+
+        if elf_section.name == ".strtab":
+            strtab_section = elf_section
+
+        if elf_section.name == ".symtab":
+            symtab_section = elf_section
+
+        if elf_section.name == ".dynstr":
+            dynstr_section = elf_section
+
+        if elf_section.name == ".dynsym":
+            dynsym_section = elf_section
+
+        if elf_section.name == ".comment":
+            comment_section = elf_section
+
+        if elf_section.name == ".dynamic":
+            dynamic_section = elf_section
+
+        if elf_section.name.startswith(".note"):
+            note_sections.append(elf_section)
+
+        elf_section.compression = None
+        if elf_section.sh_flags.value & (
+            SectionAttributeFlags.SHF_COMPRESSED.value
+        ) and budget.count(
+            elf_section.sh_offset.value,
+            1,
+            sizeof(globals()["CompressionHeader" + elf_classe]),
+        ):
+            file.seek(elf_section.sh_offset.value)
+            elf_section.compression = parse_compressionheader(file, elf_classe)
+
+        if entropy_charts_import:
+            sections.append(
+                Section(
+                    elf_section.name,
+                    elf_section.sh_offset.value,
+                    elf_section.sh_size.value,
+                )
+            )
+
+        elf_section.sh_name = Field(
+            elf_section.sh_name, "Section name position"
+        )
+
+        elf_section.sh_type = enum_from_value(
+            elf_section.sh_type, SectionHeaderType
+        )
+
+        elf_section.flags = [
+            *enum_from_flags(elf_section.sh_flags, SectionAttributeFlags)
+        ]
+
+        elf_section.sh_addr = Field(
+            elf_section.sh_addr, "Section memory address"
+        )
+
+        elf_section.sh_offset = Field(
+            elf_section.sh_offset, "Section file offset"
+        )
+
+        elf_section.sh_size = Field(
+            elf_section.sh_size, "Section size in bytes"
+        )
+
+        elf_section.sh_link = Field(elf_section.sh_link, "Section link")
+        elf_section.sh_info = Field(elf_section.sh_info, "Section info")
+
+        elf_section.sh_addralign = Field(
+            elf_section.sh_addralign,
+            "Section without alignment"
+            if elf_section.sh_addralign.value in (1, 0)
+            else "Section alignment",
+        )
+
+        elf_section.sh_entsize = Field(
+            elf_section.sh_entsize,
+            "No section symbal table"
+            if elf_section.sh_entsize.value == 0
+            else "Symbol table entry size",
+        )
+
+    return (
+        elf_sections,
+        strtab_section,
+        symtab_section,
+        dynstr_section,
+        dynsym_section,
+        comment_section,
+        dynamic_section,
+        note_sections,
+        sections,
+    )
+
+
+def parse_elfsymbolstable(
+    file: _BufferedIOBase,
+    dynsym_section: Union[ElfHeader32, ElfHeader64, None],
+    dynstr_section: Union[ElfHeader32, ElfHeader64, None],
+    symtab_section: Union[ElfHeader32, ElfHeader64, None],
+    strtab_section: Union[ElfHeader32, ElfHeader64, None],
+    elf_classe: str,
+    budget: ParseBudget = None,
+) -> Iterable[Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]]:
+    """
+    This function parses ELF symbols table.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    for symbol_section, str_section in (
+        (dynsym_section, dynstr_section),
+        (symtab_section, strtab_section),
+    ):
+        if str_section is None or symbol_section is None:
+            continue
+
+        data = BytesIO(
+            budget.read(
+                file,
+                str_section.sh_offset.value.value,
+                str_section.sh_size.value.value,
+            )
+        )
+
+        symboltable_structure = globals()["SymbolTableEntry" + elf_classe]
+        symboltable_structure_size = sizeof(symboltable_structure)
+
+        offset = symbol_section.sh_offset.value.value
+        number = budget.count(
+            offset,
+            symbol_section.sh_size.value.value // symboltable_structure_size,
+            symboltable_structure_size,
+            table=symbol_section.name,
+        )
+
+        for index in range(number):
+            if not index & 0x3FF:
+                budget.check_time()
+            file.seek(offset + index * symboltable_structure_size)
+            symbol = parse_from_structure(file, symboltable_structure)
+            symbol.st_value = Field(symbol.st_value, "Symbol table value")
+
+            symbol.st_size = Field(symbol.st_size, "Symbol table size")
+
+            symbol.st_shndx = enum_from_value(
+                symbol.st_shndx, SpecialSectionIndexes
+            )
+
+            symbol.st_bind = enum_from_value(
+                c_byte(symbol.st_info.value >> 4), SymbolBinding
+            )
+
+            symbol.st_type = enum_from_value(
+                c_byte(symbol.st_info.value & 0xF), SymbolType
+            )
+
+            symbol.st_visibility = enum_from_value(
+                c_byte(symbol.st_other.value & 0x3), SymbolVisibility
+            )
+
+            start_position = (
+                data.seek(symbol.st_name.value)
+                + str_section.sh_offset.value.value
+            )
+            symbol.st_name = read_string(data)
+            symbol.name = FileString(symbol.st_name.value.decode("latin-1"))
+            symbol.name._start_position_ = start_position
+            symbol.name._end_position_ = (
+                symbol.name._start_position_ + len(symbol.name) + 1
+            )
+            symbol.name._data_ = symbol.st_name.value + b"\0"
+            symbol.version = None
+
+            yield symbol_section.name, symbol
+
+
+def parse_elfsymbolsversions(
+    file: _BufferedIOBase,
+    symbols_tables: List[
+        Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]
+    ],
+    layout: ElfLayout = None,
+) -> Dict[int, Tuple[str, Union[str, None]]]:
+    """
+    This function joins .dynsym symbols to their versions: it sets
+    version (None without version), version_file (library of
+    needed version) and version_hidden attributes, and returns
+    versions by index.
+
+    Versions tables are read by the raw decoders (one array
+    for .gnu.version) from layout (get_parsed_layout of headers
+    already parsed, the raw layout is read when None).
+    """
+
+    symbols = [
+        symbol for table, symbol in symbols_tables if table == ".dynsym"
+    ]
+    if not symbols:
+        return {}
+
+    if layout is None:
+        layout = parse_elflayout(file)
+
+    dynamics = read_raw_dynamic(file, layout)
+    versym, versions = read_raw_versions(file, layout, len(symbols), dynamics)
+
+    for symbol, (version, version_file, hidden) in zip(
+        symbols, join_symbols_versions(versym, versions)
+    ):
+        symbol.version = version
+        symbol.version_file = version_file
+        symbol.version_hidden = hidden
+
+    return versions
+
+
+def get_abi_symbols(
+    file: _BufferedIOBase,
+    layout: ElfLayout = None,
+    budget: ParseBudget = None,
+) -> Dict[str, Tuple[str, str, int]]:
+    """
+    This function returns exported dynamic symbols of a shared
+    library as {versioned name: (type, binding, size)}, names
+    are "name@@version" (default version), "name@version"
+    (hidden version) or "name".
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+    if layout is None:
+        layout = parse_elflayout(file, budget)
+
+    _, symbols, strings, symbols_versions = read_raw_versioned_symbols(
+        file, layout, budget
+    )
+
+    types = {element.value: element.name for element in SymbolType}
+    bindings = {element.value: element.name for element in SymbolBinding}
+    undefined = SpecialSectionIndexes.SHN_UNDEF.value
+    local = SymbolBinding.STB_LOCAL.value
+    hidden = (
+        SymbolVisibility.STV_INTERNAL.value,
+        SymbolVisibility.STV_HIDDEN.value,
+    )
+    ignored_types = (SymbolType.STT_SECTION.value, SymbolType.STT_FILE.value)
+    exports = {}
+
+    for (name, info, other, shndx, _, size), (
+        version,
+        _,
+        hidden_version,
+    ) in zip(symbols, symbols_versions):
+        if (
+            not name
+            or shndx == undefined
+            or info >> 4 == local
+            or (other & 0x3) in hidden
+            or (info & 0xF) in ignored_types
+        ):
+            continue
+
+        name = get_raw_string(strings, name)
+        if version is not None:
+            name += ("@" if hidden_version else "@@") + version
+        exports[name] = (
+            types.get(info & 0xF, str(info & 0xF)),
+            bindings.get(info >> 4, str(info >> 4)),
+            size,
+        )
+
+    return exports
+
+
+def diff_abi_symbols(
+    old: Dict[str, Tuple[str, str, int]], new: Dict[str, Tuple[str, str, int]]
+) -> List[Difference]:
+    """
+    This function compares exported symbols of two shared libraries
+    (get_abi_symbols) with hash joins and returns removed, added
+    and changed (type, binding, size) symbols.
+
+    Only data symbols (objects, common and TLS) size changes break
+    the ABI (copy relocations), other size changes are "resized".
+    """
+
+    data_types = ("STT_OBJECT", "STT_COMMON", "STT_TLS")
+    differences = []
+
+    for name in sorted(old.keys() - new.keys()):
+        differences.append(Difference("symbol", name, "removed"))
+
+    for name in sorted(
+        name for name in old.keys() & new.keys() if old[name] != new[name]
+    ):
+        for field, old_value, new_value in zip(
+            ("type", "binding", "size"), old[name], new[name]
+        ):
+            if old_value != new_value:
+                differences.append(
+                    Difference(
+                        "symbol",
+                        name,
+                        (
+                            "changed"
+                            if field != "size"
+                            or old[name][0] in data_types
+                            or new[name][0] in data_types
+                            else "resized"
+                        ),
+                        field,
+                        old_value,
+                        new_value,
+                    )
+                )
+
+    for name in sorted(new.keys() - old.keys()):
+        differences.append(Difference("symbol", name, "added"))
+
+    return differences
+
+
+def get_abi_manifest(
+    directory: str,
+) -> Dict[str, Dict[str, Tuple[str, str, int]]]:
+    """
+    This function returns exported symbols of each shared library
+    in a directory (recursively) by relative path, it can be saved
+    as JSON and compared to a next release (diff_abi_manifest).
+    """
+
+    from os import walk
+
+    manifest = {}
+    for root, _, filenames in walk(directory):
+        for filename in filenames:
+            path = join(root, filename)
+            if islink(path):
+                continue
+            try:
+                with open(path, "rb") as file:
+                    if file.read(4) != b"\x7fELF":
+                        continue
+                    layout = parse_elflayout(file)
+                    if layout.type != ElfType.SHARED_OBJECT.value:
+                        continue
+                    manifest[relpath(path, directory)] = get_abi_symbols(
+                        file, layout
+                    )
+            except (OSError, ValueError, StructError):
+                continue
+
+    return manifest
+
+
+def load_abi_manifest(
+    file: Iterable[str],
+) -> Dict[str, Dict[str, Tuple[str, str, int]]]:
+    """
+    This function loads a JSON ABI manifest (symbols values
+    are converted from lists to tuples).
+    """
+
+    from json import load
+
+    return {
+        library: {name: tuple(value) for name, value in symbols.items()}
+        for library, symbols in load(file).items()
+    }
+
+
+def diff_abi_manifest(
+    old: Dict[str, Dict[str, Tuple[str, str, int]]],
+    new: Dict[str, Dict[str, Tuple[str, str, int]]],
+) -> Dict[str, List[Difference]]:
+    """
+    This function compares two ABI manifests (get_abi_manifest
+    or load_abi_manifest) and returns differences by library,
+    removed and added libraries are a "library" difference.
+    """
+
+    differences = {}
+
+    for library in sorted(old.keys() | new.keys()):
+        if library not in new:
+            differences[library] = [Difference("library", library, "removed")]
+        elif library not in old:
+            differences[library] = [Difference("library", library, "added")]
+        elif old[library] != new[library]:
+            library_differences = diff_abi_symbols(old[library], new[library])
+            if library_differences:
+                differences[library] = library_differences
+
+    return differences
+
+
+def parse_elfcomment(
+    file: _BufferedIOBase,
+    comment_section: Union[SectionHeader32, SectionHeader64],
+    budget: ParseBudget = None,
+) -> Iterable[bytes]:
+    """
+    This function parses ELF comment section.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    if comment_section:
+        position = comment_section.sh_offset.value.value
+
+        for data in budget.read(
+            file, position, comment_section.sh_size.value.value
+        ).split(b"\0"):
+            if data:
+                data = FileBytes(data + b"\0")
+                data._start_position_ = position
+                data._end_position_ = position + len(data) + 1
+                data.string = data.decode("latin-1")
+                yield data
+                position += len(data) + 1
+            else:
+                position += 1
+
+
+def parse_elfnote(
+    file: _BufferedIOBase,
+    note_sections: List[Union[SectionHeader32, SectionHeader64]],
+    elf_classe: str,
+    budget: ParseBudget = None,
+) -> Iterable[Union[Note32, Note64]]:
+    """
+    This function parses ELF note sections.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    structure = globals()["Note" + elf_classe]
+
+    for note in note_sections:
+        offset = note.sh_offset.value.value
+        end = offset + note.sh_size.value.value
+        if not budget.count(offset, 1, sizeof(structure), end):
+            continue
+
+        file.seek(offset)
+        note = parse_from_structure(file, structure)
+
+        position = file.tell()
+        note.name = FileBytes(
+            budget.read(
+                file,
+                position,
+                note.name_size.value
+                + get_padding_length(note.name_size.value, 4),
+                end,
+            )
+        )
+        note.name.string = note.name.decode("latin-1")
+        note.name._start_position_ = position
+        note.name._end_position_ = file.tell()
+        position = file.tell()
+        note.descriptor = FileBytes(
+            budget.read(
+                file,
+                position,
+                note.descriptor_size.value
+                + get_padding_length(note.name_size.value, 4),
+                end,
+            )
+        )
+        note.descriptor._start_position_ = position
+        note.descriptor._end_position_ = file.tell()
+
+        yield note
+
+
+def parse_elfdynamic(
+    file: _BufferedIOBase,
+    dynamic_section: Union[SectionHeader32, SectionHeader64, None],
+    elf_classe: str,
+    budget: ParseBudget = None,
+) -> Iterable[Union[Dynamic32, Dynamic64]]:
+    """
+    This function parses ELF dynamic section
+    (until DT_NULL or the section end).
+    """
+
+    if dynamic_section is None:
+        return None
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    structure = globals()["Dynamic" + elf_classe]
+    offset = dynamic_section.sh_offset.value.value
+    number = budget.count(
+        offset,
+        dynamic_section.sh_size.value.value // sizeof(structure),
+        sizeof(structure),
+        table=".dynamic",
+    )
+    file.seek(min(offset, budget.file_size))
+
+    d_tag = 1
+    while d_tag and number:
+        number -= 1
+        position = file.tell()
+        dynamic = parse_from_structure(file, structure)
+        dynamic.dynamic_tag = enum_from_value(dynamic.dynamic_tag, DynamicType)
+        dynamic.dynamic_tag._start_position_ = position
+        dynamic.dynamic_tag._end_position_ = position + sizeof(
+            dynamic.dynamic_tag.value
+        )
+
+        if dynamic.dynamic_tag.value.value != DynamicType.DT_FLAGS.value:
+            dynamic.dynamic_value._start_position_ = position + sizeof(
+                dynamic.dynamic_tag.value
+            )
+            dynamic.dynamic_value._end_position_ = file.tell()
+        else:
+            dynamic.dynamic_value.flags = []
+            for flag in enum_from_flags(dynamic.dynamic_value, DynamicFlags):
+                flag._start_position_ = position + sizeof(
+                    dynamic.dynamic_tag.value
+                )
+                flag._end_position_ = file.tell()
+                dynamic.dynamic_value.flags.append(flag)
+
+        d_tag = dynamic.dynamic_tag.value.value
+        yield dynamic
+
+
+def parse_compressionheader(
+    file: _BufferedIOBase, elf_classe: str
+) -> Union[CompressionHeader32, CompressionHeader64]:
+    """
+    This function parses ELF compression header
+    (first bytes of a SHF_COMPRESSED section).
+    """
+
+    compression = parse_from_structure(
+        file, globals()["CompressionHeader" + elf_classe]
+    )
+
+    compression.ch_type = enum_from_value(compression.ch_type, CompressionType)
+    compression.ch_size = Field(compression.ch_size, "Uncompressed size")
+    compression.ch_addralign = Field(
+        compression.ch_addralign, "Uncompressed data alignment"
+    )
+
+    return compression
+
+
+decompressed_sections = LRUCache(8)
+memory_files_keys = WeakKeyDictionary()
+
+
+def get_file_key(file: _BufferedIOBase) -> Union[Tuple, None]:
+    """
+    This function returns a key to identify the file content
+    in caches (device, inode, modification time and size, or
+    a content digest for in-memory files, the underlying file
+    key and the bounds for a FileView), None without a stable key.
+
+    In-memory files digests are computed once by file object
+    (in-memory files must not be modified after their first key).
+    """
+
+    if isinstance(file, FileView):
+        key = get_file_key(file.file)
+        return None if key is None else (key, file.start, file.size)
+
+    spooled_file = getattr(file, "_file", None)
+    if spooled_file is not None and hasattr(file, "rollover"):
+        file = spooled_file
+
+    if hasattr(file, "getbuffer"):
+        key = memory_files_keys.get(file)
+        if key is None:
+            with file.getbuffer() as buffer:
+                key = memory_files_keys[file] = (
+                    "blake2b",
+                    blake2b(buffer, digest_size=16).digest(),
+                )
+        return key
+
+    try:
+        stat = fstat(file.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def get_zstd_decompressor() -> Any:
+    """
+    This function returns a zstd decompressor from the standard
+    library (Python 3.14+, needs_input API) or from the optional
+    zstandard package (stream_reader API), or None if zstd is not
+    available.
+    """
+
+    try:
+        from compression.zstd import ZstdDecompressor
+    except ImportError:
+        pass
+    else:
+        return ZstdDecompressor()
+
+    try:
+        from zstandard import ZstdDecompressor
+    except ImportError:
+        return None
+
+    return ZstdDecompressor()
+
+
+def decompress_stream(
+    file: _BufferedIOBase,
+    size: int,
+    decompressor: Any,
+    max_size: int = None,
+    chunk_size: int = 65536,
+) -> bytes:
+    """
+    This function decompresses size bytes from the file position,
+    chunk by chunk, and stops after max_size decompressed bytes
+    (output is bounded for zlib, needs_input decompressors like
+    compression.zstd and zstandard stream readers).
+    """
+
+    output = bytearray()
+
+    if hasattr(decompressor, "stream_reader"):
+        reader = decompressor.stream_reader(
+            FileView(file, file.tell(), max(size, 0))
+        )
+        while max_size is None or len(output) < max_size:
+            data = reader.read(
+                chunk_size
+                if max_size is None
+                else min(chunk_size, max_size - len(output))
+            )
+            if not data:
+                break
+            output += data
+        return bytes(output)
+
+    while (
+        size > 0
+        and not decompressor.eof
+        and (max_size is None or len(output) < max_size)
+    ):
+        data = file.read(min(chunk_size, size))
+        if not data:
+            break
+        size -= len(data)
+
+        while max_size is None or len(output) < max_size:
+            if hasattr(decompressor, "unconsumed_tail"):
+                if not data:
+                    break
+                output += decompressor.decompress(
+                    data, 0 if max_size is None else max_size - len(output)
+                )
+                data = decompressor.unconsumed_tail
+            else:
+                if decompressor.eof or (not data and decompressor.needs_input):
+                    break
+                output += decompressor.decompress(
+                    data, -1 if max_size is None else max_size - len(output)
+                )
+                data = b""
+
+    if max_size is not None:
+        del output[max_size:]
+
+    return bytes(output)
+
+
+def read_section_data(
+    file: _BufferedIOBase,
+    name: str,
+    offset: int,
+    size: int,
+    flags: int,
+    section_type: int,
+    elf_classe: str,
+    max_size: int = None,
+    budget: ParseBudget = None,
+) -> bytes:
+    """
+    This function returns the section content, SHF_COMPRESSED
+    and legacy .zdebug sections are decompressed (zlib and zstd)
+    and kept in a small LRU cache to be decompressed only once.
+
+    Reads and decompressed data are bounded by budget (a default
+    ParseBudget when None).
+    """
+
+    if section_type == SectionHeaderType.SHT_NOBITS.value:
+        return b""
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    size = budget.clamp(offset, size)
+    if not size:
+        return b""
+
+    compressed = flags & SectionAttributeFlags.SHF_COMPRESSED.value
+    if not compressed and not name.startswith(".zdebug"):
+        return budget.read(
+            file, offset, size if max_size is None else min(size, max_size)
+        )
+
+    file_key = get_file_key(file)
+    key = None if file_key is None else (file_key, offset, size, max_size)
+    data = None if key is None else decompressed_sections.get(key)
+    if data is not None:
+        budget.add_bytes(len(data))
+        return data
+
+    file.seek(offset)
+    if compressed:
+        compression = parse_compressionheader(file, elf_classe)
+        size -= sizeof(compression)
+        compression_type = compression.ch_type.value.value
+    elif file.read(4) == b"ZLIB":
+        file.seek(8, 1)
+        size -= 12
+        compression_type = CompressionType.ELFCOMPRESS_ZLIB.value
+    else:
+        return budget.read(
+            file, offset, size if max_size is None else min(size, max_size)
+        )
+
+    if compression_type == CompressionType.ELFCOMPRESS_ZLIB.value:
+        decompressor = decompressobj()
+    elif compression_type == CompressionType.ELFCOMPRESS_ZSTD.value:
+        decompressor = get_zstd_decompressor()
+        if decompressor is None:
+            raise ValueError(
+                "zstd compressed section: install zstandard package"
+            )
+    else:
+        raise ValueError(f"Invalid compression type: {compression_type}")
+
+    budget.add_bytes(max(size, 0))
+    if budget.max_bytes is not None:
+        remaining = budget.max_bytes - budget.bytes_read + 1
+        max_size = remaining if max_size is None else min(max_size, remaining)
+
+    data = decompress_stream(file, size, decompressor, max_size)
+    budget.add_bytes(len(data))
+    if key is not None:
+        decompressed_sections[key] = data
+    return data
+
+
+def get_section_data(
+    file: _BufferedIOBase,
+    elf_section: Union[SectionHeader32, SectionHeader64],
+    elf_classe: str,
+    max_size: int = None,
+    budget: ParseBudget = None,
+) -> bytes:
+    """
+    This function returns the (decompressed) content
+    of a section parsed by parse_elfsections.
+    """
+
+    return read_section_data(
+        file,
+        elf_section.name,
+        elf_section.sh_offset.value.value,
+        elf_section.sh_size.value.value,
+        elf_section.sh_flags.value,
+        elf_section.sh_type.value.value,
+        elf_classe,
+        max_size,
+        budget,
+    )
+
+
+string_pool = None
+statistics_fields = (
+    "counts",
+    "classes",
+    "machines",
+    "types",
+    "osabi",
+    "interpreters",
+    "needed",
+    "sections",
+    "sizes",
+)
+
+raw_structs = {
+    (elf_classe, order): {
+        name: Struct(("<" if order == "little" else ">") + format)
+        for name, format in formats.items()
+    }
+    for elf_classe, formats in (
+        (
+            "32",
+            {
+                "header": "HHIIIIIHHHHHH",
+                "section": "IIIIIIIIII",
+                "segment": "IIIIIIII",
+                "symbol": "IIIBBH",
+                "dynamic": "iI",
+                "address": "I",
+                "verneed": "HHIII",
+                "vernaux": "IHHII",
+                "verdef": "HHHHIII",
+                "verdaux": "II",
+            },
+        ),
+        (
+            "64",
+            {
+                "header": "HHIQQQIHHHHHH",
+                "section": "IIQQQQIIQQ",
+                "segment": "IIQQQQQQ",
+                "symbol": "IBBHQQ",
+                "dynamic": "qQ",
+                "address": "Q",
+                "verneed": "HHIII",
+                "vernaux": "IHHII",
+                "verdef": "HHHHIII",
+                "verdaux": "II",
+            },
+        ),
+    )
+    for order in ("little", "big")
+}
+
+
+def parse_elflayout(
+    file: _BufferedIOBase, budget: ParseBudget = None
+) -> ElfLayout:
+    """
+    This function reads ELF headers, sections headers and
+    programs headers with one read for each table and returns
+    an ElfLayout (without any Structure, Field or Enum object),
+    reads are bounded by budget (a default ParseBudget when None).
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    file.seek(0)
+    identification = file.read(16)
+    if identification[:4] != b"\x7fELF" or identification[4] not in (1, 2):
+        raise ValueError("Invalid ELF magic bytes or class")
+
+    elf_classe = "32" if identification[4] == 1 else "64"
+    order = "big" if identification[5] == 2 else "little"
+    structs = raw_structs[(elf_classe, order)]
+
+    (
+        e_type,
+        e_machine,
+        _,
+        e_entry,
+        e_phoff,
+        e_shoff,
+        _,
+        _,
+        _,
+        e_phnum,
+        e_shentsize,
+        e_shnum,
+        e_shstrndx,
+    ) = structs["header"].unpack(file.read(structs["header"].size))
+
+    section_struct = structs["section"]
+    headers = []
+    if e_shoff and e_shentsize == section_struct.size:
+        budget.seek(file, e_shoff, "Sections headers")
+        if not e_shnum:
+            first = file.read(section_struct.size)
+            if len(first) == section_struct.size:
+                e_shnum = section_struct.unpack(first)[5]
+        e_shnum = budget.count(
+            e_shoff, e_shnum, section_struct.size, table="Sections headers"
+        )
+        file.seek(e_shoff)
+        data = file.read(e_shnum * section_struct.size)
+        headers = [
+            *section_struct.iter_unpack(
+                data[: len(data) - len(data) % section_struct.size]
+            )
+        ]
+        if e_shstrndx == 0xFFFF and headers:
+            e_shstrndx = headers[0][6]
+
+    names = b""
+    if e_shstrndx < len(headers):
+        names = budget.read(
+            file, headers[e_shstrndx][4], headers[e_shstrndx][5]
+        )
+
+    sections = [
+        RawSection(
+            get_raw_string(names, name),
+            type,
+            flags,
+            addr,
+            offset,
+            size,
+            link,
+            info,
+            entsize,
+        )
+        for (
+            name,
+            type,
+            flags,
+            addr,
+            offset,
+            size,
+            link,
+            info,
+            _,
+            entsize,
+        ) in headers
+    ]
+
+    segment_struct = structs["segment"]
+    data = b""
+    if e_phoff:
+        budget.seek(file, e_phoff, "Program headers")
+        data = file.read(
+            budget.count(
+                e_phoff, e_phnum, segment_struct.size, table="Program headers"
+            )
+            * segment_struct.size
+        )
+    if elf_classe == "32":
+        segments = [
+            RawSegment(type, flags, offset, vaddr, filesz, memsz)
+            for (
+                type,
+                offset,
+                vaddr,
+                _,
+                filesz,
+                memsz,
+                flags,
+                _,
+            ) in segment_struct.iter_unpack(data)
+        ]
+    else:
+        segments = [
+            RawSegment(type, flags, offset, vaddr, filesz, memsz)
+            for (
+                type,
+                flags,
+                offset,
+                vaddr,
+                _,
+                filesz,
+                memsz,
+                _,
+            ) in segment_struct.iter_unpack(data)
+        ]
+
+    return ElfLayout(
+        elf_classe,
+        order,
+        e_type,
+        e_machine,
+        e_entry,
+        sections,
+        segments,
+    )
+
+
+def get_parsed_layout(
+    elfindent: ElfIdent,
+    elf_headers: Union[ElfHeader32, ElfHeader64],
+    programs_headers: List[Union[ProgramHeader32, ProgramHeader64]],
+    elf_sections: List[Union[SectionHeader32, SectionHeader64]],
+) -> ElfLayout:
+    """
+    This function returns the ElfLayout of headers already parsed
+    by parse_elffile functions (without any read).
+    """
+
+    return ElfLayout(
+        "64" if elfindent.ei_class.value.value == 2 else "32",
+        "little" if elfindent.ei_data.value.value == 1 else "big",
+        elf_headers.e_type.value.value,
+        elf_headers.e_machine.value.value,
+        elf_headers.e_entry.value.value,
+        [
+            RawSection(
+                section.name,
+                section.sh_type.value.value,
+                section.sh_flags.value,
+                section.sh_addr.value.value,
+                section.sh_offset.value.value,
+                section.sh_size.value.value,
+                section.sh_link.value.value,
+                section.sh_info.value.value,
+                section.sh_entsize.value.value,
+            )
+            for section in elf_sections
+        ],
+        [
+            RawSegment(
+                program.p_type.value.value,
+                program.p_flags.value,
+                program.p_offset.value.value,
+                program.p_vaddr.value.value,
+                program.p_filesz.value.value,
+                program.p_memsz.value.value,
+            )
+            for program in programs_headers
+        ],
+    )
+
+
+def address_to_offset(layout: ElfLayout, address: int) -> Union[int, None]:
+    """
+    This function returns the file offset of a virtual address
+    (using PT_LOAD segments) or None when it is not in the file.
+    """
+
+    for segment in layout.segments:
+        if (
+            segment.type == ProgramHeaderType.PT_LOAD.value
+            and segment.vaddr <= address < segment.vaddr + segment.filesz
+        ):
+            return address - segment.vaddr + segment.offset
+    return None
+
+
+def get_segment_end(layout: ElfLayout, offset: int) -> Union[int, None]:
+    """
+    This function returns the file end offset of the PT_LOAD segment
+    containing a file offset (to bound reads of tables found by
+    dynamic entries) or None when it is not loaded.
+    """
+
+    for segment in layout.segments:
+        if (
+            segment.type == ProgramHeaderType.PT_LOAD.value
+            and segment.offset <= offset < segment.offset + segment.filesz
+        ):
+            return segment.offset + segment.filesz
+    return None
+
+
+def read_raw_dynamic(
+    file: _BufferedIOBase, layout: ElfLayout, budget: ParseBudget = None
+) -> List[Tuple[int, int]]:
+    """
+    This function returns (tag, value) of the dynamic section
+    (or PT_DYNAMIC segment when there is no section headers),
+    stopping on DT_NULL.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    for section in layout.sections:
+        if section.type == SectionHeaderType.SHT_DYNAMIC.value:
+            offset, size = section.offset, section.size
+            break
+    else:
+        for segment in layout.segments:
+            if segment.type == ProgramHeaderType.PT_DYNAMIC.value:
+                offset, size = segment.offset, segment.filesz
+                break
+        else:
+            return []
+
+    dynamic_struct = raw_structs[(layout.elf_classe, layout.order)]["dynamic"]
+    data = budget.read(file, offset, size)
+    dynamics = []
+    for tag, value in dynamic_struct.iter_unpack(
+        data[: len(data) - len(data) % dynamic_struct.size]
+    ):
+        if tag == DynamicType.DT_NULL.value:
+            break
+        dynamics.append((tag, value))
+    return dynamics
+
+
+def count_hash_symbols(
+    file: _BufferedIOBase,
+    layout: ElfLayout,
+    dynamics: Dict[int, int],
+    budget: ParseBudget = None,
+) -> int:
+    """
+    This function returns the number of dynamic symbols from
+    DT_HASH (nchain) or DT_GNU_HASH (last chain end), it is used
+    when there is no section headers.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    order = "<" if layout.order == "little" else ">"
+    offset = address_to_offset(
+        layout, dynamics.get(DynamicType.DT_HASH.value, -1)
+    )
+    if offset is not None:
+        data = budget.read(file, offset, 8, get_segment_end(layout, offset))
+        return Struct(order + "II").unpack(data)[1] if len(data) == 8 else 0
+
+    offset = address_to_offset(
+        layout, dynamics.get(DynamicType.DT_GNU_HASH.value, -1)
+    )
+    if offset is None:
+        return 0
+
+    end = get_segment_end(layout, offset)
+    data = budget.read(file, offset, 16, end)
+    if len(data) != 16:
+        return 0
+    buckets_number, symbols_offset, bloom_size, _ = Struct(
+        order + "IIII"
+    ).unpack(data)
+    offset += 16 + bloom_size * (4 if layout.elf_classe == "32" else 8)
+    data = budget.read(file, offset, buckets_number * 4, end)
+    buckets = Struct(order + "I" * (len(data) // 4)).unpack(
+        data[: len(data) - len(data) % 4]
+    )
+    last_symbol = max(buckets, default=0)
+    if last_symbol < symbols_offset:
+        return symbols_offset
+
+    offset += buckets_number * 4 + (last_symbol - symbols_offset) * 4
+    chain_struct = Struct(order + "I")
+    while True:
+        data = budget.read(file, offset, 4, end)
+        if len(data) != 4 or chain_struct.unpack(data)[0] & 1:
+            return last_symbol + 1
+        last_symbol += 1
+        offset += 4
+
+
+def read_raw_dynamic_symbols(
+    file: _BufferedIOBase,
+    layout: ElfLayout,
+    dynamics: List[Tuple[int, int]] = None,
+    budget: ParseBudget = None,
+) -> Tuple[List[Tuple[int, int, int, int, int, int]], bytes]:
+    """
+    This function reads the dynamic symbols table with one read
+    and returns symbols as (st_name, st_info, st_other, st_shndx,
+    st_value, st_size) tuples and the dynamic strings table.
+
+    Without section headers, tables are found with DT_SYMTAB,
+    DT_STRTAB, DT_STRSZ and the hash table symbols number.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    structs = raw_structs[(layout.elf_classe, layout.order)]
+    symbol_struct = structs["symbol"]
+    symbols_section = strings_section = None
+
+    for section in layout.sections:
+        if section.type == SectionHeaderType.SHT_DYNSYM.value:
+            symbols_section = section
+            if section.link < len(layout.sections):
+                strings_section = layout.sections[section.link]
+            break
+
+    symbols_end = strings_end = None
+    if symbols_section is not None and strings_section is not None:
+        symbols_offset, symbols_size = (
+            symbols_section.offset,
+            symbols_section.size,
+        )
+        strings_offset, strings_size = (
+            strings_section.offset,
+            strings_section.size,
+        )
+    else:
+        dynamics = dict(
+            read_raw_dynamic(file, layout, budget)
+            if dynamics is None
+            else dynamics
+        )
+        symbols_offset = address_to_offset(
+            layout, dynamics.get(DynamicType.DT_SYMTAB.value, -1)
+        )
+        strings_offset = address_to_offset(
+            layout, dynamics.get(DynamicType.DT_STRTAB.value, -1)
+        )
+        if symbols_offset is None or strings_offset is None:
+            return [], b""
+        strings_size = dynamics.get(DynamicType.DT_STRSZ.value, 0)
+        strings_end = get_segment_end(layout, strings_offset)
+        symbols_size = (
+            count_hash_symbols(file, layout, dynamics, budget)
+            * symbol_struct.size
+        )
+        symbols_end = get_segment_end(layout, symbols_offset)
+
+    strings = budget.read(file, strings_offset, strings_size, strings_end)
+    return (
+        unpack_raw_symbols(
+            budget.read(file, symbols_offset, symbols_size, symbols_end),
+            layout,
+        ),
+        strings,
+    )
+
+
+def unpack_raw_symbols(
+    data: bytes, layout: ElfLayout
+) -> List[Tuple[int, int, int, int, int, int]]:
+    """
+    This function unpacks a symbols table as (st_name, st_info,
+    st_other, st_shndx, st_value, st_size) tuples.
+    """
+
+    symbol_struct = raw_structs[(layout.elf_classe, layout.order)]["symbol"]
+    data = data[: len(data) - len(data) % symbol_struct.size]
+
+    if layout.elf_classe == "64":
+        return [*symbol_struct.iter_unpack(data)]
+    return [
+        (name, info, other, shndx, value, size)
+        for name, value, size, info, other, shndx in symbol_struct.iter_unpack(
+            data
+        )
+    ]
+
+
+def read_raw_symbols(
+    file: _BufferedIOBase, layout: ElfLayout, budget: ParseBudget = None
+) -> Iterable[Tuple[RawSection, List[Tuple], bytes]]:
+    """
+    This function yields (section, symbols, strings table)
+    for each symbols table (.symtab and .dynsym).
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    for section in layout.sections:
+        if section.type not in (
+            SectionHeaderType.SHT_SYMTAB.value,
+            SectionHeaderType.SHT_DYNSYM.value,
+        ) or section.link >= len(layout.sections):
+            continue
+
+        strings_section = layout.sections[section.link]
+        strings = budget.read(
+            file, strings_section.offset, strings_section.size
+        )
+        yield section, unpack_raw_symbols(
+            budget.read(file, section.offset, section.size), layout
+        ), strings
+
+
+def read_raw_build_id(
+    file: _BufferedIOBase, layout: ElfLayout, budget: ParseBudget = None
+) -> Union[str, None]:
+    """
+    This function returns the GNU build-id (hexadecimal) from notes
+    sections (or PT_NOTE segments), None when there is no build-id.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    notes = [
+        (section.offset, section.size)
+        for section in layout.sections
+        if section.type == SectionHeaderType.SHT_NOTE.value
+    ] or [
+        (segment.offset, segment.filesz)
+        for segment in layout.segments
+        if segment.type == ProgramHeaderType.PT_NOTE.value
+    ]
+    note_struct = Struct(("<" if layout.order == "little" else ">") + "III")
+
+    for offset, size in notes:
+        data = budget.read(file, offset, size)
+        position = 0
+        while position + 12 <= len(data):
+            name_size, descriptor_size, type = note_struct.unpack_from(
+                data, position
+            )
+            position += 12
+            name = data[position : position + name_size]
+            position += name_size + get_padding_length(name_size, 4)
+            descriptor = data[position : position + descriptor_size]
+            position += descriptor_size + get_padding_length(
+                descriptor_size, 4
+            )
+            if type == 3 and name == b"GNU\0":
+                return descriptor.hex()
+
+    return None
+
+
+def offset_to_address(layout: ElfLayout, offset: int) -> Union[int, None]:
+    """
+    This function returns the virtual address of a file offset
+    (using PT_LOAD segments) or None when it is not loaded.
+    """
+
+    for segment in layout.segments:
+        if (
+            segment.type == ProgramHeaderType.PT_LOAD.value
+            and segment.offset <= offset < segment.offset + segment.filesz
+        ):
+            return offset - segment.offset + segment.vaddr
+    return None
+
+
+def get_raw_string(strings: bytes, offset: int) -> str:
+    """
+    This function returns the NULL terminated string
+    at offset in a strings table.
+    """
+
+    end = strings.find(b"\0", offset)
+    string = strings[offset : end if end >= 0 else None].decode("latin-1")
+    if string_pool is None:
+        return string
+    return string_pool.intern(string)
+
+
+def get_raw_strings(strings: bytes) -> Dict[int, str]:
+    """
+    This function decodes a whole strings table once and returns
+    strings by offset (strings starting inside another string,
+    for shared suffixes, are not indexed: use get_raw_string).
+    """
+
+    parts = strings.decode("latin-1").split("\0")
+    offsets = [0]
+    offsets.extend(accumulate(len(part) + 1 for part in parts))
+    return dict(zip(offsets, parts))
+
+
+def set_string_pool(maxsize: int = 1048576) -> Union[StringPool, None]:
+    """
+    This function enables (maxsize > 0) or disables the strings pool
+    used by raw decoders for sections names, symbols names, DT_NEEDED
+    values and comments (batch and stats workers, server mode)
+    and returns it.
+    """
+
+    global string_pool
+    string_pool = StringPool(maxsize) if maxsize > 0 else None
+    return string_pool
+
+
+def read_raw_comments(
+    file: _BufferedIOBase, layout: ElfLayout, budget: ParseBudget = None
+) -> List[str]:
+    """
+    This function returns the .comment section strings.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    for section in layout.sections:
+        if (
+            section.name == ".comment"
+            and section.type != SectionHeaderType.SHT_NOBITS.value
+        ):
+            data = budget.read(file, section.offset, section.size)
+            return [
+                get_raw_string(data, offset)
+                for offset, byte in enumerate(data)
+                if byte and (not offset or not data[offset - 1])
+            ]
+    return []
+
+
+def read_raw_dynamic_strings(
+    file: _BufferedIOBase,
+    layout: ElfLayout,
+    dynamics: List[Tuple[int, int]],
+    budget: ParseBudget = None,
+) -> bytes:
+    """
+    This function reads the dynamic strings table using DT_STRTAB
+    and DT_STRSZ (bounded by its PT_LOAD segment).
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    dynamics = dict(dynamics)
+    offset = address_to_offset(
+        layout, dynamics.get(DynamicType.DT_STRTAB.value, -1)
+    )
+    if offset is None:
+        return b""
+
+    return budget.read(
+        file,
+        offset,
+        dynamics.get(DynamicType.DT_STRSZ.value, 0),
+        get_segment_end(layout, offset),
+    )
+
+
+def decode_versions(
+    needed: bytes,
+    needed_number: int,
+    defined: bytes,
+    defined_number: int,
+    strings: bytes,
+    structs: Dict[str, Struct],
+) -> Dict[int, Tuple[str, Union[str, None]]]:
+    """
+    This function decodes needed versions (.gnu.version_r) and
+    versions definitions (.gnu.version_d) and returns
+    {version index: (version name, library or None)}.
+    """
+
+    versions = {}
+    verneed = structs["verneed"]
+    vernaux = structs["vernaux"]
+    offset = 0
+
+    for _ in range(needed_number):
+        if offset + verneed.size > len(needed):
+            break
+        _, auxiliaries_number, file_name, auxiliary, next = (
+            verneed.unpack_from(needed, offset)
+        )
+        library = get_raw_string(strings, file_name)
+        auxiliary += offset
+
+        for _ in range(auxiliaries_number):
+            if auxiliary + vernaux.size > len(needed):
+                break
+            _, _, index, name, auxiliary_next = vernaux.unpack_from(
+                needed, auxiliary
+            )
+            versions[index & 0x7FFF] = (get_raw_string(strings, name), library)
+            if not auxiliary_next:
+                break
+            auxiliary += auxiliary_next
+
+        if not next:
+            break
+        offset += next
+
+    verdef = structs["verdef"]
+    verdaux = structs["verdaux"]
+    offset = 0
+
+    for _ in range(defined_number):
+        if offset + verdef.size > len(defined):
+            break
+        _, _, index, _, _, auxiliary, next = verdef.unpack_from(
+            defined, offset
+        )
+        auxiliary += offset
+        if auxiliary + verdaux.size <= len(defined):
+            versions[index & 0x7FFF] = (
+                get_raw_string(
+                    strings, verdaux.unpack_from(defined, auxiliary)[0]
+                ),
+                None,
+            )
+        if not next:
+            break
+        offset += next
+
+    return versions
+
+
+def read_raw_versions(
+    file: _BufferedIOBase,
+    layout: ElfLayout,
+    symbols_number: int,
+    dynamics: List[Tuple[int, int]] = None,
+    budget: ParseBudget = None,
+) -> Tuple[array, Dict[int, Tuple[str, Union[str, None]]]]:
+    """
+    This function reads symbols versions indexes (.gnu.version as
+    one array of symbols_number unsigned shorts) and versions
+    names (.gnu.version_r and .gnu.version_d).
+
+    Without section headers, tables are found with DT_VERSYM,
+    DT_VERNEED(NUM), DT_VERDEF(NUM) and DT_STRTAB.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    tables = {}
+    strings = None
+
+    for section in layout.sections:
+        if section.type in (
+            SectionHeaderType.SHT_VERSYM1.value,
+            SectionHeaderType.SHT_VERNEED.value,
+            SectionHeaderType.SHT_VERDEF.value,
+        ):
+            tables[section.type] = (section.offset, section.size, section.info)
+            if section.type != SectionHeaderType.SHT_VERSYM1.value and (
+                section.link < len(layout.sections)
+            ):
+                strings = layout.sections[section.link]
+
+    if strings is not None:
+        strings = budget.read(file, strings.offset, strings.size)
+    elif not tables:
+        dynamics = dict(
+            read_raw_dynamic(file, layout, budget)
+            if dynamics is None
+            else dynamics
+        )
+        for type, address, number in (
+            (SectionHeaderType.SHT_VERSYM1.value, DynamicType.DT_VERSYM, None),
+            (
+                SectionHeaderType.SHT_VERNEED.value,
+                DynamicType.DT_VERNEED,
+                DynamicType.DT_VERNEEDNUM,
+            ),
+            (
+                SectionHeaderType.SHT_VERDEF.value,
+                DynamicType.DT_VERDEF,
+                DynamicType.DT_VERDEFNUM,
+            ),
+        ):
+            offset = address_to_offset(layout, dynamics.get(address.value, -1))
+            if offset is not None:
+                number = dynamics.get(number.value, 0) if number else 0
+                tables[type] = (offset, None, number)
+        strings = read_raw_dynamic_strings(
+            file, layout, dynamics.items(), budget
+        )
+
+    versym = array("H")
+    if SectionHeaderType.SHT_VERSYM1.value in tables:
+        offset, size, _ = tables[SectionHeaderType.SHT_VERSYM1.value]
+        data = budget.read(
+            file,
+            offset,
+            symbols_number * 2,
+            get_segment_end(layout, offset) if size is None else offset + size,
+        )
+        versym.frombytes(data[: len(data) - len(data) % 2])
+        if layout.order != byteorder:
+            versym.byteswap()
+
+    contents = []
+    for type in (
+        SectionHeaderType.SHT_VERNEED.value,
+        SectionHeaderType.SHT_VERDEF.value,
+    ):
+        if type not in tables:
+            contents.extend((b"", 0))
+            continue
+        offset, size, number = tables[type]
+        contents.extend(
+            (
+                budget.read(
+                    file,
+                    offset,
+                    65536 if size is None else size,
+                    get_segment_end(layout, offset) if size is None else None,
+                ),
+                number,
+            )
+        )
+
+    return versym, decode_versions(
+        *contents,
+        strings or b"",
+        raw_structs[(layout.elf_classe, layout.order)],
+    )
+
+
+def join_symbols_versions(
+    versym: array, versions: Dict[int, Tuple[str, Union[str, None]]]
+) -> List[Tuple[Union[str, None], Union[str, None], bool]]:
+    """
+    This function returns (version name, library, hidden) for
+    each symbol version index (indexes 0 and 1 are local and
+    global symbols without version).
+    """
+
+    no_version = (None, None)
+    return [
+        (
+            (*versions.get(index & 0x7FFF, no_version), bool(index & 0x8000))
+            if index & 0x7FFF > 1
+            else (None, None, False)
+        )
+        for index in versym
+    ]
+
+
+def get_required_versions(
+    file: _BufferedIOBase, layout: ElfLayout = None
+) -> Dict[str, List[str]]:
+    """
+    This function returns needed versions by library
+    (example: {"libc.so.6": ["GLIBC_2.2.5", "GLIBC_2.34"]})
+    without reading symbols.
+    """
+
+    if layout is None:
+        layout = parse_elflayout(file)
+
+    _, versions = read_raw_versions(file, layout, 0)
+    libraries = {}
+    for name, library in versions.values():
+        if library is not None:
+            libraries.setdefault(library, []).append(name)
+    return libraries
+
+
+def get_max_version(
+    versions: Iterable[str], prefix: str = "GLIBC_"
+) -> Union[str, None]:
+    """
+    This function returns the greatest version starting with prefix
+    (numeric comparison: GLIBC_2.14 > GLIBC_2.2.5).
+    """
+
+    def key(version: str) -> Tuple[int]:
+        return tuple(
+            int(part) if part.isdigit() else -1
+            for part in version[len(prefix) :].split(".")
+        )
+
+    return max(
+        (version for version in versions if version.startswith(prefix)),
+        key=key,
+        default=None,
+    )
+
+
+def get_max_required_version(
+    file: _BufferedIOBase, prefix: str = "GLIBC_", layout: ElfLayout = None
+) -> Union[str, None]:
+    """
+    This function returns the greatest needed version starting
+    with prefix (example: the minimum glibc to run the file).
+    """
+
+    return get_max_version(
+        (
+            version
+            for versions in get_required_versions(file, layout).values()
+            for version in versions
+        ),
+        prefix,
+    )
+
+
+def read_raw_versioned_symbols(
+    file: _BufferedIOBase, layout: ElfLayout, budget: ParseBudget = None
+) -> Tuple[
+    List[Tuple[int, int]],
+    List[Tuple[int, int, int, int, int, int]],
+    bytes,
+    List[Tuple[Union[str, None], Union[str, None], bool]],
+]:
+    """
+    This function returns dynamic entries, dynamic symbols, the
+    dynamic strings table and (version, library, hidden) for each
+    dynamic symbol.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    dynamics = read_raw_dynamic(file, layout, budget)
+    symbols, strings = read_raw_dynamic_symbols(file, layout, dynamics, budget)
+
+    if not strings:
+        strings = read_raw_dynamic_strings(file, layout, dynamics, budget)
+
+    versym, versions = read_raw_versions(
+        file, layout, len(symbols), dynamics, budget
+    )
+    symbols_versions = join_symbols_versions(versym, versions)
+    symbols_versions.extend(
+        [(None, None, False)] * (len(symbols) - len(symbols_versions))
+    )
+    return dynamics, symbols, strings, symbols_versions
+
+
+def get_elffile_dependencies(
+    file: _BufferedIOBase,
+    layout: ElfLayout = None,
+    budget: ParseBudget = None,
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    This function returns DT_NEEDED, imported and exported
+    dynamic symbols names using the raw layout only.
+
+    Versioned names are "name@version" for imports and hidden
+    exports, "name@@version" for default exports.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+    if layout is None:
+        layout = parse_elflayout(file, budget)
+
+    dynamics, symbols, strings, symbols_versions = read_raw_versioned_symbols(
+        file, layout, budget
+    )
+
+    needed = [
+        get_raw_string(strings, value)
+        for tag, value in dynamics
+        if tag == DynamicType.DT_NEEDED.value
+    ]
+
+    imports = []
+    exports = []
+    undefined = SpecialSectionIndexes.SHN_UNDEF.value
+    local = SymbolBinding.STB_LOCAL.value
+    hidden = (
+        SymbolVisibility.STV_INTERNAL.value,
+        SymbolVisibility.STV_HIDDEN.value,
+    )
+    ignored_types = (SymbolType.STT_SECTION.value, SymbolType.STT_FILE.value)
+
+    for (name, info, other, shndx, _, _), (version, _, hidden_version) in zip(
+        symbols, symbols_versions
+    ):
+        if not name or info >> 4 == local:
+            continue
+
+        name = get_raw_string(strings, name)
+        if shndx == undefined:
+            imports.append(name if version is None else f"{name}@{version}")
+        elif (other & 0x3) not in hidden and (info & 0xF) not in ignored_types:
+            exports.append(
+                name
+                if version is None
+                else f"{name}{'@' if hidden_version else '@@'}{version}"
+            )
+
+    return needed, imports, exports
+
+
+def fingerprint_elffile(
+    file: _BufferedIOBase,
+    layout: ElfLayout = None,
+    budget: ParseBudget = None,
+) -> str:
+    """
+    This function returns an imports/exports fingerprint: hash of
+    sorted DT_NEEDED values, sorted imported and exported dynamic
+    symbols names with versions (addresses and order are ignored,
+    so it is stable across rebuilds of the same code).
+    """
+
+    needed, imports, exports = get_elffile_dependencies(file, layout, budget)
+    return blake2b(
+        "\0\0".join(
+            "\0".join(sorted(set(names)))
+            for names in (needed, imports, exports)
+        ).encode("latin-1"),
+        digest_size=16,
+    ).hexdigest()
+
+
+ld_so_cache_flags = {
+    (ElfMachine.INTEL_80386.value, "32"): (0x0000,),
+    (ElfMachine.AMD_X86_64.value, "64"): (0x0300,),
+    (ElfMachine.AMD_X86_64.value, "32"): (0x0800,),
+    (ElfMachine.AARCH64.value, "64"): (0x0A00,),
+    (ElfMachine.ARM.value, "32"): (0x0900, 0x0B00, 0x0000),
+    (ElfMachine.SPARC_V9.value, "64"): (0x0100,),
+    (ElfMachine.INTEL_IA_64.value, "64"): (0x0200,),
+    (ElfMachine.IBM_SYSTEM390.value, "64"): (0x0400,),
+    (ElfMachine.IBM_SYSTEM390.value, "32"): (0x0000,),
+    (ElfMachine.POWERPC64.value, "64"): (0x0500,),
+    (ElfMachine.POWERPC.value, "32"): (0x0000,),
+    (ElfMachine.MIPS_I.value, "64"): (0x0700, 0x0E00),
+    (ElfMachine.MIPS_I.value, "32"): (0x0000, 0x0600, 0x0C00, 0x0D00),
+    (ElfMachine.RISCV.value, "64"): (0x0F00, 0x1000),
+    (ElfMachine.RISCV.value, "32"): (0x0F00, 0x1000),
+    (ElfMachine.LOONGARCH.value, "64"): (0x1100, 0x1200),
+}
+
+
+def parse_ld_so_cache(data: bytes) -> List[Tuple[str, str, int, int]]:
+    """
+    This function parses ld.so.cache content (old "ld.so-1.7.0",
+    new "glibc-ld.so.cache1.1" or both) and returns entries
+    (soname, path, flags, hwcap) in the cache order.
+    """
+
+    new_magic = b"glibc-ld.so.cache1.1"
+    old_magic = b"ld.so-1.7.0"
+    entries = []
+
+    if data.startswith(old_magic):
+        order = "<" if byteorder == "little" else ">"
+        libraries_number = Struct(order + "I").unpack_from(data, 12)[0]
+        if 16 + libraries_number * 12 > len(data):
+            order = ">" if order == "<" else "<"
+            libraries_number = Struct(order + "I").unpack_from(data, 12)[0]
+
+        strings_offset = 16 + libraries_number * 12
+        new_offset = strings_offset + get_padding_length(strings_offset, 8)
+        if data[new_offset : new_offset + len(new_magic)] != new_magic:
+            for flags, key, value in Struct(order + "iII").iter_unpack(
+                data[16:strings_offset]
+            ):
+                entries.append(
+                    (
+                        get_raw_string(data, strings_offset + key),
+                        get_raw_string(data, strings_offset + value),
+                        flags,
+                        0,
+                    )
+                )
+            return entries
+        data = data[new_offset:]
+
+    if not data.startswith(new_magic):
+        raise ValueError("Invalid ld.so.cache magic bytes")
+
+    order = {2: "<", 3: ">"}.get(
+        data[28], "<" if byteorder == "little" else ">"
+    )
+    libraries_number = Struct(order + "I").unpack_from(data, 20)[0]
+    for flags, key, value, _, hwcap in Struct(order + "iIIIQ").iter_unpack(
+        data[48 : 48 + libraries_number * 24]
+    ):
+        entries.append(
+            (
+                get_raw_string(data, key),
+                get_raw_string(data, value),
+                flags,
+                hwcap,
+            )
+        )
+
+    return entries
+
+
+def get_ld_so_cache_index(
+    entries: List[Tuple[str, str, int, int]],
+    elf_classe: str,
+    machine: int,
+    hwcaps: bool = False,
+) -> Dict[str, str]:
+    """
+    This function returns {soname: path} for ELF entries compatible
+    with the class and machine (first entry wins, like ld.so).
+
+    Entries with hwcap (optimized libraries for some processors) are
+    used only when hwcaps is True, offline the processor is unknown.
+    """
+
+    accepted = ld_so_cache_flags.get((machine, elf_classe))
+    index = {}
+
+    for soname, path, flags, hwcap in entries:
+        if (
+            flags & 0xFF in (1, 3)
+            and (accepted is None or flags & 0xFF00 in accepted)
+            and (hwcaps or not hwcap)
+            and soname not in index
+        ):
+            index[soname] = path
+
+    return index
+
+
+def read_dynamic_info(
+    file: _BufferedIOBase, path: str, budget: ParseBudget = None
+) -> DynamicInfo:
+    """
+    This function returns the dynamic linking informations
+    (interpreter, DT_SONAME, DT_NEEDED, DT_RPATH and DT_RUNPATH)
+    using the raw layout.
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+
+    layout = parse_elflayout(file, budget)
+    dynamics = read_raw_dynamic(file, layout, budget)
+    strings = read_raw_dynamic_strings(file, layout, dynamics, budget)
+
+    interpreter = None
+    for segment in layout.segments:
+        if segment.type == ProgramHeaderType.PT_INTERP.value:
+            interpreter = get_raw_string(
+                budget.read(file, segment.offset, segment.filesz), 0
+            )
+            break
+
+    values = {}
+    for tag, value in dynamics:
+        values.setdefault(tag, []).append(get_raw_string(strings, value))
+
+    return DynamicInfo(
+        path,
+        layout.elf_classe,
+        layout.order,
+        layout.machine,
+        interpreter,
+        values.get(DynamicType.DT_SONAME.value, [None])[0],
+        values.get(DynamicType.DT_NEEDED.value, []),
+        [
+            directory
+            for rpath in values.get(DynamicType.DT_RPATH.value, [])
+            for directory in rpath.split(":")
+            if directory
+        ],
+        [
+            directory
+            for runpath in values.get(DynamicType.DT_RUNPATH.value, [])
+            for directory in runpath.split(":")
+            if directory
+        ],
+    )
+
+
+class DependencyResolver:
+    """
+    This class implements an offline shared libraries resolver
+    (like ldd without executing anything) for a sysroot.
+
+    DT_NEEDED are searched in DT_RPATH (of the object and its
+    loaders, when the object has no DT_RUNPATH), library_paths
+    (like LD_LIBRARY_PATH), DT_RUNPATH, ld.so.cache (ld.so.conf
+    directories when there is no cache) and default directories,
+    $ORIGIN and $LIB are expanded.
+    Only libraries with the same class, data encoding and machine
+    as the requesting object are used.
+
+    Dynamic informations, symbolic links, directories contents and
+    searches are cached: a resolver reused for all files of an
+    image parses each library only once.
+    """
+
+    def __init__(self, sysroot: str = "/", library_paths: List[str] = ()):
+        self.sysroot = abspath(sysroot)
+        self.library_paths = [*library_paths]
+        self.infos = {}
+        self.realpaths = {}
+        self.directories = {}
+        self.searches = {}
+        self.caches = {}
+
+        try:
+            with open(
+                self.get_host_path(self.realpath("/etc/ld.so.cache")), "rb"
+            ) as file:
+                self.cache_entries = parse_ld_so_cache(file.read())
+        except (OSError, ValueError, StructError):
+            self.cache_entries = None
+
+        self.configuration_paths = (
+            self.parse_ld_so_conf() if self.cache_entries is None else []
+        )
+
+    def get_cache_index(self, info: DynamicInfo) -> Dict[str, str]:
+        """
+        This method returns (and caches) the ld.so.cache index
+        for the class and machine of info.
+        """
+
+        key = (info.elf_classe, info.machine)
+        index = self.caches.get(key)
+        if index is None:
+            index = self.caches[key] = get_ld_so_cache_index(
+                self.cache_entries or [], info.elf_classe, info.machine
+            )
+        return index
+
+    def get_host_path(self, path: str) -> str:
+        """
+        This method returns the host path of a sysroot path.
+        """
+
+        return join(self.sysroot, path.lstrip("/"))
+
+    def realpath(self, path: str) -> str:
+        """
+        This method resolves symbolic links of a sysroot path,
+        absolute links targets stay in the sysroot.
+        """
+
+        realpath = self.realpaths.get(path)
+        if realpath is not None:
+            return realpath
+
+        parts = [part for part in path.split("/") if part and part != "."]
+        parts.reverse()
+        resolved = []
+        links = 0
+
+        while parts:
+            part = parts.pop()
+            if part == "..":
+                if resolved:
+                    resolved.pop()
+                continue
+
+            resolved.append(part)
+            host_path = join(self.sysroot, *resolved)
+            if links < 40 and islink(host_path):
+                links += 1
+                target = readlink(host_path)
+                resolved.pop()
+                if target.startswith("/"):
+                    resolved = []
+                parts.extend(
+                    reversed(
+                        [
+                            part
+                            for part in target.split("/")
+                            if part and part != "."
+                        ]
+                    )
+                )
+
+        realpath = self.realpaths[path] = "/" + "/".join(resolved)
+        return realpath
+
+    def list_directory(self, directory: str) -> frozenset:
+        """
+        This method returns (and caches) filenames of a directory,
+        searches test names in memory instead of calling stat.
+        """
+
+        names = self.directories.get(directory)
+        if names is None:
+            try:
+                names = frozenset(
+                    listdir(self.get_host_path(self.realpath(directory)))
+                )
+            except OSError:
+                names = frozenset()
+            self.directories[directory] = names
+        return names
+
+    def parse_ld_so_conf(
+        self, path: str = "/etc/ld.so.conf", depth: int = 0
+    ) -> List[str]:
+        """
+        This method returns directories of ld.so.conf
+        (include directives are followed).
+        """
+
+        try:
+            with open(
+                self.get_host_path(self.realpath(path)), encoding="latin-1"
+            ) as file:
+                lines = file.read().splitlines()
+        except OSError:
+            return []
+
+        from glob import glob
+
+        directories = []
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if not line or line.startswith("hwcap"):
+                continue
+
+            if line.startswith("include") and depth < 8:
+                for pattern in line.split()[1:]:
+                    if not pattern.startswith("/"):
+                        pattern = join(dirname(path), pattern)
+                    for filename in sorted(
+                        glob(self.get_host_path(self.realpath(pattern)))
+                    ):
+                        directories.extend(
+                            self.parse_ld_so_conf(
+                                "/" + relpath(filename, self.sysroot),
+                                depth + 1,
+                            )
+                        )
+                continue
+
+            directories.extend(
+                directory.split("=", 1)[0]
+                for directory in line.replace(",", " ")
+                .replace(":", " ")
+                .split()
+            )
+
+        return directories
+
+    def get_info(self, path: str) -> Union[DynamicInfo, None]:
+        """
+        This method returns (and caches) dynamic informations
+        of a sysroot path, None when it is not a valid ELF file.
+        """
+
+        realpath = self.realpath(path)
+        if realpath in self.infos:
+            return self.infos[realpath]
+
+        try:
+            with open(self.get_host_path(realpath), "rb") as file:
+                info = read_dynamic_info(file, realpath)
+        except (OSError, ValueError, StructError):
+            info = None
+
+        self.infos[realpath] = info
+        return info
+
+    def get_default_paths(self, info: DynamicInfo) -> List[str]:
+        """
+        This method returns default libraries directories.
+        """
+
+        if info.elf_classe == "64":
+            return ["/lib64", "/usr/lib64", "/lib", "/usr/lib"]
+        return ["/lib", "/usr/lib"]
+
+    def expand_paths(
+        self, directories: List[str], origin: str, info: DynamicInfo
+    ) -> List[str]:
+        """
+        This method expands $ORIGIN and $LIB in search directories.
+        """
+
+        lib = "lib64" if info.elf_classe == "64" else "lib"
+        return [
+            directory.replace("${ORIGIN}", origin)
+            .replace("$ORIGIN", origin)
+            .replace("${LIB}", lib)
+            .replace("$LIB", lib)
+            for directory in directories
+        ]
+
+    def find_library(
+        self,
+        name: str,
+        info: DynamicInfo,
+        path: str,
+        rpaths: Tuple[str],
+    ) -> Union[Tuple[str, DynamicInfo], None]:
+        """
+        This method searches a DT_NEEDED name for the object info
+        (found at path) and returns (path, library informations).
+        """
+
+        if "/" in name:
+            candidates = [name if name.startswith("/") else "/" + name]
+        else:
+            directories = (
+                [] if info.runpath else [*rpaths]
+            ) + self.library_paths
+            directories.extend(
+                self.expand_paths(info.runpath, dirname(path), info)
+            )
+            candidates = [
+                join(directory, name)
+                for directory in directories
+                if name in self.list_directory(directory)
+            ]
+
+            cached = self.get_cache_index(info).get(name)
+            if cached is not None:
+                candidates.append(cached)
+
+            candidates.extend(
+                join(directory, name)
+                for directory in (
+                    *self.configuration_paths,
+                    *self.get_default_paths(info),
+                )
+                if name in self.list_directory(directory)
+            )
+
+        key = (tuple(candidates), info.elf_classe, info.order, info.machine)
+        if key in self.searches:
+            return self.searches[key]
+
+        result = None
+        for candidate in candidates:
+            library = self.get_info(candidate)
+            if (
+                library is not None
+                and library.elf_classe == info.elf_classe
+                and library.order == info.order
+                and library.machine == info.machine
+            ):
+                result = (candidate, library)
+                break
+
+        self.searches[key] = result
+        return result
+
+    def resolve(
+        self, path: str
+    ) -> Dict[str, List[Tuple[str, Union[str, None]]]]:
+        """
+        This method returns the transitive dependencies graph in
+        loading order (breadth first): {object path: [(DT_NEEDED,
+        library path or None)]}, paths are real paths in the sysroot.
+        """
+
+        root = self.get_info(path)
+        if root is None:
+            raise ValueError(f"Not an ELF file: {path!r}")
+
+        graph = {}
+        loaded = {}
+        queue = deque([(root, path, ())])
+
+        while queue:
+            info, found_path, rpaths = queue.popleft()
+            if info.path in graph:
+                continue
+
+            if not info.runpath:
+                rpaths = (
+                    *self.expand_paths(info.rpath, dirname(found_path), info),
+                    *rpaths,
+                )
+
+            dependencies = graph[info.path] = []
+            for name in info.needed:
+                library_path = loaded.get(name)
+                if library_path is None:
+                    result = self.find_library(name, info, found_path, rpaths)
+                    if result is not None:
+                        library_path = result[1].path
+                        loaded[name] = library_path
+                        if result[1].soname:
+                            loaded.setdefault(result[1].soname, library_path)
+                        queue.append((result[1], result[0], rpaths))
+                dependencies.append((name, library_path))
+
+        return graph
+
+
+class SymbolIndex:
+    """
+    This class implements sorted symbols and sections arrays of an
+    ELF file to symbolize many addresses with one merge walk.
+
+    Functions, objects, indirect functions and untyped symbols
+    defined in a section are used (.symtab and .dynsym). An address
+    after the end of a sized symbol belongs to the enclosing symbol
+    (parents), an address after an unsized label belongs to the
+    label when they are in the same section. TLS NOBITS sections
+    (.tbss) are not indexed, their addresses overlap next sections.
+    """
+
+    def __init__(self, file: _BufferedIOBase, layout: ElfLayout = None):
+        if layout is None:
+            layout = parse_elflayout(file)
+
+        self.layout = layout
+        self.build_id = read_raw_build_id(file, layout)
+
+        tls = SectionAttributeFlags.SHF_TLS.value
+        nobits = SectionHeaderType.SHT_NOBITS.value
+        self.sections = sorted(
+            (section.addr, section.addr + section.size, section.name)
+            for section in layout.sections
+            if section.addr
+            and section.flags & SectionAttributeFlags.SHF_ALLOC.value
+            and not (section.flags & tls and section.type == nobits)
+        )
+
+        types = (
+            SymbolType.STT_NOTYPE.value,
+            SymbolType.STT_OBJECT.value,
+            SymbolType.STT_FUNC.value,
+            10,
+        )
+        undefined = SpecialSectionIndexes.SHN_UNDEF.value
+        reserved = SpecialSectionIndexes.SHN_LORESERVE.value
+        symbols = {}
+
+        for _, table, strings in read_raw_symbols(file, layout):
+            for name, info, _, shndx, value, size in table:
+                if (
+                    not name
+                    or shndx == undefined
+                    or shndx >= reserved
+                    or info & 0xF not in types
+                ):
+                    continue
+                local = info >> 4 == SymbolBinding.STB_LOCAL.value
+                key = (value, -size)
+                if key not in symbols or symbols[key][0] and not local:
+                    symbols[key] = (local, get_raw_string(strings, name))
+
+        self.starts = []
+        self.ends = []
+        self.names = []
+        self.parents = []
+        stack = []
+
+        for value, size in sorted(symbols):
+            name = symbols[(value, size)][1]
+            index = len(self.starts)
+            while stack and self.ends[stack[-1]] <= value:
+                stack.pop()
+            self.parents.append(stack[-1] if stack else -1)
+            self.starts.append(value)
+            self.ends.append(value - size)
+            self.names.append(name)
+            if size:
+                stack.append(index)
+
+    def get_section(self, address: int, index: int) -> Tuple[int, str]:
+        """
+        This method moves the sections cursor index to address
+        (addresses are increasing) and returns (index, name).
+        """
+
+        sections = self.sections
+        while index + 1 < len(sections) and sections[index + 1][0] <= address:
+            index += 1
+        if 0 <= index < len(sections) and address < sections[index][1]:
+            return index, sections[index][2]
+        return index, None
+
+    def lookup(self, addresses: List[int]) -> List[SymbolLocation]:
+        """
+        This method sorts addresses once and returns SymbolLocation
+        for each address (in the addresses order).
+        """
+
+        starts = self.starts
+        ends = self.ends
+        parents = self.parents
+        symbols_number = len(starts)
+        results = [None] * len(addresses)
+        symbol_index = 0
+        section_index = -1
+
+        for position in sorted(
+            range(len(addresses)), key=addresses.__getitem__
+        ):
+            address = addresses[position]
+            while (
+                symbol_index < symbols_number
+                and starts[symbol_index] <= address
+            ):
+                symbol_index += 1
+
+            section_index, section = self.get_section(address, section_index)
+            location = results[position] = SymbolLocation(
+                address, section=section
+            )
+
+            index = symbol_index - 1
+            while index >= 0 and starts[index] != ends[index] <= address:
+                index = parents[index]
+            if index < 0:
+                continue
+
+            if starts[index] == ends[index]:
+                parent = parents[index]
+                if parent >= 0 and address < ends[parent]:
+                    index = parent
+                elif self.get_section(starts[index], -1)[1] != section:
+                    continue
+
+            location.symbol = self.names[index]
+            location.offset = address - starts[index]
+
+        return results
+
+
+symbol_indexes = LRUCache(32)
+
+
+def symbolize(
+    path: str, addresses: List[int], offsets: bool = False
+) -> List[SymbolLocation]:
+    """
+    This function returns symbol, offset and section for many
+    addresses (virtual addresses, or file offsets when offsets
+    is True) of an ELF file.
+
+    Prepared indexes are cached by build-id (or file identity
+    without build-id) and reused by next calls.
+    """
+
+    with open(path, "rb") as file:
+        layout = parse_elflayout(file)
+        key = read_raw_build_id(file, layout) or get_file_key(file)
+        index = symbol_indexes.get(key)
+        if index is None:
+            index = symbol_indexes[key] = SymbolIndex(file, layout)
+
+    if not offsets:
+        return index.lookup(addresses)
+
+    results = index.lookup(
+        [
+            -1 if address is None else address
+            for address in (
+                offset_to_address(layout, offset) for offset in addresses
+            )
+        ]
+    )
+    for location, offset in zip(results, addresses):
+        location.address = offset
+    return results
+
+
+def read_uleb128(data: bytes, position: int) -> Tuple[int, int]:
+    """
+    This function decodes an unsigned LEB128 integer
+    and returns (value, next position).
+    """
+
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def read_sleb128(data: bytes, position: int) -> Tuple[int, int]:
+    """
+    This function decodes a signed LEB128 integer
+    and returns (value, next position).
+    """
+
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            if byte & 0x40:
+                value -= 1 << shift
+            return value, position
+
+
+dwarf_fixed_forms = {
+    0x05: 2,
+    0x06: 4,
+    0x07: 8,
+    0x0B: 1,
+    0x0C: 1,
+    0x11: 1,
+    0x12: 2,
+    0x13: 4,
+    0x14: 8,
+    0x19: 0,
+    0x1C: 4,
+    0x1E: 16,
+    0x20: 8,
+    0x21: 0,
+    0x24: 8,
+    0x25: 1,
+    0x26: 2,
+    0x27: 3,
+    0x28: 4,
+    0x29: 1,
+    0x2A: 2,
+    0x2B: 3,
+    0x2C: 4,
+}
+dwarf_offset_forms = (0x0E, 0x17, 0x1D, 0x1F, 0x1F20, 0x1F21)
+dwarf_uleb128_forms = (0x0F, 0x15, 0x1A, 0x1B, 0x22, 0x23, 0x1F01, 0x1F02)
+dwarf_block_forms = {0x03: 2, 0x04: 4, 0x09: None, 0x0A: 1, 0x18: None}
+
+
+class DwarfLineIndex:
+    """
+    This class implements a lazy address to source line index
+    (DWARF 2 to 5 .debug_line).
+
+    Compilation units ranges come from .debug_aranges (or a scan
+    of compilation units first entries: DW_AT_low_pc, DW_AT_high_pc
+    and DW_AT_ranges), a line program is decoded only when an address
+    is in its unit and decoded rows are kept in an LRU cache.
+    Compressed debug sections are supported, reads are clamped
+    to the file.
+    """
+
+    def __init__(
+        self,
+        file: _BufferedIOBase,
+        layout: ElfLayout = None,
+        cache_size: int = 16,
+    ):
+        if layout is None:
+            layout = parse_elflayout(file)
+
+        self.file = file
+        self.layout = layout
+        self.budget = ParseBudget(file, None, None, None)
+        self.order = "<" if layout.order == "little" else ">"
+        self.sections = {
+            (
+                (".debug_" + section.name[8:])
+                if section.name.startswith(".zdebug_")
+                else section.name
+            ): section
+            for section in layout.sections
+        }
+        self.tables = LRUCache(cache_size)
+        self.abbreviations = {}
+        self.units = {}
+        self.ranges = None
+        self.starts = None
+
+    def read(self, name: str, offset: int = 0, size: int = None) -> bytes:
+        """
+        This method reads size bytes (all when size is None)
+        from offset in a debug section.
+        """
+
+        section = self.sections.get(name)
+        if section is None:
+            return b""
+
+        if (
+            section.flags & SectionAttributeFlags.SHF_COMPRESSED.value
+            or section.name.startswith(".zdebug_")
+        ):
+            DataToCClass.order = self.layout.order
+            data = read_section_data(
+                self.file,
+                section.name,
+                section.offset,
+                section.size,
+                section.flags,
+                section.type,
+                self.layout.elf_classe,
+            )
+            return data[offset : None if size is None else offset + size]
+
+        if offset >= section.size:
+            return b""
+
+        return self.budget.read(
+            self.file,
+            section.offset + offset,
+            (
+                section.size - offset
+                if size is None
+                else min(size, section.size - offset)
+            ),
+        )
+
+    def get_size(self, name: str) -> int:
+        """
+        This method returns the (uncompressed) size of a debug section.
+        """
+
+        section = self.sections.get(name)
+        if section is None:
+            return 0
+        if (
+            section.flags & SectionAttributeFlags.SHF_COMPRESSED.value
+            or section.name.startswith(".zdebug_")
+        ):
+            return len(self.read(name))
+        return section.size
+
+    def read_unit(self, name: str, offset: int) -> Tuple[bytes, int, int]:
+        """
+        This method reads a unit (unit_length and content) and returns
+        (data, content position, offset size: 4 or 8 for DWARF64).
+        """
+
+        header = self.read(name, offset, 12)
+        if len(header) < 4:
+            return b"", 0, 4
+        length = Struct(self.order + "I").unpack_from(header)[0]
+        if length == 0xFFFFFFFF:
+            length = Struct(self.order + "Q").unpack_from(header, 4)[0]
+            return self.read(name, offset, 12 + length), 12, 8
+        return self.read(name, offset, 4 + length), 4, 4
+
+    def read_integer(self, data: bytes, position: int, size: int) -> int:
+        """
+        This method reads an unsigned integer of size bytes.
+        """
+
+        return int.from_bytes(
+            data[position : position + size], self.layout.order
+        )
+
+    def get_abbreviations(self, offset: int) -> Dict[int, Tuple]:
+        """
+        This method returns (and caches) the abbreviations table at
+        offset: {code: (tag, [(attribute, form, implicit value)])}.
+        """
+
+        abbreviations = self.abbreviations.get(offset)
+        if abbreviations is not None:
+            return abbreviations
+
+        data = self.read(".debug_abbrev", offset)
+        abbreviations = self.abbreviations[offset] = {}
+        position = 0
+
+        while position < len(data):
+            code, position = read_uleb128(data, position)
+            if not code:
+                break
+            tag, position = read_uleb128(data, position)
+            position += 1
+            attributes = []
+            while True:
+                attribute, position = read_uleb128(data, position)
+                form, position = read_uleb128(data, position)
+                implicit = None
+                if form == 0x21:
+                    implicit, position = read_sleb128(data, position)
+                if not attribute and not form:
+                    break
+                attributes.append((attribute, form, implicit))
+            abbreviations[code] = (tag, attributes)
+
+        return abbreviations
+
+    def read_form(
+        self,
+        data: bytes,
+        position: int,
+        form: int,
+        offset_size: int,
+        address_size: int,
+        version: int,
+    ) -> Tuple[Union[int, bytes, str], int]:
+        """
+        This method reads an attribute value and returns
+        (value, next position), blocks are bytes and
+        DW_FORM_string is str.
+        """
+
+        if form == 0x16:
+            form, position = read_uleb128(data, position)
+
+        size = dwarf_fixed_forms.get(form)
+        if size is not None:
+            return self.read_integer(data, position, size), position + size
+        if form == 0x01 or form == 0x10 and version < 3:
+            return (
+                self.read_integer(data, position, address_size),
+                position + address_size,
+            )
+        if form in dwarf_offset_forms or form == 0x10:
+            return (
+                self.read_integer(data, position, offset_size),
+                position + offset_size,
+            )
+        if form in dwarf_uleb128_forms:
+            return read_uleb128(data, position)
+        if form == 0x0D:
+            return read_sleb128(data, position)
+        if form == 0x08:
+            end = data.index(b"\0", position)
+            return data[position:end].decode("latin-1"), end + 1
+        if form in dwarf_block_forms:
+            size = dwarf_block_forms[form]
+            if size is None:
+                length, position = read_uleb128(data, position)
+            else:
+                length = self.read_integer(data, position, size)
+                position += size
+            return data[position : position + length], position + length
+
+        raise ValueError(f"Unknown DWARF form: {form:#x}")
+
+    def get_string(self, form: int, value: Union[int, str], unit: Dict) -> str:
+        """
+        This method returns the string of a string attribute.
+        """
+
+        if form == 0x08:
+            return value
+        if form == 0x1F:
+            return get_raw_string(self.read(".debug_line_str", value, 4096), 0)
+        if form in (0x1A, 0x25, 0x26, 0x27, 0x28):
+            offset_size = unit["offset_size"]
+            value = self.read_integer(
+                self.read(
+                    ".debug_str_offsets",
+                    unit.get("str_offsets_base", 8) + value * offset_size,
+                    offset_size,
+                ),
+                0,
+                offset_size,
+            )
+        return get_raw_string(self.read(".debug_str", value, 4096), 0)
+
+    def get_address(self, form: int, value: int, unit: Dict) -> int:
+        """
+        This method returns the address of an address attribute
+        (DW_FORM_addrx* use .debug_addr).
+        """
+
+        if form in (0x1B, 0x29, 0x2A, 0x2B, 0x2C, 0x1F01):
+            size = unit["address_size"]
+            return self.read_integer(
+                self.read(
+                    ".debug_addr",
+                    unit.get("addr_base", 8) + value * size,
+                    size,
+                ),
+                0,
+                size,
+            )
+        return value
+
+    def get_unit(self, offset: int) -> Dict[str, Any]:
+        """
+        This method decodes (and caches) the compilation unit header
+        and its first entry attributes (only name, comp_dir, stmt_list,
+        low_pc, high_pc, ranges and bases are kept).
+        """
+
+        unit = self.units.get(offset)
+        if unit is not None:
+            return unit
+
+        unit = self.units[offset] = {}
+        header = self.read(".debug_info", offset, 12)
+        if len(header) < 4:
+            return unit
+
+        length = self.read_integer(header, 0, 4)
+        position, offset_size = 4, 4
+        if length == 0xFFFFFFFF:
+            length = self.read_integer(header, 4, 8)
+            position, offset_size = 12, 8
+        end = offset + position + length
+
+        data = self.read(".debug_info", offset, position + min(length, 65536))
+        version = self.read_integer(data, position, 2)
+        position += 2
+
+        if version >= 5:
+            unit_type = data[position]
+            address_size = data[position + 1]
+            position += 2
+            abbreviations_offset = self.read_integer(
+                data, position, offset_size
+            )
+            position += offset_size
+            if unit_type in (4, 5):
+                position += 8
+            elif unit_type in (2, 6):
+                position += 8 + offset_size
+        else:
+            abbreviations_offset = self.read_integer(
+                data, position, offset_size
+            )
+            address_size = data[position + offset_size]
+            position += offset_size + 1
+
+        unit.update(
+            offset_size=offset_size,
+            address_size=address_size,
+            version=version,
+            end=end,
+        )
+
+        code, position = read_uleb128(data, position)
+        _, attributes = self.get_abbreviations(abbreviations_offset).get(
+            code, (None, [])
+        )
+
+        values = {}
+        for attribute, form, implicit in attributes:
+            value, position = self.read_form(
+                data, position, form, offset_size, address_size, version
+            )
+            values[attribute] = (form, implicit if form == 0x21 else value)
+
+        for attribute, name in (
+            (0x73, "addr_base"),
+            (0x72, "str_offsets_base"),
+            (0x74, "rnglists_base"),
+        ):
+            if attribute in values:
+                unit[name] = values[attribute][1]
+
+        for attribute, name in ((0x03, "name"), (0x1B, "comp_dir")):
+            if attribute in values:
+                unit[name] = self.get_string(*values[attribute], unit)
+
+        if 0x10 in values:
+            unit["stmt_list"] = values[0x10][1]
+        if 0x11 in values:
+            unit["low_pc"] = self.get_address(*values[0x11], unit)
+        if 0x12 in values:
+            form, value = values[0x12]
+            unit["high_pc"] = (
+                self.get_address(form, value, unit)
+                if form in (0x01, 0x1B, 0x29, 0x2A, 0x2B, 0x2C, 0x1F01)
+                else unit.get("low_pc", 0) + value
+            )
+        if 0x55 in values:
+            unit["ranges"] = values[0x55]
+
+        return unit
+
+    def get_unit_ranges(self, unit: Dict[str, Any]) -> List[Tuple[int, int]]:
+        """
+        This method returns addresses ranges of a compilation unit
+        (DW_AT_low_pc/DW_AT_high_pc, .debug_ranges or .debug_rnglists).
+        """
+
+        if "ranges" not in unit:
+            if "low_pc" in unit and "high_pc" in unit:
+                return [(unit["low_pc"], unit["high_pc"])]
+            return []
+
+        form, value = unit["ranges"]
+        size = unit["address_size"]
+        base = unit.get("low_pc", 0)
+        ranges = []
+
+        if unit["version"] < 5:
+            data = self.read(".debug_ranges", value)
+            maximum = (1 << (size * 8)) - 1
+            for position in range(0, len(data) - 2 * size + 1, 2 * size):
+                start = self.read_integer(data, position, size)
+                end = self.read_integer(data, position + size, size)
+                if not start and not end:
+                    break
+                if start == maximum:
+                    base = end
+                else:
+                    ranges.append((base + start, base + end))
+            return ranges
+
+        if form == 0x23:
+            offset_size = unit["offset_size"]
+            rnglists_base = unit.get("rnglists_base", 12)
+            value = rnglists_base + self.read_integer(
+                self.read(
+                    ".debug_rnglists",
+                    rnglists_base + value * offset_size,
+                    offset_size,
+                ),
+                0,
+                offset_size,
+            )
+
+        data = self.read(".debug_rnglists", value, 65536)
+        position = 0
+        while position < len(data):
+            kind = data[position]
+            position += 1
+            if kind == 0:
+                break
+            if kind in (1, 2, 3):
+                first, position = read_uleb128(data, position)
+                first = self.get_address(0x1B, first, unit)
+                if kind == 1:
+                    base = first
+                    continue
+                second, position = read_uleb128(data, position)
+                if kind == 2:
+                    second = self.get_address(0x1B, second, unit)
+                else:
+                    second += first
+                ranges.append((first, second))
+            elif kind == 4:
+                first, position = read_uleb128(data, position)
+                second, position = read_uleb128(data, position)
+                ranges.append((base + first, base + second))
+            else:
+                first = self.read_integer(data, position, size)
+                position += size
+                if kind == 5:
+                    base = first
+                    continue
+                if kind == 6:
+                    second = self.read_integer(data, position, size)
+                    position += size
+                else:
+                    second, position = read_uleb128(data, position)
+                    second += first
+                ranges.append((first, second))
+
+        return ranges
+
+    def get_ranges(self) -> List[Tuple[int, int, int]]:
+        """
+        This method returns sorted (start, end, unit offset) from
+        .debug_aranges, or from a scan of compilation units without
+        it (done once, only units headers and first entries).
+        """
+
+        if self.ranges is not None:
+            return self.ranges
+
+        ranges = []
+        offset = 0
+        aranges_size = self.get_size(".debug_aranges")
+
+        while offset < aranges_size:
+            data, position, offset_size = self.read_unit(
+                ".debug_aranges", offset
+            )
+            if not data:
+                break
+            unit_offset = self.read_integer(data, position + 2, offset_size)
+            position += 2 + offset_size
+            address_size = data[position]
+            segment_size = data[position + 1]
+            position += 2
+            tuple_size = 2 * address_size + segment_size
+            position += get_padding_length(position, tuple_size)
+
+            while position + tuple_size <= len(data):
+                position += segment_size
+                start = self.read_integer(data, position, address_size)
+                length = self.read_integer(
+                    data, position + address_size, address_size
+                )
+                position += 2 * address_size
+                if not start and not length:
+                    break
+                ranges.append((start, start + length, unit_offset))
+
+            offset += len(data)
+
+        if not ranges:
+            offset = 0
+            info_size = self.get_size(".debug_info")
+            while offset < info_size:
+                unit = self.get_unit(offset)
+                if not unit or unit["end"] <= offset:
+                    break
+                ranges.extend(
+                    (start, end, offset)
+                    for start, end in self.get_unit_ranges(unit)
+                    if end > start
+                )
+                offset = unit["end"]
+
+        ranges.sort()
+        self.ranges = ranges
+        self.starts = [start for start, _, _ in ranges]
+        self.ends = []
+        maximum = 0
+        for _, end, _ in ranges:
+            maximum = max(maximum, end)
+            self.ends.append(maximum)
+        return ranges
+
+    def get_files(
+        self,
+        data: bytes,
+        position: int,
+        version: int,
+        offset_size: int,
+        address_size: int,
+        unit: Dict[str, Any],
+    ) -> Tuple[List[str], int]:
+        """
+        This method decodes directories and files names
+        of a line program header, returns (paths, position).
+        """
+
+        comp_dir = unit.get("comp_dir", "")
+
+        if version < 5:
+            directories = [comp_dir]
+            while data[position]:
+                end = data.index(b"\0", position)
+                directories.append(data[position:end].decode("latin-1"))
+                position = end + 1
+            position += 1
+
+            files = [None]
+            while data[position]:
+                end = data.index(b"\0", position)
+                name = data[position:end].decode("latin-1")
+                directory, position = read_uleb128(data, end + 1)
+                _, position = read_uleb128(data, position)
+                _, position = read_uleb128(data, position)
+                files.append(
+                    join(
+                        (
+                            directories[directory]
+                            if directory < len(directories)
+                            else ""
+                        ),
+                        name,
+                    )
+                )
+            return files, position + 1
+
+        tables = []
+        for _ in range(2):
+            formats_number = data[position]
+            position += 1
+            formats = []
+            for _ in range(formats_number):
+                content, position = read_uleb128(data, position)
+                form, position = read_uleb128(data, position)
+                formats.append((content, form))
+
+            entries_number, position = read_uleb128(data, position)
+            entries = []
+            for _ in range(entries_number):
+                entry = {}
+                for content, form in formats:
+                    value, position = self.read_form(
+                        data,
+                        position,
+                        form,
+                        offset_size,
+                        address_size,
+                        version,
+                    )
+                    if content == 1:
+                        value = self.get_string(form, value, unit)
+                    entry[content] = value
+                entries.append(entry)
+            tables.append(entries)
+
+        directories = [entry.get(1, "") for entry in tables[0]]
+        if directories and not directories[0].startswith("/") and comp_dir:
+            directories[0] = join(comp_dir, directories[0])
+        return [
+            join(
+                (
+                    directories[entry.get(2, 0)]
+                    if entry.get(2, 0) < len(directories)
+                    else ""
+                ),
+                entry.get(1, ""),
+            )
+            for entry in tables[1]
+        ], position
+
+    def decode_lines(self, unit_offset: int) -> List[Tuple]:
+        """
+        This method decodes the line program of a compilation unit
+        and returns sorted sequences (start, end, addresses, files
+        indexes, lines, files names).
+        """
+
+        unit = self.get_unit(unit_offset)
+        if "stmt_list" not in unit:
+            return []
+
+        data, position, offset_size = self.read_unit(
+            ".debug_line", unit["stmt_list"]
+        )
+        if not data:
+            return []
+
+        version = self.read_integer(data, position, 2)
+        position += 2
+        address_size = unit.get("address_size", 8)
+        if version >= 5:
+            address_size = data[position]
+            position += 2
+
+        header_length = self.read_integer(data, position, offset_size)
+        position += offset_size
+        program_start = position + header_length
+
+        minimum_length = data[position]
+        position += 1
+        if version >= 4:
+            position += 1
+        line_base = data[position + 1] - (
+            256 if data[position + 1] > 127 else 0
+        )
+        line_range = data[position + 2] or 1
+        opcode_base = data[position + 3]
+        lengths = data[position + 4 : position + 3 + opcode_base]
+        position += 3 + opcode_base
+
+        files, _ = self.get_files(
+            data, position, version, offset_size, address_size, unit
+        )
+
+        sequences = []
+        position = program_start
+        end = len(data)
+        address = 0
+        file = 1
+        line = 1
+        addresses = array("Q")
+        files_indexes = array("I")
+        lines = array("I")
+
+        while position < end:
+            opcode = data[position]
+            position += 1
+
+            if opcode >= opcode_base:
+                opcode -= opcode_base
+                address += (opcode // line_range) * minimum_length
+                line += line_base + opcode % line_range
+                addresses.append(address)
+                files_indexes.append(file)
+                lines.append(max(line, 0))
+            elif opcode == 0:
+                length, position = read_uleb128(data, position)
+                next_position = position + length
+                if not length:
+                    continue
+                extended = data[position]
+                if extended == 1:
+                    if addresses:
+                        sequences.append(
+                            (
+                                addresses[0],
+                                address,
+                                addresses,
+                                files_indexes,
+                                lines,
+                                files,
+                            )
+                        )
+                    address = 0
+                    file = 1
+                    line = 1
+                    addresses = array("Q")
+                    files_indexes = array("I")
+                    lines = array("I")
+                elif extended == 2:
+                    address = self.read_integer(data, position + 1, length - 1)
+                elif extended == 3:
+                    name_end = data.index(b"\0", position + 1)
+                    files.append(
+                        data[position + 1 : name_end].decode("latin-1")
+                    )
+                position = next_position
+            elif opcode == 1:
+                addresses.append(address)
+                files_indexes.append(file)
+                lines.append(max(line, 0))
+            elif opcode == 2:
+                value, position = read_uleb128(data, position)
+                address += value * minimum_length
+            elif opcode == 3:
+                value, position = read_sleb128(data, position)
+                line += value
+            elif opcode == 4:
+                file, position = read_uleb128(data, position)
+            elif opcode == 8:
+                address += ((255 - opcode_base) // line_range) * minimum_length
+            elif opcode == 9:
+                address += self.read_integer(data, position, 2)
+                position += 2
+            elif opcode in (5, 12):
+                _, position = read_uleb128(data, position)
+            elif opcode not in (6, 7, 10, 11):
+                for _ in range(lengths[opcode - 1]):
+                    _, position = read_uleb128(data, position)
+
+        sequences.sort(key=lambda sequence: sequence[0])
+        return sequences
+
+    def lookup(self, address: int) -> Union[Tuple[str, int], None]:
+        """
+        This method returns (source file, line) of an address
+        or None when it is not in the debug informations.
+        """
+
+        ranges = self.get_ranges()
+        index = bisect_right(self.starts, address) - 1
+
+        while index >= 0 and self.ends[index] > address:
+            start, end, unit_offset = ranges[index]
+            index -= 1
+            if address >= end:
+                continue
+
+            sequences = self.tables.get(unit_offset)
+            if sequences is None:
+                sequences = self.tables[unit_offset] = self.decode_lines(
+                    unit_offset
+                )
+
+            for (
+                start,
+                end,
+                addresses,
+                files_indexes,
+                lines,
+                files,
+            ) in sequences:
+                if start <= address < end:
+                    row = bisect_right(addresses, address) - 1
+                    file = files_indexes[row]
+                    return (
+                        files[file] if file < len(files) else None,
+                        lines[row],
+                    )
+
+        return None
+
+
+def read_encoded_pointer(
+    data: bytes,
+    position: int,
+    encoding: int,
+    base_address: int,
+    address_size: int,
+    order: str,
+    data_base: int = 0,
+) -> Tuple[int, int]:
+    """
+    This function decodes a DW_EH_PE encoded pointer and returns
+    (value, next position), base_address is the virtual address
+    of data[0] (pc relative pointers) and data_base the start of
+    .eh_frame_hdr (data relative pointers).
+    """
+
+    format = encoding & 0x0F
+    if format == 0x01:
+        value, next_position = read_uleb128(data, position)
+    elif format == 0x09:
+        value, next_position = read_sleb128(data, position)
+    else:
+        size = {0x00: address_size, 0x02: 2, 0x03: 4, 0x04: 8}.get(
+            format & 0x07, address_size
+        )
+        value = int.from_bytes(
+            data[position : position + size], order, signed=bool(format & 0x08)
+        )
+        next_position = position + size
+
+    application = encoding & 0x70
+    if application == 0x10:
+        value += base_address + position
+    elif application == 0x30:
+        value += data_base
+
+    return value & ((1 << (address_size * 8)) - 1), next_position
+
+
+class EhFrameIndex:
+    """
+    This class implements functions boundaries from the .eh_frame_hdr
+    binary search table (PT_GNU_EH_FRAME without section headers):
+    starts are sorted initial locations, ends are read on demand
+    from the FDE (pc_begin + pc_range) in .eh_frame.
+
+    Without .eh_frame_hdr, the .eh_frame section is scanned once.
+    Tables reads are bounded by budget (a default ParseBudget when
+    None), lookups reads are clamped to the file.
+    """
+
+    def __init__(
+        self,
+        file: _BufferedIOBase,
+        layout: ElfLayout = None,
+        budget: ParseBudget = None,
+    ):
+        if budget is None:
+            budget = ParseBudget(file)
+        if layout is None:
+            layout = parse_elflayout(file, budget)
+
+        self.file = file
+        self.layout = layout
+        self.budget = budget
+        self.address_size = 8 if layout.elf_classe == "64" else 4
+        self.starts = array("Q")
+        self.fdes = array("Q")
+        self.ends = array("Q")
+        self.cies = {}
+
+        for section in layout.sections:
+            if section.name == ".eh_frame_hdr":
+                address, offset, size = (
+                    section.addr,
+                    section.offset,
+                    section.size,
+                )
+                break
+        else:
+            for segment in layout.segments:
+                if segment.type == ProgramHeaderType.PT_GNU_EH_FRAME.value:
+                    address, offset, size = (
+                        segment.vaddr,
+                        segment.offset,
+                        segment.filesz,
+                    )
+                    break
+            else:
+                self.scan_eh_frame()
+                return
+
+        data = budget.read(file, offset, size)
+        if len(data) < 4 or data[0] != 1 or data[3] == 0xFF:
+            return
+
+        order = layout.order
+        position = 4
+        _, position = read_encoded_pointer(
+            data, position, data[1], address, self.address_size, order, address
+        )
+        if data[2] == 0xFF:
+            return
+        count, position = read_encoded_pointer(
+            data, position, data[2], address, self.address_size, order, address
+        )
+
+        table_encoding = data[3]
+        for _ in range(count):
+            if position >= len(data):
+                break
+            start, position = read_encoded_pointer(
+                data,
+                position,
+                table_encoding,
+                address,
+                self.address_size,
+                order,
+                address,
+            )
+            fde, position = read_encoded_pointer(
+                data,
+                position,
+                table_encoding,
+                address,
+                self.address_size,
+                order,
+                address,
+            )
+            self.starts.append(start)
+            self.fdes.append(fde)
+
+        self.ends = array("Q", bytes(len(self.starts) * 8))
+
+    def scan_eh_frame(self) -> None:
+        """
+        This method builds the sorted table from all FDE
+        of the .eh_frame section (no .eh_frame_hdr).
+        """
+
+        for section in self.layout.sections:
+            if section.name == ".eh_frame" and section.addr:
+                break
+        else:
+            return
+
+        data = self.budget.read(self.file, section.offset, section.size)
+        functions = []
+        position = 0
+
+        while position + 8 <= len(data):
+            length = int.from_bytes(
+                data[position : position + 4], self.layout.order
+            )
+            header_size = 4
+            if length == 0xFFFFFFFF:
+                length = int.from_bytes(
+                    data[position + 4 : position + 12], self.layout.order
+                )
+                header_size = 12
+            if not length:
+                break
+
+            identifier_size = 8 if header_size == 12 else 4
+            identifier = int.from_bytes(
+                data[
+                    position
+                    + header_size : position
+                    + header_size
+                    + identifier_size
+                ],
+                self.layout.order,
+            )
+            if identifier:
+                address = section.addr + position
+                encoding = self.get_cie_encoding(
+                    address + header_size - identifier
+                )
+                start, _ = read_encoded_pointer(
+                    data,
+                    position + header_size + identifier_size,
+                    encoding,
+                    section.addr,
+                    self.address_size,
+                    self.layout.order,
+                )
+                functions.append((start, address))
+
+            position += header_size + length
+
+        functions.sort()
+        self.starts = array("Q", [start for start, _ in functions])
+        self.fdes = array("Q", [fde for _, fde in functions])
+        self.ends = array("Q", bytes(len(self.starts) * 8))
+
+    def read(self, address: int, size: int) -> bytes:
+        """
+        This method reads size bytes at a virtual address.
+        """
+
+        offset = address_to_offset(self.layout, address)
+        if offset is None:
+            return b""
+        size = self.budget.clamp(
+            offset, size, get_segment_end(self.layout, offset)
+        )
+        if not size:
+            return b""
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def get_cie_encoding(self, address: int) -> int:
+        """
+        This method returns (and caches) the FDE pointers
+        encoding of a CIE ("R" augmentation, absolute pointer
+        without augmentation).
+        """
+
+        encoding = self.cies.get(address)
+        if encoding is not None:
+            return encoding
+
+        encoding = self.cies[address] = 0x00
+        data = self.read(address, 512)
+        position = 12 if data[:4] == b"\xff\xff\xff\xff" else 4
+        position += 8 if position == 12 else 4
+        if position >= len(data):
+            return encoding
+
+        version = data[position]
+        end = data.find(b"\0", position + 1)
+        augmentation = data[position + 1 : end]
+        position = end + 1
+        if b"eh" in augmentation:
+            position += self.address_size
+        _, position = read_uleb128(data, position)
+        _, position = read_sleb128(data, position)
+        if version == 1:
+            position += 1
+        else:
+            _, position = read_uleb128(data, position)
+
+        if not augmentation.startswith(b"z"):
+            return encoding
+
+        _, position = read_uleb128(data, position)
+        for character in augmentation[1:]:
+            if character == ord("R"):
+                encoding = self.cies[address] = data[position]
+                break
+            if character == ord("L"):
+                position += 1
+            elif character == ord("P"):
+                _, position = read_encoded_pointer(
+                    data,
+                    position + 1,
+                    data[position],
+                    address,
+                    self.address_size,
+                    self.layout.order,
+                )
+
+        return encoding
+
+    def get_end(self, index: int) -> int:
+        """
+        This method returns (and caches) the end address of the
+        function index, decoding its FDE (0 when unreadable).
+        """
+
+        end = self.ends[index]
+        if end:
+            return end
+
+        address = self.fdes[index]
+        data = self.read(address, 48)
+        position = 4
+        if data[:4] == b"\xff\xff\xff\xff":
+            position = 12
+        size = 8 if position == 12 else 4
+        if len(data) < position + size:
+            return 0
+
+        cie_pointer = int.from_bytes(
+            data[position : position + size], self.layout.order
+        )
+        encoding = self.get_cie_encoding(address + position - cie_pointer)
+        position += size
+
+        start, position = read_encoded_pointer(
+            data,
+            position,
+            encoding,
+            address,
+            self.address_size,
+            self.layout.order,
+        )
+        length, position = read_encoded_pointer(
+            data,
+            position,
+            encoding & 0x0F,
+            address,
+            self.address_size,
+            self.layout.order,
+        )
+
+        end = self.ends[index] = start + length
+        return end
+
+    def get_ranges(self) -> Tuple[array, array]:
+        """
+        This method decodes all FDE and returns sorted
+        (starts, ends) arrays.
+        """
+
+        for index in range(len(self.starts)):
+            self.get_end(index)
+        return self.starts, self.ends
+
+    def lookup(self, address: int) -> Union[Tuple[int, int], None]:
+        """
+        This method returns (start, end) of the function
+        containing address or None.
+        """
+
+        index = bisect_right(self.starts, address) - 1
+        if index >= 0 and address < self.get_end(index):
+            return self.starts[index], self.ends[index]
+        return None
+
+
+plt_sizes = {
+    ElfMachine.INTEL_80386.value: (16, 16),
+    ElfMachine.AMD_X86_64.value: (16, 16),
+    ElfMachine.AARCH64.value: (32, 16),
+    ElfMachine.ARM.value: (20, 12),
+    ElfMachine.IBM_SYSTEM390.value: (32, 32),
+    ElfMachine.RISCV.value: (32, 16),
+    ElfMachine.LOONGARCH.value: (32, 16),
+    ElfMachine.MIPS_I.value: (32, 16),
+}
+
+
+class PltMap:
+    """
+    This class implements the map of PLT stubs and GOT slots to
+    imported functions, from PLT relocations (.rela.plt/.rel.plt or
+    DT_JMPREL) and .dynsym.
+
+    The PLT header and entry sizes depend on e_machine (plt_sizes),
+    the stub of the nth relocation is computed (IBT .plt.sec entries
+    are used when present), call targets are resolved with bisect.
+    Reads are bounded by budget (a default ParseBudget when None).
+    """
+
+    def __init__(
+        self,
+        file: _BufferedIOBase,
+        layout: ElfLayout = None,
+        budget: ParseBudget = None,
+    ):
+        if budget is None:
+            budget = ParseBudget(file)
+        if layout is None:
+            layout = parse_elflayout(file, budget)
+
+        self.entries = []
+        self.got = {}
+        self.starts = []
+
+        dynamics = read_raw_dynamic(file, layout, budget)
+        symbols, strings = read_raw_dynamic_symbols(
+            file, layout, dynamics, budget
+        )
+        if not strings:
+            strings = read_raw_dynamic_strings(file, layout, dynamics, budget)
+        dynamics = dict(dynamics)
+        sections = {section.name: section for section in layout.sections}
+
+        relocations = sections.get(".rela.plt") or sections.get(".rel.plt")
+        end = None
+        if relocations is not None:
+            offset, size = relocations.offset, relocations.size
+            addend = relocations.type == SectionHeaderType.SHT_RELA.value
+        else:
+            offset = address_to_offset(
+                layout, dynamics.get(DynamicType.DT_JMPREL.value, -1)
+            )
+            if offset is None:
+                return
+            size = dynamics.get(DynamicType.DT_PLTRELSZ.value, 0)
+            end = get_segment_end(layout, offset)
+            addend = dynamics.get(DynamicType.DT_PLTREL.value) == (
+                DynamicType.DT_RELA.value
+            )
+
+        address_format = "Q" if layout.elf_classe == "64" else "I"
+        relocation_struct = Struct(
+            ("<" if layout.order == "little" else ">")
+            + address_format * (3 if addend else 2)
+        )
+        symbol_shift = 32 if layout.elf_classe == "64" else 8
+
+        data = budget.read(file, offset, size, end)
+        data = data[: len(data) - len(data) % relocation_struct.size]
+
+        header_size, self.entry_size = plt_sizes.get(layout.machine, (0, 0))
+        stubs = sections.get(".plt.sec")
+        if stubs is not None:
+            first_stub = stubs.addr
+        elif ".plt" in sections and self.entry_size:
+            first_stub = sections[".plt"].addr + header_size
+        else:
+            first_stub = None
+
+        for index, (got, info, *_) in enumerate(
+            relocation_struct.iter_unpack(data)
+        ):
+            symbol = info >> symbol_shift
+            name = (
+                get_raw_string(strings, symbols[symbol][0])
+                if 0 < symbol < len(symbols)
+                else None
+            )
+            entry = PltEntry(
+                (
+                    None
+                    if first_stub is None
+                    else first_stub + index * self.entry_size
+                ),
+                got,
+                name,
+            )
+            self.entries.append(entry)
+            self.got[got] = entry
+
+        self.entries.sort(
+            key=lambda entry: -1 if entry.address is None else entry.address
+        )
+        self.starts = [
+            entry.address
+            for entry in self.entries
+            if entry.address is not None
+        ]
+        self.entries = self.entries[len(self.entries) - len(self.starts) :]
+
+    def lookup(self, address: int) -> Union["PltEntry", None]:
+        """
+        This method returns the PLT entry of a stub address
+        (example: a call target) or None.
+        """
+
+        index = bisect_right(self.starts, address) - 1
+        if index >= 0 and address < self.starts[index] + self.entry_size:
+            return self.entries[index]
+        return None
+
+    def lookup_got(self, address: int) -> Union["PltEntry", None]:
+        """
+        This method returns the PLT entry of a GOT slot address.
+        """
+
+        return self.got.get(address)
+
+
+def sweep_ranges(
+    ranges: Iterable[Tuple[int, int, Any]], start: int, end: int
+) -> Tuple[Dict[Any, int], List[Tuple[int, int]]]:
+    """
+    This function sorts ranges (start, end, key) once and attributes
+    each byte between start and end to the first range covering it
+    (overlays are counted once), it returns (sizes by key, gaps).
+    """
+
+    sizes = {}
+    gaps = []
+    cursor = start
+
+    for range_start, range_end, key in sorted(
+        ranges, key=lambda range_: (range_[0], -range_[1])
+    ):
+        range_start = max(range_start, start)
+        range_end = min(range_end, end)
+        sizes.setdefault(key, 0)
+        if range_start >= range_end:
+            continue
+        if range_start > cursor:
+            gaps.append((cursor, range_start))
+            cursor = range_start
+        if range_end > cursor:
+            sizes[key] += range_end - cursor
+            cursor = range_end
+
+    if cursor < end:
+        gaps.append((cursor, end))
+    return sizes, gaps
+
+
+def get_size_report(
+    file: _BufferedIOBase,
+    layout: ElfLayout = None,
+    budget: ParseBudget = None,
+) -> List[SizeEntry]:
+    """
+    This function attributes file bytes and virtual memory bytes
+    to PT_LOAD segments, sections and symbols (sized symbols of
+    .symtab, or .dynsym when the file is stripped).
+
+    Overlapping ranges are counted once, bytes without section
+    are reported as [ELF header], [program headers],
+    [section headers] or [padding] and section bytes without
+    symbol as [section <name>].
+    """
+
+    if budget is None:
+        budget = ParseBudget(file)
+    if layout is None:
+        layout = parse_elflayout(file, budget)
+
+    structs = raw_structs[(layout.elf_classe, layout.order)]
+    file_size = file.seek(0, 2)
+    file.seek(16)
+    header = structs["header"].unpack(file.read(structs["header"].size))
+    entries = []
+
+    loads = [
+        segment
+        for segment in layout.segments
+        if segment.type == ProgramHeaderType.PT_LOAD.value
+    ]
+    files_sizes, _ = sweep_ranges(
+        (
+            (segment.offset, segment.offset + segment.filesz, index)
+            for index, segment in enumerate(loads)
+        ),
+        0,
+        file_size,
+    )
+    for index, segment in enumerate(loads):
+        flags = "".join(
+            character if segment.flags & flag else "-"
+            for character, flag in (("R", 4), ("W", 2), ("X", 1))
+        )
+        entries.append(
+            SizeEntry(
+                "segment",
+                f"LOAD #{index} [{flags}]",
+                None,
+                files_sizes[index],
+                segment.memsz,
+            )
+        )
+    entries.append(
+        SizeEntry(
+            "segment",
+            "[unmapped]",
+            None,
+            file_size - sum(files_sizes.values()),
+            0,
+        )
+    )
+
+    nobits = SectionHeaderType.SHT_NOBITS.value
+    alloc = SectionAttributeFlags.SHF_ALLOC.value
+    tls = SectionAttributeFlags.SHF_TLS.value
+    sections = layout.sections
+    header_size = structs["header"].size + 16
+    phoff, shoff = header[4:6]
+    files_ranges = [
+        (0, header_size, "[ELF header]"),
+        (
+            phoff,
+            phoff + len(layout.segments) * structs["segment"].size,
+            "[program headers]",
+        ),
+        (
+            shoff,
+            shoff + len(sections) * structs["section"].size,
+            "[section headers]",
+        ),
+    ]
+    files_ranges.extend(
+        (section.offset, section.offset + section.size, index)
+        for index, section in enumerate(sections)
+        if index and section.type != nobits
+    )
+    files_sizes, files_gaps = sweep_ranges(files_ranges, 0, file_size)
+
+    vms_ranges = [
+        (section.addr, section.addr + section.size, index)
+        for index, section in enumerate(sections)
+        if section.flags & alloc
+        and not (section.flags & tls and section.type == nobits)
+    ]
+    vms_sizes = {}
+    vms_gaps = []
+    if loads:
+        for segment in loads:
+            sizes, gaps = sweep_ranges(
+                vms_ranges, segment.vaddr, segment.vaddr + segment.memsz
+            )
+            vms_gaps.extend(gaps)
+            for key, size in sizes.items():
+                vms_sizes[key] = vms_sizes.get(key, 0) + size
+    else:
+        vms_sizes = {key: end - start for start, end, key in vms_ranges}
+
+    for key, size in files_sizes.items():
+        if isinstance(key, str) and size:
+            entries.append(SizeEntry("section", key, None, size, 0))
+    for index, section in enumerate(sections):
+        if index:
+            entries.append(
+                SizeEntry(
+                    "section",
+                    section.name,
+                    None,
+                    files_sizes.get(index, 0),
+                    vms_sizes.get(index, 0),
+                )
+            )
+    entries.append(
+        SizeEntry(
+            "section",
+            "[padding]",
+            None,
+            sum(end - start for start, end in files_gaps),
+            sum(end - start for start, end in vms_gaps),
+        )
+    )
+
+    symbols_table = strings = None
+    for section in sections:
+        if section.type == SectionHeaderType.SHT_SYMTAB.value or (
+            section.type == SectionHeaderType.SHT_DYNSYM.value
+            and symbols_table is None
+        ):
+            symbols_table = section
+    table = ()
+    if symbols_table is not None and symbols_table.link < len(sections):
+        strings_section = sections[symbols_table.link]
+        strings = budget.read(
+            file, strings_section.offset, strings_section.size
+        )
+        table = unpack_raw_symbols(
+            budget.read(file, symbols_table.offset, symbols_table.size),
+            layout,
+        )
+
+    sections_number = len(sections)
+    symbols = sorted(
+        (shndx, value, -value - size, name)
+        for name, _, _, shndx, value, size in table
+        if size and 0 < shndx < sections_number
+    )
+    symbols.append((sections_number, 0, 0, 0))
+
+    relocatable = layout.type == ElfType.RELOCATABLE.value
+    names = None
+    attributed = {}
+    sizes = {}
+    current = limit = cursor = 0
+
+    for shndx, start, end, name in symbols:
+        if shndx != current:
+            if sizes:
+                if names is None:
+                    names = get_raw_strings(strings)
+                section = sections[current]
+                file_part = files_sizes.get(current, 0)
+                vm_part = vms_sizes.get(current, 0)
+                for name_offset, size in sizes.items():
+                    entries.append(
+                        SizeEntry(
+                            "symbol",
+                            names.get(name_offset)
+                            or get_raw_string(strings, name_offset),
+                            section.name,
+                            size if file_part else 0,
+                            size if vm_part else 0,
+                        )
+                    )
+                attributed[current] = sum(sizes.values())
+                sizes = {}
+            if shndx == sections_number:
+                break
+            current = shndx
+            cursor = 0 if relocatable else sections[shndx].addr
+            limit = cursor + sections[shndx].size
+
+        end = -end
+        if end > limit:
+            end = limit
+        if start < cursor:
+            start = cursor
+        if end > start:
+            sizes[name] = sizes.get(name, 0) + end - start
+            cursor = end
+
+    for index, section in enumerate(sections):
+        size = section.size - attributed.get(index, 0)
+        if index and size > 0:
+            entries.append(
+                SizeEntry(
+                    "symbol",
+                    f"[section {section.name}]",
+                    section.name,
+                    min(size, files_sizes.get(index, 0)),
+                    min(size, vms_sizes.get(index, 0)),
+                )
+            )
+
+    return entries
+
+
+def diff_size_reports(
+    old: List[SizeEntry], new: List[SizeEntry]
+) -> List[SizeEntry]:
+    """
+    This function compares two size reports and returns changed
+    entries (sizes are new sizes minus old sizes) sorted by
+    absolute differences.
+    """
+
+    sizes = {}
+    for sign, entries in ((-1, old), (1, new)):
+        for entry in entries:
+            key = (entry.category, entry.name, entry.parent)
+            file_size, vm_size = sizes.get(key, (0, 0))
+            sizes[key] = (
+                file_size + sign * entry.file_size,
+                vm_size + sign * entry.vm_size,
+            )
+
+    return sorted(
+        (
+            SizeEntry(category, name, parent, file_size, vm_size)
+            for (category, name, parent), (file_size, vm_size) in sizes.items()
+            if file_size or vm_size
+        ),
+        key=lambda entry: (-abs(entry.file_size), -abs(entry.vm_size)),
+    )
+
+
+class FileView(_BufferedIOBase):
+    """
+    This class implements a read-only file view bounded
+    to size bytes from the start offset of another file
+    (positions are relative to start).
+    """
+
+    def __init__(
+        self, file: _BufferedIOBase, start: int, size: int, name: str = None
+    ):
+        self.file = file
+        self.start = start
+        self.size = size
+        self.name = name
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        This method reads at most size bytes in the view.
+        """
+
+        remaining = max(self.size - self.position, 0)
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+
+        self.file.seek(self.start + self.position)
+        data = self.file.read(size)
+        self.position += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        """
+        This method reads at most size bytes in the view.
+        """
+
+        return self.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """
+        This method moves the position in the view.
+        """
+
+        if whence == 1:
+            offset += self.position
+        elif whence == 2:
+            offset += self.size
+
+        self.position = max(offset, 0)
+        return self.position
+
+    def tell(self) -> int:
+        """
+        This method returns the position in the view.
+        """
+
+        return self.position
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+
+@dataclass
+class ArchiveMember:
+    """
+    This class implements an archive (ar) member index entry,
+    offset is the data position in the archive.
+    """
+
+    name: str
+    header_offset: int
+    offset: int
+    size: int
+
+
+def parse_archive(
+    file: _BufferedIOBase,
+) -> Tuple[List[ArchiveMember], Dict[str, ArchiveMember]]:
+    """
+    This function indexes members of a static archive (ar: GNU
+    and BSD formats) without reading the members data,
+    it returns members and the symbol index (symbol to member).
+    """
+
+    file.seek(0)
+    if file.read(8) != b"!<arch>\n":
+        raise ValueError("Invalid archive magic bytes")
+
+    members = []
+    long_names = b""
+    symbols_offsets = []
+    header_offset = 8
+    header = file.read(60)
+
+    while len(header) == 60:
+        if header[58:60] != b"`\n":
+            raise ValueError(f"Invalid archive header at {header_offset}")
+
+        name = header[:16].rstrip(b" ")
+        size = int(header[48:58].strip() or 0)
+        offset = header_offset + 60
+
+        if name in (b"/", b"/SYM64/"):
+            word_size = 8 if name == b"/SYM64/" else 4
+            data = file.read(size)
+            number = int.from_bytes(data[:word_size], "big")
+            names = data[word_size * (number + 1) :].split(b"\0")
+            symbols_offsets.extend(
+                (
+                    names[index].decode("latin-1"),
+                    int.from_bytes(
+                        data[
+                            word_size * (index + 1) : word_size * (index + 2)
+                        ],
+                        "big",
+                    ),
+                )
+                for index in range(min(number, len(names)))
+            )
+        elif name == b"//":
+            long_names = file.read(size)
+        else:
+            if name.startswith(b"#1/"):
+                name_length = int(name[3:])
+                name = file.read(name_length).rstrip(b"\0")
+                offset += name_length
+                size -= name_length
+            elif name.startswith(b"/") and name[1:].isdigit():
+                start = int(name[1:])
+                end = long_names.find(b"/\n", start)
+                name = long_names[start : end if end != -1 else None]
+            elif name.endswith(b"/"):
+                name = name[:-1]
+
+            if name.startswith(b"__.SYMDEF"):
+                file.seek(offset)
+                data = file.read(size)
+                ranlib_size = int.from_bytes(data[:4], "little")
+                strings = data[8 + ranlib_size :]
+                symbols_offsets.extend(
+                    (
+                        strings[
+                            string_offset : strings.find(b"\0", string_offset)
+                        ].decode("latin-1"),
+                        member_offset,
+                    )
+                    for string_offset, member_offset in (
+                        (
+                            int.from_bytes(data[x : x + 4], "little"),
+                            int.from_bytes(data[x + 4 : x + 8], "little"),
+                        )
+                        for x in range(4, 4 + ranlib_size, 8)
+                    )
+                )
+            else:
+                members.append(
+                    ArchiveMember(
+                        name.decode("latin-1"), header_offset, offset, size
+                    )
+                )
+
+        header_offset = offset + size + (offset + size) % 2
+        file.seek(header_offset)
+        header = file.read(60)
+
+    members_offsets = {member.header_offset: member for member in members}
+    symbols = {}
+    for symbol, member_offset in symbols_offsets:
+        member = members_offsets.get(member_offset)
+        if member is not None:
+            symbols.setdefault(symbol, member)
+
+    return members, symbols
+
+
+def parse_archive_member(
+    filename: str, member: ArchiveMember
+) -> Tuple[ArchiveMember, Tuple]:
+    """
+    This function parses an archive member (ELF file) from
+    the archive path (used by the processes pool).
+    """
+
+    with open(filename, "rb") as file:
+        return member, parse_elffile(
+            FileView(file, member.offset, member.size, member.name)
+        )
+
+
+def parse_archive_members(
+    filename: str,
+    members: List[ArchiveMember] = None,
+    processes: int = 0,
+) -> Iterable[Tuple[ArchiveMember, Tuple]]:
+    """
+    This function parses ELF members of a static archive
+    (all members when members is None) and yields the member
+    with parse_elffile result, members are parsed in a
+    processes pool when processes is not 0 (None: CPU count).
+    """
+
+    with open(filename, "rb") as file:
+        if members is None:
+            members, _ = parse_archive(file)
+
+        elf_members = []
+        for member in members:
+            file.seek(member.offset)
+            if member.size >= 4 and file.read(4) == b"\x7fELF":
+                elf_members.append(member)
+
+    if processes == 0:
+        for member in elf_members:
+            yield parse_archive_member(filename, member)
+        return None
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(processes) as executor:
+        yield from executor.map(
+            partial(parse_archive_member, filename),
+            elf_members,
+            chunksize=16,
+        )
+
+
+def hash_chunks(
+    file: _BufferedIOBase, offset: int, size: int, chunk_size: int = 65536
+) -> List[bytes]:
+    """
+    This function returns hashes of file chunks
+    (size bytes read from offset).
+    """
+
+    file.seek(offset)
+    hashes = []
+
+    while size > 0:
+        data = file.read(min(chunk_size, size))
+        if not data:
+            break
+        size -= len(data)
+        hashes.append(blake2b(data, digest_size=16).digest())
+
+    return hashes
+
+
+def index_elements(
+    elements: Iterable[Tuple[str, Tuple]],
+) -> Dict[str, Tuple]:
+    """
+    This function builds a hash table from (name, values),
+    a duplicate name is indexed with its occurrence number.
+    """
+
+    index = {}
+    for name, values in elements:
+        key = name
+        counter = 1
+        while key in index:
+            counter += 1
+            key = f"{name}#{counter}"
+        index[key] = values
+
+    return index
+
+
+def diff_indexes(
+    category: str,
+    old_index: Dict[str, Tuple],
+    new_index: Dict[str, Tuple],
+    fields: Tuple[str],
+) -> Iterable[Difference]:
+    """
+    This function yields differences between two hash tables
+    built by index_elements.
+    """
+
+    for name, old_values in old_index.items():
+        new_values = new_index.get(name)
+        if new_values is None:
+            yield Difference(category, name, "removed")
+            continue
+
+        for field, old, new in zip(fields, old_values, new_values):
+            if old != new:
+                yield Difference(category, name, "changed", field, old, new)
+
+    for name in new_index:
+        if name not in old_index:
+            yield Difference(category, name, "added")
+
+
+def get_elffile_indexes(
+    file: _BufferedIOBase,
+) -> Tuple[
+    Tuple,
+    Dict[str, Tuple],
+    Dict[str, Tuple],
+    Dict[str, Tuple],
+    Dict[str, Tuple],
+    Dict[str, Union[SectionHeader32, SectionHeader64]],
+]:
+    """
+    This function parses the ELF file and returns hash tables used
+    to compare it: headers, segments, sections, symbols, dynamics
+    and sections headers.
+    """
+
+    (
+        elfindent,
+        elf_headers,
+        programs_headers,
+        elf_sections,
+        symbols_tables,
+        comments,
+        note_sections,
+        notes,
+        dynamics,
+        sections,
+    ) = parse_elffile(file)
+
+    headers = (
+        elfindent.ei_class.information,
+        elfindent.ei_data.information,
+        elfindent.ei_osabi.information,
+        elfindent.ei_abiversion.value.value,
+        elf_headers.e_type.information,
+        elf_headers.e_machine.information,
+        elf_headers.e_entry.value.value,
+        elf_headers.e_flags.value.value,
+        elf_headers.e_phnum.value.value,
+        elf_headers.e_shnum.value.value,
+    )
+
+    segments = index_elements(
+        (
+            program.p_type.information,
+            (
+                program.p_flags.value,
+                program.p_filesz.value.value,
+                program.p_memsz.value.value,
+                program.p_align.value.value,
+            ),
+        )
+        for program in programs_headers
+    )
+
+    sections_headers = index_elements(
+        (section.name, section) for section in elf_sections
+    )
+    sections_index = {
+        name: (
+            section.sh_type.information,
+            section.sh_flags.value,
+            section.sh_size.value.value,
+            section.sh_addralign.value.value,
+            section.sh_entsize.value.value,
+        )
+        for name, section in sections_headers.items()
+    }
+
+    symbols = index_elements(
+        (
+            f"{table}:{symbol.name}"
+            + (
+                ""
+                if symbol.version is None
+                else (
+                    "@"
+                    if symbol.version_hidden or symbol.version_file
+                    else "@@"
+                )
+                + symbol.version
+            ),
+            (
+                symbol.st_type.information,
+                symbol.st_bind.information,
+                symbol.st_visibility.information,
+                symbol.st_size.value.value,
+                (
+                    elf_sections[symbol.st_shndx.value.value].name
+                    if len(elf_sections) > symbol.st_shndx.value.value
+                    else symbol.st_shndx.information
+                ),
+                getattr(symbol, "version_file", None),
+            ),
+        )
+        for table, symbol in symbols_tables
+    )
+
+    dynstr_section = sections_headers.get(".dynstr")
+    dynamic_elements = []
+    for dynamic in dynamics:
+        tag = dynamic.dynamic_tag
+        if tag.value.value == DynamicType.DT_NULL.value:
+            continue
+
+        if (
+            tag.value.value
+            in (
+                DynamicType.DT_NEEDED.value,
+                DynamicType.DT_SONAME.value,
+                DynamicType.DT_RPATH.value,
+                DynamicType.DT_RUNPATH.value,
+            )
+            and dynstr_section is not None
+        ):
+            file.seek(
+                dynstr_section.sh_offset.value.value
+                + dynamic.dynamic_value.value
+            )
+            dynamic_elements.append(
+                (
+                    tag.information
+                    + ":"
+                    + read_string(file).value.decode("latin-1"),
+                    (),
+                )
+            )
+        elif tag.usage == "pointer":
+            dynamic_elements.append((tag.information, ()))
+        else:
+            dynamic_elements.append(
+                (
+                    (
+                        hex(tag.value.value)
+                        if tag.information == "UNDEFINED"
+                        else tag.information
+                    ),
+                    (dynamic.dynamic_value.value,),
+                )
+            )
+
+    return (
+        headers,
+        segments,
+        sections_index,
+        symbols,
+        index_elements(dynamic_elements),
+        sections_headers,
+    )
+
+
+def diff_elffiles(
+    file1: _BufferedIOBase, file2: _BufferedIOBase, chunk_size: int = 65536
+) -> Iterable[Difference]:
+    """
+    This function compares two ELF files: headers, segments,
+    sections (matched by name, bodies compared by chunks hashes),
+    symbols (matched by table, name and version) and dynamic entries
+    (matched by tag), and yields differences.
+    """
+
+    (
+        headers1,
+        segments1,
+        sections1,
+        symbols1,
+        dynamics1,
+        sections_headers1,
+    ) = get_elffile_indexes(file1)
+    (
+        headers2,
+        segments2,
+        sections2,
+        symbols2,
+        dynamics2,
+        sections_headers2,
+    ) = get_elffile_indexes(file2)
+
+    yield from diff_indexes(
+        "header",
+        {"ELF header": headers1},
+        {"ELF header": headers2},
+        (
+            "class",
+            "data",
+            "OS ABI",
+            "ABI version",
+            "type",
+            "machine",
+            "entry",
+            "flags",
+            "program headers number",
+            "sections number",
+        ),
+    )
+    yield from diff_indexes(
+        "segment",
+        segments1,
+        segments2,
+        ("flags", "file size", "memory size", "alignment"),
+    )
+    yield from diff_indexes(
+        "section",
+        sections1,
+        sections2,
+        ("type", "flags", "size", "alignment", "entry size"),
+    )
+
+    for name, section1 in sections_headers1.items():
+        section2 = sections_headers2.get(name)
+        if (
+            section2 is None
+            or section1.sh_type.value.value
+            == SectionHeaderType.SHT_NOBITS.value
+        ):
+            continue
+
+        hashes1 = hash_chunks(
+            file1,
+            section1.sh_offset.value.value,
+            section1.sh_size.value.value,
+            chunk_size,
+        )
+        hashes2 = hash_chunks(
+            file2,
+            section2.sh_offset.value.value,
+            section2.sh_size.value.value,
+            chunk_size,
+        )
+
+        if hashes1 != hashes2:
+            changed = sum(
+                hash1 != hash2 for hash1, hash2 in zip(hashes1, hashes2)
+            ) + abs(len(hashes1) - len(hashes2))
+            yield Difference(
+                "section",
+                name,
+                "changed",
+                "content",
+                f"{len(hashes1)} chunks",
+                f"{len(hashes2)} chunks ({changed} differ)",
+            )
+
+    yield from diff_indexes(
+        "symbol",
+        symbols1,
+        symbols2,
+        ("type", "binding", "visibility", "size", "section", "version file"),
+    )
+    yield from diff_indexes("dynamic", dynamics1, dynamics2, ("value",))
+
+
+def hash_elffile(
+    file: _BufferedIOBase,
+    elf_sections: List[Union[SectionHeader32, SectionHeader64]],
+    programs_headers: List[Union[ProgramHeader32, ProgramHeader64]],
+    algorithms: Tuple[str] = ("md5", "sha1", "sha256"),
+    chunk_size: int = 4194304,
+    threads: int = 0,
+) -> Dict[str, Dict[str, Dict[str, Tuple[int, int, str]]]]:
+    """
+    This function hashes the file, each section and each segment
+    reading the file only once: each chunk updates every hasher
+    whose range covers it. Hashers are updated in a threads pool
+    when threads is not 0 (hashlib releases the GIL on large data).
+
+    It returns {"file": hashes, "sections": {name: hashes},
+    "segments": {type: hashes}}, hashes are {algorithm:
+    (start, end, hexdigest)}.
+    """
+
+    ranges = [(0, None, "file", "File")]
+    ranges.extend(
+        (
+            section.sh_offset.value.value,
+            section.sh_offset.value.value
+            + (
+                0
+                if section.sh_type.value.value
+                == SectionHeaderType.SHT_NOBITS.value
+                else section.sh_size.value.value
+            ),
+            "sections",
+            name,
+        )
+        for name, section in index_elements(
+            (section.name, section) for section in elf_sections
+        ).items()
+    )
+    ranges.extend(
+        (
+            program.p_offset.value.value,
+            program.p_offset.value.value + program.p_filesz.value.value,
+            "segments",
+            name,
+        )
+        for name, program in index_elements(
+            (program.p_type.information, program)
+            for program in programs_headers
+        ).items()
+    )
+
+    file.seek(0, 2)
+    filesize = file.tell()
+    hashes = {"file": {}, "sections": {}, "segments": {}}
+    pending = []
+
+    for start, end, category, name in ranges:
+        end = max(start, filesize if end is None else min(end, filesize))
+        hashers = [new_hash(algorithm) for algorithm in algorithms]
+        hashes[category][name] = (start, end, hashers)
+        pending.append((start, end, hashers))
+
+    pending.sort(key=lambda element: element[0], reverse=True)
+    active = []
+
+    if threads:
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(threads)
+
+    file.seek(0)
+    position = 0
+    chunk = file.read(chunk_size)
+
+    while chunk:
+        chunk_end = position + len(chunk)
+        while pending and pending[-1][0] < chunk_end:
+            active.append(pending.pop())
+
+        view = memoryview(chunk)
+        jobs = []
+        for start, end, hashers in active:
+            data = view[max(start, position) - position : end - position]
+            if data:
+                jobs.extend((hasher.update, data) for hasher in hashers)
+
+        if threads:
+            for _ in executor.map(lambda job: job[0](job[1]), jobs):
+                pass
+        else:
+            for update, data in jobs:
+                update(data)
+
+        active = [element for element in active if element[1] > chunk_end]
+        position = chunk_end
+        chunk = file.read(chunk_size)
+
+    if threads:
+        executor.shutdown()
+
+    return {
+        category: {
+            name: {
+                algorithm: (start, end, hasher.hexdigest())
+                for algorithm, hasher in zip(algorithms, hashers)
+            }
+            for name, (start, end, hashers) in elements.items()
+        }
+        for category, elements in hashes.items()
+    }
+
+
+@lru_cache(maxsize=32)
+def get_strings_regex(encoding: str, min_length: int) -> Any:
+    """
+    This function returns the compiled bytes regex matching
+    printable strings (ascii or utf-16le) of min_length characters.
+    """
+
+    if encoding == "utf-16le":
+        return regex(rb"(?:[\t\x20-\x7e]\x00){%d,}" % min_length)
+    return regex(rb"[\t\x20-\x7e]{%d,}" % min_length)
+
+
+def extract_strings(
+    file: _BufferedIOBase,
+    elf_sections: List[Union[SectionHeader32, SectionHeader64]],
+    min_length: int = 4,
+    encodings: Tuple[str] = ("ascii", "utf-16le"),
+    section_names: List[str] = None,
+    chunk_size: int = 1048576,
+) -> Iterable[Tuple[str, int, str, str]]:
+    """
+    This function yields printable strings in sections content
+    (all sections or only section_names) as (section name, offset,
+    encoding, string).
+
+    Sections are read by chunks, the end of a chunk that can be
+    the start of a string is kept and scanned with the next chunk,
+    so strings are never split or reported twice. Offsets are file
+    offsets, except in compressed sections (decompressed with
+    get_section_data) where they are offsets in the decompressed
+    section content.
+    """
+
+    regexes = [
+        (
+            encoding,
+            get_strings_regex(encoding, min_length),
+            (min_length - 1) * (2 if encoding == "utf-16le" else 1)
+            + (1 if encoding == "utf-16le" else 0),
+            "utf-16-le" if encoding == "utf-16le" else "latin-1",
+        )
+        for encoding in encodings
+    ]
+
+    for section in elf_sections:
+        size = section.sh_size.value.value
+        if (
+            not size
+            or section.sh_type.value.value
+            == SectionHeaderType.SHT_NOBITS.value
+            or (
+                section_names is not None and section.name not in section_names
+            )
+        ):
+            continue
+
+        position = section.sh_offset.value.value
+        if section.sh_flags.value & (
+            SectionAttributeFlags.SHF_COMPRESSED.value
+        ) or section.name.startswith(".zdebug"):
+            position = 0
+            content = get_section_data(
+                file,
+                section,
+                "32" if isinstance(section, SectionHeader32) else "64",
+            )
+            size = len(content)
+            read = BytesIO(content).read
+        else:
+            file.seek(position)
+            read = file.read
+
+        carries = [b""] * len(regexes)
+
+        while size > 0:
+            chunk = read(min(chunk_size, size))
+            if not chunk:
+                break
+            size -= len(chunk)
+            last = size <= 0
+
+            for index, (encoding, pattern, tail_size, codec) in enumerate(
+                regexes
+            ):
+                data = carries[index] + chunk
+                base = position - len(carries[index])
+                carry_start = len(data) if last else len(data) - tail_size
+
+                for match in pattern.finditer(data):
+                    if not last and match.end() == len(data):
+                        carry_start = min(carry_start, match.start())
+                        break
+
+                    yield (
+                        section.name,
+                        base + match.start(),
+                        encoding,
+                        match.group().decode(codec),
+                    )
+
+                carries[index] = data[max(carry_start, 0) :]
+
+            position += len(chunk)
+
+
+def parse_signature(pattern: str) -> Tuple[int, int, bytes, Tuple]:
+    """
+    This function parses an hexadecimal signature with "??"
+    wildcards (example: "55 48 89 e5 ?? ?? 48") and returns
+    (length, anchor offset, anchor, other literals), the anchor
+    is the longest literal part of the signature.
+    """
+
+    pattern = "".join(pattern.split())
+    if not pattern or len(pattern) % 2:
+        raise ValueError(f"Invalid signature: {pattern!r}")
+
+    literals = []
+    start = None
+    length = len(pattern) // 2
+
+    for index in range(length + 1):
+        byte = pattern[index * 2 : index * 2 + 2]
+        if byte and byte != "??":
+            if start is None:
+                start = index
+            continue
+        if start is not None:
+            literals.append(
+                (start, bytes.fromhex(pattern[start * 2 : index * 2]))
+            )
+            start = None
+
+    if not literals:
+        raise ValueError(f"Signature without literal bytes: {pattern!r}")
+
+    anchor_offset, anchor = max(literals, key=lambda x: len(x[1]))
+    literals.remove((anchor_offset, anchor))
+    return length, anchor_offset, anchor, tuple(literals)
+
+
+def parse_signatures_file(file: Iterable[str]) -> Dict[str, str]:
+    """
+    This function parses signatures lines "name: hexadecimal
+    pattern", empty lines and lines starting with "#" are ignored.
+    """
+
+    signatures = {}
+    for line in file:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, pattern = line.rsplit(":", 1)
+        signatures[name.strip()] = pattern.strip()
+    return signatures
+
+
+class SignatureScanner:
+    """
+    This class implements a multi-patterns bytes signatures scanner:
+    an Aho-Corasick automaton finds the anchor (longest literal part)
+    of every signature in one pass, each candidate is verified on
+    the other bytes of its signature (wildcards are skipped).
+
+    The automaton is saved as JSON in cache_directory (when
+    defined) and reused by all scanners built with the same
+    signatures.
+    """
+
+    def __init__(
+        self, signatures: Dict[str, str], cache_directory: str = None
+    ):
+        self.signatures = [
+            (name, *parse_signature(pattern))
+            for name, pattern in sorted(signatures.items())
+        ]
+        self.max_length = max(
+            (signature[1] for signature in self.signatures), default=1
+        )
+
+        if cache_directory is None:
+            self.goto, self.fail, self.outputs = self.build_automaton()
+            return
+
+        from os.path import join
+
+        key = new_hash(
+            "sha256", repr(self.signatures).encode("latin-1")
+        ).hexdigest()
+        self.cache_path = join(cache_directory, f"signatures-{key}.json")
+        automaton = self.load_automaton()
+        if automaton is None:
+            automaton = self.build_automaton()
+            self.save_automaton(automaton, cache_directory)
+        self.goto, self.fail, self.outputs = automaton
+
+    def build_automaton(self) -> Tuple[List[Dict[int, int]], List[int], List]:
+        """
+        This method builds the Aho-Corasick automaton of anchors
+        (transitions, failure links and matched signatures
+        indexes for each state).
+        """
+
+        goto = [{}]
+        outputs = [()]
+
+        for index, (_, _, _, anchor, _) in enumerate(self.signatures):
+            state = 0
+            for byte in anchor:
+                next_state = goto[state].get(byte)
+                if next_state is None:
+                    next_state = goto[state][byte] = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] += (index,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for byte, next_state in goto[state].items():
+                queue.append(next_state)
+                failure = fail[state]
+                while failure and byte not in goto[failure]:
+                    failure = fail[failure]
+                if state:
+                    fail[next_state] = goto[failure].get(byte, 0)
+                outputs[next_state] += outputs[fail[next_state]]
+
+        for byte in range(256):
+            goto[0].setdefault(byte, 0)
+
+        return goto, fail, outputs
+
+    def load_automaton(self) -> Union[Tuple, None]:
+        """
+        This method loads the cached automaton, returns None when
+        it does not exist, cannot be loaded, is not owned by the
+        current user, is writable by others or is not valid (each
+        failure link must go to a shallower state, otherwise scan
+        could loop forever).
+        """
+
+        from json import load
+
+        try:
+            from os import getuid
+        except ImportError:
+            getuid = None
+
+        try:
+            with open(self.cache_path, "rb") as file:
+                status = fstat(file.fileno())
+                if status.st_mode & 0o022 or (
+                    getuid is not None and status.st_uid != getuid()
+                ):
+                    return None
+                goto, fail, outputs = load(file)
+
+            states = len(goto)
+            goto = [
+                {int(byte): int(state) for byte, state in transitions}
+                for transitions in goto
+            ]
+            fail = [int(state) for state in fail]
+            outputs = [
+                tuple(int(index) for index in output) for output in outputs
+            ]
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if (
+            not states
+            or len(fail) != states
+            or len(outputs) != states
+            or len(goto[0]) != 256
+            or any(
+                not 0 <= state < states
+                for transitions in goto
+                for state in transitions.values()
+            )
+            or any(not 0 <= state < states for state in fail)
+            or any(
+                not 0 <= index < len(self.signatures)
+                for output in outputs
+                for index in output
+            )
+        ):
+            return None
+
+        depths = [None] * states
+        depths[0] = 0
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            for next_state in goto[state].values():
+                if depths[next_state] is None:
+                    depths[next_state] = depths[state] + 1
+                    queue.append(next_state)
+
+        if None in depths or any(
+            depths[fail[state]] >= depths[state] for state in range(1, states)
+        ):
+            return None
+
+        return goto, fail, outputs
+
+    def save_automaton(self, automaton: Tuple, cache_directory: str) -> None:
+        """
+        This method writes the automaton as JSON in the cache
+        directory (written in a temporary file and renamed,
+        concurrent processes never read a partial cache file).
+        """
+
+        from tempfile import NamedTemporaryFile
+        from os import makedirs, replace
+        from json import dump
+
+        goto, fail, outputs = automaton
+
+        try:
+            makedirs(cache_directory, mode=0o700, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=cache_directory, delete=False
+            ) as file:
+                dump(
+                    [
+                        [list(transitions.items()) for transitions in goto],
+                        fail,
+                        outputs,
+                    ],
+                    file,
+                    separators=(",", ":"),
+                )
+            replace(file.name, self.cache_path)
+        except OSError:
+            pass
+
+    def verify(self, index: int, data: bytes, start: int) -> bool:
+        """
+        This method checks literal bytes (except the anchor)
+        of a signature at start position in data.
+        """
+
+        for offset, literal in self.signatures[index][4]:
+            offset += start
+            if data[offset : offset + len(literal)] != literal:
+                return False
+        return True
+
+    def scan_ranges(
+        self,
+        file: _BufferedIOBase,
+        ranges: Iterable[Tuple[int, int]],
+        chunk_size: int = 1048576,
+    ) -> Iterable[Tuple[int, int]]:
+        """
+        This method yields (signature index, file offset) for each
+        signature found entirely in a file range (offset, size).
+        """
+
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        signatures = self.signatures
+        overlap = self.max_length - 1
+
+        for range_start, range_size in ranges:
+            range_end = range_start + range_size
+            position = file.seek(range_start)
+            state = 0
+            carry = b""
+            pending = []
+
+            while position < range_end:
+                chunk = file.read(min(chunk_size, range_end - position))
+                if not chunk:
+                    break
+
+                data = carry + chunk
+                data_start = position - len(carry)
+                data_end = position + len(chunk)
+                candidates = pending
+                pending = []
+
+                for position, byte in enumerate(chunk, position + 1):
+                    transitions = goto[state]
+                    next_state = transitions.get(byte)
+                    if next_state is None:
+                        failure = fail[state]
+                        next_state = goto[failure].get(byte)
+                        while next_state is None:
+                            failure = fail[failure]
+                            next_state = goto[failure].get(byte)
+                        transitions[byte] = next_state
+                    state = next_state
+
+                    for index in outputs[state]:
+                        _, length, anchor_offset, anchor, _ = signatures[index]
+                        start = position - len(anchor) - anchor_offset
+                        if range_start <= start <= range_end - length:
+                            candidates.append((index, start))
+
+                for index, start in candidates:
+                    if start + signatures[index][1] > data_end:
+                        pending.append((index, start))
+                    elif self.verify(index, data, start - data_start):
+                        yield index, start
+
+                position = data_end
+                carry = data[max(len(data) - overlap, 0) :] if overlap else b""
+
+    def scan_elffile(
+        self,
+        file: _BufferedIOBase,
+        elf_sections: List[Union[SectionHeader32, SectionHeader64]],
+        programs_headers: List[Union[ProgramHeader32, ProgramHeader64]] = (),
+        symbols_tables: List[
+            Tuple[str, Union[SymbolTableEntry32, SymbolTableEntry64]]
+        ] = (),
+        names: List[str] = None,
+        chunk_size: int = 1048576,
+    ) -> Iterable[SignatureMatch]:
+        """
+        This method scans sections contents (or segments contents
+        when there is no section) and yields SignatureMatch with
+        section and symbol names.
+
+        names restricts the scan to sections names and segments
+        types (example: [".text", "PT_LOAD"]).
+        """
+
+        sections = sorted(
+            (
+                section.sh_offset.value.value,
+                section.sh_offset.value.value + section.sh_size.value.value,
+                section.name,
+            )
+            for section in elf_sections
+            if section.sh_size.value.value
+            and section.sh_type.value.value
+            not in (
+                SectionHeaderType.SHT_NULL.value,
+                SectionHeaderType.SHT_NOBITS.value,
+            )
+        )
+
+        if names is None:
+            ranges = [(start, end - start) for start, end, _ in sections]
+            if not ranges:
+                ranges = [
+                    (
+                        program.p_offset.value.value,
+                        program.p_filesz.value.value,
+                    )
+                    for program in programs_headers
+                    if program.p_type.information == "PT_LOAD"
+                ]
+        else:
+            ranges = [
+                (start, end - start)
+                for start, end, name in sections
+                if name in names
+            ]
+            ranges.extend(
+                (program.p_offset.value.value, program.p_filesz.value.value)
+                for program in programs_headers
+                if program.p_type.information in names
+            )
+
+        symbols = []
+        for _, symbol in symbols_tables:
+            index = symbol.st_shndx.value.value
+            size = symbol.st_size.value.value
+            if not size or not 0 < index < len(elf_sections):
+                continue
+            section = elf_sections[index]
+            start = (
+                section.sh_offset.value.value
+                + symbol.st_value.value.value
+                - section.sh_addr.value.value
+            )
+            symbols.append((start, start + size, symbol.name))
+        symbols.sort()
+
+        sections_starts = [section[0] for section in sections]
+        symbols_starts = [symbol[0] for symbol in symbols]
+
+        for index, offset in self.scan_ranges(file, ranges, chunk_size):
+            name, length, *_ = self.signatures[index]
+            match = SignatureMatch(name, offset, length)
+
+            position = bisect_right(sections_starts, offset) - 1
+            if position >= 0 and offset < sections[position][1]:
+                match.section = sections[position][2]
+
+            position = bisect_right(symbols_starts, offset) - 1
+            if position >= 0 and offset < symbols[position][1]:
+                match.symbol = symbols[position][2]
+
+            yield match
+
+
+def peek_file(file: _BufferedIOBase, size: int) -> bytes:
+    """
+    This function returns the next size bytes of the file
+    without moving the position (non-seekable files must
+    implement peek).
+    """
+
+    if file.seekable():
+        position = file.tell()
+        data = file.read(size)
+        file.seek(position)
+        return data
+
+    return file.peek(size)[:size]
+
+
+def get_container_type(file: _BufferedIOBase) -> Union[str, None]:
+    """
+    This function returns "zip" or "tar" (compressed or not)
+    from the first bytes of the file, or None.
+
+    Compressed files are "tar" only when the decompressed first
+    bytes are a tar header (a plain foo.gz is not a container),
+    bzip2 blocks too large to be decompressed from the first
+    bytes are reported as "tar" and checked when opened.
+    """
+
+    header = peek_file(file, 262)
+
+    if header.startswith((b"PK\x03\x04", b"PK\x05\x06")):
+        return "zip"
+
+    if header[257:262] == b"ustar":
+        return "tar"
+
+    if header.startswith(b"\x1f\x8b"):
+        decompressor = decompressobj(31)
+    elif header.startswith(b"BZh"):
+        from bz2 import BZ2Decompressor
+
+        decompressor = BZ2Decompressor()
+    elif header.startswith(b"\xfd7zXZ\x00"):
+        from lzma import LZMADecompressor
+
+        decompressor = LZMADecompressor()
+    else:
+        return None
+
+    try:
+        data = decompressor.decompress(peek_file(file, 65536), max_length=262)
+    except Exception:
+        return None
+
+    if len(data) >= 262:
+        return "tar" if data[257:262] == b"ustar" else None
+
+    return None if decompressor.eof else "tar"
+
+
+def spool_file(
+    file: _BufferedIOBase,
+    data: bytes = b"",
+    spool_size: int = 67108864,
+) -> _BufferedIOBase:
+    """
+    This function copies data and the file content in a seekable
+    file: in memory up to spool_size bytes, on disk beyond.
+    """
+
+    from tempfile import SpooledTemporaryFile
+    from shutil import copyfileobj
+
+    spool = SpooledTemporaryFile(max_size=spool_size)
+    spool.write(data)
+    copyfileobj(file, spool, 1048576)
+    spool.seek(0)
+    return spool
+
+
+def iter_container_elffiles(
+    file: _BufferedIOBase,
+    archive_path: str = "",
+    spool_size: int = 67108864,
+) -> Iterable[Tuple[str, str, _BufferedIOBase]]:
+    """
+    This function yields ELF files (archive_path, member name, file)
+    from a tar (compressed or not) or zip archive without extraction.
+
+    Members of seekable uncompressed archives are bounded views,
+    others members (compressed or from a non-seekable stream)
+    are spooled (in memory up to spool_size bytes, on disk beyond).
+    Member files are valid until the next iteration.
+    """
+
+    from zipfile import ZipFile, ZIP_STORED
+    from tarfile import open as open_tar
+
+    if get_container_type(file) == "zip":
+        if not file.seekable():
+            file = spool_file(file, spool_size=spool_size)
+
+        with ZipFile(file) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or info.file_size < 4 or info.flag_bits & 1:
+                    continue
+
+                if info.compress_type == ZIP_STORED:
+                    file.seek(info.header_offset + 26)
+                    names_size = file.read(4)
+                    member = FileView(
+                        file,
+                        info.header_offset
+                        + 30
+                        + int.from_bytes(names_size[:2], "little")
+                        + int.from_bytes(names_size[2:], "little"),
+                        info.file_size,
+                        info.filename,
+                    )
+                    if member.read(4) == b"\x7fELF":
+                        member.seek(0)
+                        yield archive_path, info.filename, member
+                    continue
+
+                with archive.open(info) as member:
+                    magic = member.read(4)
+                    if magic != b"\x7fELF":
+                        continue
+
+                    with spool_file(member, magic, spool_size) as member:
+                        yield archive_path, info.filename, member
+
+        return None
+
+    seekable = file.seekable()
+    with open_tar(fileobj=file, mode="r:*" if seekable else "r|*") as archive:
+        uncompressed = seekable and archive.fileobj is file
+
+        for member in archive:
+            if not member.isfile() or member.size < 4 or member.issparse():
+                continue
+
+            if uncompressed:
+                view = FileView(
+                    file, member.offset_data, member.size, member.name
+                )
+                if view.read(4) == b"\x7fELF":
+                    view.seek(0)
+                    yield archive_path, member.name, view
+                continue
+
+            extracted = archive.extractfile(member)
+            magic = extracted.read(4)
+            if magic == b"\x7fELF":
+                with spool_file(extracted, magic, spool_size) as spool:
+                    yield archive_path, member.name, spool
+
+
+def parse_container_elffiles(
+    file: _BufferedIOBase,
+    archive_path: str = "",
+    spool_size: int = 67108864,
+) -> Iterable[Tuple[str, str, Tuple]]:
+    """
+    This function parses ELF files in a tar or zip archive and
+    yields (archive_path, member name, parse_elffile result).
+    """
+
+    for archive_path, name, member in iter_container_elffiles(
+        file, archive_path, spool_size
+    ):
+        yield archive_path, name, parse_elffile(member)
+
+
+def iter_directory_files(directory: str) -> Iterable[str]:
+    """
+    This function yields regular files paths of a directory
+    (recursively, symbolic links are not followed).
+    """
+
+    from os import walk
+
+    for root, _, filenames in walk(directory):
+        for filename in filenames:
+            path = join(root, filename)
+            if not islink(path):
+                yield path
+
+
+def iter_chunks(elements: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    """
+    This function yields lists of size elements
+    (the last list can be smaller).
+    """
+
+    chunk = []
+    for element in elements:
+        chunk.append(element)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def add_elffile_statistics(
+    statistics: Dict[str, Counter], file: _BufferedIOBase, path: str
+) -> None:
+    """
+    This function adds a file to statistics (counters of files
+    and bytes, and for ELF files: classes, machines, types, OS ABI,
+    interpreters, DT_NEEDED, sections names and sizes).
+    """
+
+    size = file.seek(0, 2)
+    statistics["counts"]["files"] += 1
+    statistics["counts"]["bytes"] += size
+
+    file.seek(0)
+    identification = file.read(16)
+    if identification[:4] != b"\x7fELF":
+        return None
+
+    statistics["counts"]["elf"] += 1
+    statistics["sizes"][1 << max(size - 1, 0).bit_length()] += 1
+    osabi = identification[7]
+    budget = ParseBudget(file)
+    layout = parse_elflayout(file, budget)
+    information = read_dynamic_info(file, path, budget)
+
+    statistics["classes"][f"ELF{layout.elf_classe} {layout.order}"] += 1
+    statistics["osabi"][
+        (
+            ELfIdentOS(osabi).name
+            if osabi in ELfIdentOS._value2member_map_
+            else str(osabi)
+        )
+    ] += 1
+    statistics["types"][
+        (
+            ElfType(layout.type).name
+            if layout.type in ElfType._value2member_map_
+            else str(layout.type)
+        )
+    ] += 1
+    statistics["machines"][
+        (
+            ElfMachine(layout.machine).name
+            if layout.machine in ElfMachine._value2member_map_
+            else str(layout.machine)
+        )
+    ] += 1
+    if information.interpreter:
+        statistics["interpreters"][information.interpreter] += 1
+    statistics["needed"].update(information.needed)
+    statistics["sections"].update(
+        {section.name for section in layout.sections if section.name}
+    )
+
+
+def get_statistics_chunk(paths: List[str]) -> Dict[str, Counter]:
+    """
+    This function computes partial statistics of some files
+    (map step, used by the processes pool), files raising any
+    error are counted in errors without stopping the corpus.
+    """
+
+    statistics = {field: Counter() for field in statistics_fields}
+    for path in paths:
+        try:
+            with open(path, "rb") as file:
+                add_elffile_statistics(statistics, file, path)
+        except Exception:
+            statistics["counts"]["errors"] += 1
+    return statistics
+
+
+def merge_statistics(
+    statistics: Dict[str, Counter], partial: Dict[str, Counter]
+) -> Dict[str, Counter]:
+    """
+    This function merges partial statistics into statistics
+    (reduce step) and returns statistics.
+    """
+
+    for field, counter in partial.items():
+        statistics[field].update(counter)
+    return statistics
+
+
+def get_corpus_statistics(
+    directory: str, processes: int = None, chunk_size: int = 64
+) -> Dict[str, Counter]:
+    """
+    This function computes statistics of all files of a directory:
+    chunks of paths are mapped to small partial statistics in a
+    processes pool (None: CPU count, 0: no pool, workers intern
+    strings in a StringPool) and merged in this process, only a few
+    chunks are submitted at a time to keep the memory flat on very
+    large corpus.
+    """
+
+    statistics = {field: Counter() for field in statistics_fields}
+    chunks = iter_chunks(iter_directory_files(directory), chunk_size)
+
+    if processes == 0:
+        for chunk in chunks:
+            merge_statistics(statistics, get_statistics_chunk(chunk))
+        return statistics
+
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor,
+        wait,
+    )
+    from os import cpu_count
+
+    processes = processes or cpu_count() or 1
+    pending = set()
+
+    with ProcessPoolExecutor(
+        processes, initializer=set_string_pool
+    ) as executor:
+        for chunk in chunks:
+            pending.add(executor.submit(get_statistics_chunk, chunk))
+            if len(pending) >= processes * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge_statistics(statistics, future.result())
+
+        for future in pending:
+            merge_statistics(statistics, future.result())
+
+    return statistics
+
+
+def summarize_statistics(
+    statistics: Dict[str, Counter], top: int = 20
+) -> Dict[str, Any]:
+    """
+    This function returns a JSON serializable summary of
+    statistics (top DT_NEEDED and sections names only).
+    """
+
+    return {
+        "counts": dict(statistics["counts"]),
+        "classes": dict(statistics["classes"].most_common()),
+        "machines": dict(statistics["machines"].most_common()),
+        "types": dict(statistics["types"].most_common()),
+        "osabi": dict(statistics["osabi"].most_common()),
+        "interpreters": dict(statistics["interpreters"].most_common()),
+        "needed": dict(statistics["needed"].most_common(top)),
+        "sections": dict(statistics["sections"].most_common(top)),
+        "sizes": {
+            f"<={size}": number
+            for size, number in sorted(statistics["sizes"].items())
+        },
+    }
+
+
+def get_batch_key(directory: str, path: str, status: Any) -> str:
+    """
+    This function returns the batch record key of a file: relative
+    path, size and modification time (a modified file gets a new
+    record, consumers keep the last record of each path).
+    """
+
+    return f"{relpath(path, directory)}:{status.st_size}:{status.st_mtime_ns}"
+
+
+def get_batch_record(directory: str, path: str) -> Dict[str, Any]:
+    """
+    This function returns the batch record of a file: dynamic linking
+    informations, build-id, imports/exports fingerprint and .comment
+    strings, the error message or the skip reason (non ELF files are
+    recorded to be skipped on resume).
+    """
+
+    name = relpath(path, directory)
+    record = {"key": name, "path": name}
+
+    try:
+        with open(path, "rb") as file:
+            status = fstat(file.fileno())
+            record["key"] = get_batch_key(directory, path, status)
+            record["size"] = status.st_size
+            if file.read(4) != b"\x7fELF":
+                record["skipped"] = "not an ELF file"
+                return record
+
+            budget = ParseBudget(file)
+            layout = parse_elflayout(file, budget)
+            information = read_dynamic_info(file, name, budget)
+            record.update(
+                {
+                    "class": layout.elf_classe,
+                    "order": layout.order,
+                    "type": layout.type,
+                    "machine": layout.machine,
+                    "interpreter": information.interpreter,
+                    "soname": information.soname,
+                    "needed": information.needed,
+                    "build_id": read_raw_build_id(file, layout, budget),
+                    "fingerprint": fingerprint_elffile(file, layout, budget),
+                    "comments": read_raw_comments(file, layout, budget),
+                }
+            )
+    except Exception as error:
+        record["error"] = f"{error.__class__.__name__}: {error}"
+
+    return record
+
+
+def read_batch_output(path: str) -> Tuple[set, int]:
+    """
+    This function returns keys of complete records of a batch NDJSON
+    output and its size without the last partial record (written
+    when the scan was killed).
+    """
+
+    from json import loads
+
+    keys = set()
+    offset = 0
+
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return keys, offset
+
+    with file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                keys.add(loads(line)["key"])
+            except (ValueError, KeyError, TypeError):
+                break
+            offset += len(line)
+
+    return keys, offset
+
+
+def save_batch_journal(path: str, journal: Dict[str, Any]) -> None:
+    """
+    This function writes the batch journal (written in a temporary
+    file and renamed, a killed scan never leaves a partial journal).
+    """
+
+    from tempfile import NamedTemporaryFile
+    from os import replace
+    from json import dump
+
+    with NamedTemporaryFile(
+        "w", dir=dirname(abspath(path)), delete=False, encoding="utf-8"
+    ) as file:
+        dump(journal, file)
+    replace(file.name, path)
+
+
+def get_process_rss() -> Union[int, None]:
+    """
+    This function returns the resident memory size (bytes) of this
+    process, None when it is unknown (no /proc/self/statm).
+    """
+
+    try:
+        with open("/proc/self/statm", "rb") as file:
+            pages = int(file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+    from os import sysconf
+
+    return pages * sysconf("SC_PAGE_SIZE")
+
+
+def run_pool_worker(
+    function: Any,
+    connection: Any,
+    max_tasks_per_child: int = None,
+    max_rss: int = None,
+    initializer: Any = None,
+) -> None:
+    """
+    This function runs a WorkersPool worker: it calls initializer,
+    receives arguments, sends (result, error, retire) and exits
+    after retiring (too many tasks or RSS over max_rss bytes)
+    or when None is received.
+    """
+
+    if initializer is not None:
+        initializer()
+
+    tasks = 0
+    while True:
+        try:
+            argument = connection.recv()
+        except (EOFError, OSError):
+            return None
+        if argument is None:
+            return None
+
+        try:
+            result, error = function(argument), None
+        except Exception as exception:
+            result, error = (
+                None,
+                f"{exception.__class__.__name__}: {exception}",
+            )
+
+        tasks += 1
+        rss = get_process_rss() if max_rss else None
+        retire = bool(
+            (max_tasks_per_child and tasks >= max_tasks_per_child)
+            or (rss is not None and rss > max_rss)
+        )
+        connection.send((result, error, retire))
+        if retire:
+            return None
+
+
+class WorkersPool:
+    """
+    This class implements a bounded processes pool: each worker has
+    one task in flight and results are yielded before next tasks are
+    sent (backpressure: nothing is queued in the parent when the
+    consumer is slow), the sum of in-flight tasks sizes is capped
+    (a bigger task runs alone) and workers are recycled after
+    max_tasks_per_child tasks or when their RSS is over max_rss bytes.
+    Each worker calls initializer (when defined) when it starts.
+    """
+
+    def __init__(
+        self,
+        function: Any,
+        processes: int = None,
+        max_tasks_per_child: int = None,
+        max_rss: int = None,
+        max_in_flight_bytes: int = None,
+        initializer: Any = None,
+    ):
+        from os import cpu_count
+
+        self.function = function
+        self.initializer = initializer
+        self.processes = processes or cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_rss = max_rss
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.workers = {}
+        self.in_flight_bytes = 0
+
+    @property
+    def in_flight(self) -> List[Any]:
+        """
+        This method returns arguments of running tasks.
+        """
+
+        return [
+            task[0] for _, task in self.workers.values() if task is not None
+        ]
+
+    def start_worker(self) -> None:
+        """
+        This method starts a worker process.
+        """
+
+        from multiprocessing import Pipe, Process
+
+        connection, child_connection = Pipe()
+        process = Process(
+            target=run_pool_worker,
+            args=(
+                self.function,
+                child_connection,
+                self.max_tasks_per_child,
+                self.max_rss,
+                self.initializer,
+            ),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        self.workers[connection] = (process, None)
+
+    def stop_worker(self, connection: Any) -> None:
+        """
+        This method stops a worker process.
+        """
+
+        process, _ = self.workers.pop(connection)
+        try:
+            connection.send(None)
+        except (OSError, ValueError):
+            pass
+        connection.close()
+        process.join(1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    def imap_unordered(
+        self, tasks: Iterable[Tuple[Any, int]]
+    ) -> Iterable[Tuple[Any, Any, Union[str, None]]]:
+        """
+        This method runs the function for each (argument, size) task
+        and yields (argument, result, error) in completion order,
+        error is the exception message (or the worker exit code when
+        it died, for example killed by the OOM killer).
+        """
+
+        from multiprocessing.connection import wait
+
+        tasks = iter(tasks)
+        task = next(tasks, None)
+
+        try:
+            while len(self.workers) < self.processes:
+                self.start_worker()
+
+            while True:
+                for connection, (process, running) in self.workers.items():
+                    if task is None:
+                        break
+                    if running is not None:
+                        continue
+                    if (
+                        self.max_in_flight_bytes
+                        and self.in_flight_bytes
+                        and self.in_flight_bytes + task[1]
+                        > self.max_in_flight_bytes
+                    ):
+                        break
+                    connection.send(task[0])
+                    self.workers[connection] = (process, task)
+                    self.in_flight_bytes += task[1]
+                    task = next(tasks, None)
+
+                busy = [
+                    connection
+                    for connection, (_, running) in self.workers.items()
+                    if running is not None
+                ]
+                if not busy:
+                    break
+
+                for connection in wait(busy):
+                    process, (argument, size) = self.workers[connection]
+                    self.workers[connection] = (process, None)
+                    self.in_flight_bytes -= size
+                    try:
+                        result, error, retire = connection.recv()
+                    except (EOFError, OSError):
+                        process.join()
+                        result, retire = None, True
+                        error = f"Worker exited with code {process.exitcode}"
+                    if retire:
+                        self.stop_worker(connection)
+                        self.start_worker()
+                    yield argument, result, error
+        finally:
+            for connection in [*self.workers]:
+                self.stop_worker(connection)
+
+
+def serialize_batch_record(directory: str, path: str) -> bytes:
+    """
+    This function returns the NDJSON line of a file batch record,
+    records are serialized in workers.
+    """
+
+    from json import dumps
+
+    return dumps(get_batch_record(directory, path)).encode("utf-8") + b"\n"
+
+
+def run_batch(
+    directory: str,
+    output: str,
+    journal: str = None,
+    processes: int = None,
+    checkpoint_interval: float = 30,
+    max_tasks_per_child: int = None,
+    max_rss: int = None,
+    max_in_flight_bytes: int = 268435456,
+) -> Dict[str, int]:
+    """
+    This function scans all files of a directory and appends one
+    NDJSON record by file to output (non ELF files are recorded with
+    a skip reason), it is resumable: files with a complete record in
+    output are skipped (the last partial record is truncated) and
+    in-flight files of the journal are retried first.
+
+    The journal (output + ".journal" by default) is a checkpoint
+    written every checkpoint_interval seconds after the output is
+    flushed: directory and output paths (a journal of another scan
+    raises ValueError), records number and in-flight paths.
+
+    Files are discovered lazily and records are built and serialized
+    in a WorkersPool (bounded memory: max_rss per worker, in-flight
+    files sizes capped to max_in_flight_bytes, strings interned in
+    a StringPool by each worker).
+    """
+
+    from os import fsync, stat
+    from itertools import chain
+    from json import dumps, load
+    from time import monotonic
+
+    journal = journal or output + ".journal"
+    try:
+        with open(journal, encoding="utf-8") as file:
+            state = load(file)
+    except FileNotFoundError:
+        state = {}
+
+    for name, path in (("directory", directory), ("output", output)):
+        if name in state and state[name] != abspath(path):
+            raise ValueError(
+                f"Journal {journal!r} is for another {name}: {state[name]!r}"
+            )
+
+    keys, offset = read_batch_output(output)
+    counts = {"records": len(keys), "written": 0, "skipped": 0}
+    retried = state.get("in_flight", [])
+
+    def iter_paths() -> Iterable[Tuple[str, int]]:
+        seen = set(retried)
+        for path in chain(
+            retried,
+            (
+                path
+                for path in iter_directory_files(directory)
+                if path not in seen
+            ),
+        ):
+            try:
+                status = stat(path)
+            except OSError:
+                yield path, 0
+                continue
+            if get_batch_key(directory, path, status) in keys:
+                counts["skipped"] += 1
+                continue
+            yield path, status.st_size
+
+    def write(line: bytes) -> None:
+        output_file.write(line)
+        counts["records"] += 1
+        counts["written"] += 1
+
+    def checkpoint(in_flight: Iterable[str], complete: bool = False) -> None:
+        output_file.flush()
+        fsync(output_file.fileno())
+        save_batch_journal(
+            journal,
+            {
+                "directory": abspath(directory),
+                "output": abspath(output),
+                "records": counts["records"],
+                "in_flight": sorted(in_flight),
+                "complete": complete,
+            },
+        )
+
+    with open(output, "ab") as output_file:
+        output_file.truncate(offset)
+        last_checkpoint = monotonic()
+
+        if processes == 0:
+            for path, _ in iter_paths():
+                write(serialize_batch_record(directory, path))
+                if monotonic() - last_checkpoint >= checkpoint_interval:
+                    checkpoint(())
+                    last_checkpoint = monotonic()
+            checkpoint((), True)
+            return counts
+
+        pool = WorkersPool(
+            partial(serialize_batch_record, directory),
+            processes,
+            max_tasks_per_child,
+            max_rss,
+            max_in_flight_bytes,
+            set_string_pool,
+        )
+        for path, line, error in pool.imap_unordered(iter_paths()):
+            if error is not None:
+                name = relpath(path, directory)
+                record = {"key": name, "path": name}
+                try:
+                    status = stat(path)
+                except OSError:
+                    pass
+                else:
+                    record["key"] = get_batch_key(directory, path, status)
+                    record["size"] = status.st_size
+                record["error"] = error
+                line = dumps(record).encode("utf-8") + b"\n"
+            write(line)
+            if monotonic() - last_checkpoint >= checkpoint_interval:
+                checkpoint(pool.in_flight)
+                last_checkpoint = monotonic()
+
+        checkpoint((), True)
+
+    return counts
+
+
+analysis_details = ("layout", "dynamic", "symbols", "size")
+
+
+def analyze_elffile(
+    file: _BufferedIOBase, detail: str = "dynamic"
+) -> Dict[str, Any]:
+    """
+    This function returns a JSON serializable analysis of an ELF file,
+    detail is "layout" (headers values, sections and segments),
+    "dynamic" (layout with dynamic linking informations, build-id,
+    fingerprint and comments), "symbols" (dynamic with imports and exports)
+    or "size" (dynamic with the size report).
+    """
+
+    if detail not in analysis_details:
+        raise ValueError(f"Invalid detail level: {detail!r}")
+
+    budget = ParseBudget(file)
+    layout = parse_elflayout(file, budget)
+    result = {
+        "class": layout.elf_classe,
+        "order": layout.order,
+        "type": layout.type,
+        "machine": layout.machine,
+        "entry": layout.entry,
+        "sections": [section._asdict() for section in layout.sections],
+        "segments": [segment._asdict() for segment in layout.segments],
+    }
+    if detail == "layout":
+        return result
+
+    information = read_dynamic_info(file, None, budget)
+    result.update(
+        {
+            "interpreter": information.interpreter,
+            "soname": information.soname,
+            "needed": information.needed,
+            "rpath": information.rpath,
+            "runpath": information.runpath,
+            "build_id": read_raw_build_id(file, layout, budget),
+            "fingerprint": fingerprint_elffile(file, layout, budget),
+            "comments": read_raw_comments(file, layout, budget),
+        }
+    )
+
+    if detail == "symbols":
+        result["imports"] = get_elffile_dependencies(file, layout, budget)[1]
+        result["exports"] = get_abi_symbols(file, layout, budget)
+    elif detail == "size":
+        result["size_report"] = [
+            asdict(entry) for entry in get_size_report(file, layout, budget)
+        ]
+
+    return result
+
+
+class AnalysisServer:
+    """
+    This class implements the analysis daemon state: warm caches
+    (results by file identity or content hash and detail level,
+    strings pool) and a lock around analyses (parsers use global
+    state, requests are handled in threads).
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        from threading import Lock
+
+        self.cache = LRUCache(cache_size)
+        self.lock = Lock()
+        set_string_pool()
+
+    def handle(
+        self, request: Dict[str, Any], data: bytes = None
+    ) -> Dict[str, Any]:
+        """
+        This method analyzes the request "path" (or the uploaded
+        data, or base64 "data" in the request) at the "detail"
+        level and returns {"result": ..., "cached": ...}
+        or {"error": ...} (invalid request or any analysis error,
+        the daemon never stops on a malformed file).
+        """
+
+        from base64 import b64decode
+
+        if not isinstance(request, dict):
+            return {"error": "Invalid request: JSON object expected"}
+
+        detail = request.get("detail", "dynamic")
+        if not isinstance(detail, str) or detail not in analysis_details:
+            return {"error": f"Invalid detail level: {detail!r}"}
+
+        path = request.get("path")
+        if data is None and "data" in request:
+            if not isinstance(request["data"], str):
+                return {"error": "Invalid request: base64 data expected"}
+        elif data is None and not isinstance(path, str):
+            return {"error": "Missing request field: 'path' (or 'data')"}
+
+        try:
+            if data is None and "data" in request:
+                data = b64decode(request["data"], validate=True)
+
+            if data is not None:
+                file = BytesIO(data)
+                key = (blake2b(data, digest_size=16).digest(), detail)
+            else:
+                file = open(path, "rb")
+                key = (get_file_key(file), detail)
+
+            with file, self.lock:
+                result = self.cache.get(key)
+                cached = result is not None
+                if not cached:
+                    result = self.cache[key] = analyze_elffile(file, detail)
+        except Exception as error:
+            return {"error": f"{error.__class__.__name__}: {error}"}
+
+        return {"result": result, "cached": cached}
+
+
+def serve(
+    address: Union[str, int],
+    server: AnalysisServer = None,
+    token: str = None,
+) -> None:
+    """
+    This function runs the analysis daemon on a Unix socket path
+    (one JSON request by line, one JSON response by line, the socket
+    is only accessible by the user) or on a localhost HTTP port (POST
+    JSON requests, or POST file bytes with ?detail=..., GET
+    /?path=...&detail=...) until it is interrupted.
+
+    HTTP requests must send the "Authorization: Bearer <token>"
+    header when token is defined, without token any local user can
+    read files readable by the daemon.
+    """
+
+    from json import dumps, loads
+
+    if server is None:
+        server = AnalysisServer()
+
+    if isinstance(address, int):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qs, urlsplit
+        from hmac import compare_digest
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def send_json(
+                self, response: Dict[str, Any], status: int = None
+            ) -> None:
+                body = dumps(response).encode("utf-8")
+                self.send_response(
+                    status or (400 if "error" in response else 200)
+                )
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def authorize(self) -> bool:
+                if token is None or compare_digest(
+                    self.headers.get("Authorization", "").encode("utf-8"),
+                    f"Bearer {token}".encode("utf-8"),
+                ):
+                    return True
+                self.send_json({"error": "Unauthorized: invalid token"}, 401)
+                return False
+
+            def do_GET(self) -> None:
+                if not self.authorize():
+                    return None
+                query = parse_qs(urlsplit(self.path).query)
+                self.send_json(
+                    server.handle(
+                        {
+                            name: values[0]
+                            for name, values in query.items()
+                            if name in ("path", "detail")
+                        }
+                    )
+                )
+
+            def do_POST(self) -> None:
+                if not self.authorize():
+                    return None
+                query = parse_qs(urlsplit(self.path).query)
+                body = self.rfile.read(
+                    int(self.headers.get("Content-Length", 0))
+                )
+                if self.headers.get("Content-Type") == (
+                    "application/octet-stream"
+                ):
+                    response = server.handle(
+                        {"detail": query.get("detail", ["dynamic"])[0]}, body
+                    )
+                else:
+                    try:
+                        response = server.handle(loads(body))
+                    except ValueError as error:
+                        response = {"error": f"Invalid JSON request: {error}"}
+                self.send_json(response)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        listener = ThreadingHTTPServer(("127.0.0.1", address), Handler)
+    else:
+        from socketserver import (
+            StreamRequestHandler,
+            ThreadingUnixStreamServer,
+        )
+        from os import lstat, umask, unlink
+        from stat import S_ISSOCK
+
+        class Handler(StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        response = server.handle(loads(line))
+                    except ValueError as error:
+                        response = {"error": f"Invalid JSON request: {error}"}
+                    self.wfile.write(dumps(response).encode("utf-8") + b"\n")
+
+        try:
+            status = lstat(address)
+        except FileNotFoundError:
+            pass
+        else:
+            if not S_ISSOCK(status.st_mode):
+                raise FileExistsError(
+                    f"{address!r} exists and is not a Unix socket"
+                )
+            unlink(address)
+
+        mask = umask(0o077)
+        try:
+            listener = ThreadingUnixStreamServer(address, Handler)
+        finally:
+            umask(mask)
+
+    listener.daemon_threads = True
+    try:
+        listener.serve_forever()
+    finally:
+        listener.server_close()
+        if not isinstance(address, int):
+            unlink(address)
+
+
+class AnalysisClient:
+    """
+    This class implements the analysis daemon client, the Unix
+    socket connection is kept open for all requests (token is
+    the HTTP daemon token).
+    """
+
+    def __init__(self, address: str, token: str = None):
+        self.address = address
+        self.token = token
+        self.connection = None
+
+        if not address.startswith("http://"):
+            from socket import AF_UNIX, SOCK_STREAM, socket
+
+            self.connection = socket(AF_UNIX, SOCK_STREAM)
+            self.connection.connect(address)
+            self.reader = self.connection.makefile("rb")
+
+    def analyze(
+        self, path: str = None, data: bytes = None, detail: str = "dynamic"
+    ) -> Dict[str, Any]:
+        """
+        This method sends a path (absolute path, resolved by the
+        daemon) or file bytes and returns the daemon response.
+        """
+
+        from json import dumps, loads
+
+        request = {"detail": detail}
+        if data is None:
+            request["path"] = abspath(path)
+
+        if self.connection is None:
+            from urllib.request import Request, urlopen
+            from urllib.error import HTTPError
+            from urllib.parse import urlencode
+
+            headers = (
+                {}
+                if self.token is None
+                else {"Authorization": f"Bearer {self.token}"}
+            )
+            if data is None:
+                http_request = Request(
+                    self.address,
+                    dumps(request).encode("utf-8"),
+                    {**headers, "Content-Type": "application/json"},
+                )
+            else:
+                http_request = Request(
+                    self.address.rstrip("/") + "/?" + urlencode(request),
+                    data,
+                    {**headers, "Content-Type": "application/octet-stream"},
+                )
+            try:
+                with urlopen(http_request) as response:
+                    return loads(response.read())
+            except HTTPError as error:
+                return loads(error.read())
+
+        if data is not None:
+            from base64 import b64encode
+
+            request["data"] = b64encode(data).decode("ascii")
+
+        self.connection.sendall(dumps(request).encode("utf-8") + b"\n")
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the analysis daemon")
+        return loads(line)
+
+    def close(self) -> None:
+        """
+        This method closes the Unix socket connection.
+        """
+
+        if self.connection is not None:
+            self.reader.close()
+            self.connection.close()
+
+
+if __name__ == "__main__":
+    exit(main())
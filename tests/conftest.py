@@ -0,0 +1,170 @@
+"""
+This file defines the ELF fixtures compiled for the ElfAnalyzer tests.
+"""
+
+from os.path import dirname, abspath, join
+from subprocess import run, DEVNULL
+from shutil import which
+from sys import path
+
+import pytest
+
+root = dirname(dirname(abspath(__file__)))
+path.insert(0, root)
+
+source = r"""
+#include <stdio.h>
+#include <string.h>
+#include <math.h>
+static const char secret[] = "HelloSecretString";
+int global_counter = 5;
+int helper(int x) { return x * 2 + global_counter; }
+int main(int argc, char **argv) {
+    char b[64];
+    memcpy(b, secret, sizeof secret);
+    printf("%s %d %f\n", b, helper(argc), sqrt(argc));
+    return 0;
+}
+"""
+
+versioned_source = r"""
+__asm__(".symver foo_v1, foo@V1");
+__asm__(".symver foo_v2, foo@@V2");
+int foo_v1(void) { return 1; }
+int foo_v2(void) { return 2; }
+int bar(void) { return 3; }
+"""
+versions_script = """
+V1 { global: foo; bar; local: *; };
+V2 { global: foo; } V1;
+"""
+
+builds = {
+    "executable": ["-g", "-o", "{output}", "{source}", "-lm"],
+    "compressed": ["-g", "-gz", "-o", "{output}", "{source}", "-lm"],
+    "library": ["-shared", "-fPIC", "-g", "-o", "{output}", "{source}"],
+    "object": ["-c", "-g", "-o", "{output}", "{source}"],
+}
+
+
+@pytest.fixture(scope="session")
+def elf_files(tmp_path_factory):
+    """
+    This fixture compiles the test sources and returns
+    a dictionary of build names to ELF paths.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required to build ELF fixtures")
+
+    directory = tmp_path_factory.mktemp("elf")
+    source_path = directory / "test.c"
+    source_path.write_text(source)
+
+    files = {}
+    for name, arguments in builds.items():
+        output = directory / name
+        command = [compiler] + [
+            argument.format(output=output, source=source_path)
+            for argument in arguments
+        ]
+        if run(command, stdout=DEVNULL, stderr=DEVNULL).returncode == 0:
+            files[name] = str(output)
+
+    if "executable" not in files:
+        pytest.skip("the C compiler cannot build ELF fixtures")
+
+    return files
+
+
+@pytest.fixture
+def elf_file(elf_files):
+    """
+    This fixture returns the path of the compiled executable.
+    """
+
+    return elf_files["executable"]
+
+
+@pytest.fixture
+def elf_data(elf_file):
+    """
+    This fixture returns the content of the compiled executable.
+    """
+
+    with open(elf_file, "rb") as file:
+        return file.read()
+
+
+def run_cli(*arguments, **kwargs):
+    """
+    This function runs the ElfAnalyzer command line.
+    """
+
+    from sys import executable
+
+    return run(
+        [executable, join(root, "ElfAnalyzer.py"), *arguments],
+        capture_output=True,
+        **kwargs,
+    )
+
+
+elf64_header_fields = {
+    "e_phoff": (0x20, 8),
+    "e_shoff": (0x28, 8),
+    "e_phentsize": (0x36, 2),
+    "e_phnum": (0x38, 2),
+    "e_shentsize": (0x3A, 2),
+    "e_shnum": (0x3C, 2),
+    "e_shstrndx": (0x3E, 2),
+}
+
+
+def set_header_fields(data: bytes, **fields) -> bytes:
+    """
+    This function returns a copy of a 64 bits little endian
+    ELF file with forged header fields.
+    """
+
+    data = bytearray(data)
+    for name, value in fields.items():
+        offset, size = elf64_header_fields[name]
+        data[offset : offset + size] = value.to_bytes(size, "little")
+    return bytes(data)
+
+
+@pytest.fixture(scope="session")
+def versioned_library(tmp_path_factory):
+    """
+    This fixture builds a shared library with two versions of foo.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required")
+
+    directory = tmp_path_factory.mktemp("versions")
+    (directory / "versions.c").write_text(versioned_source)
+    (directory / "versions.map").write_text(versions_script)
+    path = directory / "libversions.so"
+    if (
+        run(
+            [
+                compiler,
+                "-shared",
+                "-fPIC",
+                "-Wl,--version-script=versions.map",
+                "-o",
+                str(path),
+                "versions.c",
+            ],
+            cwd=directory,
+            capture_output=True,
+        ).returncode
+        != 0
+    ):
+        pytest.skip("the C compiler cannot build versioned symbols")
+
+    return str(path)
@@ -0,0 +1,137 @@
+"""
+This file tests the shared libraries ABI comparison.
+"""
+
+from shutil import copyfile, which
+from subprocess import run
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import (
+    Difference,
+    diff_abi_manifest,
+    diff_abi_symbols,
+    get_abi_manifest,
+    get_abi_symbols,
+    main_abi,
+)
+from conftest import run_cli
+
+
+def build_library(directory, name, source):
+    """
+    This function builds a shared library from a C source.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required")
+
+    (directory / (name + ".c")).write_text(source)
+    path = directory / (name + ".so")
+    run(
+        [compiler, "-shared", "-fPIC", "-o", str(path), name + ".c"],
+        cwd=directory,
+        check=True,
+    )
+    return str(path)
+
+
+def test_versioned_exports(versioned_library):
+    with open(versioned_library, "rb") as file:
+        exports = get_abi_symbols(file)
+
+    assert set(exports) == {"foo@V1", "foo@@V2", "bar@@V1", "V1@@V1", "V2@@V2"}
+    assert exports["foo@@V2"][:2] == ("STT_FUNC", "STB_GLOBAL")
+
+
+def test_diff_symbols():
+    old = {
+        "a": ("STT_FUNC", "STB_GLOBAL", 8),
+        "b": ("STT_FUNC", "STB_WEAK", 4),
+    }
+    new = {
+        "a": ("STT_FUNC", "STB_GLOBAL", 16),
+        "c": ("STT_FUNC", "STB_GLOBAL", 4),
+    }
+    assert diff_abi_symbols(old, new) == [
+        Difference("symbol", "b", "removed"),
+        Difference("symbol", "a", "resized", "size", 8, 16),
+        Difference("symbol", "c", "added"),
+    ]
+    assert diff_abi_symbols(old, old) == []
+
+    for type in ("STT_OBJECT", "STT_TLS"):
+        assert diff_abi_symbols(
+            {"d": (type, "STB_GLOBAL", 8)}, {"d": (type, "STB_GLOBAL", 16)}
+        ) == [Difference("symbol", "d", "changed", "size", 8, 16)]
+
+
+def test_main_abi(tmp_path, monkeypatch, capsys):
+    old = build_library(
+        tmp_path, "old", "int data[2];\nint f(int x) { return x + 1; }\n"
+    )
+    resized = build_library(
+        tmp_path,
+        "resized",
+        "int data[2];\nint f(int x) { return x * x * x + x / 3 - 7; }\n",
+    )
+    changed = build_library(
+        tmp_path, "changed", "int data[4];\nint f(int x) { return x + 1; }\n"
+    )
+    monkeypatch.setattr(ElfAnalyzer.Data, "no_color", False)
+
+    for new, code, name in ((resized, 0, "f"), (changed, 1, "data")):
+        arguments = ["ElfAnalyzer", "abi", "-c", old, new]
+        monkeypatch.setattr(ElfAnalyzer, "argv", arguments)
+        assert main_abi() == code
+        assert arguments[2] == "-c"
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split()[2] for line in lines if line.startswith("~")] == [
+            name
+        ]
+
+
+def test_manifest(elf_files, versioned_library, tmp_path):
+    old = tmp_path / "old"
+    new = tmp_path / "new"
+    for directory in (old, new):
+        (directory / "lib").mkdir(parents=True)
+        copyfile(elf_files["object"], directory / "object.o")
+    copyfile(versioned_library, old / "lib" / "libtest.so")
+    copyfile(elf_files["library"], new / "lib" / "libtest.so")
+    copyfile(versioned_library, new / "lib" / "libnew.so")
+
+    old_manifest = get_abi_manifest(str(old))
+    assert list(old_manifest) == ["lib/libtest.so"]
+    assert diff_abi_manifest(old_manifest, old_manifest) == {}
+
+    differences = diff_abi_manifest(old_manifest, get_abi_manifest(str(new)))
+    assert differences["lib/libnew.so"] == [
+        Difference("library", "lib/libnew.so", "added")
+    ]
+    assert Difference("symbol", "foo@@V2", "removed") in (
+        differences["lib/libtest.so"]
+    )
+    assert Difference("symbol", "helper", "added") in (
+        differences["lib/libtest.so"]
+    )
+
+
+def test_cli_manifest(elf_files, versioned_library, tmp_path):
+    (tmp_path / "lib").mkdir()
+    copyfile(versioned_library, tmp_path / "lib" / "libtest.so")
+    manifest = str(tmp_path / "manifest.json")
+    directory = str(tmp_path / "lib")
+
+    assert run_cli("abi", "-m", "-w", manifest, directory).returncode == 0
+    assert run_cli("abi", "-c", "-m", manifest, directory).returncode == 0
+
+    copyfile(elf_files["library"], tmp_path / "lib" / "libtest.so")
+    process = run_cli("abi", "-c", "-m", manifest, directory)
+    assert process.returncode == 1
+    assert b"foo@@V2" in process.stdout
+
+    process = run_cli("abi", "-c", versioned_library, versioned_library)
+    assert process.returncode == 0
@@ -0,0 +1,128 @@
+"""
+This file tests the static archives (ar) index and members parsing.
+"""
+
+from shutil import copyfile, which
+from subprocess import run
+
+import pytest
+
+from ElfAnalyzer import (
+    FileView,
+    parse_archive,
+    parse_archive_members,
+    parse_elffile,
+)
+from conftest import run_cli
+
+long_name = "a_very_very_long_member_name_object.o"
+
+
+@pytest.fixture(scope="module")
+def archive(elf_files, tmp_path_factory):
+    """
+    This fixture builds a GNU static archive with
+    a short and a long member name.
+    """
+
+    if "object" not in elf_files or which("ar") is None:
+        pytest.skip("ar and an object file are required")
+
+    directory = tmp_path_factory.mktemp("archive")
+    copyfile(elf_files["object"], directory / long_name)
+    copyfile(elf_files["object"], directory / "short.o")
+    (directory / "text.txt").write_bytes(b"not an ELF file\n")
+    path = directory / "libtest.a"
+    run(
+        ["ar", "rcs", str(path), long_name, "short.o", "text.txt"],
+        cwd=directory,
+        check=True,
+    )
+    return str(path)
+
+
+def bsd_archive(members):
+    """
+    This function builds a BSD archive (names after headers).
+    """
+
+    data = b"!<arch>\n"
+    for name, content in members:
+        encoded_name = name.encode()
+        size = len(encoded_name) + len(content)
+        data += (
+            f"#1/{len(encoded_name)}".ljust(16).encode()
+            + b"0".ljust(12)
+            + b"0".ljust(6)
+            + b"0".ljust(6)
+            + b"644".ljust(8)
+            + str(size).ljust(10).encode()
+            + b"`\n"
+            + encoded_name
+            + content
+        )
+        if size % 2:
+            data += b"\n"
+    return data
+
+
+def get_sections_names(result):
+    """
+    This function returns the sections names of a parse result.
+    """
+
+    return [section.name for section in result[3]]
+
+
+def test_gnu_archive_index(archive, elf_files):
+    with open(archive, "rb") as file:
+        members, symbols = parse_archive(file)
+        names = [member.name for member in members]
+        assert names == [long_name, "short.o", "text.txt"]
+        assert symbols["helper"].name == long_name
+        assert symbols["global_counter"].name == long_name
+
+        with open(elf_files["object"], "rb") as object_file:
+            expected = get_sections_names(parse_elffile(object_file))
+
+        view = FileView(file, members[1].offset, members[1].size)
+        assert get_sections_names(parse_elffile(view)) == expected
+
+
+def test_bsd_archive_names(tmp_path, elf_files):
+    with open(elf_files["object"], "rb") as file:
+        content = file.read()
+
+    path = tmp_path / "bsd.a"
+    path.write_bytes(bsd_archive([("odd.o", content), ("x" * 20, b"abc")]))
+    with open(path, "rb") as file:
+        members, _ = parse_archive(file)
+        assert [member.name for member in members] == ["odd.o", "x" * 20]
+        file.seek(members[0].offset)
+        assert file.read(members[0].size) == content
+
+
+def test_invalid_archive(tmp_path):
+    path = tmp_path / "invalid.a"
+    path.write_bytes(b"!<arch>\n" + b"x" * 60)
+    with open(path, "rb") as file, pytest.raises(ValueError):
+        parse_archive(file)
+
+
+def test_members_in_processes(archive):
+    sequential = [
+        (member.name, get_sections_names(result))
+        for member, result in parse_archive_members(archive)
+    ]
+    parallel = [
+        (member.name, get_sections_names(result))
+        for member, result in parse_archive_members(archive, processes=2)
+    ]
+    assert [name for name, _ in sequential] == [long_name, "short.o"]
+    assert sequential == parallel
+
+
+def test_cli_archive(archive):
+    process = run_cli("-c", archive)
+    assert process.returncode == 0
+    assert process.stdout.count(b"Archive member") == 2
@@ -0,0 +1,167 @@
+"""
+This file tests the resumable batch scan.
+"""
+
+from json import dumps, loads
+from os import _exit
+from shutil import copyfile
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import (
+    get_batch_record,
+    iter_directory_files,
+    read_batch_output,
+    run_batch,
+    serialize_batch_record,
+)
+from conftest import run_cli
+
+
+@pytest.fixture
+def corpus(elf_files, elf_data, tmp_path):
+    """
+    This fixture returns a directory of ELF and non ELF files.
+    """
+
+    directory = tmp_path / "corpus"
+    directory.mkdir()
+    copyfile(elf_files["executable"], directory / "program")
+    copyfile(elf_files["library"], directory / "libtest.so")
+    (directory / "README").write_text("not an ELF file")
+    (directory / "truncated").write_bytes(elf_data[:20])
+    return directory
+
+
+def read_records(path):
+    with open(path, "rb") as file:
+        return {record["path"]: record for record in map(loads, file)}
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_records(corpus, tmp_path, processes):
+    output = str(tmp_path / "scan.ndjson")
+    counts = run_batch(str(corpus), output, processes=processes)
+    assert counts == {"records": 4, "written": 4, "skipped": 0}
+
+    records = read_records(output)
+    assert records["README"]["skipped"] == "not an ELF file"
+    assert "error" in records["truncated"]
+    assert records["libtest.so"]["type"] == 3
+    assert "libc.so.6" in records["program"]["needed"]
+    for path, record in records.items():
+        size = (corpus / path).stat().st_size
+        assert record["size"] == size
+        assert record["key"].startswith(f"{path}:{size}:")
+
+    counts = run_batch(str(corpus), output, processes=processes)
+    assert counts == {"records": 4, "written": 0, "skipped": 4}
+
+
+def test_resume(corpus, tmp_path):
+    output = tmp_path / "scan.ndjson"
+    run_batch(str(corpus), str(output), processes=0)
+    data = output.read_bytes()
+    output.write_bytes(data[: data.index(b"\n") + 10])
+
+    keys, offset = read_batch_output(str(output))
+    assert len(keys) == 1
+    assert offset == data.index(b"\n") + 1
+
+    counts = run_batch(str(corpus), str(output), processes=0)
+    assert counts == {"records": 4, "written": 3, "skipped": 1}
+    assert sorted(output.read_bytes().splitlines()) == sorted(
+        data.splitlines()
+    )
+
+    (corpus / "README").write_text("modified")
+    counts = run_batch(str(corpus), str(output), processes=0)
+    assert counts == {"records": 5, "written": 1, "skipped": 3}
+
+
+def test_worker_exit(corpus, tmp_path, monkeypatch):
+    def get_record(directory, path):
+        if path.endswith("program"):
+            _exit(3)
+        return get_batch_record(directory, path)
+
+    monkeypatch.setattr(ElfAnalyzer, "get_batch_record", get_record)
+    output = str(tmp_path / "scan.ndjson")
+    run_batch(str(corpus), output, processes=2)
+
+    record = read_records(output)["program"]
+    assert record["error"] == "Worker exited with code 3"
+    assert (
+        record["key"]
+        == get_batch_record(str(corpus), str(corpus / "program"))["key"]
+    )
+
+    counts = run_batch(str(corpus), output, processes=2)
+    assert counts == {"records": 4, "written": 0, "skipped": 4}
+
+
+def test_serial_errors(corpus, tmp_path, monkeypatch):
+    def read_dynamic_info(file, path, budget=None):
+        raise MemoryError("forged")
+
+    monkeypatch.setattr(ElfAnalyzer, "read_dynamic_info", read_dynamic_info)
+    output = str(tmp_path / "scan.ndjson")
+    counts = run_batch(str(corpus), output, processes=0)
+    assert counts["written"] == 4
+
+    records = read_records(output)
+    assert records["program"]["error"] == "MemoryError: forged"
+    status = (corpus / "program").stat()
+    assert records["program"]["key"] == (
+        f"program:{status.st_size}:{status.st_mtime_ns}"
+    )
+    assert records["program"]["size"] == status.st_size
+
+
+def test_journal_in_flight(corpus, tmp_path, monkeypatch):
+    output = tmp_path / "scan.ndjson"
+    journal = tmp_path / "scan.journal"
+    run_batch(str(corpus), str(output), str(journal), processes=0)
+    state = loads(journal.read_text())
+    assert state["complete"] and state["in_flight"] == []
+    assert state["directory"] == str(corpus)
+    assert state["output"] == str(output)
+
+    last = [*iter_directory_files(str(corpus))][-1]
+    output.write_bytes(b"")
+    journal.write_text(
+        dumps({**state, "complete": False, "in_flight": [last]})
+    )
+
+    written = []
+    monkeypatch.setattr(
+        ElfAnalyzer,
+        "serialize_batch_record",
+        lambda directory, path: written.append(path)
+        or serialize_batch_record(directory, path),
+    )
+    counts = run_batch(str(corpus), str(output), str(journal), 0)
+
+    assert written[0] == last
+    assert sorted(written) == sorted(iter_directory_files(str(corpus)))
+    assert counts == {"records": 4, "written": 4, "skipped": 0}
+    assert loads(journal.read_text())["in_flight"] == []
+
+
+def test_journal_of_another_scan(corpus, tmp_path):
+    output = tmp_path / "scan.ndjson"
+    journal = tmp_path / "scan.journal"
+    run_batch(str(corpus), str(output), str(journal), processes=0)
+
+    with pytest.raises(ValueError, match="another directory"):
+        run_batch(str(tmp_path), str(output), str(journal), processes=0)
+    with pytest.raises(ValueError, match="another output"):
+        run_batch(str(corpus), str(tmp_path / "other"), str(journal), 0)
+
+    process = run_cli("batch", str(tmp_path), str(output), "-j", str(journal))
+    assert process.returncode == 1
+    assert b"another directory" in process.stderr
+    process = run_cli("batch", str(corpus), str(output), "-p")
+    assert process.returncode == 1
+    assert b"USAGES:" in process.stderr
@@ -0,0 +1,13 @@
+"""
+This file tests the ElfAnalyzer command line.
+"""
+
+from conftest import run_cli
+
+
+def test_banner_on_stderr(elf_file):
+    process = run_cli("-c", elf_file)
+    assert process.returncode == 0
+    assert b"Copyright" in process.stderr
+    assert b"Copyright" not in process.stdout
+    assert b"ELF" in process.stdout
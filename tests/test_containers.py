@@ -0,0 +1,153 @@
+"""
+This file tests the ELF files analysis inside tar and zip archives.
+"""
+
+from bz2 import compress as bz2_compress
+from gzip import compress as gzip_compress
+from io import BufferedReader, BytesIO
+from lzma import compress as xz_compress
+from os import urandom
+from tarfile import TarInfo, open as open_tar
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+
+from ElfAnalyzer import (
+    FileView,
+    get_container_type,
+    iter_container_elffiles,
+    parse_container_elffiles,
+)
+from conftest import run_cli
+
+
+def build_tar(members, mode):
+    """
+    This function returns a tar archive content.
+    """
+
+    data = BytesIO()
+    with open_tar(fileobj=data, mode=mode) as archive:
+        for name, content in members:
+            info = TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, BytesIO(content))
+    return data.getvalue()
+
+
+def build_zip(members, compression):
+    """
+    This function returns a zip archive content.
+    """
+
+    data = BytesIO()
+    with ZipFile(data, "w", compression) as archive:
+        for name, content in members:
+            archive.writestr(name, content)
+    return data.getvalue()
+
+
+class Stream:
+    """
+    This class implements a non-seekable stream.
+    """
+
+    def __init__(self, data: bytes):
+        self.file = BufferedReader(BytesIO(data))
+        self.read = self.file.read
+        self.peek = self.file.peek
+
+    def seekable(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def members(elf_data):
+    """
+    This fixture returns archive members (two ELF files).
+    """
+
+    return [
+        ("bin/first", elf_data),
+        ("README", b"not an ELF file"),
+        ("lib/second", elf_data),
+    ]
+
+
+@pytest.mark.parametrize(
+    "build, container_type, view",
+    [
+        (lambda members: build_tar(members, "w"), "tar", True),
+        (lambda members: build_tar(members, "w:gz"), "tar", False),
+        (lambda members: build_zip(members, ZIP_STORED), "zip", True),
+        (lambda members: build_zip(members, ZIP_DEFLATED), "zip", False),
+    ],
+)
+def test_container_members(members, elf_data, build, container_type, view):
+    data = build(members)
+    file = BytesIO(data)
+    assert get_container_type(file) == container_type
+
+    found = []
+    for archive_path, name, member in iter_container_elffiles(file, "a"):
+        assert archive_path == "a"
+        assert isinstance(member, FileView) is view
+        assert member.read() == elf_data
+        found.append(name)
+
+    assert found == ["bin/first", "lib/second"]
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda members: build_tar(members, "w:gz"),
+        lambda members: build_zip(members, ZIP_DEFLATED),
+    ],
+)
+def test_non_seekable_stream(members, elf_data, build):
+    found = [
+        (name, member.read())
+        for _, name, member in iter_container_elffiles(
+            Stream(build(members)), spool_size=1024
+        )
+    ]
+    assert found == [("bin/first", elf_data), ("lib/second", elf_data)]
+
+
+def test_parse_container(members):
+    results = list(parse_container_elffiles(BytesIO(build_tar(members, "w"))))
+    assert [name for _, name, _ in results] == ["bin/first", "lib/second"]
+    assert ".text" in [section.name for section in results[0][2][3]]
+
+
+def test_cli_stdin_zip(members):
+    process = run_cli("-c", "-", input=build_zip(members, ZIP_DEFLATED))
+    assert process.returncode == 0
+    assert b":bin/first" in process.stdout
+    assert b":lib/second" in process.stdout
+
+
+@pytest.mark.parametrize(
+    "compress", [gzip_compress, bz2_compress, xz_compress]
+)
+def test_compressed_non_tar(members, compress):
+    data = compress(b"not a tar archive\n")
+    assert get_container_type(BytesIO(data)) is None
+    assert get_container_type(BytesIO(build_tar(members, "w:gz"))) == "tar"
+    assert get_container_type(BytesIO(build_tar(members, "w:xz"))) == "tar"
+
+    process = run_cli("-c", "-", input=data)
+    assert process.returncode == 1
+    assert b"Traceback" not in process.stderr
+    assert b"not an ELF file" in process.stderr
+
+
+def test_large_bzip2_non_tar():
+    data = bz2_compress(urandom(262144))
+    assert get_container_type(BytesIO(data)) == "tar"
+
+    process = run_cli("-c", "-", input=data)
+    assert process.returncode == 1
+    assert b"Traceback" not in process.stderr
+    assert b"not a valid container" in process.stderr
@@ -0,0 +1,107 @@
+"""
+This file tests the offline shared libraries dependencies resolver.
+"""
+
+from shutil import copyfile, which
+from subprocess import run
+
+import pytest
+
+from ElfAnalyzer import DependencyResolver, read_dynamic_info
+from conftest import run_cli
+
+sources = {
+    "b.c": "int b(void) { return 2; }",
+    "a.c": "int b(void); int a(void) { return b(); }",
+    "main.c": "int a(void); int main(void) { return a(); }",
+    "c.c": "int fake(void) { return 0; }",
+}
+
+
+@pytest.fixture(scope="module")
+def sysroot(tmp_path_factory):
+    """
+    This fixture builds a sysroot: /opt/bin/app needs liba.so
+    (DT_RUNPATH $ORIGIN/../lib) that needs libb.so (DT_RUNPATH
+    $ORIGIN), libc.so.6 is in a ld.so.conf included directory.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required")
+
+    directory = tmp_path_factory.mktemp("sysroot")
+    root = directory / "root"
+    for path in ("opt/lib", "opt/bin", "custom", "etc/ld.so.conf.d"):
+        (root / path).mkdir(parents=True)
+    for name, source in sources.items():
+        (directory / name).write_text(source)
+
+    library = str(root / "opt" / "lib")
+    commands = [
+        ["-shared", "-fPIC", "-nostdlib", "-Wl,-soname,libc.so.6"]
+        + ["-o", str(root / "custom" / "libc.so.6"), "c.c"],
+        ["-shared", "-fPIC", "-Wl,-soname,libb.so"]
+        + ["-o", library + "/libb.so", "b.c"],
+        ["-shared", "-fPIC", "-Wl,-soname,liba.so", "-Wl,--enable-new-dtags"]
+        + ["-Wl,-rpath,$ORIGIN", "-Wl,--as-needed"]
+        + ["-o", library + "/liba.so", "a.c"]
+        + ["-L" + library, "-lb"],
+        ["-Wl,--enable-new-dtags", "-Wl,-rpath,$ORIGIN/../lib"]
+        + ["-o", str(root / "opt" / "bin" / "app"), "main.c"]
+        + ["-L" + library, "-la", "-Wl,-rpath-link," + library],
+    ]
+    for command in commands:
+        if run([compiler] + command, cwd=directory).returncode:
+            pytest.skip("the C compiler cannot build the sysroot")
+
+    (root / "etc" / "ld.so.conf").write_text(
+        "include /etc/ld.so.conf.d/*.conf\n"
+    )
+    (root / "etc" / "ld.so.conf.d" / "custom.conf").write_text("/custom\n")
+    return root
+
+
+def test_dynamic_info(sysroot):
+    with open(sysroot / "opt" / "lib" / "liba.so", "rb") as file:
+        info = read_dynamic_info(file, "/opt/lib/liba.so")
+
+    assert info.soname == "liba.so"
+    assert info.needed[0] == "libb.so"
+    assert info.runpath == ["$ORIGIN"]
+    assert info.interpreter is None
+
+
+def test_resolve(sysroot):
+    resolver = DependencyResolver(str(sysroot))
+    assert resolver.resolve("/opt/bin/app") == {
+        "/opt/bin/app": [
+            ("liba.so", "/opt/lib/liba.so"),
+            ("libc.so.6", "/custom/libc.so.6"),
+        ],
+        "/opt/lib/liba.so": [("libb.so", "/opt/lib/libb.so")],
+        "/custom/libc.so.6": [],
+        "/opt/lib/libb.so": [],
+    }
+
+
+def test_library_paths_and_missing(sysroot, tmp_path):
+    override = sysroot / "override"
+    override.mkdir(exist_ok=True)
+    copyfile(sysroot / "opt" / "lib" / "libb.so", override / "libb.so")
+    try:
+        resolver = DependencyResolver(str(sysroot), ["/override"])
+        graph = resolver.resolve("/opt/bin/app")
+    finally:
+        (override / "libb.so").unlink()
+
+    assert graph["/opt/lib/liba.so"][0] == ("libb.so", "/override/libb.so")
+
+    with pytest.raises(ValueError):
+        resolver.resolve("/etc/ld.so.conf")
+
+
+def test_cli_ldd(sysroot):
+    process = run_cli("ldd", "-c", "-r", str(sysroot), "/opt/bin/app")
+    assert process.returncode == 0
+    assert b"liba.so => /opt/lib/liba.so" in process.stdout
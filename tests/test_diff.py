@@ -0,0 +1,84 @@
+"""
+This file tests the ELF files comparison.
+"""
+
+import ElfAnalyzer
+from ElfAnalyzer import diff_elffiles, main_diff, parse_elflayout
+from conftest import run_cli
+
+
+def swap_dynamic_symbols(path: str, output: str) -> None:
+    """
+    This function writes a copy of the library with the two
+    foo symbols swapped in .dynsym and .gnu.version.
+    """
+
+    with open(path, "rb") as file:
+        layout = parse_elflayout(file)
+        file.seek(0)
+        data = bytearray(file.read())
+
+    sections = {section.name: section for section in layout.sections}
+    dynsym = sections[".dynsym"]
+    strings = sections[".dynstr"]
+    names = []
+    for index in range(dynsym.size // dynsym.entsize):
+        offset = dynsym.offset + index * dynsym.entsize
+        name_offset = strings.offset + int.from_bytes(
+            data[offset : offset + 4], "little"
+        )
+        names.append(data[name_offset : data.index(b"\0", name_offset)])
+
+    first, second = [
+        index for index, name in enumerate(names) if name == b"foo"
+    ]
+    for section in (dynsym, sections[".gnu.version"]):
+        size = section.entsize or 2
+        start1 = section.offset + first * size
+        start2 = section.offset + second * size
+        entry1 = data[start1 : start1 + size]
+        data[start1 : start1 + size] = data[start2 : start2 + size]
+        data[start2 : start2 + size] = entry1
+
+    with open(output, "wb") as file:
+        file.write(data)
+
+
+def test_versioned_symbols_order(versioned_library, tmp_path):
+    swapped = str(tmp_path / "swapped.so")
+    swap_dynamic_symbols(versioned_library, swapped)
+
+    with open(versioned_library, "rb") as file1, open(swapped, "rb") as file2:
+        differences = list(diff_elffiles(file1, file2))
+
+    assert not [
+        difference
+        for difference in differences
+        if difference.category == "symbol"
+    ]
+    assert [difference.name for difference in differences] == [
+        ".dynsym",
+        ".gnu.version",
+    ]
+
+
+def test_identical_files(elf_file):
+    with open(elf_file, "rb") as file1, open(elf_file, "rb") as file2:
+        assert list(diff_elffiles(file1, file2)) == []
+
+
+def test_main_diff_keeps_argv(elf_files, monkeypatch):
+    arguments = ["ElfAnalyzer", "diff", "-c", elf_files["executable"]]
+    arguments.append(elf_files["executable"])
+    monkeypatch.setattr(ElfAnalyzer, "argv", arguments)
+    monkeypatch.setattr(ElfAnalyzer.Data, "no_color", False)
+    assert main_diff() == 0
+    assert arguments[2] == "-c"
+
+
+def test_cli_diff(elf_files):
+    process = run_cli(
+        "diff", "-c", elf_files["executable"], elf_files["compressed"]
+    )
+    assert process.returncode == 1
+    assert b".debug_info" in process.stdout
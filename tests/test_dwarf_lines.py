@@ -0,0 +1,110 @@
+"""
+This file tests the DWARF addresses to source lines index.
+"""
+
+from shutil import copyfile, which
+from subprocess import run
+
+import pytest
+
+from ElfAnalyzer import (
+    DwarfLineIndex,
+    get_raw_string,
+    parse_elflayout,
+    read_raw_symbols,
+)
+from conftest import run_cli, source
+
+variants = {
+    "dwarf4": ["-gdwarf-4"],
+    "dwarf5": ["-gdwarf-5"],
+    "compressed": ["-gdwarf-5", "-gz"],
+    "no_aranges": ["-gdwarf-5"],
+}
+
+
+@pytest.fixture(scope="module", params=list(variants))
+def debug_file(request, tmp_path_factory):
+    """
+    This fixture builds the test source with DWARF variants.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None or which("addr2line") is None:
+        pytest.skip("a C compiler and addr2line are required")
+
+    directory = tmp_path_factory.mktemp(request.param)
+    (directory / "test.c").write_text(source)
+    path = str(directory / "test")
+    command = [compiler, *variants[request.param], "-o", path, "test.c"]
+    if run(command + ["-lm"], cwd=directory).returncode:
+        pytest.skip(f"the C compiler cannot build {request.param}")
+
+    if request.param == "no_aranges":
+        if which("objcopy") is None:
+            pytest.skip("objcopy is required")
+        copyfile(path, path + ".full")
+        run(
+            ["objcopy", "--remove-section=.debug_aranges", path + ".full"]
+            + [path],
+            check=True,
+        )
+
+    return path
+
+
+def get_text_addresses(path: str):
+    """
+    This function returns addresses of the helper and main functions.
+    """
+
+    with open(path, "rb") as file:
+        layout = parse_elflayout(file)
+        symbols = {
+            get_raw_string(strings, name): (value, size)
+            for _, table, strings in read_raw_symbols(file, layout)
+            for name, _, _, _, value, size in table
+        }
+
+    start = symbols["helper"][0]
+    end = symbols["main"][0] + symbols["main"][1]
+    return list(range(start, end, 3)) + [end + 0x1000, 0]
+
+
+def addr2line(path: str, addresses):
+    """
+    This function returns the binutils addr2line results.
+    """
+
+    output = run(
+        ["addr2line", "-e", path] + [hex(address) for address in addresses],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    results = []
+    for line in output.splitlines():
+        filename, line_number = line.split(" ")[0].rsplit(":", 1)
+        results.append(
+            None if filename == "??" else (filename, int(line_number))
+        )
+    return results
+
+
+def test_lines_match_addr2line(debug_file):
+    addresses = get_text_addresses(debug_file)
+    with open(debug_file, "rb") as file:
+        index = DwarfLineIndex(file)
+        lines = [index.lookup(address) for address in addresses]
+
+    assert lines == addr2line(debug_file, addresses)
+    assert lines[0][0].endswith("test.c")
+    assert lines[0][1] == 7
+
+
+def test_cli_addr2line(debug_file):
+    address = get_text_addresses(debug_file)[0]
+    process = run_cli("addr2line", debug_file, hex(address))
+    assert process.returncode == 0
+    assert b"helper+0x0 .text " in process.stdout
+    assert b"test.c:7" in process.stdout
@@ -0,0 +1,76 @@
+"""
+This file tests the functions boundaries from .eh_frame_hdr.
+"""
+
+from io import BytesIO
+from shutil import which
+from subprocess import run
+
+import pytest
+
+from ElfAnalyzer import (
+    EhFrameIndex,
+    get_raw_string,
+    parse_elflayout,
+    read_raw_symbols,
+)
+from conftest import set_header_fields, source
+
+
+def get_functions(data: bytes):
+    """
+    This function returns (start, end) of the test functions.
+    """
+
+    file = BytesIO(data)
+    layout = parse_elflayout(file)
+    return {
+        get_raw_string(strings, name): (value, value + size)
+        for _, table, strings in read_raw_symbols(file, layout)
+        for name, _, _, _, value, size in table
+        if get_raw_string(strings, name) in ("helper", "main")
+    }
+
+
+def check_functions(index: EhFrameIndex, functions) -> None:
+    """
+    This function checks functions boundaries in the index.
+    """
+
+    for start, end in functions.values():
+        assert index.lookup(start) == (start, end)
+        assert index.lookup(end - 1) == (start, end)
+        assert index.lookup(end) != (start, end)
+
+    starts, ends = index.get_ranges()
+    assert list(starts) == sorted(starts)
+    assert all(start < end for start, end in zip(starts, ends))
+
+
+def test_boundaries(elf_data):
+    functions = get_functions(elf_data)
+    check_functions(EhFrameIndex(BytesIO(elf_data)), functions)
+    assert EhFrameIndex(BytesIO(elf_data)).lookup(0) is None
+
+
+def test_without_sections_headers(elf_data):
+    functions = get_functions(elf_data)
+    stripped = set_header_fields(elf_data, e_shoff=0, e_shnum=0, e_shstrndx=0)
+    check_functions(EhFrameIndex(BytesIO(stripped)), functions)
+
+
+def test_without_eh_frame_hdr(tmp_path):
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required")
+
+    (tmp_path / "test.c").write_text(source)
+    path = tmp_path / "test"
+    command = [compiler, "-Wl,--no-eh-frame-hdr", "-o", str(path), "test.c"]
+    if run(command + ["-lm"], cwd=tmp_path).returncode:
+        pytest.skip("the linker cannot remove .eh_frame_hdr")
+
+    data = path.read_bytes()
+    layout = parse_elflayout(BytesIO(data))
+    assert ".eh_frame_hdr" not in [section.name for section in layout.sections]
+    check_functions(EhFrameIndex(BytesIO(data)), get_functions(data))
@@ -0,0 +1,58 @@
+"""
+This file tests the single pass file, sections and segments hashes.
+"""
+
+from hashlib import new
+
+import pytest
+
+from ElfAnalyzer import SectionHeaderType, hash_elffile, parse_elffile
+from conftest import run_cli
+
+
+def expected_hash(data: bytes, start: int, end: int, algorithm: str) -> str:
+    """
+    This function returns the hash of the data range.
+    """
+
+    return new(algorithm, data[start:end]).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "chunk_size, threads", [(4194304, 0), (4096, 0), (4096, 4), (1000, 2)]
+)
+def test_hashes(elf_file, elf_data, chunk_size, threads):
+    with open(elf_file, "rb") as file:
+        _, _, programs_headers, elf_sections, *_ = parse_elffile(file)
+        hashes = hash_elffile(
+            file,
+            elf_sections,
+            programs_headers,
+            ("md5", "sha256"),
+            chunk_size,
+            threads,
+        )
+
+    assert hashes["file"]["File"]["sha256"][2] == expected_hash(
+        elf_data, 0, None, "sha256"
+    )
+
+    sections = {section.name: section for section in elf_sections}
+    for name, section_hashes in hashes["sections"].items():
+        start, end, hexdigest = section_hashes["md5"]
+        section = sections[name]
+        assert start == section.sh_offset.value.value
+        if section.sh_type.value.value == SectionHeaderType.SHT_NOBITS.value:
+            assert end == start
+        assert hexdigest == expected_hash(elf_data, start, end, "md5")
+
+    assert len(hashes["segments"]) == len(programs_headers)
+    for name, segment_hashes in hashes["segments"].items():
+        start, end, hexdigest = segment_hashes["sha256"]
+        assert hexdigest == expected_hash(elf_data, start, end, "sha256")
+
+
+def test_cli_hashes(elf_file, elf_data):
+    process = run_cli("-c", "-H", elf_file)
+    assert process.returncode == 0
+    assert new("sha1", elf_data).hexdigest().encode() in process.stdout
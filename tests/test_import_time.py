@@ -0,0 +1,63 @@
+"""
+This file tests the import time budget of ElfAnalyzer.
+"""
+
+from os import environ
+from os.path import dirname, abspath
+from subprocess import run
+from sys import executable
+
+root = dirname(dirname(abspath(__file__)))
+heavy_modules = {
+    "EntropyAnalysis",
+    "matplotlib",
+    "urllib.request",
+    "multiprocessing",
+    "concurrent.futures",
+    "http.server",
+    "socketserver",
+    "json",
+    "pickle",
+    "lzma",
+}
+
+
+def import_time(code: str):
+    """
+    This function runs python -X importtime and returns the process
+    stdout and a dictionary of module names to cumulative time (us).
+    """
+
+    environment = dict(environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = run(
+        [executable, "-X", "importtime", "-c", code],
+        cwd=root,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return process.stdout, modules
+
+
+def test_import_prints_nothing():
+    import_time("import ElfAnalyzer")
+    stdout, _ = import_time("import ElfAnalyzer")
+    assert stdout == ""
+
+
+def test_import_budget():
+    import_time("import ElfAnalyzer")
+    _, baseline = import_time("pass")
+    _, modules = import_time("import ElfAnalyzer")
+    new_modules = set(modules) - set(baseline)
+    assert not heavy_modules & new_modules
+    assert len(new_modules) < 80
+    assert modules["ElfAnalyzer"] < 500000
@@ -0,0 +1,102 @@
+"""
+This file tests the raw layout and the imports/exports fingerprint.
+"""
+
+from io import BytesIO
+
+import pytest
+
+from ElfAnalyzer import (
+    fingerprint_elffile,
+    get_elffile_dependencies,
+    parse_elffile,
+    parse_elflayout,
+    read_raw_dynamic,
+    read_raw_dynamic_symbols,
+)
+from conftest import set_header_fields
+
+
+@pytest.mark.parametrize("build", ["executable", "library", "object"])
+def test_layout_matches_parser(elf_files, build):
+    if build not in elf_files:
+        pytest.skip(f"the C compiler cannot build {build}")
+
+    with open(elf_files[build], "rb") as file:
+        _, elf_headers, programs_headers, elf_sections, *_ = parse_elffile(
+            file
+        )
+        layout = parse_elflayout(file)
+
+    assert layout.elf_classe == "64"
+    assert layout.type == elf_headers.e_type.value.value
+    assert layout.entry == elf_headers.e_entry.value.value
+    assert [
+        (section.name, section.type, section.offset, section.size)
+        for section in layout.sections
+    ] == [
+        (
+            section.name,
+            section.sh_type.value.value,
+            section.sh_offset.value.value,
+            section.sh_size.value.value,
+        )
+        for section in elf_sections
+    ]
+    assert [
+        (segment.type, segment.offset, segment.filesz)
+        for segment in layout.segments
+    ] == [
+        (
+            program.p_type.value.value,
+            program.p_offset.value.value,
+            program.p_filesz.value.value,
+        )
+        for program in programs_headers
+    ]
+
+
+def test_dependencies(elf_file):
+    with open(elf_file, "rb") as file:
+        needed, imports, exports = get_elffile_dependencies(file)
+
+    assert "libc.so.6" in needed
+    assert any(name.startswith("printf@GLIBC_") for name in imports)
+    assert any(name.startswith("sqrt@GLIBC_") for name in imports)
+    assert "__gmon_start__" in imports
+
+
+def test_without_sections_headers(elf_data):
+    stripped = set_header_fields(elf_data, e_shoff=0, e_shnum=0, e_shstrndx=0)
+    file = BytesIO(elf_data)
+    stripped_file = BytesIO(stripped)
+    layout = parse_elflayout(stripped_file)
+    assert layout.sections == []
+
+    symbols, strings = read_raw_dynamic_symbols(file, parse_elflayout(file))
+    assert read_raw_dynamic_symbols(stripped_file, layout) == (
+        symbols,
+        strings,
+    )
+    assert read_raw_dynamic(stripped_file, layout) == read_raw_dynamic(
+        file, parse_elflayout(file)
+    )
+    assert get_elffile_dependencies(stripped_file) == (
+        get_elffile_dependencies(file)
+    )
+
+
+def test_fingerprint_is_stable(elf_files):
+    if "compressed" not in elf_files:
+        pytest.skip("the C compiler cannot compress debug sections")
+
+    fingerprints = set()
+    for build in ("executable", "compressed"):
+        with open(elf_files[build], "rb") as file:
+            fingerprints.add(fingerprint_elffile(file))
+
+    with open(elf_files["library"], "rb") as file:
+        library = fingerprint_elffile(file)
+
+    assert len(fingerprints) == 1
+    assert library not in fingerprints
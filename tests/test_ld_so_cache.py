@@ -0,0 +1,128 @@
+"""
+This file tests the ld.so.cache parser and the libraries lookups.
+"""
+
+from os.path import exists
+from shutil import copyfile
+from struct import pack
+
+import pytest
+
+from ElfAnalyzer import (
+    DependencyResolver,
+    ElfMachine,
+    get_ld_so_cache_index,
+    parse_ld_so_cache,
+)
+
+x86_64 = ElfMachine.AMD_X86_64.value
+i386 = ElfMachine.INTEL_80386.value
+entries = [
+    ("libc.so.6", "/lib/haswell/libc.so.6", 0x0303, 1),
+    ("libc.so.6", "/lib64/libc.so.6", 0x0303, 0),
+    ("libc.so.6", "/lib/libc.so.6", 0x0003, 0),
+    ("libm.so.6", "/weird/libm.so.6", 0x0303, 0),
+    ("libx32.so", "/libx32/libx32.so", 0x0803, 0),
+]
+
+
+def build_new_cache(entries, order="<") -> bytes:
+    """
+    This function builds a "glibc-ld.so.cache1.1" cache.
+    """
+
+    strings_offset = 48 + len(entries) * 24
+    strings = b""
+    table = b""
+    for soname, path, flags, hwcap in entries:
+        key = strings_offset + len(strings)
+        strings += soname.encode() + b"\0"
+        value = strings_offset + len(strings)
+        strings += path.encode() + b"\0"
+        table += pack(order + "iIIIQ", flags, key, value, 0, hwcap)
+
+    return (
+        b"glibc-ld.so.cache1.1"
+        + pack(order + "II", len(entries), len(strings))
+        + bytes([2 if order == "<" else 3, 0, 0, 0])
+        + bytes(16)
+        + table
+        + strings
+    )
+
+
+def build_old_cache(entries, new_cache: bytes = b"") -> bytes:
+    """
+    This function builds a "ld.so-1.7.0" cache (followed
+    by the aligned new cache when new_cache is defined).
+    """
+
+    strings = b""
+    table = b""
+    for soname, path, flags, _ in entries:
+        key = len(strings)
+        strings += soname.encode() + b"\0"
+        value = len(strings)
+        strings += path.encode() + b"\0"
+        table += pack("<iII", flags, key, value)
+
+    data = b"ld.so-1.7.0\0" + pack("<I", len(entries)) + table
+    if new_cache:
+        return data + bytes(-len(data) % 8) + new_cache
+    return data + strings
+
+
+@pytest.mark.parametrize("order", ["<", ">"])
+def test_new_format(order):
+    assert parse_ld_so_cache(build_new_cache(entries, order)) == entries
+
+
+def test_old_and_combined_formats():
+    old = [(soname, path, flags, 0) for soname, path, flags, _ in entries]
+    assert parse_ld_so_cache(build_old_cache(entries)) == old
+    assert (
+        parse_ld_so_cache(build_old_cache(entries, build_new_cache(entries)))
+        == entries
+    )
+
+    with pytest.raises(ValueError):
+        parse_ld_so_cache(b"not a cache" + bytes(64))
+
+
+def test_index_by_class_and_machine():
+    assert get_ld_so_cache_index(entries, "64", x86_64) == {
+        "libc.so.6": "/lib64/libc.so.6",
+        "libm.so.6": "/weird/libm.so.6",
+    }
+    hwcaps = get_ld_so_cache_index(entries, "64", x86_64, True)
+    assert hwcaps["libc.so.6"] == "/lib/haswell/libc.so.6"
+    assert get_ld_so_cache_index(entries, "32", i386) == {
+        "libc.so.6": "/lib/libc.so.6"
+    }
+    assert get_ld_so_cache_index(entries, "32", x86_64) == {
+        "libx32.so": "/libx32/libx32.so"
+    }
+
+
+@pytest.mark.skipif(
+    not exists("/etc/ld.so.cache"), reason="no host ld.so.cache"
+)
+def test_host_cache():
+    with open("/etc/ld.so.cache", "rb") as file:
+        cache = parse_ld_so_cache(file.read())
+
+    assert any(soname == "libc.so.6" for soname, *_ in cache)
+
+
+def test_resolver_uses_sysroot_cache(elf_files, tmp_path):
+    for directory in ("bin", "weird", "etc"):
+        (tmp_path / directory).mkdir()
+    copyfile(elf_files["executable"], tmp_path / "bin" / "app")
+    copyfile(elf_files["library"], tmp_path / "weird" / "libm.so.6")
+    (tmp_path / "etc" / "ld.so.cache").write_bytes(build_new_cache(entries))
+
+    graph = DependencyResolver(str(tmp_path)).resolve("/bin/app")
+    assert dict(graph["/bin/app"]) == {
+        "libm.so.6": "/weird/libm.so.6",
+        "libc.so.6": None,
+    }
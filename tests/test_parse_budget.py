@@ -0,0 +1,190 @@
+"""
+This file tests the parse budget on forged headers.
+"""
+
+from io import BytesIO
+from json import loads
+from struct import pack_into, unpack_from
+
+import pytest
+
+from ElfAnalyzer import (
+    ParseBudget,
+    ParseBudgetError,
+    analyze_elffile,
+    get_elffile_dependencies,
+    get_section_data,
+    parse_elffile,
+    parse_elflayout,
+    read_dynamic_info,
+    read_section_data,
+)
+from conftest import run_cli, set_header_fields
+
+
+def get_section_header(data, name):
+    """
+    This function returns the index and the header offset
+    of a section of a 64 bits little endian ELF file.
+    """
+
+    e_shoff = unpack_from("<Q", data, 0x28)[0]
+    for index, section in enumerate(parse_elflayout(BytesIO(data)).sections):
+        if section.name == name:
+            return section, e_shoff + index * 64
+    raise KeyError(name)
+
+
+def forge_section_field(data, name, field_offset, format, value):
+    data = bytearray(data)
+    pack_into(
+        format, data, get_section_header(data, name)[1] + field_offset, value
+    )
+    return bytes(data)
+
+
+def test_forged_shstrtab_size(elf_data):
+    data = forge_section_field(elf_data, ".shstrtab", 32, "<Q", 6 << 30)
+    layout = parse_elflayout(BytesIO(data))
+    assert ".text" in {section.name for section in layout.sections}
+    assert ".text" in {
+        str(section.name) for section in parse_elffile(BytesIO(data))[3]
+    }
+
+    with pytest.raises(ParseBudgetError):
+        parse_elflayout(BytesIO(data), ParseBudget(BytesIO(data), 4096))
+
+
+def test_forged_shnum(elf_data):
+    data = set_header_fields(elf_data, e_shnum=0xFFFF)
+    layout = parse_elflayout(BytesIO(data))
+    assert len(layout.sections) * 64 <= len(data)
+    assert len(parse_elffile(BytesIO(data))[3]) == len(layout.sections)
+
+    with pytest.raises(ParseBudgetError) as error:
+        parse_elffile(BytesIO(data), ParseBudget(BytesIO(data), None, 10))
+    assert error.value.partial[1] is not None
+    assert error.value.partial[3] is None
+
+
+@pytest.mark.parametrize("field", ["e_phoff", "e_shoff"])
+def test_forged_table_offset(elf_data, elf_file, tmp_path, field):
+    data = set_header_fields(elf_data, **{field: (1 << 63) + 8})
+    path = tmp_path / "forged"
+    path.write_bytes(data)
+
+    for file in (BytesIO(data), open(path, "rb")):
+        with file:
+            with pytest.raises(ParseBudgetError) as error:
+                parse_elffile(file)
+            assert error.value.partial[1] is not None
+            with pytest.raises(ParseBudgetError):
+                parse_elflayout(file)
+
+    process = run_cli("-c", str(path))
+    assert b"Partial result:" in process.stderr
+    assert b"Traceback" not in process.stderr
+
+
+def test_forged_note_sizes(elf_data):
+    section, _ = get_section_header(elf_data, ".note.gnu.build-id")
+    data = bytearray(elf_data)
+    pack_into("<II", data, section.offset, 0xFFFFFFF0, 0xFFFFFFF0)
+
+    notes = parse_elffile(BytesIO(bytes(data)))[7]
+    note = next(
+        note
+        for note in notes
+        if note.name._start_position_ == section.offset + 12
+    )
+    assert len(note.name) == section.size - 12
+    assert len(note.descriptor) == 0
+
+
+def test_dynamic_without_null(elf_data):
+    section, _ = get_section_header(elf_data, ".dynamic")
+    data = bytearray(elf_data)
+    for offset in range(section.offset, section.offset + section.size, 16):
+        if not unpack_from("<q", data, offset)[0]:
+            pack_into("<q", data, offset, 21)
+
+    dynamic = parse_elffile(BytesIO(bytes(data)))[8]
+    assert len(dynamic) == section.size // 16
+    assert all(entry.dynamic_tag.value.value for entry in dynamic)
+
+
+def test_read_section_data(elf_files, elf_data):
+    section, _ = get_section_header(elf_data, ".text")
+    file = BytesIO(elf_data)
+    assert (
+        read_section_data(file, ".text", section.offset, 1 << 62, 0, 1, "64")
+        == elf_data[section.offset :]
+    )
+    assert (
+        read_section_data(file, ".text", 1 << 63, section.size, 0, 1, "64")
+        == b""
+    )
+    with pytest.raises(ParseBudgetError):
+        read_section_data(
+            file,
+            ".text",
+            section.offset,
+            section.size,
+            0,
+            1,
+            "64",
+            budget=ParseBudget(file, section.size - 1),
+        )
+
+    with open(elf_files["compressed"], "rb") as file:
+        sections = parse_elffile(file)[3]
+        debug_info = next(
+            section for section in sections if section.name == ".debug_info"
+        )
+        assert len(get_section_data(file, debug_info, "64")) > 100
+        with pytest.raises(ParseBudgetError):
+            get_section_data(
+                file, debug_info, "64", budget=ParseBudget(file, 100)
+            )
+
+
+def forge_interpreter_size(data, size):
+    """
+    This function returns a copy of a 64 bits little endian ELF
+    file with a forged PT_INTERP p_filesz.
+    """
+
+    data = bytearray(data)
+    (e_phoff,) = unpack_from("<Q", data, 0x20)
+    (e_phnum,) = unpack_from("<H", data, 0x38)
+    for index in range(e_phnum):
+        offset = e_phoff + index * 56
+        if unpack_from("<I", data, offset)[0] == 3:
+            pack_into("<Q", data, offset + 32, size)
+    return bytes(data)
+
+
+def test_forged_dynamic_and_interpreter(elf_data, tmp_path):
+    data = forge_interpreter_size(
+        forge_section_field(elf_data, ".dynamic", 32, "<Q", 1 << 40),
+        1 << 40,
+    )
+    information = read_dynamic_info(BytesIO(data), None)
+    assert "libc.so.6" in information.needed
+    assert information.interpreter.startswith("/")
+    assert get_elffile_dependencies(BytesIO(data))[0] == information.needed
+    assert analyze_elffile(BytesIO(data), "size")["needed"] == (
+        information.needed
+    )
+
+    directory = tmp_path / "corpus"
+    directory.mkdir()
+    (directory / "forged").write_bytes(data)
+    process = run_cli("stats", "-p", "0", str(directory))
+    assert process.returncode == 0
+    assert loads(process.stdout)["counts"]["elf"] == 1
+
+    output = tmp_path / "scan.ndjson"
+    process = run_cli("batch", "-p", "0", str(directory), str(output))
+    assert process.returncode == 0
+    assert loads(output.read_bytes())["needed"] == information.needed
@@ -0,0 +1,76 @@
+"""
+This file tests the PLT stubs and GOT slots map.
+"""
+
+from re import finditer
+from shutil import which
+from subprocess import run
+
+import pytest
+
+from ElfAnalyzer import PltEntry, PltMap
+from conftest import source
+
+variants = {
+    "lazy": [],
+    "now": ["-Wl,-z,now"],
+    "ibt": ["-fcf-protection=full", "-Wl,-z,ibtplt"],
+}
+
+
+@pytest.fixture(scope="module", params=list(variants))
+def plt_file(request, tmp_path_factory):
+    """
+    This fixture builds the test source with PLT variants.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None or which("objdump") is None:
+        pytest.skip("a C compiler and objdump are required")
+
+    directory = tmp_path_factory.mktemp(request.param)
+    (directory / "test.c").write_text(source)
+    path = str(directory / "test")
+    command = [compiler, *variants[request.param], "-o", path, "test.c"]
+    if run(command + ["-lm"], cwd=directory).returncode:
+        pytest.skip(f"the C compiler cannot build {request.param}")
+    return path
+
+
+def test_plt_entries(elf_file):
+    with open(elf_file, "rb") as file:
+        plt = PltMap(file)
+
+    entries = {entry.symbol: entry for entry in plt.entries}
+    assert {"printf", "sqrt"} <= set(entries)
+
+    for entry in entries.values():
+        assert str(entry) == entry.symbol + "@plt"
+        assert plt.lookup(entry.address) is entry
+        assert plt.lookup(entry.address + plt.entry_size - 1) is entry
+        assert plt.lookup_got(entry.got) is entry
+
+    assert plt.lookup(0) is None
+
+
+def test_plt_matches_objdump(plt_file):
+    output = run(
+        ["objdump", "-d", "-j", ".plt", "-j", ".plt.sec", plt_file],
+        capture_output=True,
+        text=True,
+    ).stdout
+    expected = {
+        match.group(2): int(match.group(1), 16)
+        for match in finditer(r"([0-9a-f]+) <(\w+)@plt>:", output)
+    }
+
+    with open(plt_file, "rb") as file:
+        plt = PltMap(file)
+
+    assert expected
+    assert {entry.symbol: entry.address for entry in plt.entries} == expected
+
+
+def test_unnamed_entry():
+    assert str(PltEntry(0x1020, 0x4018, None)) == "*ABS*+0x4018@plt"
+    assert str(PltEntry(0x1020, 0x4018, "printf")) == "printf@plt"
@@ -0,0 +1,160 @@
+"""
+This file tests the section data reader and its decompression cache.
+"""
+
+from io import BytesIO
+from lzma import LZMADecompressor, compress as lzma_compress
+from tracemalloc import get_traced_memory, start, stop
+from zlib import compress, decompressobj
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import (
+    FileView,
+    SectionHeaderType,
+    decompress_stream,
+    decompressed_sections,
+    get_file_key,
+    get_zstd_decompressor,
+    parse_elflayout,
+    read_section_data,
+)
+
+progbits = SectionHeaderType.SHT_PROGBITS.value
+
+
+def zdebug_file(payload: bytes) -> bytes:
+    """
+    This function returns a legacy .zdebug section content.
+    """
+
+    return b"ZLIB" + len(payload).to_bytes(8, "big") + compress(payload, 0)
+
+
+class UnkeyedFile:
+    """
+    This class implements a seekable file without fileno or buffer.
+    """
+
+    def __init__(self, data: bytes):
+        self.file = BytesIO(data)
+        self.read = self.file.read
+        self.seek = self.file.seek
+        self.tell = self.file.tell
+
+
+def test_memory_file_id_reuse():
+    decompressed_sections.clear()
+    for index in range(64):
+        payload = bytes([index % 256]) * 4096
+        data = zdebug_file(payload)
+        file = BytesIO(data)
+        section = read_section_data(
+            file, ".zdebug_info", 0, len(data), 0, progbits, "64"
+        )
+        assert section == payload
+        del file
+
+
+def test_file_keys():
+    data = b"\x00" * 64
+    assert get_file_key(BytesIO(data)) == get_file_key(BytesIO(data))
+    assert get_file_key(BytesIO(data)) != get_file_key(BytesIO(b"\x01"))
+    assert get_file_key(UnkeyedFile(data)) is None
+
+    file = BytesIO(data)
+    assert get_file_key(FileView(file, 0, 32)) != get_file_key(
+        FileView(file, 32, 32)
+    )
+
+
+def test_memory_file_key_is_computed_once(monkeypatch):
+    digests = []
+    digest = ElfAnalyzer.blake2b
+
+    def blake2b(data, **kwargs):
+        digests.append(len(data))
+        return digest(data, **kwargs)
+
+    monkeypatch.setattr(ElfAnalyzer, "blake2b", blake2b)
+    file = BytesIO(b"\x00" * 64)
+    key = get_file_key(file)
+    assert get_file_key(file) == key
+    assert get_file_key(FileView(file, 0, 32))[0] == key
+    assert digests == [64]
+
+
+def test_unkeyed_file_bypasses_cache():
+    decompressed_sections.clear()
+    data = zdebug_file(b"payload")
+    section = read_section_data(
+        UnkeyedFile(data), ".zdebug_info", 0, len(data), 0, progbits, "64"
+    )
+    assert section == b"payload"
+    assert not decompressed_sections
+
+
+def test_view_cache_is_bounded_to_view():
+    decompressed_sections.clear()
+    first = zdebug_file(b"A" * 100)
+    second = zdebug_file(b"B" * 100)
+    file = BytesIO(first + second)
+    for start, expected in ((0, b"A"), (len(first), b"B")):
+        view = FileView(file, start, len(first))
+        section = read_section_data(
+            view, ".zdebug_info", 0, len(first), 0, progbits, "64"
+        )
+        assert section == expected * 100
+
+
+def test_compressed_sections(elf_files):
+    if "compressed" not in elf_files:
+        pytest.skip("the C compiler cannot compress debug sections")
+
+    with open(elf_files["compressed"], "rb") as file:
+        layout = parse_elflayout(file)
+        sections = {section.name: section for section in layout.sections}
+        info = sections[".debug_info"]
+        data = read_section_data(
+            file,
+            info.name,
+            info.offset,
+            info.size,
+            info.flags,
+            info.type,
+            layout.elf_classe,
+        )
+
+    assert len(data) > info.size
+    assert data[4:6] in (b"\x04\x00", b"\x05\x00")
+
+
+@pytest.mark.parametrize("kind", ["zlib", "lzma", "zstd"])
+def test_decompression_is_bounded(kind):
+    payload = b"\x00" * 67108864
+    if kind == "zlib":
+        data, decompressor = compress(payload), decompressobj
+    elif kind == "lzma":
+        data, decompressor = lzma_compress(payload), LZMADecompressor
+    else:
+        if get_zstd_decompressor() is None:
+            pytest.skip("zstd is not available")
+        from zstandard import ZstdCompressor
+
+        data = ZstdCompressor().compress(payload)
+        decompressor = get_zstd_decompressor
+
+    file = BytesIO(b"padding" + data)
+    file.seek(7)
+    start()
+    try:
+        assert decompress_stream(file, len(data), decompressor(), 1000) == (
+            payload[:1000]
+        )
+        assert get_traced_memory()[1] < 16777216
+    finally:
+        stop()
+
+    file.seek(7)
+    assert decompress_stream(file, len(data), decompressor()) == payload
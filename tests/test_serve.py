@@ -0,0 +1,154 @@
+"""
+This file tests the analysis daemon.
+"""
+
+from base64 import b64encode
+from json import loads
+from os.path import join
+from stat import S_IMODE
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import AnalysisClient, AnalysisServer
+from conftest import root, run_cli, set_header_fields
+
+
+def test_handle(elf_file, elf_data):
+    server = AnalysisServer(8)
+    response = server.handle({"path": elf_file, "detail": "layout"})
+    assert response["cached"] is False
+    assert response["result"]["class"] == "64"
+    assert server.handle({"path": elf_file, "detail": "layout"})["cached"]
+
+    response = server.handle({"data": b64encode(elf_data).decode()})
+    assert "libc.so.6" in response["result"]["needed"]
+    assert server.handle({}, elf_data) == {**response, "cached": True}
+
+
+@pytest.mark.parametrize(
+    "request_, error",
+    [
+        ([], "Invalid request: JSON object expected"),
+        ({"path": "/bin/ls", "detail": "all"}, "Invalid detail level: 'all'"),
+        ({"path": "/bin/ls", "detail": ["layout"]}, "Invalid detail level"),
+        ({"detail": "layout"}, "Missing request field: 'path'"),
+        ({"path": 1}, "Missing request field: 'path'"),
+        ({"data": 1}, "Invalid request: base64 data expected"),
+        ({"data": "@@"}, "Error: "),
+        ({"path": "/nonexistent"}, "FileNotFoundError: "),
+    ],
+)
+def test_invalid_requests(request_, error):
+    assert AnalysisServer().handle(request_)["error"].startswith(error)
+
+
+def test_analysis_errors(elf_data, monkeypatch):
+    server = AnalysisServer()
+    forged = set_header_fields(elf_data, e_phoff=(1 << 63) + 8)
+    assert server.handle({}, forged)["error"].startswith("ParseBudgetError: ")
+
+    for exception in (KeyError("e_type"), IndexError("index"), MemoryError()):
+
+        def analyze_elffile(file, detail):
+            raise exception
+
+        monkeypatch.setattr(ElfAnalyzer, "analyze_elffile", analyze_elffile)
+        response = server.handle({"detail": "size"}, elf_data)
+        assert response == {
+            "error": f"{exception.__class__.__name__}: {exception}"
+        }
+
+
+def start_daemon(address, **kwargs):
+    """
+    This function starts the analysis daemon and waits for it.
+    """
+
+    from socket import AF_INET, AF_UNIX, socket
+    from subprocess import PIPE, Popen
+    from sys import executable
+    from time import sleep
+
+    process = Popen(
+        [executable, join(root, "ElfAnalyzer.py"), "serve", str(address)],
+        stdout=PIPE,
+        stderr=PIPE,
+        **kwargs,
+    )
+    for _ in range(100):
+        with socket(AF_INET if isinstance(address, int) else AF_UNIX) as s:
+            try:
+                s.connect(
+                    ("127.0.0.1", address)
+                    if isinstance(address, int)
+                    else str(address)
+                )
+            except OSError:
+                sleep(0.05)
+            else:
+                return process
+    process.kill()
+    pytest.fail(process.communicate()[1].decode())
+
+
+def stop_daemon(process):
+    from signal import SIGTERM
+
+    process.send_signal(SIGTERM)
+    return process.communicate(timeout=10)
+
+
+def test_unix_socket(elf_file, tmp_path):
+    address = tmp_path / "daemon.sock"
+    address.symlink_to(tmp_path / "target")
+    (tmp_path / "target").write_text("kept")
+    process = run_cli("serve", str(address), timeout=10)
+    assert process.returncode == 1
+    assert b"is not a Unix socket" in process.stderr
+    assert (tmp_path / "target").read_text() == "kept"
+
+    address.unlink()
+    process = start_daemon(address)
+    try:
+        assert S_IMODE(address.stat().st_mode) & 0o077 == 0
+        client = run_cli("client", "-d", "layout", str(address), elf_file)
+        assert client.returncode == 0
+        lines = client.stdout.splitlines()
+        assert len(lines) == 1
+        assert loads(lines[0])["path"] == elf_file
+        assert loads(lines[0])["result"]["class"] == "64"
+        assert not client.stderr.strip().startswith(b"{")
+    finally:
+        stop_daemon(process)
+
+    process = start_daemon(address)
+    stop_daemon(process)
+    assert not address.exists()
+
+
+def test_http_token(elf_file):
+    from os import environ
+    from socket import socket
+
+    with socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    process = start_daemon(port, env={**environ, "ELFANALYZER_TOKEN": "t0k"})
+    address = f"http://127.0.0.1:{port}/"
+    try:
+        response = AnalysisClient(address).analyze(elf_file, detail="layout")
+        assert response == {"error": "Unauthorized: invalid token"}
+        response = AnalysisClient(address, "bad").analyze(elf_file)
+        assert response == {"error": "Unauthorized: invalid token"}
+
+        client = AnalysisClient(address, "t0k")
+        response = client.analyze(elf_file, detail="layout")
+        assert response["result"]["class"] == "64"
+        with open(elf_file, "rb") as file:
+            response = client.analyze(data=file.read(), detail="layout")
+        assert response["result"]["class"] == "64"
+    finally:
+        stderr = stop_daemon(process)[1]
+    assert b"Bearer t0k" in stderr
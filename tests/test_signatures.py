@@ -0,0 +1,146 @@
+"""
+This file tests the bytes signatures scanner and its automaton cache.
+"""
+
+from json import dump, load
+from os import chmod, listdir
+
+import pytest
+
+from ElfAnalyzer import (
+    SignatureScanner,
+    parse_elffile,
+    parse_signature,
+    parse_signatures_file,
+)
+
+secret = b"HelloSecretString"
+signatures = {
+    "secret": secret[:5].hex() + " ?? ?? " + secret[7:].hex(),
+    "short": "48 65",
+    "missing": "de ad be ef ?? 00",
+}
+
+
+def scan(path: str, scanner: SignatureScanner):
+    """
+    This function returns signatures matches in the ELF file.
+    """
+
+    with open(path, "rb") as file:
+        _, _, programs_headers, elf_sections, symbols_tables, *_ = (
+            parse_elffile(file)
+        )
+        return list(
+            scanner.scan_elffile(
+                file,
+                elf_sections,
+                programs_headers,
+                symbols_tables,
+                chunk_size=16,
+            )
+        )
+
+
+def test_parse_signature():
+    assert parse_signature("55 48 ?? e5 89 41 ?? 48") == (
+        8,
+        3,
+        b"\xe5\x89\x41",
+        ((0, b"\x55\x48"), (7, b"\x48")),
+    )
+    with pytest.raises(ValueError):
+        parse_signature("?? ??")
+    assert parse_signatures_file(["# comment", "", "a: 00 ??"]) == {
+        "a": "00 ??"
+    }
+
+
+def test_scan_elffile(elf_file, elf_data):
+    matches = scan(elf_file, SignatureScanner(signatures))
+    found = [match for match in matches if match.name == "secret"]
+    assert len(found) == 1
+    assert found[0].section == ".rodata"
+    assert elf_data[found[0].offset :].startswith(secret)
+    assert not [match for match in matches if match.name == "missing"]
+    assert len([match for match in matches if match.name == "short"]) >= 1
+
+
+def test_automaton_json_cache(elf_file, tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    expected = scan(elf_file, SignatureScanner(signatures))
+    first = SignatureScanner(signatures, str(directory))
+
+    names = listdir(directory)
+    assert len(names) == 1 and names[0].endswith(".json")
+    assert (directory / names[0]).stat().st_mode & 0o077 == 0
+    with open(directory / names[0]) as file:
+        assert len(load(file)) == 3
+
+    monkeypatch.setattr(
+        SignatureScanner,
+        "build_automaton",
+        lambda self: pytest.fail("the cached automaton is not used"),
+    )
+    second = SignatureScanner(signatures, str(directory))
+    assert (second.goto, second.fail, second.outputs) == (
+        first.goto,
+        first.fail,
+        first.outputs,
+    )
+    assert scan(elf_file, second) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        "[[], [], []]",
+        "[[[[0, 99]]], [0], [[]]]",
+        '{"goto": 1, "fail": 2, "outputs": 3}',
+    ],
+)
+def test_invalid_cache_is_rebuilt(tmp_path, content):
+    directory = tmp_path / "cache"
+    scanner = SignatureScanner(signatures, str(directory))
+    with open(scanner.cache_path, "w") as file:
+        file.write(content)
+
+    assert scanner.load_automaton() is None
+    rebuilt = SignatureScanner(signatures, str(directory))
+    assert rebuilt.goto == scanner.goto
+
+
+def test_writable_cache_is_ignored(tmp_path):
+    directory = tmp_path / "cache"
+    scanner = SignatureScanner(signatures, str(directory))
+    assert scanner.load_automaton() is not None
+
+    chmod(scanner.cache_path, 0o666)
+    assert scanner.load_automaton() is None
+
+
+@pytest.mark.parametrize("corruption", ["cycle", "self", "unreachable"])
+def test_cyclic_cache_is_rebuilt(elf_file, tmp_path, corruption):
+    directory = tmp_path / "cache"
+    scanner = SignatureScanner(signatures, str(directory))
+    with open(scanner.cache_path) as file:
+        goto, fail, outputs = load(file)
+
+    last = len(fail) - 1
+    if corruption == "cycle":
+        fail[last], fail[last - 1] = last - 1, last
+    elif corruption == "self":
+        fail[last] = last
+    else:
+        goto.append([])
+        fail.append(0)
+        outputs.append([])
+
+    with open(scanner.cache_path, "w") as file:
+        dump([goto, fail, outputs], file)
+
+    assert scanner.load_automaton() is None
+    rebuilt = SignatureScanner(signatures, str(directory))
+    assert rebuilt.fail == scanner.fail
+    assert scan(elf_file, rebuilt) == scan(elf_file, scanner)
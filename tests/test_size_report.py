@@ -0,0 +1,88 @@
+"""
+This file tests the file and virtual memory size report.
+"""
+
+from os.path import getsize
+
+from ElfAnalyzer import diff_size_reports, get_size_report, sweep_ranges
+from conftest import run_cli
+
+
+def get_report(path: str):
+    """
+    This function returns the size report of an ELF file.
+    """
+
+    with open(path, "rb") as file:
+        return get_size_report(file)
+
+
+def test_sweep_ranges():
+    sizes, gaps = sweep_ranges(
+        [(10, 20, "a"), (15, 30, "b"), (12, 14, "c"), (40, 45, "d")], 0, 50
+    )
+    assert sizes == {"a": 10, "b": 10, "c": 0, "d": 5}
+    assert gaps == [(0, 10), (30, 40), (45, 50)]
+
+
+def test_sizes_cover_the_file(elf_file):
+    report = get_report(elf_file)
+    size = getsize(elf_file)
+
+    for category in ("segment", "section"):
+        assert (
+            sum(
+                entry.file_size
+                for entry in report
+                if entry.category == category
+            )
+            == size
+        )
+
+    sections = {
+        entry.name: entry for entry in report if entry.category == "section"
+    }
+    assert sections[".bss"].file_size == 0
+    assert sections[".bss"].vm_size > 0
+    assert sections[".comment"].vm_size == 0
+    assert sections["[ELF header]"].file_size == 64
+
+
+def test_symbols_sizes(elf_file):
+    symbols = {
+        entry.name: entry
+        for entry in get_report(elf_file)
+        if entry.category == "symbol"
+    }
+    assert symbols["main"].parent == ".text"
+    assert symbols["main"].file_size == symbols["main"].vm_size > 0
+    assert symbols["global_counter"].parent == ".data"
+
+
+def test_diff_reports(elf_files):
+    report = get_report(elf_files["executable"])
+    assert diff_size_reports(report, report) == []
+
+    differences = {
+        (entry.category, entry.name): entry
+        for entry in diff_size_reports(
+            report, get_report(elf_files["compressed"])
+        )
+    }
+    assert differences[("section", ".debug_info")].file_size < 0
+    assert differences[("section", ".debug_info")].vm_size == 0
+    assert ("symbol", "main") not in differences
+
+
+def test_cli_size_report(elf_files):
+    process = run_cli(
+        "--size-report",
+        "-c",
+        "-n",
+        "3",
+        elf_files["executable"],
+        elf_files["compressed"],
+    )
+    assert process.returncode == 0
+    assert b".debug_info" in process.stdout
+    assert b"Symbols sizes" in process.stdout
@@ -0,0 +1,88 @@
+"""
+This file tests the corpus statistics.
+"""
+
+from json import loads
+from shutil import copyfile
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import (
+    add_elffile_statistics,
+    get_corpus_statistics,
+    summarize_statistics,
+)
+from conftest import run_cli
+
+
+@pytest.fixture
+def corpus(elf_files, elf_data, tmp_path):
+    """
+    This fixture returns a directory of ELF and non ELF files.
+    """
+
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "lib").mkdir()
+    copyfile(elf_files["executable"], tmp_path / "bin" / "program")
+    copyfile(elf_files["library"], tmp_path / "lib" / "libtest.so")
+    (tmp_path / "README").write_text("not an ELF file")
+    (tmp_path / "bin" / "truncated").write_bytes(elf_data[:20])
+    return tmp_path
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_statistics(corpus, processes):
+    summary = summarize_statistics(
+        get_corpus_statistics(str(corpus), processes, chunk_size=1), 100
+    )
+    assert summary["counts"]["files"] == 4
+    assert summary["counts"]["elf"] == 3
+    assert summary["counts"]["errors"] == 1
+    assert summary["classes"] == {"ELF64 little": 2}
+    assert summary["needed"]["libc.so.6"] == 2
+    assert summary["sections"][".text"] == 2
+    assert sum(summary["sizes"].values()) == 3
+
+
+def test_processes_pool_matches(corpus):
+    assert get_corpus_statistics(str(corpus), 2, 1) == (
+        get_corpus_statistics(str(corpus), 0)
+    )
+
+
+def test_cli_stdout_is_json(corpus, tmp_path):
+    process = run_cli("stats", "-p", "1", "-n", "3", str(corpus))
+    assert process.returncode == 0
+    summary = loads(process.stdout)
+    assert summary["counts"]["elf"] == 3
+    assert len(summary["sections"]) == 3
+
+    output = tmp_path / "summary.json"
+    process = run_cli("stats", "-o", str(output), str(corpus))
+    assert process.stdout == b""
+    assert loads(output.read_text())["counts"]["elf"] == 3
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_file_errors(corpus, monkeypatch, processes):
+    def add_statistics(statistics, file, path):
+        if path.endswith("program"):
+            raise MemoryError()
+        return add_elffile_statistics(statistics, file, path)
+
+    monkeypatch.setattr(ElfAnalyzer, "add_elffile_statistics", add_statistics)
+    counts = get_corpus_statistics(str(corpus), processes, 1)["counts"]
+    assert counts["errors"] == 2
+    assert counts["files"] == 3
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [["-p"], ["-n"], ["-o"], ["-p", "x"], ["-n", "-1"]],
+)
+def test_cli_invalid_options(corpus, arguments):
+    process = run_cli("stats", str(corpus), *arguments)
+    assert process.returncode == 1
+    assert b"USAGES:" in process.stderr
+    assert b"Traceback" not in process.stderr
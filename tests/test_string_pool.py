@@ -0,0 +1,71 @@
+"""
+This file tests the strings pool used by the raw decoders.
+"""
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import (
+    StringPool,
+    WorkersPool,
+    get_batch_record,
+    get_raw_string,
+    parse_elflayout,
+    read_raw_comments,
+    set_string_pool,
+)
+
+
+def is_pool_enabled(argument):
+    """
+    This function returns whether the worker strings pool is enabled.
+    """
+
+    return ElfAnalyzer.string_pool is not None
+
+
+@pytest.fixture
+def pool():
+    """
+    This fixture enables the strings pool during a test.
+    """
+
+    yield set_string_pool(4)
+    set_string_pool(0)
+
+
+def test_intern_is_bounded():
+    strings = StringPool(2)
+    first = "".join(["sec", "tion"])
+    assert strings.intern(first) is first
+    assert strings.intern("".join(["sec", "tion"])) is first
+    strings.intern("a")
+    strings.intern("b")
+    assert len(strings) == 2
+    assert strings.intern("".join(["sec", "tion"])) is not first
+
+
+def test_raw_strings_are_interned(pool):
+    table = b"\0printf\0printf\0"
+    assert get_raw_string(table, 1) is get_raw_string(table, 8)
+    set_string_pool(0)
+    assert get_raw_string(table, 1) is not get_raw_string(table, 8)
+
+
+def test_raw_comments(elf_file):
+    with open(elf_file, "rb") as file:
+        comments = read_raw_comments(file, parse_elflayout(file))
+
+    assert any(comment.startswith("GCC: ") for comment in comments)
+
+
+def test_batch_record_comments(elf_file, tmp_path):
+    record = get_batch_record(str(tmp_path), elf_file)
+    assert any(comment.startswith("GCC: ") for comment in record["comments"])
+
+
+def test_workers_initializer():
+    pool = WorkersPool(is_pool_enabled, 2, initializer=set_string_pool)
+    results = [result for _, result, _ in pool.imap_unordered([(1, 0)] * 4)]
+    assert results == [True] * 4
+    assert ElfAnalyzer.string_pool is None
@@ -0,0 +1,97 @@
+"""
+This file tests the strings extraction from ELF sections.
+"""
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import (
+    extract_strings,
+    get_section_data,
+    main_strings,
+    parse_elffile,
+)
+from conftest import run_cli
+
+
+def get_strings(path: str, **kwargs):
+    """
+    This function returns the strings of the ELF file.
+    """
+
+    with open(path, "rb") as file:
+        elf_sections = parse_elffile(file)[3]
+        return list(extract_strings(file, elf_sections, **kwargs))
+
+
+def test_strings_offsets(elf_file, elf_data):
+    strings = get_strings(elf_file, section_names=[".rodata"])
+    matches = [
+        (offset, string)
+        for name, offset, encoding, string in strings
+        if string == "HelloSecretString"
+    ]
+    assert len(matches) == 1
+    offset, string = matches[0]
+    assert elf_data[offset : offset + len(string)] == string.encode()
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 4096])
+def test_strings_across_chunks(elf_file, chunk_size):
+    assert get_strings(elf_file, chunk_size=chunk_size) == get_strings(
+        elf_file
+    )
+
+
+def test_compressed_sections_strings(elf_files):
+    if "compressed" not in elf_files:
+        pytest.skip("the C compiler cannot compress debug sections")
+
+    compressed = {
+        (name, string)
+        for name, _, _, string in get_strings(
+            elf_files["compressed"], chunk_size=64
+        )
+        if name.startswith(".debug") and not string.startswith("GNU C")
+    }
+    assert (".debug_str", "global_counter") in compressed
+    assert compressed == {
+        (name, string)
+        for name, _, _, string in get_strings(elf_files["executable"])
+        if name.startswith(".debug") and not string.startswith("GNU C")
+    }
+
+
+def test_compressed_sections_offsets(elf_files):
+    if "compressed" not in elf_files:
+        pytest.skip("the C compiler cannot compress debug sections")
+
+    with open(elf_files["compressed"], "rb") as file:
+        elf_sections = parse_elffile(file)[3]
+        section = next(
+            section for section in elf_sections if section.name == ".debug_str"
+        )
+        content = get_section_data(file, section, "64")
+        strings = list(
+            extract_strings(file, elf_sections, section_names=[".debug_str"])
+        )
+
+    assert strings
+    for _, offset, _, string in strings:
+        assert content[offset : offset + len(string)] == string.encode()
+
+
+def test_main_strings(elf_file, monkeypatch, capsys):
+    arguments = ["ElfAnalyzer", "strings", "-c", "-n", "8", elf_file]
+    monkeypatch.setattr(ElfAnalyzer, "argv", arguments)
+    assert main_strings() == 0
+    assert arguments == ["ElfAnalyzer", "strings", "-c", "-n", "8", elf_file]
+    assert "HelloSecretString" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("options", [["-n"], ["-n", "x"], ["-n", "0"]])
+def test_cli_invalid_options(elf_file, options):
+    process = run_cli("strings", elf_file, *options)
+    assert process.returncode == 1
+    assert b"USAGES:" in process.stderr
+    assert b"Traceback" not in process.stderr
@@ -0,0 +1,100 @@
+"""
+This file tests the specialized structure constructors.
+"""
+
+from io import BytesIO
+
+import pytest
+
+from ElfAnalyzer import (
+    BaseStructure,
+    DataToCClass,
+    ElfHeader64,
+    ElfIdent,
+    SectionHeader32,
+    SectionHeader64,
+    SymbolTableEntry64,
+    sizeof,
+)
+
+
+def get_fields(structure):
+    """
+    This function returns the values and positions of the fields.
+    """
+
+    fields = {}
+    for name in structure.__annotations__:
+        value = getattr(structure, name)
+        if isinstance(value, BaseStructure):
+            fields[name] = get_fields(value)
+            continue
+        fields[name] = (
+            bytes(value._data_),
+            value._start_position_,
+            value._end_position_,
+            list(value) if hasattr(value, "_length_") else value.value,
+        )
+    return fields
+
+
+@pytest.fixture(params=["little", "big"])
+def order(request):
+    """
+    This fixture sets the byte order used to build structures.
+    """
+
+    DataToCClass.order = request.param
+    yield request.param
+    DataToCClass.order = "little"
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        ElfIdent,
+        ElfHeader64,
+        SectionHeader32,
+        SectionHeader64,
+        SymbolTableEntry64,
+    ],
+)
+def test_specialized_matches_generic(cls, order):
+    size = sizeof(cls)
+    data = bytes(range(7, 7 + size + 5))
+
+    specialized = cls(BytesIO(data[3:]))
+    generic = cls.__new__(cls)
+    BaseStructure.__init__(generic, BytesIO(data[3:]))
+
+    assert get_fields(specialized) == get_fields(generic)
+    assert specialized._source == generic._source == data[3 : 3 + size]
+
+
+def test_from_buffer_positions():
+    size = sizeof(SectionHeader64)
+    data = bytes(16) + bytes(range(size))
+    header = SectionHeader64.from_buffer(data, 16)
+    generic = SectionHeader64.__new__(SectionHeader64)
+    file = BytesIO(data)
+    file.seek(16)
+    BaseStructure.__init__(generic, file)
+
+    assert get_fields(header) == get_fields(generic)
+    assert header.sh_name._start_position_ == 16
+    assert header.sh_entsize._end_position_ == 16 + size
+
+
+def test_stream_position_after_build():
+    size = sizeof(SectionHeader64)
+    file = BytesIO(bytes(size * 2))
+    SectionHeader64(file)
+    assert file.tell() == size
+
+
+def test_truncated_data_falls_back():
+    size = sizeof(SectionHeader32)
+    header = SectionHeader32(BytesIO(bytes(range(size - 4))))
+    assert header._source == bytes(range(size - 4))
+    assert header.sh_addralign._data_ == bytes(range(32, 36))
+    assert header.sh_entsize._data_ == b""
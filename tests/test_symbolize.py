@@ -0,0 +1,159 @@
+"""
+This file tests the addresses symbolization.
+"""
+
+from shutil import which
+from subprocess import run
+
+import pytest
+
+from ElfAnalyzer import (
+    parse_elflayout,
+    read_raw_symbols,
+    get_raw_string,
+    symbol_indexes,
+    symbolize,
+)
+
+nested_source = """
+.text
+.globl outer
+.type outer, @function
+outer:
+    nop
+.globl inner
+.type inner, @function
+inner:
+    nop
+    nop
+.size inner, 2
+    nop
+    nop
+.size outer, 5
+.globl label
+label:
+    nop
+    nop
+"""
+
+tls_source = """
+__thread int counter[64];
+__attribute__((constructor)) static void start(void) { counter[0] = 1; }
+int get(void) { return counter[0]; }
+"""
+
+
+def get_symbols(path: str):
+    """
+    This function returns symbols addresses by name.
+    """
+
+    with open(path, "rb") as file:
+        layout = parse_elflayout(file)
+        return {
+            get_raw_string(strings, name): value
+            for _, table, strings in read_raw_symbols(file, layout)
+            for name, _, _, _, value, _ in table
+        }
+
+
+@pytest.fixture(scope="module")
+def nested_library(tmp_path_factory):
+    """
+    This fixture builds a library with nested and unsized symbols.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required")
+
+    directory = tmp_path_factory.mktemp("nested")
+    (directory / "nested.s").write_text(nested_source)
+    path = directory / "libnested.so"
+    command = [compiler, "-shared", "-nostdlib", "-o", str(path), "nested.s"]
+    if run(command, cwd=directory).returncode:
+        pytest.skip("the C compiler cannot build the nested symbols")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def tls_library(tmp_path_factory):
+    """
+    This fixture builds a library with a .tbss and an .init_array section.
+    """
+
+    compiler = which("gcc") or which("cc")
+    if compiler is None:
+        pytest.skip("a C compiler is required")
+
+    directory = tmp_path_factory.mktemp("tls")
+    (directory / "tls.c").write_text(tls_source)
+    path = directory / "libtls.so"
+    command = [compiler, "-shared", "-fPIC", "-o", str(path), "tls.c"]
+    if run(command, cwd=directory).returncode:
+        pytest.skip("the C compiler cannot build the TLS library")
+    return str(path)
+
+
+def test_functions(elf_file):
+    symbols = get_symbols(elf_file)
+    locations = symbolize(
+        elf_file, [symbols["main"] + 4, symbols["helper"], 0]
+    )
+    assert [
+        (location.symbol, location.offset, location.section)
+        for location in locations
+    ] == [("main", 4, ".text"), ("helper", 0, ".text"), (None, None, None)]
+    assert locations[0].address == symbols["main"] + 4
+
+
+def test_offsets(elf_file):
+    symbols = get_symbols(elf_file)
+    with open(elf_file, "rb") as file:
+        layout = parse_elflayout(file)
+
+    text = [section for section in layout.sections if section.name == ".text"]
+    offset = symbols["helper"] - text[0].addr + text[0].offset + 2
+    location = symbolize(elf_file, [offset], offsets=True)[0]
+    assert (location.symbol, location.offset, location.address) == (
+        "helper",
+        2,
+        offset,
+    )
+
+
+def test_nested_symbols(nested_library):
+    symbols = get_symbols(nested_library)
+    outer = symbols["outer"]
+    locations = symbolize(
+        nested_library, [outer + 4, outer + 1, outer, symbols["label"] + 1]
+    )
+    assert [(location.symbol, location.offset) for location in locations] == [
+        ("outer", 4),
+        ("inner", 0),
+        ("outer", 0),
+        ("label", 1),
+    ]
+
+
+def test_index_is_cached(elf_file):
+    symbol_indexes.clear()
+    symbolize(elf_file, [0])
+    index = next(iter(symbol_indexes.values()))
+    symbolize(elf_file, [0])
+    assert len(symbol_indexes) == 1
+    assert next(iter(symbol_indexes.values())) is index
+
+
+def test_tls_sections_are_not_indexed(tls_library):
+    with open(tls_library, "rb") as file:
+        layout = parse_elflayout(file)
+    sections = {section.name: section for section in layout.sections}
+    if ".tbss" not in sections or ".init_array" not in sections:
+        pytest.skip("the compiler does not emit .tbss and .init_array")
+
+    address = sections[".tbss"].addr
+    location = symbolize(tls_library, [address])[0]
+    assert location.section != ".tbss"
+    if sections[".init_array"].addr == address:
+        assert location.section == ".init_array"
@@ -0,0 +1,49 @@
+"""
+This file tests the dynamic symbols versions of the full parser.
+"""
+
+from re import fullmatch
+
+import pytest
+
+import ElfAnalyzer
+from ElfAnalyzer import get_parsed_layout, parse_elffile, parse_elflayout
+
+
+@pytest.mark.parametrize("build", ["executable", "library", "object"])
+def test_parsed_layout(elf_files, build):
+    if build not in elf_files:
+        pytest.skip(f"the C compiler cannot build {build}")
+
+    with open(elf_files[build], "rb") as file:
+        elfindent, elf_headers, programs_headers, elf_sections, *_ = (
+            parse_elffile(file)
+        )
+        assert get_parsed_layout(
+            elfindent, elf_headers, programs_headers, elf_sections
+        ) == parse_elflayout(file)
+
+
+def test_versions_without_layout_read(elf_file, monkeypatch):
+    def fail(file):
+        pytest.fail("the raw layout is read again")
+
+    monkeypatch.setattr(ElfAnalyzer, "parse_elflayout", fail)
+    with open(elf_file, "rb") as file:
+        symbols_tables = parse_elffile(file)[4]
+
+    versions = {
+        symbol.name: (symbol.version, symbol.version_file)
+        for table, symbol in symbols_tables
+        if table == ".dynsym"
+    }
+    for name, library in (("printf", "libc.so.6"), ("sqrt", "libm.so.6")):
+        version, version_file = versions[name]
+        assert fullmatch(r"GLIBC_2(\.\d+)+", version)
+        assert version_file == library
+    assert versions["__gmon_start__"] == (None, None)
+    assert all(
+        symbol.version is None
+        for table, symbol in symbols_tables
+        if table == ".symtab"
+    )
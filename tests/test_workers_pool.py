@@ -0,0 +1,84 @@
+"""
+This file tests the bounded processes pool.
+"""
+
+from os import _exit, getpid
+
+from ElfAnalyzer import WorkersPool
+
+
+def square(number):
+    if number == 5:
+        _exit(3)
+    if number == 7:
+        raise ValueError("seven")
+    return number * number
+
+
+def get_pid(_):
+    return getpid()
+
+
+def test_results_and_errors():
+    results = {
+        argument: (result, error)
+        for argument, result, error in WorkersPool(square, 3).imap_unordered(
+            (number, 1) for number in range(20)
+        )
+    }
+    assert sorted(results) == list(range(20))
+    assert results[5] == (None, "Worker exited with code 3")
+    assert results[7] == (None, "ValueError: seven")
+    assert all(
+        results[number] == (number * number, None)
+        for number in range(20)
+        if number not in (5, 7)
+    )
+
+
+def test_recycling():
+    pool = WorkersPool(get_pid, 1, max_tasks_per_child=2)
+    pids = [
+        pid for _, pid, _ in pool.imap_unordered((n, 1) for n in range(10))
+    ]
+    assert len(set(pids)) == 5
+    assert all(pids.count(pid) == 2 for pid in pids)
+    assert not pool.workers
+
+    pool = WorkersPool(get_pid, 2, max_rss=1)
+    pids = [pid for _, pid, _ in pool.imap_unordered((n, 1) for n in range(6))]
+    assert len(set(pids)) == 6
+
+
+def test_backpressure():
+    pool = WorkersPool(square, 2)
+    pulled = []
+
+    def tasks():
+        for number in range(10, 30):
+            pulled.append(number)
+            yield number, 1
+
+    for received, _ in enumerate(pool.imap_unordered(tasks()), 1):
+        assert len(pulled) <= received + 3
+        assert len(pool.in_flight) <= 2
+    assert received == 20
+
+
+def test_in_flight_bytes():
+    pool = WorkersPool(square, 4, max_in_flight_bytes=10)
+    in_flight = []
+
+    def tasks():
+        for number, size in ((10, 6), (11, 6), (12, 100), (13, 3), (14, 3)):
+            in_flight.append(len(pool.in_flight))
+            yield number, size
+
+    results = [
+        result
+        for _, result, error in pool.imap_unordered(tasks())
+        if error is None
+    ]
+    assert sorted(results) == [100, 121, 144, 169, 196]
+    assert max(in_flight) == 1
+    assert pool.in_flight_bytes == 0